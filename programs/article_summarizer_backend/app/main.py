@@ -48,6 +48,7 @@ logger.info(f"Logging to file: {log_file}")
 
 # Import routes
 from app.routes import article, auth, reprocess
+from core.browser_pool import start_browser_pools, stop_browser_pools, browser_pool_status
 
 
 @asynccontextmanager
@@ -81,10 +82,15 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning(f"⚠️ Storage directory not found: {storage_dir}")
 
+    # Warm browser pool for Playwright fetches (falls back to per-request launch if unavailable)
+    if await start_browser_pools():
+        logger.info("✅ Browser pools started")
+
     yield
 
     # Shutdown
     logger.info("👋 Shutting down Article Summarizer Backend")
+    await stop_browser_pools()
 
 
 # Create FastAPI app
@@ -173,6 +179,7 @@ async def health_check():
         "storage": storage_exists,
         "session_configured": session_configured,
         "session_source": session_source,
+        "browser_pools": browser_pool_status(),
         "environment": os.getenv('ENVIRONMENT', 'development')
     }
 
@@ -417,7 +417,49 @@ async def process_article_direct(
             await asyncio.sleep(0)
 
             logger.info("Starting AI summary generation...")
-            ai_summary = await processor._generate_summary_async(processing_url, metadata)
+
+            # Stream completed summary fields (ai_partial) while Claude is still generating
+            summary_queue = asyncio.Queue()
+            summary_result = None
+            summary_error = None
+
+            async def summary_progress_callback(event_type: str, data: dict):
+                await summary_queue.put({
+                    "event": event_type,
+                    "data": {**data, "elapsed": elapsed()}
+                })
+
+            async def generate_summary_task():
+                nonlocal summary_result, summary_error
+                try:
+                    summary_result = await processor._generate_summary_async(
+                        processing_url,
+                        metadata,
+                        progress_callback=summary_progress_callback
+                    )
+                except Exception as e:
+                    summary_error = e
+                finally:
+                    await summary_queue.put(None)
+
+            summary_task = asyncio.create_task(generate_summary_task())
+
+            while True:
+                event = await summary_queue.get()
+                if event is None:  # Completion signal
+                    break
+                yield {
+                    "event": event["event"],
+                    "data": json.dumps(event["data"])
+                }
+                await asyncio.sleep(0)
+
+            await summary_task
+
+            if summary_error:
+                raise summary_error
+
+            ai_summary = summary_result
 
             yield {
                 "event": "ai_complete",
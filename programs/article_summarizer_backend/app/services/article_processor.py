@@ -49,6 +49,11 @@ from core.authentication import AuthenticationManager
 from core.claude_client import ClaudeClient
 from core.source_extractor import extract_source, extract_domain, normalize_source_name
 from core.text_utils import sanitize_filename
+from core.title_matcher import TitleMatcher
+from core.transcript_cache import canonicalize_media_url, make_cache_key
+from core.streaming_json import IncrementalJSONParser
+from core.embedding_service import EmbeddingService
+from core.embedding_cache import get_embedding_cache
 from core.prompts import (
     ArticleAnalysisPrompt,
     VideoContextBuilder,
@@ -60,8 +65,13 @@ from core.prompts import (
 )
 from processors.transcript_processor import TranscriptProcessor
 from processors.file_transcriber import FileTranscriber
+from processors.chunked_transcriber import ChunkedTranscriber
+from processors.audio_splitter import iter_audio_chunks
 from core.youtube_discovery import YouTubeDiscoveryService
 
+# Summary fields pushed to the client as 'ai_partial' events while Claude is still generating
+STREAMED_SUMMARY_FIELDS = ArticleAnalysisPrompt.RESPONSE_FIELDS
+
 
 class ArticleProcessor(BaseProcessor):
     """
@@ -110,10 +120,16 @@ class ArticleProcessor(BaseProcessor):
         # Initialize OpenAI client for embeddings
         openai_api_key = os.getenv('OPENAI_API_KEY')
         self.openai_client: Optional[OpenAI] = None
+        self.embedding_service: Optional[EmbeddingService] = None
 
         if openai_api_key:
             try:
                 self.openai_client = OpenAI(api_key=openai_api_key)
+                self.embedding_service = EmbeddingService(
+                    self.openai_client,
+                    cache=get_embedding_cache(),
+                    logger=self.logger
+                )
                 self.logger.info("✅ OpenAI client initialized for embeddings")
             except Exception as e:
                 self.logger.warning(f"⚠️ Failed to initialize OpenAI client: {e}")
@@ -1833,24 +1849,74 @@ class ArticleProcessor(BaseProcessor):
 
         self.logger.info(f"   ✅ Applied {applied_count} AI summaries to frames")
 
-    async def _generate_summary_async(self, url: str, metadata: Dict) -> Dict:
+    async def _generate_summary_async(
+        self,
+        url: str,
+        metadata: Dict,
+        progress_callback: Optional[Callable[[str, Dict], Awaitable[None]]] = None
+    ) -> Dict:
         """
-        Async wrapper for AI summary generation.
+        Async AI summary generation.
 
-        Runs the synchronous Claude API call in a thread pool to avoid blocking
-        the event loop, enabling real-time SSE streaming.
+        Awaits the Claude API on the shared async client so the event loop stays
+        free for real-time SSE streaming. With a progress_callback (and
+        CLAUDE_STREAMING enabled) the response is streamed and each top-level
+        field (summary, key_insights, ...) is reported as an 'ai_partial' event
+        as soon as it is complete.
         """
-        import asyncio
-
         # Enrich video frames with transcript excerpts BEFORE sending to AI
         if metadata.get('video_frames'):
             self._enrich_frames_with_transcript(metadata)
 
-        # Run the synchronous method in a thread pool
-        return await asyncio.to_thread(self._generate_summary_with_ai, url, metadata)
+        prompt = self._build_summary_prompt(url, metadata)
+        if progress_callback and Config.CLAUDE_STREAMING:
+            response = await self._stream_claude_api_async(prompt, progress_callback)
+        else:
+            response = await self._call_claude_api_async(prompt)
+        return self._parse_summary_response(response, metadata)
+
+    async def _stream_claude_api_async(
+        self,
+        prompt: str,
+        progress_callback: Callable[[str, Dict], Awaitable[None]]
+    ) -> str:
+        """
+        Stream the Claude response, emitting completed summary fields as they arrive
+
+        Falls back to a regular call if the stream fails before any text arrives.
+
+        Returns:
+            The full response text
+        """
+        parser = IncrementalJSONParser()
+        chunks = []
+
+        try:
+            async for delta in self.claude_client.astream_api(prompt):
+                chunks.append(delta)
+                for field, value in parser.feed(delta):
+                    if field not in STREAMED_SUMMARY_FIELDS:
+                        continue
+                    if field == 'summary' and isinstance(value, str) and not any(tag in value for tag in ['<p>', '<div>', '<h1>', '<h2>', '<h3>']):
+                        value = self._format_summary_as_html(value)
+                    self.logger.info(f"   ⚡ [STREAM] {field} ready")
+                    await progress_callback('ai_partial', {'field': field, 'value': value})
+        except Exception as e:
+            if chunks:
+                raise
+            self.logger.warning(f"   ⚠️ [STREAM] Streaming unavailable ({e}), falling back to single response")
+            return await self._call_claude_api_async(prompt)
+
+        return ''.join(chunks).strip()
 
     def _generate_summary_with_ai(self, url: str, metadata: Dict) -> Dict:
         """Generate AI summary based on content type"""
+        prompt = self._build_summary_prompt(url, metadata)
+        response = self._call_claude_api(prompt)
+        return self._parse_summary_response(response, metadata)
+
+    def _build_summary_prompt(self, url: str, metadata: Dict) -> str:
+        """Build the article analysis prompt for the detected content type"""
         content_type = metadata['content_type']
 
         # Build context based on content type using prompt builders
@@ -1863,12 +1929,10 @@ class ArticleProcessor(BaseProcessor):
 
         # Generate prompt using ArticleAnalysisPrompt
         simplified_metadata = create_metadata_for_prompt(metadata)
-        prompt = ArticleAnalysisPrompt.build(url, media_context, simplified_metadata)
-
-        # Call Claude API
-        response = self._call_claude_api(prompt)
+        return ArticleAnalysisPrompt.build(url, media_context, simplified_metadata)
 
-        # Parse response
+    def _parse_summary_response(self, response: str, metadata: Dict) -> Dict:
+        """Parse Claude's summary response, falling back to HTML-formatted raw text"""
         parsed_json = self._extract_json_from_response(response)
 
         if parsed_json:
@@ -1976,8 +2040,7 @@ class ArticleProcessor(BaseProcessor):
                 article_summary=ai_summary.get('summary', '')
             )
 
-            # Run in thread pool to avoid blocking
-            response = await asyncio.to_thread(self._call_claude_api, prompt)
+            response = await self._call_claude_api_async(prompt)
             parsed = self._extract_json_from_response(response)
 
             if parsed and 'themed_insights' in parsed:
@@ -2040,6 +2103,10 @@ class ArticleProcessor(BaseProcessor):
         """Call Claude Code API for AI-powered analysis"""
         return self.claude_client.call_api(prompt)
 
+    async def _call_claude_api_async(self, prompt: str) -> str:
+        """Call Claude Code API without blocking the event loop"""
+        return await self.claude_client.acall_api(prompt)
+
     def _extract_json_from_response(self, response: str) -> Optional[Dict]:
         """Extract and parse JSON from Claude's response"""
         import re
@@ -2098,31 +2165,12 @@ class ArticleProcessor(BaseProcessor):
         Returns:
             Embedding vector (384 dimensions) or None if generation fails
         """
-        if not self.openai_client:
+        if not self.embedding_service:
             return None
 
-        try:
-            # Truncate text to avoid token limits (8191 tokens max for text-embedding-3-small)
-            # Approximately 4 characters per token, so limit to ~32000 characters
-            if len(text) > 32000:
-                text = text[:32000]
-                self.logger.info(f"   📊 [EMBEDDING] Truncated text to 32000 characters for embedding")
-
-            self.logger.info(f"   📊 [EMBEDDING] Generating embedding for {len(text)} characters...")
-
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text,
-                dimensions=384  # Use 384 dimensions for performance
-            )
-
-            embedding = response.data[0].embedding
-            self.logger.info(f"   ✅ [EMBEDDING] Generated {len(embedding)}-dimensional embedding")
-            return embedding
-
-        except Exception as e:
-            self.logger.error(f"   ❌ [EMBEDDING] Failed to generate embedding: {e}")
-            return None
+        # Batched/retried/cached path shared with scripts/article_summarizer/backfill_embeddings.py
+        # (unchanged embedding text - e.g. summary-only reprocess - is served from the cache)
+        return self.embedding_service.embed_one(text)
 
     def _extract_transcript_excerpt(self, transcript_data: Dict, start_seconds: float, end_seconds: float, max_words: int = 100) -> str:
         """
@@ -2358,82 +2406,19 @@ class ArticleProcessor(BaseProcessor):
         Returns:
             Tuple of (is_match, confidence_ratio)
         """
-        from difflib import SequenceMatcher
-        from datetime import datetime, timedelta
-        import re
-
         # If video title not provided, we'd need to fetch it from YouTube
         # For now, require it to be passed in
         if not video_title:
             self.logger.warning(f"   ⚠️ [MATCH] No video title provided for comparison")
             return False, 0.0
 
-        # Calculate character-level similarity ratio
-        ratio = SequenceMatcher(None, episode_title.lower(), video_title.lower()).ratio()
-
-        # Default threshold is 70%
-        threshold = 0.70
-
-        # Use relaxed threshold (40%) if published within 1 day of each other
-        if episode_published_date and video_published_date:
-            self.logger.info(f"         [DATE CHECK] Episode: '{episode_published_date}' | Video: '{video_published_date}'")
-            try:
-                from dateutil import parser
-
-                # Parse episode date
-                episode_date = parser.parse(episode_published_date)
-
-                # Parse video date (handle relative dates like "2 days ago")
-                video_date = None
-                if 'ago' in video_published_date.lower():
-                    match = re.search(r'(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago', video_published_date.lower())
-                    if match:
-                        amount = int(match.group(1))
-                        unit = match.group(2)
-
-                        now = datetime.now()
-                        if unit == 'second':
-                            video_date = now - timedelta(seconds=amount)
-                        elif unit == 'minute':
-                            video_date = now - timedelta(minutes=amount)
-                        elif unit == 'hour':
-                            video_date = now - timedelta(hours=amount)
-                        elif unit == 'day':
-                            video_date = now - timedelta(days=amount)
-                        elif unit == 'week':
-                            video_date = now - timedelta(weeks=amount)
-                        elif unit == 'month':
-                            video_date = now - timedelta(days=amount*30)
-                        elif unit == 'year':
-                            video_date = now - timedelta(days=amount*365)
-                else:
-                    # Try to parse as ISO format
-                    try:
-                        video_date = parser.parse(video_published_date)
-                    except:
-                        pass
-
-                if video_date:
-                    # Compare dates
-                    days_apart = abs((episode_date.replace(tzinfo=None) - video_date.replace(tzinfo=None)).days)
-                    self.logger.info(f"         [DATE COMPARE] {days_apart} days apart (episode: {episode_date.date()}, video: {video_date.date()})")
-                    if days_apart <= 1:
-                        threshold = 0.40
-                        self.logger.info(f"         ✅ [DATE MATCH] Within 1 day! Using relaxed 40% threshold")
-                    else:
-                        self.logger.info(f"         ⚠️ [DATE DIFF] More than 1 day apart, using standard 70% threshold")
-                else:
-                    self.logger.info(f"         ⚠️ [DATE PARSE] Could not parse video date: '{video_published_date}'")
-            except Exception as e:
-                self.logger.warning(f"         ⚠️ [DATE ERROR] Error parsing dates: {e}")
-        else:
-            if not episode_published_date:
-                self.logger.info(f"         ℹ️ [NO DATE] No episode published date available")
-            if not video_published_date:
-                self.logger.info(f"         ℹ️ [NO DATE] No video published date available")
-
-        is_match = ratio >= threshold
-        return is_match, ratio
+        # 70% title similarity, or 40% if published within 1 day of each other
+        match = TitleMatcher([{'title': video_title, 'published': video_published_date}]).best_match(
+            episode_title, episode_published_date
+        )
+        if not match:
+            return False, 0.0
+        return match.is_match, match.ratio
 
     async def _discover_youtube_url(
         self,
@@ -2653,35 +2638,15 @@ class ArticleProcessor(BaseProcessor):
             self.logger.info(f"      📊 [SCRAPING] Found {len(videos)} videos, matching against title...")
             self.logger.info(f"      📝 [EPISODE TITLE] '{episode_title}'")
 
-            # Find best match using the unified matching method
-            best_match = None
-            best_ratio = 0.0
-
-            for idx, video in enumerate(videos, 1):
-                # Use the unified matching method with date-based thresholds
-                video_published = video.get('published', '')
-                is_match, ratio = await self._is_video_match_for_podcast(
-                    video_url=video['url'],
-                    video_title=video['title'],
-                    episode_title=episode_title,
-                    episode_published_date=episode_published_date,
-                    video_published_date=video_published
-                )
-
-                # Log EVERY comparison with published date
-                pub_info = f" (published: {video_published})" if video_published else ""
-                self.logger.info(f"         [{idx}/{len(videos)}] {ratio:.1%}{pub_info} - '{video['title'][:80]}...'")
-
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = video
-                    best_is_match = is_match
+            # Titles are indexed and dates parsed once for all videos
+            match = TitleMatcher(videos).best_match(episode_title, episode_published_date)
 
-            if best_match and best_is_match:
-                self.logger.info(f"      ✅ [MATCH] Found with {best_ratio:.1%} confidence: {best_match['title'][:80]}...")
-                return best_match['url']
-            elif best_match:
-                self.logger.info(f"      ⚠️ [LOW CONFIDENCE] Best match only {best_ratio:.1%}: {best_match['title'][:80]}...")
+            if match and match.is_match:
+                self.logger.info(f"      ✅ [MATCH] Found with {match.ratio:.1%} confidence (threshold {match.threshold:.0%}): {match.candidate['title'][:80]}...")
+                return match.candidate['url']
+            elif match:
+                pub_info = f" (published: {match.candidate.get('published')})" if match.candidate.get('published') else ""
+                self.logger.info(f"      ⚠️ [LOW CONFIDENCE] Best match only {match.ratio:.1%}{pub_info}: {match.candidate['title'][:80]}...")
                 return None
             else:
                 self.logger.info(f"      ℹ️ [NO MATCH] No videos passed threshold")
@@ -3439,40 +3404,61 @@ class ArticleProcessor(BaseProcessor):
 
             self.logger.info(f"   🎵 [DEEPGRAM] Attempting to transcribe {media_type} from URL...")
 
-            if progress_callback:
-                await progress_callback("downloading_audio", {"media_type": media_type})
+            # Check the transcript cache by canonical media URL before downloading
+            cache = getattr(self.file_transcriber, 'cache', None)
+            url_cache_key = None
+            transcript_data = None
+            if cache:
+                url_cache_key = make_cache_key(
+                    f"url:{canonicalize_media_url(media_url)}",
+                    self.file_transcriber.transcription_options()
+                )
+                transcript_data = await asyncio.to_thread(cache.get, url_cache_key)
 
-            # Download media file to temp location (run in thread pool - blocking I/O)
-            def download_file():
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                    self.logger.info(f"   📥 [DOWNLOAD] Downloading {media_type} file...")
+            temp_path = None
+            transcript_json_file = None
 
-                    response = requests.get(media_url, stream=True, timeout=60)
-                    response.raise_for_status()
+            if transcript_data:
+                self.logger.info(f"   ♻️ [CACHE] Reusing transcript for this {media_type} URL (skipping download and DeepGram)")
+            else:
+                if progress_callback:
+                    await progress_callback("downloading_audio", {"media_type": media_type})
 
-                    # Write to temp file
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)
+                # Download media file to temp location (run in thread pool - blocking I/O)
+                def download_file():
+                    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
+                        temp_path = temp_file.name
+                        self.logger.info(f"   📥 [DOWNLOAD] Downloading {media_type} file...")
 
-                    return temp_path
+                        response = requests.get(media_url, stream=True, timeout=60)
+                        response.raise_for_status()
 
-            temp_path = await asyncio.to_thread(download_file)
-            self.logger.info(f"   ✅ [DOWNLOAD] Downloaded to {temp_path}")
+                        # Write to temp file
+                        for chunk in response.iter_content(chunk_size=8192):
+                            temp_file.write(chunk)
 
-            # Use centralized transcription method with automatic size checking and chunking
-            result = await self._transcribe_audio_with_size_check(
-                temp_path,
-                media_type=media_type,
-                progress_callback=progress_callback
-            )
+                        return temp_path
 
-            if not result:
-                self.logger.warning(f"   ❌ Transcription failed")
-                return None
+                temp_path = await asyncio.to_thread(download_file)
+                self.logger.info(f"   ✅ [DOWNLOAD] Downloaded to {temp_path}")
+
+                # Use centralized transcription method with automatic size checking and chunking
+                result = await self._transcribe_audio_with_size_check(
+                    temp_path,
+                    media_type=media_type,
+                    progress_callback=progress_callback
+                )
+
+                if not result:
+                    self.logger.warning(f"   ❌ Transcription failed")
+                    return None
+
+                transcript_data = result['transcript_data']
+                transcript_json_file = result.get('output_file')
 
-            transcript_data = result['transcript_data']
-            transcript_json_file = result.get('output_file')
+                # Only complete transcripts are cached under the URL
+                if url_cache_key and '_partial' not in transcript_data.get('type', ''):
+                    await asyncio.to_thread(cache.set, url_cache_key, transcript_data)
 
             # Format for our use - convert to same format as YouTube transcripts
             segments = transcript_data.get('segments', [])
@@ -3500,7 +3486,8 @@ class ArticleProcessor(BaseProcessor):
 
             # Clean up temp files
             try:
-                await asyncio.to_thread(os.unlink, temp_path)  # Delete downloaded audio file
+                if temp_path and os.path.exists(temp_path):  # Chunking deletes the download itself
+                    await asyncio.to_thread(os.unlink, temp_path)  # Delete downloaded audio file
                 if transcript_json_file:  # Only delete if not None (chunking sets it to None)
                     await asyncio.to_thread(os.unlink, transcript_json_file)  # Delete transcript JSON file
                 self.logger.info(f"   🧹 Cleaned up temp files")
@@ -3591,6 +3578,11 @@ class ArticleProcessor(BaseProcessor):
         """
         Async version: Transcribe large audio files by splitting into chunks with progress callbacks
 
+        The file is split with ffmpeg stream-copy segmenting (no decode), and each
+        chunk is handed to ChunkedTranscriber as soon as ffmpeg writes it. Chunks
+        are transcribed concurrently (bounded by Config.DEEPGRAM_CHUNK_CONCURRENCY),
+        so latency tracks the slowest chunk and memory stays flat.
+
         Args:
             audio_path: Path to the audio file
             media_type: Type of media (audio or video)
@@ -3600,152 +3592,83 @@ class ArticleProcessor(BaseProcessor):
         Returns:
             Transcript data dict or None if transcription fails
         """
-        try:
-            from pydub import AudioSegment
-            import tempfile
-            import os
-            import time
+        import math
+        import shutil
+        import tempfile
 
-            self.logger.info(f"   🎵 [CHUNKING] Loading audio file for splitting...")
-            start_time = time.time()
+        chunk_dir = tempfile.mkdtemp(prefix='audio_chunks_')
+        try:
             timeout_seconds = max_duration_minutes * 60
+            chunk_seconds = 20 * 60  # 20 minutes
 
-            # Load audio file (run in thread pool since it's I/O bound)
-            audio = await asyncio.to_thread(AudioSegment.from_file, audio_path)
-            duration_ms = len(audio)
-            duration_min = duration_ms / 1000 / 60
+            duration_seconds = await asyncio.to_thread(self._get_media_duration, audio_path)
+            expected_chunks = math.ceil(duration_seconds / chunk_seconds) if duration_seconds else None
+            duration_min = (duration_seconds or 0) / 60
 
             self.logger.info(f"   ⏱️ [DURATION] Audio is {duration_min:.1f} minutes")
             self.logger.info(f"   ⏰ [TIMEOUT] Will process for max {max_duration_minutes} minutes")
-
-            # Split into 20-minute chunks
-            chunk_length_ms = 20 * 60 * 1000  # 20 minutes
-            chunks = []
-
-            for i in range(0, duration_ms, chunk_length_ms):
-                chunk = audio[i:i + chunk_length_ms]
-                chunks.append((i / 1000, chunk))  # Store start time in seconds
-
-            self.logger.info(f"   ✂️ [CHUNKS] Split into {len(chunks)} chunks of ~20 minutes each")
+            self.logger.info(f"   ✂️ [CHUNKS] Splitting into ~{expected_chunks or '?'} chunks of ~20 minutes each")
 
             if progress_callback:
                 await progress_callback("audio_split", {
-                    "total_chunks": len(chunks),
+                    "total_chunks": expected_chunks,
                     "duration_minutes": duration_min
                 })
 
-            # Transcribe each chunk
-            all_segments = []
-            all_words = []
-            all_text = []
-            chunks_completed = 0
-
-            for chunk_idx, (start_offset, chunk) in enumerate(chunks):
-                # Check if we've exceeded timeout
-                elapsed = time.time() - start_time
-                if elapsed > timeout_seconds:
-                    self.logger.warning(f"   ⏰ [TIMEOUT] Reached {max_duration_minutes} minute limit after {chunk_idx}/{len(chunks)} chunks")
-                    self.logger.info(f"   📦 [PARTIAL] Processing {chunks_completed} completed chunks...")
-                    break
-
-                self.logger.info(f"   🎙️ [CHUNK {chunk_idx + 1}/{len(chunks)}] Transcribing... ({elapsed/60:.1f}/{max_duration_minutes} min elapsed)")
-
-                if progress_callback:
-                    await progress_callback("transcribing_chunk", {
-                        "current": chunk_idx + 1,
-                        "total": len(chunks),
-                        "elapsed_minutes": elapsed / 60
-                    })
-
-                # Save chunk to temp file
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as chunk_file:
-                    chunk_path = chunk_file.name
-                    await asyncio.to_thread(chunk.export, chunk_path, format='mp3')
-
-                try:
-                    # Transcribe this chunk (run in thread pool - blocking I/O)
-                    result = await asyncio.to_thread(
-                        self.file_transcriber.transcribe_file,
-                        chunk_path
-                    )
-                    transcript_data = result['transcript_data']
-                    transcript_json_file = result['output_file']
-
-                    # Adjust timestamps to account for chunk offset
-                    segments = transcript_data.get('segments', [])
-                    for segment in segments:
-                        all_segments.append({
-                            'start': segment.get('start', 0) + start_offset,
-                            'text': segment.get('text', ''),
-                            'duration': segment.get('end', 0) - segment.get('start', 0)
-                        })
-
-                    # Also collect word-level data with adjusted timestamps
-                    words = transcript_data.get('words', [])
-                    for word in words:
-                        all_words.append({
-                            'word': word.get('word', ''),
-                            'start': word.get('start', 0) + start_offset,
-                            'end': word.get('end', 0) + start_offset,
-                            'confidence': word.get('confidence', 0)
-                        })
-
-                    all_text.append(transcript_data.get('text', ''))
-                    chunks_completed += 1
-
-                    self.logger.info(f"   ✅ [CHUNK {chunk_idx + 1}/{len(chunks)}] Complete ({len(segments)} segments, {len(words)} words)")
-
-                    # Clean up chunk files
-                    await asyncio.to_thread(os.unlink, chunk_path)
-                    await asyncio.to_thread(os.unlink, transcript_json_file)
-
-                except Exception as chunk_error:
-                    self.logger.warning(f"   ⚠️ [CHUNK {chunk_idx + 1}/{len(chunks)}] Failed: {chunk_error}")
-                    # Continue with other chunks even if one fails
-                    try:
-                        await asyncio.to_thread(os.unlink, chunk_path)
-                    except:
-                        pass
+            # Transcribe chunks concurrently as ffmpeg yields them; failed chunks are retried individually
+            scheduler = ChunkedTranscriber(self.file_transcriber)
+            merged = await scheduler.transcribe_chunks(
+                iter_audio_chunks(audio_path, chunk_dir, chunk_seconds),
+                timeout_seconds=timeout_seconds,
+                progress_callback=progress_callback,
+                expected_chunks=expected_chunks
+            )
 
             # Clean up original file
             await asyncio.to_thread(os.unlink, audio_path)
 
+            all_segments = merged['segments']
             if not all_segments:
                 self.logger.warning(f"   ❌ [CHUNKING] No segments transcribed successfully")
                 return None
 
             # Combine all transcripts
-            is_partial = chunks_completed < len(chunks)
+            total_chunks = merged['total_chunks']
+            chunks_completed = merged['chunks_completed']
+            is_partial = chunks_completed < total_chunks
             formatted_transcript = {
                 'success': True,
                 'transcript': all_segments,
                 'segments': all_segments,  # Also use 'segments' key for consistency
-                'text': ' '.join(all_text),
+                'text': merged['text'],
                 'language': 'unknown',
                 'type': 'deepgram_transcription_chunked' + ('_partial' if is_partial else ''),
                 'source': media_type,
                 'total_entries': len(all_segments),
                 'chunks_processed': chunks_completed,
-                'total_chunks': len(chunks),
+                'total_chunks': total_chunks,
                 'is_partial': is_partial,
-                'words': all_words  # Include combined word-level data for frame extraction
+                'words': merged['words']  # Include combined word-level data for frame extraction
             }
 
             if is_partial:
-                self.logger.warning(f"   ⚠️ [PARTIAL] Transcription incomplete: {chunks_completed}/{len(chunks)} chunks processed")
+                self.logger.warning(f"   ⚠️ [PARTIAL] Transcription incomplete: {chunks_completed}/{total_chunks} chunks processed (failed: {merged['failed_chunks']})")
                 self.logger.info(f"   📊 [PARTIAL] Returning partial transcript ({len(formatted_transcript['text'])} chars)")
             else:
-                self.logger.info(f"   ✅ [DEEPGRAM] Chunked transcription successful ({len(formatted_transcript['text'])} chars, {len(chunks)} chunks)")
+                self.logger.info(f"   ✅ [DEEPGRAM] Chunked transcription successful ({len(formatted_transcript['text'])} chars, {total_chunks} chunks)")
 
             return formatted_transcript
 
-        except ImportError:
-            self.logger.error(f"   ❌ [CHUNKING] pydub library not installed. Install with: pip install pydub")
-            self.logger.error(f"   ❌ [CHUNKING] Also requires ffmpeg: brew install ffmpeg (macOS) or apt-get install ffmpeg (Linux)")
+        except FileNotFoundError as e:
+            self.logger.error(f"   ❌ [CHUNKING] ffmpeg not found: {e}")
+            self.logger.error(f"   ❌ [CHUNKING] Install ffmpeg: brew install ffmpeg (macOS) or apt-get install ffmpeg (Linux)")
             return None
         except Exception as e:
             self.logger.error(f"   ❌ [CHUNKING] Failed to process large audio file: {e}")
             return None
+        finally:
+            # Clean up chunk files
+            await asyncio.to_thread(shutil.rmtree, chunk_dir, True)
 
     def _extract_article_text_content(self, soup) -> str:
         """Extract main article text content with preserved structure"""
@@ -4195,39 +4118,45 @@ class ArticleProcessor(BaseProcessor):
             # Use a temporary article ID if not provided (will be updated later)
             temp_article_id = article_id or 0
 
-            # Extract frames
             extractor = FrameExtractor(min_interval_seconds=30)
-            frames = await extractor.extract_frames(video_path)
-
-            if not frames:
-                self.logger.warning("⚠️ No frames extracted from video")
-                extractor.cleanup()
-                return []
-
-            # Upload frames to Supabase storage
             storage_manager = StorageManager()
-            uploaded_frames = []
-
-            for frame in frames:
-                success, storage_path, public_url = storage_manager.upload_frame(
-                    frame["path"],
-                    temp_article_id,
-                    frame["timestamp_seconds"]
-                )
+            upload_semaphore = asyncio.Semaphore(4)
+
+            async def upload(frame: Dict) -> Optional[Dict]:
+                async with upload_semaphore:
+                    success, storage_path, public_url = await asyncio.to_thread(
+                        storage_manager.upload_frame,
+                        frame["path"],
+                        temp_article_id,
+                        frame["timestamp_seconds"]
+                    )
 
-                if success:
-                    uploaded_frames.append({
-                        "url": public_url,
-                        "storage_path": storage_path,
-                        "timestamp_seconds": frame["timestamp_seconds"],
-                        "time_formatted": frame["time_formatted"],
-                        "perceptual_hash": frame.get("hash")
-                    })
-                else:
+                if not success:
                     self.logger.warning(f"⚠️ Failed to upload frame at {frame['time_formatted']}")
+                    return None
+                return {
+                    "url": public_url,
+                    "storage_path": storage_path,
+                    "timestamp_seconds": frame["timestamp_seconds"],
+                    "time_formatted": frame["time_formatted"],
+                    "perceptual_hash": frame.get("hash")
+                }
 
-            # Clean up temporary frames
-            extractor.cleanup()
+            # Upload frames to Supabase storage as they stream out of classification
+            upload_tasks = []
+            try:
+                async for frame in extractor.iter_frames(video_path):
+                    upload_tasks.append(asyncio.create_task(upload(frame)))
+                results = await asyncio.gather(*upload_tasks)
+            finally:
+                # Clean up temporary frames
+                extractor.cleanup()
+
+            if not upload_tasks:
+                self.logger.warning("⚠️ No frames extracted from video")
+                return []
+
+            uploaded_frames = [frame for frame in results if frame]
 
             self.logger.info(f"✅ Uploaded {len(uploaded_frames)} frames to storage")
             return uploaded_frames
@@ -5138,19 +5067,25 @@ class ArticleProcessor(BaseProcessor):
             file_size_mb = os.path.getsize(local_path) / (1024 * 1024)
             self.logger.info(f"   ✅ Downloaded media: {file_size_mb:.1f}MB")
 
-            # Transcribe with Deepgram
+            # Transcribe with Deepgram (served from the transcript cache when this media was seen before)
             self.logger.info("   🎯 Transcribing with Deepgram...")
-            transcript_result = self.file_transcriber.transcribe(local_path)
+            transcript_result = await self._transcribe_audio_with_size_check(local_path, media_type='reprocess')
 
-            if not transcript_result or not transcript_result.get('success'):
-                error_msg = transcript_result.get('error', 'Transcription failed') if transcript_result else 'Transcription failed'
+            if not transcript_result or not transcript_result.get('transcript_data'):
+                error_msg = 'Transcription failed'
                 self.logger.error(f"   ❌ {error_msg}")
                 if progress_callback:
                     await progress_callback('transcript_error', {'error': error_msg})
                 return {'success': False, 'error': error_msg}
 
+            if transcript_result.get('output_file'):
+                try:
+                    os.unlink(transcript_result['output_file'])
+                except OSError:
+                    pass
+
             # Format transcript text
-            segments = transcript_result.get('segments', [])
+            segments = transcript_result['transcript_data'].get('segments', [])
             transcript_lines = []
             for segment in segments:
                 start_time = segment.get('start', 0)
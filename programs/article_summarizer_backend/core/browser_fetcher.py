@@ -24,6 +24,7 @@ except ImportError:
 
 # Import generalized authentication helper
 from .playwright_auth import PlaywrightAuthenticator, get_q4_config
+from .browser_pool import DEFAULT_POOL, Q4_POOL, build_browser_args, get_browser_pool
 
 
 class BrowserFetcher:
@@ -62,216 +63,201 @@ class BrowserFetcher:
         if not PLAYWRIGHT_AVAILABLE:
             return False, None, "Playwright not installed"
 
-        self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Launching browser for: {url}")
+        self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Fetching: {url}")
         self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Headless: {self.headless}, Timeout: {self.timeout}ms")
         if storage_state:
             self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Using storage_state with {len(storage_state.get('cookies', []))} cookies")
 
+        # Detect Q4 Inc URLs which need special handling (crash with --single-process)
+        is_q4_url = 'q4inc.com' in url or 'q4web.com' in url
+        if is_q4_url:
+            self.logger.info(f"🎯 [Q4 DETECTION] Q4 Inc URL detected, using media-enabled browser args")
+
+        # Create context with realistic settings + storage_state if provided
+        context_options = {
+            'viewport': {'width': 1920, 'height': 1080},
+            'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+        }
+
+        # Use storage_state if provided (includes cookies + localStorage + sessionStorage)
+        if storage_state:
+            context_options['storage_state'] = storage_state
+
         try:
+            # Prefer a warm browser from the app-level pool (started in app/main.py lifespan)
+            pool = get_browser_pool(Q4_POOL if is_q4_url else DEFAULT_POOL)
+            if pool:
+                self.logger.info(f"🏊 [BROWSER FETCH ASYNC] Using pooled browser ({pool.name})")
+                async with pool.context(**context_options) as context:
+                    return await self._fetch_in_context_async(context, url, cookies, storage_state)
+
+            # No pool in this process (CLI scripts, earnings_insights) - launch a one-off browser
             async with async_playwright() as p:
-                # Detect Q4 Inc URLs which need special handling (crash with --single-process)
-                is_q4_url = 'q4inc.com' in url or 'q4web.com' in url
-
-                # Base args that work for most sites
-                browser_args = [
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                ]
-
-                # Only add --single-process and --no-zygote for non-Q4 URLs
-                # Q4 Inc uses heavy JavaScript/WebAssembly that crashes with these flags
-                if not is_q4_url:
-                    browser_args.extend([
-                        '--single-process',
-                        '--no-zygote',
-                        '--disable-gpu',
-                    ])
-                else:
-                    # Q4-specific args: enable media features for video player
-                    self.logger.info(f"🎯 [Q4 DETECTION] Q4 Inc URL detected, using media-enabled browser args")
-                    browser_args.extend([
-                        '--enable-features=WebRTC,WebAudio,MediaStreamTrack',
-                        '--use-fake-ui-for-media-stream',  # Auto-grant media permissions
-                        '--use-fake-device-for-media-stream',  # Provide fake media devices
-                        '--autoplay-policy=no-user-gesture-required',  # Allow autoplay
-                        '--disable-features=IsolateOrigins,site-per-process',  # Better compatibility
-                    ])
-
-                # Launch browser
                 browser = await p.chromium.launch(
                     headless=self.headless,
-                    args=browser_args
+                    args=build_browser_args(media_enabled=is_q4_url)
                 )
+                try:
+                    context = await browser.new_context(**context_options)
+                    return await self._fetch_in_context_async(context, url, cookies, storage_state)
+                finally:
+                    await browser.close()
 
-                # Create context with realistic settings + storage_state if provided
-                context_options = {
-                    'viewport': {'width': 1920, 'height': 1080},
-                    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'locale': 'en-US',
-                    'timezone_id': 'America/New_York',
-                }
-
-                # Use storage_state if provided (includes cookies + localStorage + sessionStorage)
-                if storage_state:
-                    context_options['storage_state'] = storage_state
-
-                context = await browser.new_context(**context_options)
+        except Exception as e:
+            self.logger.error(f"❌ [BROWSER FETCH ASYNC] Error: {e}")
+            return False, None, f"Error: {str(e)}"
 
-                # Only inject cookies manually if storage_state not provided
-                if not storage_state and cookies:
-                    await self._inject_cookies_async(context, cookies, url)
+    async def _fetch_in_context_async(self, context, url: str, cookies: Optional[Dict], storage_state: Optional[Dict]) -> Tuple[bool, Optional[str], str]:
+        """Navigate to url in a fresh browser context and extract the rendered HTML"""
+        # Only inject cookies manually if storage_state not provided
+        if not storage_state and cookies:
+            await self._inject_cookies_async(context, cookies, url)
 
-                # Create page and navigate
-                page = await context.new_page()
+        # Create page and navigate
+        page = await context.new_page()
 
-                # Additional stealth: hide webdriver property
-                await page.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
+        # Additional stealth: hide webdriver property
+        await page.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            });
+        """)
 
-                self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Navigating to URL...")
+        self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Navigating to URL...")
 
-                try:
-                    # Navigate with timeout
-                    response = await page.goto(url, timeout=self.timeout, wait_until='networkidle')
-
-                    if response:
-                        self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Response status: {response.status}")
-
-                    # Check for bot detection challenges and wait for manual completion
-                    await self._handle_bot_challenges_async(page, url)
-
-                    # Check if Q4 Inc URL and perform automated login if needed
-                    if 'q4inc.com' in url:
-                        q4_email = os.getenv('Q4_EMAIL')
-                        q4_password = os.getenv('Q4_PASSWORD')
-
-                        if q4_email and q4_password:
-                            # Wait for page to render and check if login is needed
-                            await page.wait_for_timeout(2000)
-
-                            # Check if we're on a registration/login page
-                            register_button = page.locator('button:has-text("Register with a Q4 Account")')
-                            has_register_button = await register_button.count() > 0
-
-                            if has_register_button:
-                                self.logger.info("🔐 [Q4 AUTH] Detected Q4 registration page, performing automated login...")
-
-                                # Use generalized authenticator
-                                q4_config = get_q4_config(email=q4_email, password=q4_password)
-                                login_success = await self.authenticator.login(page, q4_config)
-
-                                if login_success:
-                                    self.logger.info("✅ [Q4 AUTH] Automated login successful")
-                                    # Wait for React app to load and video element to appear
-                                    self.logger.info("⏳ [Q4 AUTH] Waiting for React app and video element to load...")
-                                    try:
-                                        await page.wait_for_selector('video', timeout=15000, state='attached')
-                                        self.logger.info("✅ [Q4 AUTH] Video element loaded successfully")
-                                        # Give video a bit more time to be fully ready
-                                        await page.wait_for_timeout(2000)
-                                    except AsyncPlaywrightTimeoutError:
-                                        self.logger.warning("⚠️ [Q4 AUTH] Video element not found after login, continuing anyway...")
-                                        await page.wait_for_timeout(3000)
-                                else:
-                                    self.logger.error("❌ [Q4 AUTH] Automated login failed")
-                            else:
-                                self.logger.info("✅ [Q4 AUTH] Already authenticated (no registration page)")
+        try:
+            # Navigate with timeout
+            response = await page.goto(url, timeout=self.timeout, wait_until='networkidle')
+
+            if response:
+                self.logger.info(f"🌐 [BROWSER FETCH ASYNC] Response status: {response.status}")
+
+            # Check for bot detection challenges and wait for manual completion
+            await self._handle_bot_challenges_async(page, url)
+
+            # Check if Q4 Inc URL and perform automated login if needed
+            if 'q4inc.com' in url:
+                q4_email = os.getenv('Q4_EMAIL')
+                q4_password = os.getenv('Q4_PASSWORD')
+
+                if q4_email and q4_password:
+                    # Wait for page to render and check if login is needed
+                    await page.wait_for_timeout(2000)
+
+                    # Check if we're on a registration/login page
+                    register_button = page.locator('button:has-text("Register with a Q4 Account")')
+                    has_register_button = await register_button.count() > 0
+
+                    if has_register_button:
+                        self.logger.info("🔐 [Q4 AUTH] Detected Q4 registration page, performing automated login...")
+
+                        # Use generalized authenticator
+                        q4_config = get_q4_config(email=q4_email, password=q4_password)
+                        login_success = await self.authenticator.login(page, q4_config)
+
+                        if login_success:
+                            self.logger.info("✅ [Q4 AUTH] Automated login successful")
+                            # Wait for React app to load and video element to appear
+                            self.logger.info("⏳ [Q4 AUTH] Waiting for React app and video element to load...")
+                            try:
+                                await page.wait_for_selector('video', timeout=15000, state='attached')
+                                self.logger.info("✅ [Q4 AUTH] Video element loaded successfully")
+                                # Give video a bit more time to be fully ready
+                                await page.wait_for_timeout(2000)
+                            except AsyncPlaywrightTimeoutError:
+                                self.logger.warning("⚠️ [Q4 AUTH] Video element not found after login, continuing anyway...")
+                                await page.wait_for_timeout(3000)
                         else:
-                            self.logger.warning("⚠️ [Q4 AUTH] Q4_EMAIL or Q4_PASSWORD not set in environment")
-
-                    # Wait for content to load
-                    success = await self._wait_for_content_async(page)
-
-                    if not success:
-                        self.logger.warning("⚠️ [BROWSER FETCH ASYNC] Content did not load within timeout")
-
-                    # Wait for potential dynamic video embeds (e.g., Loom iframes)
-                    try:
-                        self.logger.info(f"⏳ [BROWSER FETCH ASYNC] Waiting for dynamic content (iframes)...")
-                        await page.wait_for_selector('iframe', timeout=5000)
-                        self.logger.info(f"✅ [BROWSER FETCH ASYNC] Iframe(s) detected")
-                        # Wait a bit more for iframe content to fully load
-                        await page.wait_for_timeout(2000)
-
-                        # Extract iframe and surrounding context using JavaScript
-                        video_info = await page.evaluate("""
-                            () => {
-                                const iframes = document.querySelectorAll('iframe');
-                                const videoData = [];
-                                iframes.forEach(iframe => {
-                                    const src = iframe.src || iframe.getAttribute('data-src') || '';
-                                    const parent = iframe.parentElement;
-                                    const parentHtml = parent ? parent.outerHTML.substring(0, 500) : '';
-                                    videoData.push({
-                                        src: src,
-                                        parentHtml: parentHtml
-                                    });
-                                });
-                                return videoData;
-                            }
-                        """)
-
-                        if video_info:
-                            self.logger.info(f"📹 [VIDEO EMBEDS] Found {len(video_info)} iframes")
-                            for i, vid in enumerate(video_info[:3]):
-                                src_preview = vid['src'][:100] if vid['src'] else 'no-src'
-                                self.logger.info(f"   Iframe {i+1}: {src_preview}...")
-                                # Check if parent HTML contains loom.com references
-                                if 'loom.com' in vid.get('parentHtml', '').lower():
-                                    self.logger.info(f"   🎯 Found loom.com reference in parent HTML")
-
-                    except Exception as e:
-                        self.logger.info(f"ℹ️ [BROWSER FETCH ASYNC] No iframes detected or timeout: {e}")
-
-                    # Take screenshot for debugging
-                    screenshot_path = await self._take_screenshot_async(page, url)
-                    self.logger.info(f"📸 [BROWSER FETCH ASYNC] Screenshot saved: {screenshot_path}")
-
-                    # Extract HTML - use evaluate to get the full DOM including all attributes
-                    # document.documentElement.outerHTML captures everything including data attributes
-                    html_content = await page.evaluate("() => document.documentElement.outerHTML")
-                    self.logger.info(f"✅ [HTML EXTRACTION] Extracted {len(html_content)} chars using document.outerHTML")
-
-                    # If we have original HTML with video URLs, prefer that for video detection
-                    # (Some sites like GitBook use iframe.ly which replaces URLs after JS runs)
-                    if hasattr(page, '_original_html') and page._original_html:
-                        self.logger.info(f"✅ [USING ORIGINAL HTML] Using original response HTML (contains video URLs before JS modification)")
-                        html_content = page._original_html
-                    elif hasattr(page, '_api_responses_with_video') and page._api_responses_with_video:
-                        # If video URLs were found in API responses, inject them into the HTML
-                        self.logger.info(f"✅ [USING API DATA] Found {len(page._api_responses_with_video)} API responses with video URLs")
-                        # Append the API response data to the HTML for video detection
-                        for api_resp in page._api_responses_with_video[:3]:
-                            html_content += f"\n<!-- API Response Data: {api_resp['text'][:1000]} -->"
-
-                    # Try to detect logged-in user from page content
-                    logged_in_user = await self._detect_logged_in_user_from_page_async(page)
-                    if logged_in_user:
-                        self.logger.info(f"✅ [BROWSER FETCH ASYNC] Successfully fetched {len(html_content)} chars - authenticated as: {logged_in_user}")
+                            self.logger.error("❌ [Q4 AUTH] Automated login failed")
                     else:
-                        self.logger.info(f"✅ [BROWSER FETCH ASYNC] Successfully fetched {len(html_content)} chars")
+                        self.logger.info("✅ [Q4 AUTH] Already authenticated (no registration page)")
+                else:
+                    self.logger.warning("⚠️ [Q4 AUTH] Q4_EMAIL or Q4_PASSWORD not set in environment")
 
-                    await browser.close()
-                    return True, html_content, "Success"
+            # Wait for content to load
+            success = await self._wait_for_content_async(page)
 
-                except PlaywrightTimeoutError as e:
-                    self.logger.error(f"❌ [BROWSER FETCH ASYNC] Timeout: {e}")
+            if not success:
+                self.logger.warning("⚠️ [BROWSER FETCH ASYNC] Content did not load within timeout")
 
-                    if self.screenshot_on_error:
-                        screenshot_path = await self._take_screenshot_async(page, url)
-                        self.logger.info(f"📸 [BROWSER FETCH ASYNC] Screenshot saved: {screenshot_path}")
+            # Wait for potential dynamic video embeds (e.g., Loom iframes)
+            try:
+                self.logger.info(f"⏳ [BROWSER FETCH ASYNC] Waiting for dynamic content (iframes)...")
+                await page.wait_for_selector('iframe', timeout=5000)
+                self.logger.info(f"✅ [BROWSER FETCH ASYNC] Iframe(s) detected")
+                # Wait a bit more for iframe content to fully load
+                await page.wait_for_timeout(2000)
 
-                    await browser.close()
-                    return False, None, f"Timeout: {str(e)}"
+                # Extract iframe and surrounding context using JavaScript
+                video_info = await page.evaluate("""
+                    () => {
+                        const iframes = document.querySelectorAll('iframe');
+                        const videoData = [];
+                        iframes.forEach(iframe => {
+                            const src = iframe.src || iframe.getAttribute('data-src') || '';
+                            const parent = iframe.parentElement;
+                            const parentHtml = parent ? parent.outerHTML.substring(0, 500) : '';
+                            videoData.push({
+                                src: src,
+                                parentHtml: parentHtml
+                            });
+                        });
+                        return videoData;
+                    }
+                """)
 
-        except Exception as e:
-            self.logger.error(f"❌ [BROWSER FETCH ASYNC] Error: {e}")
-            return False, None, f"Error: {str(e)}"
+                if video_info:
+                    self.logger.info(f"📹 [VIDEO EMBEDS] Found {len(video_info)} iframes")
+                    for i, vid in enumerate(video_info[:3]):
+                        src_preview = vid['src'][:100] if vid['src'] else 'no-src'
+                        self.logger.info(f"   Iframe {i+1}: {src_preview}...")
+                        # Check if parent HTML contains loom.com references
+                        if 'loom.com' in vid.get('parentHtml', '').lower():
+                            self.logger.info(f"   🎯 Found loom.com reference in parent HTML")
+
+            except Exception as e:
+                self.logger.info(f"ℹ️ [BROWSER FETCH ASYNC] No iframes detected or timeout: {e}")
+
+            # Take screenshot for debugging
+            screenshot_path = await self._take_screenshot_async(page, url)
+            self.logger.info(f"📸 [BROWSER FETCH ASYNC] Screenshot saved: {screenshot_path}")
+
+            # Extract HTML - use evaluate to get the full DOM including all attributes
+            # document.documentElement.outerHTML captures everything including data attributes
+            html_content = await page.evaluate("() => document.documentElement.outerHTML")
+            self.logger.info(f"✅ [HTML EXTRACTION] Extracted {len(html_content)} chars using document.outerHTML")
+
+            # If we have original HTML with video URLs, prefer that for video detection
+            # (Some sites like GitBook use iframe.ly which replaces URLs after JS runs)
+            if hasattr(page, '_original_html') and page._original_html:
+                self.logger.info(f"✅ [USING ORIGINAL HTML] Using original response HTML (contains video URLs before JS modification)")
+                html_content = page._original_html
+            elif hasattr(page, '_api_responses_with_video') and page._api_responses_with_video:
+                # If video URLs were found in API responses, inject them into the HTML
+                self.logger.info(f"✅ [USING API DATA] Found {len(page._api_responses_with_video)} API responses with video URLs")
+                # Append the API response data to the HTML for video detection
+                for api_resp in page._api_responses_with_video[:3]:
+                    html_content += f"\n<!-- API Response Data: {api_resp['text'][:1000]} -->"
+
+            # Try to detect logged-in user from page content
+            logged_in_user = await self._detect_logged_in_user_from_page_async(page)
+            if logged_in_user:
+                self.logger.info(f"✅ [BROWSER FETCH ASYNC] Successfully fetched {len(html_content)} chars - authenticated as: {logged_in_user}")
+            else:
+                self.logger.info(f"✅ [BROWSER FETCH ASYNC] Successfully fetched {len(html_content)} chars")
+
+            return True, html_content, "Success"
+
+        except PlaywrightTimeoutError as e:
+            self.logger.error(f"❌ [BROWSER FETCH ASYNC] Timeout: {e}")
+
+            if self.screenshot_on_error:
+                screenshot_path = await self._take_screenshot_async(page, url)
+                self.logger.info(f"📸 [BROWSER FETCH ASYNC] Screenshot saved: {screenshot_path}")
+
+            return False, None, f"Timeout: {str(e)}"
 
     def should_use_browser_fetch(self, url: str, response: Optional[requests.Response] = None) -> bool:
         """
@@ -0,0 +1,299 @@
+"""
+Browser Pool Module
+
+Keeps warm Chromium instances alive for the lifetime of the FastAPI app so
+paywalled fetches only pay for navigation, not browser startup.
+
+- Each pool owns N browsers; a request checks one out exclusively and gets a
+  fresh context (built from the caller's cached storage_state), so cookies and
+  storage never leak between requests
+- Browsers are health-checked on checkout and recycled after K pages
+- Q4 Inc pages need media-enabled args that are incompatible with
+  --single-process, so they get their own (lazily launched) pool
+
+Lifecycle is owned by app/main.py lifespan:
+    await start_browser_pools()
+    ...
+    await stop_browser_pools()
+
+Callers (BrowserFetcher) use get_browser_pool() and fall back to launching a
+one-off browser when no pool is running (CLI scripts, earnings_insights).
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+DEFAULT_POOL = "default"
+Q4_POOL = "q4"
+
+
+def build_browser_args(media_enabled: bool = False) -> List[str]:
+    """
+    Chromium launch args for regular fetches or Q4 Inc media pages
+
+    Args:
+        media_enabled: True for Q4 Inc pages (heavy JS/WebAssembly video player
+            that crashes with --single-process)
+    """
+    # Base args that work for most sites
+    browser_args = [
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+    ]
+
+    if not media_enabled:
+        browser_args.extend([
+            '--single-process',
+            '--no-zygote',
+            '--disable-gpu',
+        ])
+    else:
+        # Q4-specific args: enable media features for video player
+        browser_args.extend([
+            '--enable-features=WebRTC,WebAudio,MediaStreamTrack',
+            '--use-fake-ui-for-media-stream',  # Auto-grant media permissions
+            '--use-fake-device-for-media-stream',  # Provide fake media devices
+            '--autoplay-policy=no-user-gesture-required',  # Allow autoplay
+            '--disable-features=IsolateOrigins,site-per-process',  # Better compatibility
+        ])
+
+    return browser_args
+
+
+@dataclass
+class _PooledBrowser:
+    """A pool slot; browser is None until launched (or after a failed relaunch)"""
+    browser: Any = None
+    pages_served: int = 0
+
+
+class BrowserPool:
+    """Fixed-size pool of Chromium browsers with per-request contexts"""
+
+    def __init__(
+        self,
+        name: str,
+        browser_args: List[str],
+        size: int,
+        max_pages_per_browser: int,
+        headless: bool = True,
+        warm: bool = True
+    ):
+        """
+        Args:
+            name: Pool name for logging/status
+            browser_args: Chromium launch args
+            size: Number of browsers (= max concurrent fetches)
+            max_pages_per_browser: Recycle a browser after serving this many pages
+            headless: Launch headless
+            warm: Launch all browsers at start() instead of on first use
+        """
+        self.name = name
+        self.browser_args = browser_args
+        self.size = max(1, size)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.headless = headless
+        self.warm = warm
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+        self._playwright = None
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._slots: List[_PooledBrowser] = []
+        self._pages_total = 0
+        self._recycled_total = 0
+
+    async def start(self, playwright) -> None:
+        """Create the pool slots and launch browsers if warm"""
+        self._playwright = playwright
+        for _ in range(self.size):
+            slot = _PooledBrowser()
+            if self.warm:
+                await self._launch(slot)
+            self._slots.append(slot)
+            self._idle.put_nowait(slot)
+
+        launched = sum(1 for slot in self._slots if slot.browser)
+        self.logger.info(f"🏊 [BROWSER POOL:{self.name}] Ready with {self.size} slots ({launched} warm)")
+
+    async def stop(self) -> None:
+        """Close every browser in the pool"""
+        for slot in self._slots:
+            await self._close(slot)
+        self._slots.clear()
+        self.logger.info(f"👋 [BROWSER POOL:{self.name}] Stopped")
+
+    @asynccontextmanager
+    async def context(self, **context_options) -> AsyncIterator[Any]:
+        """
+        Check out a browser and yield a fresh context on it
+
+        The context is closed (and the browser returned or recycled) on exit.
+        """
+        slot = await self._acquire()
+        context = None
+        try:
+            context = await slot.browser.new_context(**context_options)
+            yield context
+        finally:
+            if context:
+                try:
+                    await context.close()
+                except Exception as e:
+                    self.logger.debug(f"[BROWSER POOL:{self.name}] Context close failed: {e}")
+            slot.pages_served += 1
+            self._pages_total += 1
+            await self._release(slot)
+
+    def status(self) -> Dict:
+        """Pool statistics for the health endpoint"""
+        return {
+            'size': self.size,
+            'idle': self._idle.qsize(),
+            'launched': sum(1 for slot in self._slots if slot.browser and slot.browser.is_connected()),
+            'pages_served': self._pages_total,
+            'recycled': self._recycled_total,
+            'max_pages_per_browser': self.max_pages_per_browser,
+        }
+
+    async def _acquire(self) -> _PooledBrowser:
+        slot = await self._idle.get()
+        try:
+            if not self._is_healthy(slot):
+                if slot.browser:
+                    self.logger.warning(f"⚠️ [BROWSER POOL:{self.name}] Browser disconnected, relaunching")
+                await self._close(slot)
+                await self._launch(slot)
+            return slot
+        except BaseException:
+            # Keep the slot in circulation even if the launch failed
+            self._idle.put_nowait(slot)
+            raise
+
+    async def _release(self, slot: _PooledBrowser) -> None:
+        if slot.pages_served >= self.max_pages_per_browser:
+            self.logger.info(f"♻️ [BROWSER POOL:{self.name}] Recycling browser after {slot.pages_served} pages")
+            await self._close(slot)
+            self._recycled_total += 1
+            try:
+                await self._launch(slot)
+            except Exception as e:
+                # Slot stays empty; next checkout will retry the launch
+                self.logger.warning(f"⚠️ [BROWSER POOL:{self.name}] Relaunch failed: {e}")
+        self._idle.put_nowait(slot)
+
+    async def _launch(self, slot: _PooledBrowser) -> None:
+        slot.browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=self.browser_args
+        )
+        slot.pages_served = 0
+
+    async def _close(self, slot: _PooledBrowser) -> None:
+        if slot.browser:
+            try:
+                await slot.browser.close()
+            except Exception as e:
+                self.logger.debug(f"[BROWSER POOL:{self.name}] Browser close failed: {e}")
+        slot.browser = None
+
+    @staticmethod
+    def _is_healthy(slot: _PooledBrowser) -> bool:
+        return slot.browser is not None and slot.browser.is_connected()
+
+
+# Process-wide pools, started/stopped by the FastAPI lifespan
+_playwright_manager = None
+_playwright = None
+_pools: Dict[str, BrowserPool] = {}
+
+
+async def start_browser_pools() -> bool:
+    """
+    Start Playwright and the default + Q4 browser pools
+
+    Configured with BROWSER_POOL_ENABLED, BROWSER_POOL_SIZE,
+    BROWSER_POOL_Q4_SIZE and BROWSER_POOL_MAX_PAGES.
+
+    Returns:
+        True if pools are running
+    """
+    global _playwright_manager, _playwright
+
+    if _pools:
+        return True
+    if not PLAYWRIGHT_AVAILABLE:
+        logger.warning("⚠️ [BROWSER POOL] Playwright not available - pools disabled")
+        return False
+    if os.getenv('BROWSER_POOL_ENABLED', 'true').lower() != 'true':
+        logger.info("ℹ️ [BROWSER POOL] Disabled via BROWSER_POOL_ENABLED")
+        return False
+
+    headless = os.getenv('PLAYWRIGHT_HEADLESS', 'true').lower() == 'true'
+    max_pages = int(os.getenv('BROWSER_POOL_MAX_PAGES', '50'))
+
+    try:
+        _playwright_manager = async_playwright()
+        _playwright = await _playwright_manager.start()
+
+        pools = {
+            DEFAULT_POOL: BrowserPool(
+                DEFAULT_POOL, build_browser_args(media_enabled=False),
+                size=int(os.getenv('BROWSER_POOL_SIZE', '2')),
+                max_pages_per_browser=max_pages, headless=headless, warm=True
+            ),
+            Q4_POOL: BrowserPool(
+                Q4_POOL, build_browser_args(media_enabled=True),
+                size=int(os.getenv('BROWSER_POOL_Q4_SIZE', '1')),
+                max_pages_per_browser=max_pages, headless=headless, warm=False
+            ),
+        }
+        for pool in pools.values():
+            await pool.start(_playwright)
+        _pools.update(pools)
+        return True
+
+    except Exception as e:
+        logger.error(f"❌ [BROWSER POOL] Failed to start: {e}")
+        await stop_browser_pools()
+        return False
+
+
+async def stop_browser_pools() -> None:
+    """Close all pooled browsers and stop Playwright"""
+    global _playwright_manager, _playwright
+
+    for pool in list(_pools.values()):
+        await pool.stop()
+    _pools.clear()
+
+    if _playwright_manager:
+        try:
+            await _playwright_manager.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"[BROWSER POOL] Playwright stop failed: {e}")
+    _playwright_manager = None
+    _playwright = None
+
+
+def get_browser_pool(name: str = DEFAULT_POOL) -> Optional[BrowserPool]:
+    """Return a running pool, or None if pools are not started in this process"""
+    return _pools.get(name)
+
+
+def browser_pool_status() -> Dict:
+    """Status of all running pools (empty if pools are not started)"""
+    return {name: pool.status() for name, pool in _pools.items()}
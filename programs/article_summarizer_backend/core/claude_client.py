@@ -2,14 +2,108 @@
 """
 Claude CLI Client
 Handles all interactions with Claude CLI (via Braintrust proxy)
+
+The OpenAI-compatible clients (and their pooled HTTP transports) are created
+once per process and shared by every ClaudeClient, so repeated summary and
+themed-insights calls reuse keep-alive connections to the proxy instead of
+paying a TLS handshake each time.
 """
 
-import subprocess
+import asyncio
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator
 import braintrust
-from openai import OpenAI
+import httpx
+from dotenv import load_dotenv
+from openai import APITimeoutError, AsyncOpenAI, OpenAI
+
+BRAINTRUST_PROXY_URL = "https://api.braintrust.dev/v1/proxy"
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+CLAUDE_MAX_TOKENS = 8000
+CLAUDE_TIMEOUT_SECONDS = float(os.getenv('CLAUDE_TIMEOUT_SECONDS', '300'))
+
+# Process-wide clients, created lazily on first use
+_client_lock = threading.Lock()
+_sync_client = None
+_async_clients = {}  # event loop -> wrapped AsyncOpenAI (httpx async pools are loop-bound)
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv('CLAUDE_MAX_CONNECTIONS', '10')),
+        max_keepalive_connections=int(os.getenv('CLAUDE_MAX_KEEPALIVE', '5')),
+        keepalive_expiry=60.0
+    )
+
+
+def _get_api_key(base_dir: Path) -> str:
+    api_key = os.getenv('ANTHROPIC_API_KEY')
+    if not api_key:
+        # Load environment variables from root .env.local (only when not already loaded)
+        load_dotenv(base_dir / '.env.local')
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+    return api_key
+
+
+def get_shared_client(base_dir: Path):
+    """
+    Process-wide Braintrust-wrapped OpenAI client (proxy translates to Anthropic)
+
+    Args:
+        base_dir: Repository root, used to locate .env.local
+
+    Returns:
+        Wrapped OpenAI client with a pooled keep-alive transport
+    """
+    global _sync_client
+
+    with _client_lock:
+        if _sync_client is None:
+            _sync_client = braintrust.wrap_openai(
+                OpenAI(
+                    base_url=BRAINTRUST_PROXY_URL,
+                    api_key=_get_api_key(base_dir),  # Anthropic API key
+                    timeout=CLAUDE_TIMEOUT_SECONDS,
+                    http_client=httpx.Client(limits=_http_limits(), timeout=CLAUDE_TIMEOUT_SECONDS)
+                )
+            )
+        return _sync_client
+
+
+def get_shared_async_client(base_dir: Path):
+    """
+    Braintrust-wrapped AsyncOpenAI client shared within the running event loop
+
+    Args:
+        base_dir: Repository root, used to locate .env.local
+
+    Returns:
+        Wrapped AsyncOpenAI client with a pooled keep-alive transport
+    """
+    loop = asyncio.get_running_loop()
+
+    with _client_lock:
+        # Drop clients whose loop has gone away (e.g. repeated asyncio.run() in scripts)
+        for stale_loop in [l for l in _async_clients if l.is_closed()]:
+            del _async_clients[stale_loop]
+
+        client = _async_clients.get(loop)
+        if client is None:
+            client = braintrust.wrap_openai(
+                AsyncOpenAI(
+                    base_url=BRAINTRUST_PROXY_URL,
+                    api_key=_get_api_key(base_dir),  # Anthropic API key
+                    timeout=CLAUDE_TIMEOUT_SECONDS,
+                    http_client=httpx.AsyncClient(limits=_http_limits(), timeout=CLAUDE_TIMEOUT_SECONDS)
+                )
+            )
+            _async_clients[loop] = client
+        return client
 
 
 class ClaudeClient:
@@ -30,6 +124,9 @@ class ClaudeClient:
         self.logs_dir = base_dir / "programs" / "article_summarizer_backend" / "logs"
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
+        # Full prompt/response dumps are opt-in (they can be 150KB+ per call)
+        self.debug_dump = os.getenv('CLAUDE_DEBUG_DUMP', 'false').lower() == 'true'
+
         # Initialize Braintrust (will use BRAINTRUST_API_KEY env var)
         try:
             braintrust.login()
@@ -49,101 +146,133 @@ class ClaudeClient:
             Claude's response as a string
         """
         try:
-            # Log prompt details
-            prompt_length = len(prompt)
-            self.logger.info(f"   🤖 [CLAUDE API] Sending prompt ({prompt_length} chars)")
-
-            # Save prompt to debug file
-            debug_file = self.logs_dir / "debug_prompt.txt"
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(prompt)
-            self.logger.info(f"   💾 [DEBUG] Full prompt saved to: {debug_file}")
-
-            # Use OpenAI client with Braintrust proxy for Claude API
-            # This automatically logs all calls to Braintrust dashboard
-            self.logger.info(f"   🔧 [DEBUG] Using OpenAI client with Braintrust proxy")
-            self.logger.info(f"   🔧 [DEBUG] Prompt length: {len(prompt)} chars")
-
-            import os
-            from dotenv import load_dotenv
-
-            # Load environment variables from root .env.local
-            env_file = self.base_dir / '.env.local'
-            load_dotenv(env_file)
-
-            # Get API key from environment (Anthropic key for proxy)
-            api_key = os.getenv('ANTHROPIC_API_KEY')
-            if not api_key:
-                raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-
-            # Create OpenAI client with Braintrust proxy
-            # The proxy translates OpenAI API calls to Anthropic API calls
-            client = braintrust.wrap_openai(
-                OpenAI(
-                    base_url="https://api.braintrust.dev/v1/proxy",
-                    api_key=api_key  # Anthropic API key
-                )
-            )
+            self.logger.info(f"   🤖 [CLAUDE API] Sending prompt ({len(prompt)} chars)")
+            if self.debug_dump:
+                self._dump_prompt(prompt)
 
             # Use OpenAI-style chat completions (proxy converts to Anthropic format)
-            message = client.chat.completions.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
+            # The wrapped client automatically logs all calls to Braintrust dashboard
+            message = get_shared_client(self.base_dir).chat.completions.create(
+                **self._request_kwargs(prompt)
             )
+            response = (message.choices[0].message.content or '').strip()
 
-            response = message.choices[0].message.content
+            if self.debug_dump:
+                self._dump_response(response)
 
-            result = type('Result', (), {
-                'returncode': 0,
-                'stdout': response,
-                'stderr': ''
-            })()
+            return self._check_response(response)
 
-            # Log result details
-            self.logger.info(f"   🔧 [DEBUG] Return code: {result.returncode}")
-            self.logger.info(f"   🔧 [DEBUG] STDOUT length: {len(result.stdout)} chars")
-            self.logger.info(f"   🔧 [DEBUG] STDERR length: {len(result.stderr)} chars")
+        except APITimeoutError as e:
+            self.logger.error(f"   ❌ Claude API call timed out after {CLAUDE_TIMEOUT_SECONDS:.0f} seconds")
+            raise TimeoutError(f"Claude API call timed out after {CLAUDE_TIMEOUT_SECONDS:.0f} seconds") from e
+        except Exception as e:
+            self.logger.error(f"   ❌ Exception in Claude API call: {str(e)}")
+            # Re-raise the exception instead of returning error string
+            raise
+
+    async def acall_api(self, prompt: str) -> str:
+        """
+        Async version of call_api - awaits the proxy without tying up a worker thread
+
+        Args:
+            prompt: The prompt to send to Claude
+
+        Returns:
+            Claude's response as a string
+        """
+        try:
+            self.logger.info(f"   🤖 [CLAUDE API] Sending prompt ({len(prompt)} chars)")
+            if self.debug_dump:
+                await asyncio.to_thread(self._dump_prompt, prompt)
+
+            message = await get_shared_async_client(self.base_dir).chat.completions.create(
+                **self._request_kwargs(prompt)
+            )
+            response = (message.choices[0].message.content or '').strip()
+
+            if self.debug_dump:
+                await asyncio.to_thread(self._dump_response, response)
 
-            # Save response and stderr for debugging
-            response_file = self.logs_dir / "debug_response.txt"
-            stderr_file = self.logs_dir / "debug_stderr.txt"
+            return self._check_response(response)
 
-            response = result.stdout.strip()
-            stderr = result.stderr.strip()
+        except APITimeoutError as e:
+            self.logger.error(f"   ❌ Claude API call timed out after {CLAUDE_TIMEOUT_SECONDS:.0f} seconds")
+            raise TimeoutError(f"Claude API call timed out after {CLAUDE_TIMEOUT_SECONDS:.0f} seconds") from e
+        except Exception as e:
+            self.logger.error(f"   ❌ Exception in Claude API call: {str(e)}")
+            raise
 
-            with open(response_file, 'w', encoding='utf-8') as f:
-                f.write(f"=== CLAUDE RESPONSE ({len(response)} chars) ===\n")
-                f.write(response)
-                f.write(f"\n=== END RESPONSE ===\n")
+    async def astream_api(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream Claude's response as text deltas
 
-            with open(stderr_file, 'w', encoding='utf-8') as f:
-                f.write(f"=== STDERR (return code: {result.returncode}) ===\n")
-                f.write(stderr)
-                f.write(f"\n=== END STDERR ===\n")
+        Args:
+            prompt: The prompt to send to Claude
 
-            self.logger.info(f"   💾 [DEBUG] Response saved to: {response_file}")
-            self.logger.info(f"   💾 [DEBUG] Stderr saved to: {stderr_file}")
+        Yields:
+            Text fragments in generation order
+        """
+        chunks = []
+        try:
+            self.logger.info(f"   🤖 [CLAUDE API] Streaming prompt ({len(prompt)} chars)")
+            if self.debug_dump:
+                await asyncio.to_thread(self._dump_prompt, prompt)
 
-            # Check for errors
-            if result.returncode != 0:
-                self.logger.error(f"   ❌ Claude API failed with return code {result.returncode}")
-                self.logger.error(f"   ❌ Stderr: {stderr[:500]}")
-                raise RuntimeError(f"Claude API failed with return code {result.returncode}: {stderr}")
+            stream = await get_shared_async_client(self.base_dir).chat.completions.create(
+                **self._request_kwargs(prompt),
+                stream=True
+            )
+            async for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield delta
 
-            if not response:
-                self.logger.warning(f"   ⚠️ Claude API returned empty response (stderr: {stderr[:200]})")
-                raise RuntimeError(f"Claude API returned empty response: {stderr}")
+            response = ''.join(chunks).strip()
+            if self.debug_dump:
+                await asyncio.to_thread(self._dump_response, response)
 
-            return response
+            self._check_response(response)
 
-        except subprocess.TimeoutExpired as e:
-            self.logger.error("   ❌ Claude API call timed out after 300 seconds")
-            raise TimeoutError("Claude API call timed out after 300 seconds") from e
+        except APITimeoutError as e:
+            self.logger.error(f"   ❌ Claude API stream timed out after {CLAUDE_TIMEOUT_SECONDS:.0f} seconds")
+            raise TimeoutError(f"Claude API call timed out after {CLAUDE_TIMEOUT_SECONDS:.0f} seconds") from e
         except Exception as e:
-            self.logger.error(f"   ❌ Exception in Claude API call: {str(e)}")
-            # Re-raise the exception instead of returning error string
+            self.logger.error(f"   ❌ Exception in Claude API stream: {str(e)}")
             raise
+
+    @staticmethod
+    def _request_kwargs(prompt: str) -> dict:
+        return {
+            'model': CLAUDE_MODEL,
+            'max_tokens': CLAUDE_MAX_TOKENS,
+            'messages': [{
+                'role': 'user',
+                'content': prompt
+            }]
+        }
+
+    def _check_response(self, response: str) -> str:
+        self.logger.info(f"   🔧 [DEBUG] Response length: {len(response)} chars")
+        if not response:
+            self.logger.warning("   ⚠️ Claude API returned empty response")
+            raise RuntimeError("Claude API returned empty response")
+        return response
+
+    def _dump_prompt(self, prompt: str) -> None:
+        """Save the full prompt for debugging (CLAUDE_DEBUG_DUMP=true)"""
+        debug_file = self.logs_dir / "debug_prompt.txt"
+        with open(debug_file, 'w', encoding='utf-8') as f:
+            f.write(prompt)
+        self.logger.info(f"   💾 [DEBUG] Full prompt saved to: {debug_file}")
+
+    def _dump_response(self, response: str) -> None:
+        """Save the full response for debugging (CLAUDE_DEBUG_DUMP=true)"""
+        response_file = self.logs_dir / "debug_response.txt"
+        with open(response_file, 'w', encoding='utf-8') as f:
+            f.write(f"=== CLAUDE RESPONSE ({len(response)} chars) ===\n")
+            f.write(response)
+            f.write(f"\n=== END RESPONSE ===\n")
+        self.logger.info(f"   💾 [DEBUG] Response saved to: {response_file}")
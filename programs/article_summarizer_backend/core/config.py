@@ -33,9 +33,12 @@ class Config:
     # Claude API settings
     CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
     CLAUDE_MAX_TOKENS = 8192
+    CLAUDE_STREAMING = os.getenv('CLAUDE_STREAMING', 'true').lower() == 'true'  # Stream summaries as partial SSE events
 
     # DeepGram API settings (used for audio/video transcription)
     DEEPGRAM_MODEL = "nova-2"  # DeepGram's latest model
+    DEEPGRAM_CHUNK_CONCURRENCY = int(os.getenv('DEEPGRAM_CHUNK_CONCURRENCY', '4'))  # Chunks in flight per file
+    DEEPGRAM_CHUNK_RETRIES = int(os.getenv('DEEPGRAM_CHUNK_RETRIES', '2'))  # Retries per failed chunk
 
     # Processing settings
     RSS_FEED_ENTRY_LIMIT = 10
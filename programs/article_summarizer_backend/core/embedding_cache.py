@@ -0,0 +1,196 @@
+"""
+Embedding Cache
+
+Caches embedding vectors keyed by a hash of the normalized input text, model
+and dimensions. Regenerating a summary often leaves the embedding text
+unchanged, and the same public article is saved for many users, so most
+repeat embeddings can skip OpenAI entirely.
+
+Tiers:
+- In-process LRU (shared by every ArticleProcessor in the process)
+- Supabase (optional): `embedding_cache` table (persistent, shared across
+  instances and the backfill script), enabled with EMBEDDING_CACHE_SUPABASE=true
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Keys per Supabase `in_` lookup (keeps the request URL short)
+SUPABASE_LOOKUP_CHUNK = 100
+
+
+def normalize_embedding_text(text: str) -> str:
+    """
+    Normalize text so cosmetic differences don't produce distinct cache keys
+
+    Applies Unicode NFC and collapses runs of whitespace.
+    """
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def make_embedding_key(text: str, model: str, dimensions: int) -> str:
+    """
+    Cache key for an already-normalized embedding input
+
+    Args:
+        text: Normalized input text
+        model: Embedding model name
+        dimensions: Requested vector dimensions
+
+    Returns:
+        Hex SHA-256 key
+    """
+    payload = json.dumps({'model': model, 'dimensions': dimensions, 'text': text}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache (in-process LRU + optional Supabase table)
+
+    Usage:
+        cache = get_embedding_cache()
+        found = cache.get_many(keys)        # {key: vector} for hits
+        cache.set_many({key: vector, ...})
+    """
+
+    TABLE_NAME = "embedding_cache"
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        use_supabase: Optional[bool] = None,
+        supabase=None
+    ):
+        """
+        Args:
+            max_entries: LRU capacity (default: EMBEDDING_CACHE_MAX_ENTRIES or 5000)
+            use_supabase: Enable the Supabase tier (default: EMBEDDING_CACHE_SUPABASE env var)
+            supabase: Existing Supabase client to use for the persistent tier
+        """
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.max_entries = max(1, max_entries or int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '5000')))
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if use_supabase is None:
+            use_supabase = os.getenv('EMBEDDING_CACHE_SUPABASE', 'false').lower() == 'true'
+
+        self.supabase = None
+        if use_supabase:
+            if supabase is not None:
+                self.supabase = supabase
+            else:
+                supabase_url = os.getenv('SUPABASE_URL')
+                supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+                if supabase_url and supabase_key:
+                    try:
+                        from supabase import create_client
+                        self.supabase = create_client(supabase_url, supabase_key)
+                    except Exception as e:
+                        self.logger.warning(f"⚠️ [EMBEDDING CACHE] Supabase tier disabled: {e}")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """Return {key: vector} for every key found in any tier"""
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        missing = []
+
+        with self._lock:
+            for key in unique_keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+                else:
+                    missing.append(key)
+
+        if missing and self.supabase:
+            remote = self._get_remote(missing)
+            if remote:
+                self._put_local(remote)
+                found.update(remote)
+
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """Store vectors in every enabled tier (failures are logged, not raised)"""
+        if not vectors:
+            return
+        self._put_local(vectors)
+
+        if self.supabase:
+            try:
+                self.supabase.table(self.TABLE_NAME).upsert(
+                    [{'cache_key': key, 'embedding': vector} for key, vector in vectors.items()],
+                    on_conflict='cache_key'
+                ).execute()
+            except Exception as e:
+                self._disable_remote(f"write failed: {e}")
+
+    def _put_local(self, vectors: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_remote(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        for start in range(0, len(keys), SUPABASE_LOOKUP_CHUNK):
+            chunk = keys[start:start + SUPABASE_LOOKUP_CHUNK]
+            try:
+                result = self.supabase.table(self.TABLE_NAME)\
+                    .select('cache_key, embedding')\
+                    .in_('cache_key', chunk)\
+                    .execute()
+            except Exception as e:
+                self._disable_remote(f"lookup failed: {e}")
+                break
+            for row in result.data or []:
+                found[row['cache_key']] = row['embedding']
+
+        if found:
+            self.logger.info(f"♻️ [EMBEDDING CACHE] Supabase hit for {len(found)}/{len(keys)} embeddings")
+        return found
+
+    def _disable_remote(self, reason: str) -> None:
+        # Most likely the migration hasn't been applied; don't retry on every call
+        self.logger.warning(f"⚠️ [EMBEDDING CACHE] Supabase tier {reason} - continuing with in-process cache only")
+        self.supabase = None
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Process-wide embedding cache, or None if EMBEDDING_CACHE_ENABLED=false
+
+    ArticleProcessor is created per request, so the LRU tier has to live at
+    module level to be useful across requests.
+    """
+    global _shared_cache
+
+    if os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() != 'true':
+        return None
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = EmbeddingCache()
+        return _shared_cache
@@ -0,0 +1,201 @@
+"""
+Embedding Service
+
+Batches OpenAI embedding requests: many texts per `embeddings.create` call
+(up to the API's per-request input limits), a bounded number of batches in
+flight, and exponential backoff on rate limits and transient errors.
+
+Inputs are normalized (see core/embedding_cache.py) and, when a cache is
+given, identical inputs are served from it instead of OpenAI.
+
+Used by ArticleProcessor for live article saves and by
+scripts/article_summarizer/backfill_embeddings.py for bulk backfills.
+"""
+
+import logging
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from core.embedding_cache import EmbeddingCache, make_embedding_key, normalize_embedding_text
+from openai import APIConnectionError, APITimeoutError, InternalServerError, OpenAI, RateLimitError
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 384  # Use 384 dimensions for performance
+
+# text-embedding-3-small accepts 8191 tokens per input; ~4 characters per token
+MAX_INPUT_CHARS = 32000
+# API limits per request: 2048 inputs and 300k tokens in total
+MAX_BATCH_INPUTS = 2048
+MAX_BATCH_CHARS = 800_000  # ~300k tokens even for dense (~3 chars/token) text
+
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+
+class EmbeddingService:
+    """
+    Generates embeddings in batched, concurrent, retried requests
+
+    Usage:
+        service = EmbeddingService(OpenAI(api_key=...))
+        vectors = service.embed_many(texts)  # same order as texts, None for failures
+        vector = service.embed_one(text)
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff_seconds: float = 1.0,
+        cache: Optional[EmbeddingCache] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            client: OpenAI client
+            batch_size: Texts per request (default: EMBEDDING_BATCH_SIZE or 256, capped at 2048)
+            max_concurrency: Batches in flight (default: EMBEDDING_CONCURRENCY or 4)
+            max_retries: Retries per batch on rate limits/transient errors (default: EMBEDDING_MAX_RETRIES or 5)
+            retry_backoff_seconds: Base delay for exponential backoff
+            cache: Optional EmbeddingCache consulted before calling OpenAI
+            logger: Logger instance
+        """
+        self.client = client
+        self.batch_size = min(MAX_BATCH_INPUTS, max(1, batch_size or int(os.getenv('EMBEDDING_BATCH_SIZE', '256'))))
+        self.max_concurrency = max(1, max_concurrency or int(os.getenv('EMBEDDING_CONCURRENCY', '4')))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('EMBEDDING_MAX_RETRIES', '5'))
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.cache = cache
+        self.logger = logger or logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    def embed_one(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a single text
+
+        Returns:
+            Embedding vector or None if generation fails
+        """
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Embed many texts with as few requests as possible
+
+        Args:
+            texts: Texts to embed (empty texts are skipped)
+
+        Returns:
+            Vectors in the same order as texts; None for empty texts or failed batches
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        inputs = self._prepare_inputs(texts)
+        if not inputs:
+            return results
+
+        keys = {}
+        if self.cache:
+            keys = {index: make_embedding_key(text, EMBEDDING_MODEL, EMBEDDING_DIMENSIONS) for index, text in inputs}
+            cached = self.cache.get_many(keys.values())
+            for index, key in keys.items():
+                if key in cached:
+                    results[index] = cached[key]
+            uncached = [(index, text) for index, text in inputs if results[index] is None]
+            if len(uncached) < len(inputs):
+                self.logger.info(f"   ♻️ [EMBEDDING] {len(inputs) - len(uncached)}/{len(inputs)} embeddings served from cache")
+            inputs = uncached
+
+        batches = self._build_batches(inputs)
+        if not batches:
+            return results
+
+        total_inputs = sum(len(batch) for batch in batches)
+        self.logger.info(
+            f"   📊 [EMBEDDING] Embedding {total_inputs} texts in {len(batches)} "
+            f"request(s), {min(self.max_concurrency, len(batches))} concurrent"
+        )
+
+        if len(batches) == 1:
+            self._run_batch(batches[0], results)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='embedding') as executor:
+                list(executor.map(lambda batch: self._run_batch(batch, results), batches))
+
+        generated = {index for index, _ in inputs if results[index] is not None}
+        self.logger.info(f"   ✅ [EMBEDDING] Generated {len(generated)}/{total_inputs} embeddings")
+
+        if self.cache and generated:
+            self.cache.set_many({keys[index]: results[index] for index in generated})
+        return results
+
+    @staticmethod
+    def _prepare_inputs(texts: Sequence[str]) -> List[tuple]:
+        """Normalize and truncate texts, dropping empty ones; returns (index, text) pairs"""
+        inputs = []
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            text = normalize_embedding_text(text)[:MAX_INPUT_CHARS]
+            if text:
+                inputs.append((index, text))
+        return inputs
+
+    def _build_batches(self, inputs: List[tuple]) -> List[List[tuple]]:
+        """Group (index, text) pairs into batches within the input-count and size limits"""
+        batches = []
+        current = []
+        current_chars = 0
+
+        for index, text in inputs:
+            if current and (len(current) >= self.batch_size or current_chars + len(text) > MAX_BATCH_CHARS):
+                batches.append(current)
+                current = []
+                current_chars = 0
+
+            current.append((index, text))
+            current_chars += len(text)
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _run_batch(self, batch: List[tuple], results: List[Optional[List[float]]]) -> None:
+        """Embed one batch with retries, writing vectors into results by original index"""
+        inputs = [text for _, text in batch]
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=inputs,
+                    dimensions=EMBEDDING_DIMENSIONS
+                )
+                for item in response.data:
+                    results[batch[item.index][0]] = item.embedding
+                return
+
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    self.logger.error(f"   ❌ [EMBEDDING] Batch of {len(batch)} failed after {attempt + 1} attempts: {e}")
+                    return
+                delay = self._retry_delay(e, attempt)
+                self.logger.warning(f"   ⚠️ [EMBEDDING] {type(e).__name__}, retrying batch of {len(batch)} in {delay:.1f}s")
+                time.sleep(delay)
+
+            except Exception as e:
+                self.logger.error(f"   ❌ [EMBEDDING] Failed to generate embeddings for batch of {len(batch)}: {e}")
+                return
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Honor Retry-After when the API sends it, else exponential backoff with jitter"""
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return self.retry_backoff_seconds * (2 ** attempt) + random.uniform(0, self.retry_backoff_seconds)
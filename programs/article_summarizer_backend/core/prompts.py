@@ -35,6 +35,9 @@ class ArticleAnalysisPrompt:
     MODEL = "claude-sonnet-4-20250514"
     MAX_TOKENS = 8000
 
+    # Top-level keys of the JSON response requested below (frame_summaries only when video frames exist)
+    RESPONSE_FIELDS = ('summary', 'key_insights', 'quotes', 'duration_minutes', 'word_count', 'topics', 'frame_summaries')
+
     @staticmethod
     def build(url: str, media_context: str, metadata: Dict) -> str:
         """
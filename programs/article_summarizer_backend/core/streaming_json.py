@@ -0,0 +1,138 @@
+"""
+Incremental JSON Parser
+
+Parses the top-level object of a streamed Claude response and reports each
+field as soon as its value is complete, so the UI can render `summary`
+before `key_insights` and `quotes` have finished generating.
+
+Only top-level fields are reported; nested values are returned whole once
+their closing bracket arrives. Anything before the first '{' (e.g. a
+```json fence) is ignored. The full response is still parsed normally at
+the end - this parser only drives early previews.
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+
+class IncrementalJSONParser:
+    """
+    Feed text chunks; get back (field, value) pairs for completed top-level fields
+
+    Usage:
+        parser = IncrementalJSONParser()
+        async for delta in stream:
+            for field, value in parser.feed(delta):
+                ...
+    """
+
+    def __init__(self):
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+        # Top-level field state: 'key' -> 'colon' -> 'value' -> 'key' ...
+        self._phase = 'key'
+        self._key: Optional[str] = None
+        self._capture: Optional[List[str]] = None  # Characters of the key/value being read
+
+    @property
+    def done(self) -> bool:
+        """True once the root object's closing brace has been seen"""
+        return self._done
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Consume the next chunk of streamed text
+
+        Args:
+            text: Newly received text
+
+        Returns:
+            List of (field, value) for top-level fields completed by this chunk
+        """
+        completed = []
+        if self._done or not text:
+            return completed
+
+        for char in text:
+            if not self._started:
+                if char == '{':
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            top_level = self._depth == 1
+
+            if self._in_string:
+                self._append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if top_level and self._phase == 'key' and self._capture is not None:
+                        self._key = self._decode(''.join(self._capture))
+                        self._capture = None
+                        self._phase = 'colon'
+                continue
+
+            if top_level and self._phase == 'colon':
+                if char == ':':
+                    self._phase = 'value'
+                continue
+
+            if top_level and self._phase == 'value' and char in ',}':
+                field = self._finish_value()
+                if field:
+                    completed.append(field)
+                if char == '}':
+                    self._depth = 0
+                    self._done = True
+                    break
+                continue
+
+            if top_level and self._capture is None and not char.isspace() and char != ',':
+                # First character of a key (must be a string) or a value (any JSON token)
+                self._capture = []
+
+            self._append(char)
+
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._done = True
+                    break
+
+        return completed
+
+    def _append(self, char: str) -> None:
+        if self._capture is not None:
+            self._capture.append(char)
+
+    def _finish_value(self) -> Optional[Tuple[str, Any]]:
+        key, capture = self._key, self._capture
+        self._phase = 'key'
+        self._key = None
+        self._capture = None
+
+        if key is None or capture is None:
+            return None
+        try:
+            return key, json.loads(''.join(capture))
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _decode(token: str) -> Optional[str]:
+        try:
+            return json.loads(token)
+        except json.JSONDecodeError:
+            return None
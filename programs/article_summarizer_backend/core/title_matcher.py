@@ -0,0 +1,196 @@
+"""
+Title Matcher
+
+Finds the video matching a podcast episode among the videos scraped from a
+YouTube channel or playlist.
+
+All candidates are prepared once per scrape: titles are lowercased and
+indexed by difflib (each candidate is SequenceMatcher's second sequence, whose
+index is the expensive part), and published dates - including relative ones
+like "2 days ago" - are parsed once. Matching a title ranks candidates by
+the cheap quick_ratio() upper bound and computes full ratios in that order,
+stopping as soon as no remaining candidate can beat the best so far - when
+the right video is in the list, that's usually after a handful of them.
+Ratios are identical to SequenceMatcher(None, title, candidate).ratio().
+
+This file is duplicated byte-for-byte in article_summarizer_backend and
+content_checker_backend (each deploys on its own); edit both together.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional
+
+from dateutil import parser as date_parser
+
+# Default title similarity needed for a match
+DEFAULT_THRESHOLD = 0.70
+
+# Relaxed similarity when episode and video were published close together
+RELAXED_THRESHOLD = 0.40
+RELAXED_DATE_TOLERANCE_DAYS = 1
+
+RELATIVE_DATE_PATTERN = re.compile(r'(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago')
+
+RELATIVE_DATE_UNITS = {
+    'second': timedelta(seconds=1),
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),  # Approximate
+    'year': timedelta(days=365),  # Approximate
+}
+
+
+def parse_published_date(value: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parse an absolute or YouTube-style relative date
+
+    Args:
+        value: ISO/free-form date, or relative text like "2 days ago" / "Streamed 3 weeks ago"
+        now: Reference time for relative dates (default: now)
+
+    Returns:
+        Naive datetime, or None if the value can't be parsed
+
+    Examples:
+        >>> parse_published_date("2 days ago", now=datetime(2024, 10, 23))
+        datetime.datetime(2024, 10, 21, 0, 0)
+        >>> parse_published_date("2024-10-23T08:00:00Z")
+        datetime.datetime(2024, 10, 23, 8, 0)
+    """
+    if not value:
+        return None
+
+    text = value.strip().lower()
+    if 'ago' in text:
+        match = RELATIVE_DATE_PATTERN.search(text)
+        if not match:
+            return None
+        return (now or datetime.now()) - int(match.group(1)) * RELATIVE_DATE_UNITS[match.group(2)]
+
+    try:
+        return date_parser.parse(value).replace(tzinfo=None)
+    except (ValueError, OverflowError):
+        return None
+
+
+@dataclass
+class TitleMatch:
+    """Best candidate for a title"""
+    candidate: Dict
+    ratio: float
+    threshold: float
+    is_match: bool
+    published_date: Optional[datetime] = None
+
+
+class TitleMatcher:
+    """
+    Fuzzy title matching against a fixed set of candidates
+
+    Usage:
+        matcher = TitleMatcher(videos)  # [{'title', 'url', 'published'}, ...]
+        match = matcher.best_match(episode_title, episode_published_date)
+        if match and match.is_match:
+            video_url = match.candidate['url']
+    """
+
+    def __init__(
+        self,
+        candidates: List[Dict],
+        title_key: str = 'title',
+        date_key: str = 'published',
+        now: Optional[datetime] = None
+    ):
+        """
+        Args:
+            candidates: Dicts with a title and (optionally) a published date
+            title_key: Key of the title in each candidate
+            date_key: Key of the published date (absolute or relative text)
+            now: Reference time for relative dates (default: now)
+        """
+        self.candidates = [candidate for candidate in candidates if candidate.get(title_key)]
+        self._matchers = []
+        for candidate in self.candidates:
+            matcher = SequenceMatcher(None)
+            matcher.set_seq2(candidate[title_key].lower())
+            self._matchers.append(matcher)
+        self._dates = [parse_published_date(candidate.get(date_key), now) for candidate in self.candidates]
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def ratios(self, title: str) -> List[float]:
+        """Exact similarity of title to every candidate (same order as candidates)"""
+        text = title.lower()
+        ratios = []
+        for matcher in self._matchers:
+            matcher.set_seq1(text)
+            ratios.append(matcher.ratio())
+        return ratios
+
+    def best_match(
+        self,
+        title: str,
+        published_date: Optional[str] = None,
+        threshold: float = DEFAULT_THRESHOLD,
+        relaxed_threshold: float = RELAXED_THRESHOLD,
+        date_tolerance_days: int = RELAXED_DATE_TOLERANCE_DAYS
+    ) -> Optional[TitleMatch]:
+        """
+        Find the most similar candidate and decide whether it matches
+
+        The best candidate matches if its similarity reaches threshold, or
+        relaxed_threshold when both dates are known and within
+        date_tolerance_days of each other.
+
+        Args:
+            title: Title to match (e.g. podcast episode title)
+            published_date: Published date of the title's content (ISO format)
+            threshold: Similarity required without a date match
+            relaxed_threshold: Similarity required with a date match
+            date_tolerance_days: Maximum days apart for a date match
+
+        Returns:
+            TitleMatch for the most similar candidate, or None if nothing is similar at all
+        """
+        text = title.lower()
+        best_index = None
+        best_ratio = 0.0
+
+        # Exact ratios in order of their upper bound, stopping once no
+        # remaining candidate can beat the best so far
+        bounds = []
+        for index, matcher in enumerate(self._matchers):
+            matcher.set_seq1(text)
+            bounds.append((matcher.quick_ratio(), index))
+        bounds.sort(key=lambda bound: (-bound[0], bound[1]))
+
+        for bound, index in bounds:
+            if bound < best_ratio:
+                break
+            ratio = self._matchers[index].ratio()
+            # Ties go to the earlier candidate, as in a plain loop
+            if ratio > best_ratio or (ratio == best_ratio and ratio > 0 and index < best_index):
+                best_index, best_ratio = index, ratio
+
+        if best_index is None:
+            return None
+
+        required = threshold
+        video_date = self._dates[best_index]
+        episode_date = parse_published_date(published_date)
+        if episode_date and video_date and abs((episode_date - video_date).days) <= date_tolerance_days:
+            required = relaxed_threshold
+
+        return TitleMatch(
+            candidate=self.candidates[best_index],
+            ratio=best_ratio,
+            threshold=required,
+            is_match=best_ratio >= required,
+            published_date=video_date
+        )
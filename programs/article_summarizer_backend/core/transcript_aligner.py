@@ -10,15 +10,151 @@ This module is shared by:
 - earnings_insights (Seeking Alpha earnings calls)
 """
 
+import bisect
 import logging
 import os
 import re
+from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Minimum similarity for a segment to count as found in the audio words
+MATCH_THRESHOLD = 0.75
+
+# Rarest segment words used as anchors when locating a segment
+MAX_ANCHOR_WORDS = 12
+
+# Candidate start positions verified with SequenceMatcher per search: at
+# least MIN_CANDIDATE_STARTS, more for short segments (cheap to verify, and
+# made of common words that occur all over the call)
+MIN_CANDIDATE_STARTS = 3
+CANDIDATE_WORD_BUDGET = 240
+
+# Word insertions/deletions tolerated around an anchor-implied start
+START_TOLERANCE = 2
+
+# Shorter segments ("Thank you.") are too ambiguous to move the alignment cursor
+MIN_CURSOR_SEGMENT_WORDS = 5
+
+# Speaker label for audio-only transcripts (transcribed without diarization)
+UNKNOWN_SPEAKER = "Speaker"
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+NON_WORD_PATTERN = re.compile(r'[^\w]')
+
+
+def normalize_word(word: str) -> str:
+    """Normalize a single word (lowercase, remove punctuation)"""
+    return NON_WORD_PATTERN.sub('', word.lower())
+
+
+def normalize_text_to_words(text: str) -> List[str]:
+    """Normalize text to list of lowercase words (remove punctuation)"""
+    return WORD_PATTERN.findall(text.lower())
+
+
+class WordIndex:
+    """
+    Normalized audio words with a word -> positions index
+
+    Built once per transcript. A segment is located by its rarest words:
+    each occurrence of an anchor word implies a start position, the most
+    supported starts (within a few words of each other) are verified with
+    SequenceMatcher, and the nearest one above MATCH_THRESHOLD wins. Only
+    positions from start_at on are considered, so aligning segments in order
+    walks the audio once instead of rescanning it for every segment.
+    """
+
+    def __init__(self, words: List[str]):
+        """
+        Args:
+            words: Normalized audio words (see normalize_word)
+        """
+        self.words = words
+        self.counts = Counter(words)
+        self.positions: Dict[str, List[int]] = defaultdict(list)
+        for position, word in enumerate(words):
+            self.positions[word].append(position)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def find(self, target_words: List[str], start_at: int = 0) -> Tuple[Optional[int], Optional[int], float]:
+        """
+        Find the best window matching target_words at or after start_at
+
+        Args:
+            target_words: Normalized words to find
+            start_at: First audio word position a match may start at
+
+        Returns:
+            (start_index, end_index, similarity) - indices are None if nothing was similar
+        """
+        window_size = len(target_words)
+        last_start = len(self.words) - window_size
+        if not target_words or last_start < start_at:
+            return None, None, 0.0
+
+        # Rarest words that occur in the audio at all (misheard words simply don't vote)
+        offsets: Dict[str, List[int]] = defaultdict(list)
+        for offset, word in enumerate(target_words):
+            if word in self.counts:
+                offsets[word].append(offset)
+        anchors = sorted(offsets, key=lambda word: self.counts[word])[:MAX_ANCHOR_WORDS]
+
+        votes: Counter = Counter()
+        for word in anchors:
+            positions = self.positions[word]
+            for offset in offsets[word]:
+                # Starts implied by this word that fall in [start_at, last_start]
+                first = bisect.bisect_left(positions, start_at + offset)
+                last = bisect.bisect_right(positions, last_start + offset)
+                for position in positions[first:last]:
+                    votes[position - offset] += 1
+
+        if not votes:
+            return None, None, 0.0
+
+        # Votes within START_TOLERANCE of a start support it (insertions/deletions shift starts)
+        support = Counter()
+        for start, count in votes.items():
+            for shift in range(-START_TOLERANCE, START_TOLERANCE + 1):
+                support[start + shift] += count
+        peaks = sorted(
+            (start for start in support if start_at <= start <= last_start and start in votes),
+            key=lambda start: (-support[start], start)
+        )
+
+        max_candidates = max(MIN_CANDIDATE_STARTS, CANDIDATE_WORD_BUDGET // window_size)
+        candidates = []
+        for start in peaks:
+            if all(abs(start - chosen) > START_TOLERANCE for chosen in candidates):
+                candidates.append(start)
+                if len(candidates) == max_candidates:
+                    break
+
+        # Best shift around each candidate
+        scored = []
+        for peak in candidates:
+            best = None
+            for start in range(max(start_at, peak - START_TOLERANCE), min(last_start, peak + START_TOLERANCE) + 1):
+                score = SequenceMatcher(None, target_words, self.words[start:start + window_size]).ratio()
+                if best is None or score > best[1]:
+                    best = (start, score)
+            scored.append(best)
+
+        # The nearest good match wins: short phrases ("thank you") recur
+        # throughout a call, and the next occurrence is the one being aligned
+        good = [match for match in scored if match[1] > MATCH_THRESHOLD]
+        if good:
+            best_start, best_score = min(good)
+        else:
+            best_start, best_score = max(scored, key=lambda match: (match[1], -match[0]))
+        return best_start, best_start + window_size - 1, best_score
+
 
 @dataclass
 class AlignedSegment:
@@ -95,16 +231,25 @@ class TranscriptAligner:
         self.logger.info("🔗 [MATCHING] Aligning segments to timestamps...")
         aligned_segments = []
 
+        # Normalize and index the audio words once; segments are matched in
+        # order from a cursor that only moves forward
+        word_index = WordIndex([normalize_word(w['word']) for w in dg_words])
+        cursor = 0
+
         for i, segment in enumerate(text_segments):
             self.logger.debug(f"   Segment {i+1}/{len(text_segments)}: {segment['speaker']} - {segment['text'][:50]}...")
 
             # Find best match in Deepgram transcript
             match_start, match_end = self._find_text_in_transcript(
                 segment['text'],
-                dg_words
+                dg_words,
+                word_index=word_index,
+                start_at=cursor
             )
 
             if match_start is not None and match_end is not None:
+                if match_end - match_start + 1 >= MIN_CURSOR_SEGMENT_WORDS:
+                    cursor = max(cursor, match_end + 1)
                 aligned_segments.append(AlignedSegment(
                     speaker=segment['speaker'],
                     text=segment['text'],
@@ -290,14 +435,21 @@ class TranscriptAligner:
     def _find_text_in_transcript(
         self,
         target_text: str,
-        dg_words: List[Dict]
+        dg_words: List[Dict],
+        word_index: Optional[WordIndex] = None,
+        start_at: int = 0
     ) -> Tuple[Optional[int], Optional[int]]:
         """
         Find target text in Deepgram word list using fuzzy matching
 
+        Searches from start_at first; if the segment isn't found there (e.g.
+        the text transcript is out of order), the whole transcript is searched.
+
         Args:
             target_text: Text to find (from parsed transcript)
             dg_words: List of word dicts from Deepgram (each has 'word', 'start', 'end')
+            word_index: Index of the normalized Deepgram words (built if not given)
+            start_at: Word position to search from (end of the previous segment's match)
 
         Returns:
             (start_word_index, end_word_index) or (None, None) if not found
@@ -308,48 +460,86 @@ class TranscriptAligner:
         if not target_words or not dg_words:
             return None, None
 
-        # Build list of normalized Deepgram words
-        dg_normalized = [self._normalize_word(w['word']) for w in dg_words]
-
-        # Use sliding window to find best match
-        best_match_score = 0
-        best_match_start = None
-        best_match_end = None
-
-        window_size = len(target_words)
+        if word_index is None:
+            word_index = WordIndex([self._normalize_word(w['word']) for w in dg_words])
 
         # Don't search if target is too long
-        if window_size > len(dg_normalized):
+        if len(target_words) > len(word_index):
             # Try to find partial match with first N words
-            window_size = min(50, len(dg_normalized))
-            target_words = target_words[:window_size]
-
-        for i in range(len(dg_normalized) - window_size + 1):
-            window = dg_normalized[i:i + window_size]
+            target_words = target_words[:min(50, len(word_index))]
 
-            # Calculate similarity using SequenceMatcher
-            similarity = SequenceMatcher(None, target_words, window).ratio()
-
-            if similarity > best_match_score:
-                best_match_score = similarity
-                best_match_start = i
-                best_match_end = i + window_size - 1
+        match_start, match_end, score = word_index.find(target_words, start_at)
+        if score <= MATCH_THRESHOLD and start_at > 0:
+            match_start, match_end, score = word_index.find(target_words, 0)
 
         # Only return if match is good enough (>75% similarity)
-        if best_match_score > 0.75:
-            return best_match_start, best_match_end
+        if score > MATCH_THRESHOLD:
+            return match_start, match_end
 
         return None, None
 
     def _normalize_text_to_words(self, text: str) -> List[str]:
         """Normalize text to list of lowercase words (remove punctuation)"""
-        # Remove punctuation, lowercase, split into words
-        words = re.findall(r'\b\w+\b', text.lower())
-        return words
+        return normalize_text_to_words(text)
 
     def _normalize_word(self, word: str) -> str:
         """Normalize a single word (lowercase, remove punctuation)"""
-        return re.sub(r'[^\w]', '', word.lower())
+        return normalize_word(word)
+
+
+def transcript_from_deepgram(transcription: Dict, speaker: str = UNKNOWN_SPEAKER) -> Dict:
+    """
+    Build an align_transcript()-shaped result from audio alone
+
+    For audio without a text transcript: Deepgram's paragraphs become the
+    segments, each with the mean confidence of its words.
+
+    Args:
+        transcription: Merged result of ChunkedTranscriber.transcribe_chunks()
+            (segments with start/duration/text, offset-adjusted words)
+        speaker: Label for every segment (no diarization)
+
+    Returns:
+        {
+            "aligned_transcript": [{speaker, text, start, end, confidence}, ...],
+            "deepgram_transcript": {...},  # Words, text and chunk counts
+            "source": "transcribed_with_deepgram"
+        }
+    """
+    words = transcription.get('words', [])
+    word_starts = [word['start'] for word in words]
+
+    aligned = []
+    for segment in transcription.get('segments', []):
+        text = (segment.get('text') or '').strip()
+        if not text:
+            continue
+        start = segment['start']
+        end = start + segment.get('duration', 0)
+
+        first = bisect.bisect_left(word_starts, start)
+        last = bisect.bisect_right(word_starts, end)
+        confidences = [word.get('confidence', 0) for word in words[first:last]]
+
+        aligned.append({
+            "speaker": speaker,
+            "text": text,
+            "start": start,
+            "end": end,
+            "confidence": sum(confidences) / len(confidences) if confidences else 0.0
+        })
+
+    return {
+        "aligned_transcript": aligned,
+        "deepgram_transcript": {
+            "text": transcription.get('text', ''),
+            "words": words,
+            "chunks_completed": transcription.get('chunks_completed'),
+            "total_chunks": transcription.get('total_chunks'),
+            "failed_chunks": transcription.get('failed_chunks', [])
+        },
+        "source": "transcribed_with_deepgram"
+    }
 
 
 # =============================================================================
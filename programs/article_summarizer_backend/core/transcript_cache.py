@@ -0,0 +1,252 @@
+"""
+Content-Addressed Transcript Cache
+
+Caches DeepGram transcripts keyed by a fingerprint of the media (SHA-256 of the
+file bytes, or a canonicalized media URL) combined with the transcription
+options. Reprocessing, duplicate submissions and the same podcast enclosure
+arriving from several checkers then reuse one transcription.
+
+Tiers:
+- Local disk: one JSON file per key, LRU eviction by access time once the
+  directory exceeds TRANSCRIPT_CACHE_MAX_MB
+- Supabase (optional): `transcript_cache` table, enabled with
+  TRANSCRIPT_CACHE_SUPABASE=true; hits are promoted to the disk tier
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# Podcast analytics prefixes that wrap the real enclosure URL, e.g.
+# https://dts.podtrac.com/redirect.mp3/traffic.libsyn.com/show/ep1.mp3
+TRACKING_PREFIX_PATTERNS = [
+    re.compile(r'^(?:www\.)?dts\.podtrac\.com/redirect\.[a-z0-9]+/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?chtbl\.com/track/[^/]+/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?chrt\.fm/track/[^/]+/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?pdst\.fm/e/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?op3\.dev/e(?:,[^/]*)?/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?pfx\.vpixl\.com/[^/]+/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?mgln\.ai/e/[^/]+/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?arttrk\.com/p/[^/]+/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?(?:verifi\.)?podscribe\.com/rss/p/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?pscrb\.fm/rss/p/', re.IGNORECASE),
+    re.compile(r'^(?:www\.)?prfx\.byspotify\.com/e/', re.IGNORECASE),
+]
+
+# Query parameters that never change the media bytes
+TRACKING_QUERY_PARAMS = {'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'ref', 'source', 'from'}
+
+
+def fingerprint_file(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """
+    SHA-256 of a file's bytes, read in blocks
+
+    Args:
+        file_path: Path to the media file
+        block_size: Bytes per read
+
+    Returns:
+        Hex digest prefixed with 'sha256:'
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def canonicalize_media_url(url: str) -> str:
+    """
+    Canonicalize a media URL so the same enclosure maps to the same key
+
+    Strips podcast analytics redirect prefixes, lowercases scheme/host,
+    drops the fragment and tracking query parameters, and sorts the rest.
+
+    Examples:
+        >>> canonicalize_media_url("https://dts.podtrac.com/redirect.mp3/Traffic.Libsyn.com/show/ep1.mp3?utm_source=rss")
+        'https://traffic.libsyn.com/show/ep1.mp3'
+    """
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or 'https').lower()
+    remainder = f"{parsed.netloc}{parsed.path}"
+
+    stripped = True
+    while stripped:
+        stripped = False
+        for pattern in TRACKING_PREFIX_PATTERNS:
+            match = pattern.match(remainder)
+            if match:
+                remainder = remainder[match.end():]
+                remainder = re.sub(r'^https?:/+', '', remainder, flags=re.IGNORECASE)
+                stripped = True
+                break
+
+    host, _, path = remainder.partition('/')
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_QUERY_PARAMS
+    ))
+    return urlunparse((scheme, host.lower(), f"/{path}", '', query, ''))
+
+
+def make_cache_key(fingerprint: str, options: Optional[Dict] = None) -> str:
+    """
+    Combine a media fingerprint with transcription options into a cache key
+
+    Args:
+        fingerprint: fingerprint_file() digest or 'url:<canonical url>'
+        options: Transcription options that affect output (model, language, ...)
+
+    Returns:
+        Hex SHA-256 key
+    """
+    payload = json.dumps({'media': fingerprint, 'options': options or {}}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TranscriptCache:
+    """
+    Two-tier transcript cache (local disk LRU + optional Supabase table)
+
+    Usage:
+        cache = TranscriptCache(cache_dir)
+        key = make_cache_key(fingerprint_file(path), options)
+        transcript = cache.get(key)
+        if transcript is None:
+            transcript = transcribe(path)
+            cache.set(key, transcript)
+    """
+
+    TABLE_NAME = "transcript_cache"
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_mb: Optional[float] = None,
+        use_supabase: Optional[bool] = None
+    ):
+        """
+        Args:
+            cache_dir: Directory for the disk tier
+            max_size_mb: Disk tier budget (default: TRANSCRIPT_CACHE_MAX_MB or 500)
+            use_supabase: Enable the Supabase tier (default: TRANSCRIPT_CACHE_SUPABASE env var)
+        """
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int((max_size_mb or float(os.getenv('TRANSCRIPT_CACHE_MAX_MB', '500'))) * 1024 * 1024)
+        self._lock = threading.Lock()
+
+        if use_supabase is None:
+            use_supabase = os.getenv('TRANSCRIPT_CACHE_SUPABASE', 'false').lower() == 'true'
+
+        self.supabase = None
+        if use_supabase:
+            supabase_url = os.getenv('SUPABASE_URL')
+            supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+            if supabase_url and supabase_key:
+                try:
+                    from supabase import create_client
+                    self.supabase = create_client(supabase_url, supabase_key)
+                except Exception as e:
+                    self.logger.warning(f"⚠️ [TRANSCRIPT CACHE] Supabase tier disabled: {e}")
+            else:
+                self.logger.warning("⚠️ [TRANSCRIPT CACHE] Supabase tier requested but credentials are missing")
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached transcript for key, or None on miss"""
+        path = self._path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                transcript = json.load(f)
+            os.utime(path)  # Mark as recently used for LRU eviction
+            self.logger.info(f"♻️ [TRANSCRIPT CACHE] Disk hit ({key[:12]})")
+            return transcript
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"⚠️ [TRANSCRIPT CACHE] Dropping unreadable entry {key[:12]}: {e}")
+            path.unlink(missing_ok=True)
+
+        if not self.supabase:
+            return None
+
+        try:
+            result = self.supabase.table(self.TABLE_NAME)\
+                .select('transcript')\
+                .eq('cache_key', key)\
+                .limit(1)\
+                .execute()
+            if result.data:
+                transcript = result.data[0]['transcript']
+                self.logger.info(f"♻️ [TRANSCRIPT CACHE] Supabase hit ({key[:12]})")
+                self._write_disk(key, transcript)
+                return transcript
+        except Exception as e:
+            self.logger.warning(f"⚠️ [TRANSCRIPT CACHE] Supabase lookup failed: {e}")
+
+        return None
+
+    def set(self, key: str, transcript: Dict) -> None:
+        """Store a transcript in every enabled tier (failures are logged, not raised)"""
+        self._write_disk(key, transcript)
+
+        if self.supabase:
+            try:
+                self.supabase.table(self.TABLE_NAME).upsert({
+                    'cache_key': key,
+                    'transcript': transcript
+                }, on_conflict='cache_key').execute()
+            except Exception as e:
+                self.logger.warning(f"⚠️ [TRANSCRIPT CACHE] Supabase write failed: {e}")
+
+    def _write_disk(self, key: str, transcript: Dict) -> None:
+        """Atomically write an entry, then evict least-recently-used entries over budget"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(transcript, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path_for(key))
+        except Exception as e:
+            self.logger.warning(f"⚠️ [TRANSCRIPT CACHE] Disk write failed: {e}")
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob('*.json'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_size_bytes:
+                return
+
+            entries.sort()
+            evicted = 0
+            for _, size, path in entries:
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted += 1
+
+            self.logger.info(f"🧹 [TRANSCRIPT CACHE] Evicted {evicted} least-recently-used entries")
@@ -0,0 +1,170 @@
+"""
+Streaming Audio Splitter
+
+Splits long audio files into fixed-length chunks using ffmpeg's segment muxer
+with stream copy (no decode/re-encode). ffmpeg reports each finished segment on
+stdout via `-segment_list pipe:1`, so chunk paths are yielded as soon as they
+are written and peak memory stays constant regardless of episode length.
+
+Codecs the segment muxer cannot stream-copy into a standalone audio container
+fall back to an MP3 re-encode, which still streams through ffmpeg.
+"""
+
+import asyncio
+import logging
+import subprocess
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# codec_name (ffprobe) -> (segment muxer format, chunk file extension)
+STREAM_COPY_FORMATS = {
+    'mp3': ('mp3', '.mp3'),
+    'aac': ('adts', '.aac'),
+    'flac': ('flac', '.flac'),
+    'opus': ('ogg', '.ogg'),
+    'vorbis': ('ogg', '.ogg'),
+}
+
+
+def probe_audio_codec(audio_path: str) -> Optional[str]:
+    """
+    Get the codec name of the first audio stream using ffprobe
+
+    Args:
+        audio_path: Path to the media file
+
+    Returns:
+        Codec name (e.g. 'mp3', 'aac') or None if probing fails
+    """
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=codec_name',
+             '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_path)],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        codec = result.stdout.strip().splitlines()[0] if result.stdout.strip() else ''
+        return codec or None
+    except Exception as e:
+        logger.warning(f"⚠️ Could not probe audio codec: {e}")
+        return None
+
+
+def build_segment_command(
+    audio_path: str,
+    output_dir: str,
+    chunk_seconds: int,
+    codec: Optional[str]
+) -> Tuple[list, str]:
+    """
+    Build the ffmpeg segmenting command for an input file
+
+    Args:
+        audio_path: Path to the input audio/video file
+        output_dir: Directory to write chunk files into
+        chunk_seconds: Target chunk length in seconds
+        codec: Audio codec reported by ffprobe (None if unknown)
+
+    Returns:
+        (ffmpeg argv, chunk file extension)
+    """
+    if codec in STREAM_COPY_FORMATS:
+        segment_format, extension = STREAM_COPY_FORMATS[codec]
+        codec_args = ['-c:a', 'copy']
+    else:
+        segment_format, extension = 'mp3', '.mp3'
+        codec_args = ['-c:a', 'libmp3lame', '-q:a', '4']
+
+    output_pattern = str(Path(output_dir) / f"chunk_%04d{extension}")
+    cmd = [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        '-i', str(audio_path),
+        '-map', '0:a:0', '-vn',
+        *codec_args,
+        '-f', 'segment',
+        '-segment_time', str(chunk_seconds),
+        '-segment_format', segment_format,
+        '-reset_timestamps', '1',
+        '-segment_list', 'pipe:1',
+        '-segment_list_type', 'csv',
+        '-y', output_pattern
+    ]
+    return cmd, extension
+
+
+def parse_segment_list_line(line: str, output_dir: str) -> Optional[Tuple[float, str]]:
+    """
+    Parse one CSV line from ffmpeg's segment list ("filename,start,end")
+
+    Returns:
+        (start_offset_seconds, chunk_path) or None for blank/malformed lines
+    """
+    parts = line.strip().rsplit(',', 2)
+    if len(parts) != 3:
+        return None
+    filename, start, _end = parts
+    try:
+        start_offset = float(start)
+    except ValueError:
+        return None
+    chunk_path = Path(filename)
+    if not chunk_path.is_absolute():
+        chunk_path = Path(output_dir) / chunk_path.name
+    return start_offset, str(chunk_path)
+
+
+async def iter_audio_chunks(
+    audio_path: str,
+    output_dir: str,
+    chunk_seconds: int = 20 * 60
+) -> AsyncIterator[Tuple[float, str]]:
+    """
+    Split an audio file with ffmpeg and yield chunks as they are written
+
+    The caller owns output_dir and is responsible for deleting it.
+
+    Args:
+        audio_path: Path to the input audio/video file
+        output_dir: Existing directory for chunk files
+        chunk_seconds: Target chunk length in seconds (default: 20 minutes)
+
+    Yields:
+        (start_offset_seconds, chunk_path) in playback order
+
+    Raises:
+        RuntimeError: If ffmpeg exits with an error
+    """
+    codec = await asyncio.to_thread(probe_audio_codec, audio_path)
+    cmd, extension = build_segment_command(audio_path, output_dir, chunk_seconds, codec)
+
+    mode = 'stream copy' if codec in STREAM_COPY_FORMATS else 're-encode'
+    logger.info(f"   ✂️ [SPLITTER] Segmenting {Path(audio_path).name} ({codec or 'unknown'} → {extension}, {mode})")
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+
+    try:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            parsed = parse_segment_list_line(line.decode('utf-8', errors='replace'), output_dir)
+            if parsed:
+                yield parsed
+
+        stderr = await process.stderr.read()
+        returncode = await process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg segmenting failed ({returncode}): {stderr.decode('utf-8', errors='replace')[:500]}")
+
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
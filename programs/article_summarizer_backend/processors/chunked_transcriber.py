@@ -0,0 +1,253 @@
+"""
+Chunked Transcription Scheduler
+
+Transcribes pre-split audio chunks through DeepGram with bounded concurrency.
+Chunks are dispatched in parallel (limited by a semaphore sized per deployment),
+failed chunks are retried individually, and the results are reassembled in
+chunk order with timestamps shifted by each chunk's offset.
+
+Long-episode latency therefore tracks the slowest chunk instead of the sum
+of all chunks.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import AsyncIterable, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from core.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedTranscriber:
+    """
+    Bounded-concurrency scheduler for DeepGram chunk transcription
+
+    Usage:
+        scheduler = ChunkedTranscriber(file_transcriber)
+        result = await scheduler.transcribe_chunks([(0.0, "/tmp/c0.mp3"), (1200.0, "/tmp/c1.mp3")])
+    """
+
+    def __init__(
+        self,
+        file_transcriber,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff_seconds: float = 2.0
+    ):
+        """
+        Args:
+            file_transcriber: FileTranscriber instance (exposes transcribe_file)
+            max_concurrency: Max chunks in flight at once (default: Config.DEEPGRAM_CHUNK_CONCURRENCY)
+            max_retries: Retries per failed chunk (default: Config.DEEPGRAM_CHUNK_RETRIES)
+            retry_backoff_seconds: Base delay between retries (doubles per attempt)
+        """
+        self.file_transcriber = file_transcriber
+        self.max_concurrency = max(1, max_concurrency or Config.DEEPGRAM_CHUNK_CONCURRENCY)
+        self.max_retries = Config.DEEPGRAM_CHUNK_RETRIES if max_retries is None else max(0, max_retries)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    async def transcribe_chunks(
+        self,
+        chunks: Union[List[Tuple[float, str]], AsyncIterable[Tuple[float, str]]],
+        timeout_seconds: Optional[float] = None,
+        progress_callback: Optional[Callable[[str, Dict], Awaitable[None]]] = None,
+        expected_chunks: Optional[int] = None
+    ) -> Dict:
+        """
+        Transcribe audio chunks concurrently and merge them in order
+
+        Args:
+            chunks: (start_offset_seconds, chunk_path) pairs in playback order, either
+                a list or an async iterable (e.g. iter_audio_chunks) - chunks are
+                dispatched as soon as they are yielded
+            timeout_seconds: Overall deadline, including waiting on a streamed chunk
+                source; chunks still running or not yet yielded are dropped (partial result).
+                DeepGram requests already uploading when it passes can't be aborted, so
+                this returns once they finish (chunk files stay in use until then) -
+                no new uploads start after the deadline
+            progress_callback: Optional async callback for progress updates
+            expected_chunks: Total chunk count for progress events when streaming
+
+        Returns:
+            {
+                "segments": [...],        # start/text/duration, offset-adjusted
+                "words": [...],           # word/start/end/confidence, offset-adjusted
+                "text": "...",
+                "chunks_completed": int,
+                "total_chunks": int,
+                "failed_chunks": [idx, ...]
+            }
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        chunk_list: List[Tuple[float, str]] = []
+        results: List[Optional[Dict]] = []
+        tasks: List[asyncio.Task] = []
+        cancel_event = threading.Event()
+        uploads: Set[asyncio.Future] = set()
+        completed = 0
+        start_time = time.time()
+
+        self.logger.info(f"   🚦 [SCHEDULER] Transcribing chunks (concurrency: {self.max_concurrency}, retries: {self.max_retries})")
+
+        async def run_chunk(idx: int, chunk_path: str):
+            nonlocal completed
+            async with semaphore:
+                results[idx] = await self._transcribe_with_retry(idx, chunk_path, cancel_event, uploads)
+
+            if results[idx] is not None:
+                completed += 1
+                if progress_callback:
+                    await progress_callback("transcribing_chunk", {
+                        "current": completed,
+                        "total": expected_chunks or len(chunk_list),
+                        "elapsed_minutes": (time.time() - start_time) / 60
+                    })
+
+        def schedule(chunk: Tuple[float, str]):
+            chunk_list.append(chunk)
+            results.append(None)
+            tasks.append(asyncio.create_task(run_chunk(len(chunk_list) - 1, chunk[1])))
+
+        def remaining_seconds() -> Optional[float]:
+            return None if timeout_seconds is None else max(0.0, timeout_seconds - (time.time() - start_time))
+
+        try:
+            if hasattr(chunks, '__aiter__'):
+                chunk_iter = chunks.__aiter__()
+                while True:
+                    try:
+                        # A stalled source (e.g. ffmpeg reading a slow URL) must not outlive the deadline
+                        chunk = await asyncio.wait_for(chunk_iter.__anext__(), remaining_seconds())
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        self.logger.warning(f"   ⏰ [TIMEOUT] Deadline reached while waiting for chunk {len(chunk_list) + 1}")
+                        break
+                    schedule(chunk)
+            else:
+                for chunk in chunks:
+                    schedule(chunk)
+        except BaseException:
+            cancel_event.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._wait_for_uploads(cancel_event, uploads)
+            raise
+
+        total = len(chunk_list)
+        pending = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=remaining_seconds())
+        if pending:
+            self.logger.warning(f"   ⏰ [TIMEOUT] Deadline reached with {len(pending)}/{total} chunks still running")
+            cancel_event.set()
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self._wait_for_uploads(cancel_event, uploads)
+
+        merged = self._merge_results(chunk_list, results)
+        self.logger.info(f"   ✅ [SCHEDULER] {merged['chunks_completed']}/{total} chunks transcribed in {time.time() - start_time:.1f}s")
+        return merged
+
+    async def _wait_for_uploads(self, cancel_event: threading.Event, uploads: Set[asyncio.Future]) -> None:
+        """Wait for worker threads still talking to DeepGram (cancel_event is already set)"""
+        if uploads:
+            self.logger.info(f"   ⏳ [SCHEDULER] Waiting for {len(uploads)} in-flight DeepGram requests to finish")
+            await asyncio.gather(*uploads, return_exceptions=True)
+
+    async def _transcribe_with_retry(
+        self,
+        idx: int,
+        chunk_path: str,
+        cancel_event: threading.Event,
+        uploads: Set[asyncio.Future]
+    ) -> Optional[Dict]:
+        """Transcribe one chunk, retrying only this chunk on failure"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.logger.info(f"   🎙️ [CHUNK {idx + 1}] Transcribing (attempt {attempt + 1})...")
+                # Cancelling this coroutine can't stop the worker thread, so the thread
+                # is tracked (and shielded) until it finishes
+                upload = asyncio.ensure_future(asyncio.to_thread(
+                    self.file_transcriber.transcribe_file, chunk_path, cancel_event=cancel_event
+                ))
+                uploads.add(upload)
+                upload.add_done_callback(uploads.discard)
+                result = await asyncio.shield(upload)
+
+                if not result:
+                    # No audio track - retrying will not help
+                    self.logger.warning(f"   ⚠️ [CHUNK {idx + 1}] No transcript returned")
+                    return None
+
+                transcript_json_file = result.get('output_file')
+                if transcript_json_file:
+                    try:
+                        await asyncio.to_thread(os.unlink, transcript_json_file)
+                    except OSError:
+                        pass
+
+                transcript_data = result['transcript_data']
+                self.logger.info(
+                    f"   ✅ [CHUNK {idx + 1}] Complete "
+                    f"({len(transcript_data.get('segments', []))} segments, {len(transcript_data.get('words', []))} words)"
+                )
+                return transcript_data
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    self.logger.warning(f"   ⚠️ [CHUNK {idx + 1}] Failed after {attempt + 1} attempts: {e}")
+                    return None
+                delay = self.retry_backoff_seconds * (2 ** attempt)
+                self.logger.warning(f"   🔁 [CHUNK {idx + 1}] Failed ({e}), retrying in {delay:.0f}s...")
+                await asyncio.sleep(delay)
+
+        return None
+
+    @staticmethod
+    def _merge_results(chunks: List[Tuple[float, str]], results: List[Optional[Dict]]) -> Dict:
+        """Reassemble per-chunk transcripts in chunk order with offset timestamps"""
+        all_segments = []
+        all_words = []
+        all_text = []
+        failed_chunks = []
+
+        for idx, ((start_offset, _), transcript_data) in enumerate(zip(chunks, results)):
+            if transcript_data is None:
+                failed_chunks.append(idx)
+                continue
+
+            for segment in transcript_data.get('segments', []):
+                all_segments.append({
+                    'start': segment.get('start', 0) + start_offset,
+                    'text': segment.get('text', ''),
+                    'duration': segment.get('end', 0) - segment.get('start', 0)
+                })
+
+            for word in transcript_data.get('words', []):
+                all_words.append({
+                    'word': word.get('word', ''),
+                    'start': word.get('start', 0) + start_offset,
+                    'end': word.get('end', 0) + start_offset,
+                    'confidence': word.get('confidence', 0)
+                })
+
+            all_text.append(transcript_data.get('text', ''))
+
+        return {
+            'segments': all_segments,
+            'words': all_words,
+            'text': ' '.join(all_text),
+            'chunks_completed': len(chunks) - len(failed_chunks),
+            'total_chunks': len(chunks),
+            'failed_chunks': failed_chunks
+        }
@@ -5,6 +5,7 @@ Transcribes audio/video files using DeepGram API with Braintrust logging
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from deepgram import DeepgramClient
@@ -15,6 +16,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from core.base import BaseProcessor
 from core.config import Config
+from core.transcript_cache import TranscriptCache, fingerprint_file, make_cache_key
 
 
 class FileTranscriber(BaseProcessor):
@@ -36,6 +38,16 @@ class FileTranscriber(BaseProcessor):
         # Initialize DeepGram client
         self._setup_deepgram()
 
+        # Content-addressed transcript cache (skip DeepGram for media we've already transcribed)
+        self.cache = None
+        if os.getenv('TRANSCRIPT_CACHE_ENABLED', 'true').lower() == 'true':
+            try:
+                cache_dir = os.getenv('TRANSCRIPT_CACHE_DIR') or (self.output_dir / "transcript_cache")
+                self.cache = TranscriptCache(cache_dir)
+                self.logger.info(f"✅ Transcript cache enabled: {cache_dir}")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Transcript cache not available: {e}")
+
     def _setup_deepgram(self):
         """Setup DeepGram client with API key and custom timeout"""
         try:
@@ -219,15 +231,58 @@ class FileTranscriber(BaseProcessor):
                 pass
             raise
 
+    def transcription_options(self, language=None):
+        """DeepGram options for a request (also part of the transcript cache key)"""
+        options = {
+            "model": "nova-2",
+            "smart_format": True,
+            "utterances": True,
+            "punctuate": True,
+            "paragraphs": True,
+            "diarize": False
+        }
+
+        if language:
+            options["language"] = language
+
+        return options
+
     @braintrust.traced
-    def transcribe_file(self, file_path, language=None):
-        """Transcribe audio/video file using DeepGram with Braintrust logging"""
+    def transcribe_file(self, file_path, language=None, cancel_event=None):
+        """
+        Transcribe audio/video file using DeepGram with Braintrust logging
+
+        Args:
+            file_path: Audio/video file to transcribe
+            language: Language code (None for auto-detect)
+            cancel_event: Optional threading.Event; if set before the upload
+                starts, the file is not sent to DeepGram and None is returned
+        """
         temp_audio_path = None
         needs_cleanup = False
 
         try:
             file_path = self._validate_file(file_path)
 
+            # Prepare transcription options
+            options = self.transcription_options(language)
+
+            # Check the transcript cache before sending audio out
+            cache_key = None
+            if self.cache:
+                cache_key = make_cache_key(fingerprint_file(file_path), options)
+                cached = self.cache.get(cache_key)
+                if cached:
+                    self.logger.info(f"♻️ Using cached transcript for {file_path.name} (skipping DeepGram)")
+                    braintrust.current_span().log(
+                        input={"file_path": str(file_path), "options": options},
+                        metadata={"provider": "deepgram", "cache_hit": True}
+                    )
+                    return {
+                        'transcript_data': cached,
+                        'output_file': self._save_transcript(cached, file_path)
+                    }
+
             self.logger.info(f"🚀 Starting transcription...")
             self.logger.info(f"🎯 Language: {language or 'auto-detect'}")
 
@@ -241,25 +296,17 @@ class FileTranscriber(BaseProcessor):
 
             temp_audio_path = audio_path if needs_cleanup else None
 
+            # The caller gave up (e.g. a deadline passed) - don't pay for a transcript nobody will read
+            if cancel_event is not None and cancel_event.is_set():
+                self.logger.info(f"⏹️ Transcription cancelled before upload: {file_path.name}")
+                return None
+
             # Read audio file
             with open(audio_path, "rb") as audio_file:
                 buffer_data = audio_file.read()
 
             self.logger.info("📡 Sending audio to DeepGram API...")
 
-            # Prepare transcription options
-            options = {
-                "model": "nova-2",
-                "smart_format": True,
-                "utterances": True,
-                "punctuate": True,
-                "paragraphs": True,
-                "diarize": False
-            }
-
-            if language:
-                options["language"] = language
-
             # Log input to Braintrust
             braintrust.current_span().log(
                 input={
@@ -335,6 +382,9 @@ class FileTranscriber(BaseProcessor):
             # Save transcript to file (temporarily for logging)
             output_file = self._save_transcript(transcript_data, file_path)
 
+            if self.cache and cache_key:
+                self.cache.set(cache_key, transcript_data)
+
             # Log output to Braintrust
             braintrust.current_span().log(
                 output={
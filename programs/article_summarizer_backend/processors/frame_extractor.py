@@ -1,21 +1,34 @@
 """
 Video Frame Extractor for Demo Videos
 
-Extracts frames from demo/screen-share videos using ffmpeg scene detection
-and perceptual hashing to identify unique, significant moments.
+Extracts frames from demo/screen-share videos using scene detection and
+perceptual hashing to identify unique, significant moments. The video is
+decoded once at low resolution to choose frames (processors/frame_sampler.py);
+only the chosen frames are encoded as full-size JPEGs.
+
+Frame classification (Canny edges + Haar cascades) and perceptual hashing are
+CPU-bound, so they run in a shared process pool in small batches. Each worker
+loads the cascades once, and classified frames stream back in timestamp order
+so callers can start uploading while later frames are still being analyzed.
 """
 
 import os
 import logging
+import multiprocessing
 import subprocess
 import tempfile
 import shutil
-from typing import List, Dict, Tuple, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, List, Dict, Tuple, Optional
 from pathlib import Path
 import hashlib
 import asyncio
 import numpy as np
 
+from processors.frame_sampler import encode_frames, select_frame_timestamps
+
 # Use [FRAMEEXTRACTOR] prefix to match ArticleProcessor logging style
 logger = logging.getLogger('[FRAMEEXTRACTOR]')
 # Set logger to propagate to root logger (will inherit handlers and level from root)
@@ -43,6 +56,203 @@ except ImportError:
     import sys
     print("⚠️ WARNING: opencv-python library not available. Install with: pip install opencv-python", file=sys.stderr)
 
+# Frame analysis pool settings (0 workers = analyze in a background thread instead)
+FRAME_ANALYSIS_WORKERS = int(os.getenv('FRAME_ANALYSIS_WORKERS', str(min(4, os.cpu_count() or 1))))
+FRAME_ANALYSIS_BATCH_SIZE = int(os.getenv('FRAME_ANALYSIS_BATCH_SIZE', '4'))
+
+
+def load_detection_cascades() -> Tuple[Optional[object], Optional[object]]:
+    """
+    Load the face and upper-body Haar cascades
+
+    Returns:
+        Tuple of (face_cascade, upperbody_cascade); either may be None
+    """
+    if not CV2_AVAILABLE:
+        return None, None
+
+    face_cascade = None
+    upperbody_cascade = None
+    try:
+        # Face detection
+        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        if face_cascade.empty():
+            logger.warning("⚠️ Face detection cascade failed to load")
+            face_cascade = None
+
+        # Upper body detection (detects head + shoulders + torso)
+        upperbody_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_upperbody.xml')
+        if upperbody_cascade.empty():
+            logger.warning("⚠️ Upper body detection cascade failed to load")
+            upperbody_cascade = None
+    except Exception as e:
+        logger.warning(f"⚠️ Could not initialize detection cascades: {e}")
+        return None, None
+
+    return face_cascade, upperbody_cascade
+
+
+def classify_frame(frame_path: str, face_cascade, upperbody_cascade) -> Tuple[bool, str]:
+    """
+    Determine if a frame contains screen share content vs just a person's face.
+
+    Uses two detection methods:
+    1. Face/upper-body detection - if a large person is detected, it's likely a webcam feed
+    2. Edge density analysis - screen shares have more sharp edges (UI, text, slides)
+
+    Args:
+        frame_path: Path to the frame image file
+        face_cascade: Loaded face Haar cascade (None disables classification)
+        upperbody_cascade: Loaded upper-body Haar cascade (optional)
+
+    Returns:
+        Tuple of (is_screen_share, reason) - reason is a log line explaining the decision
+    """
+    if not CV2_AVAILABLE or face_cascade is None:
+        # If OpenCV not available, default to keeping the frame
+        return True, "⚠️ OpenCV not available, keeping frame by default"
+
+    try:
+        # Read the image
+        img = cv2.imread(frame_path)
+        if img is None:
+            return True, f"⚠️ Could not read frame {frame_path}"  # Keep frame by default if we can't read it
+
+        # Convert to grayscale for analysis
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        frame_area = img.shape[0] * img.shape[1]
+
+        # 2. Edge density analysis (do this FIRST - it's more reliable)
+        edges = cv2.Canny(gray, 50, 150)
+        edge_density = np.count_nonzero(edges) / edges.size
+
+        # 1. Upper body detection - detects head, shoulders, torso (better for webcam detection)
+        if upperbody_cascade is not None:
+            upperbodies = upperbody_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=3)
+
+            if len(upperbodies) > 0:
+                # Calculate upper body area ratio
+                upperbody_ratio = sum(w * h for (x, y, w, h) in upperbodies) / frame_area
+
+                # Upper body > 15% of frame = likely webcam/talking head
+                if upperbody_ratio > 0.15:
+                    return False, f"   🚫 REJECT: Upper body {upperbody_ratio:.1%}, edges {edge_density:.1%} - webcam/talking head"
+
+        # 2. Face detection
+        faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=2)
+
+        if len(faces) > 0:
+            # Calculate face area ratio
+            face_ratio = sum(w * h for (x, y, w, h) in faces) / frame_area
+
+            # REJECT if face >20% - large talking head
+            if face_ratio > 0.20:
+                return False, f"   🚫 REJECT: Face {face_ratio:.1%}, edges {edge_density:.1%} - large face >20%"
+
+            # If face >2%, keep only if edges >4%
+            if face_ratio > 0.02:
+                if edge_density > 0.04:
+                    return True, f"   ✅ KEEP: Face {face_ratio:.1%}, edges {edge_density:.1%} - edges >4%"
+                return False, f"   🚫 REJECT: Face {face_ratio:.1%}, edges {edge_density:.1%} - edges ≤4%"
+            # Face ≤2% - ignore as false positive, use lower edge threshold
+
+        # No significant face detected (or face ≤2%)
+        # Keep if edges >0.01%
+        if edge_density > 0.0001:
+            return True, f"   ✅ KEEP: Edges {edge_density:.1%} - screen share"
+        return False, f"   🚫 REJECT: Edges {edge_density:.1%} - blank/transition screen"
+
+    except Exception as e:
+        return True, f"⚠️ Error analyzing frame {frame_path}: {e}"  # Keep frame by default on error
+
+
+def compute_frame_hash(frame_path: str) -> Optional[str]:
+    """Perceptual hash of a frame (metadata only), or None if it can't be computed"""
+    if not IMAGEHASH_AVAILABLE:
+        return None
+    try:
+        with Image.open(frame_path) as img:
+            return str(imagehash.phash(img))
+    except Exception:
+        return None
+
+
+# Per-process cascades: loaded once by _init_analysis_worker in each pool worker
+_worker_cascades: Optional[Tuple[Optional[object], Optional[object]]] = None
+
+
+def _init_analysis_worker() -> None:
+    global _worker_cascades
+    _worker_cascades = load_detection_cascades()
+
+
+def analyze_frame_batch(frame_paths: List[str]) -> List[Dict]:
+    """
+    Classify and hash a batch of frames (runs inside a pool worker)
+
+    Args:
+        frame_paths: Frame image paths
+
+    Returns:
+        One dict per frame: {path, keep, reason, hash}; hash is only computed for kept frames
+    """
+    if _worker_cascades is None:
+        _init_analysis_worker()
+    face_cascade, upperbody_cascade = _worker_cascades
+
+    results = []
+    for frame_path in frame_paths:
+        keep, reason = classify_frame(frame_path, face_cascade, upperbody_cascade)
+        results.append({
+            'path': frame_path,
+            'keep': keep,
+            'reason': reason,
+            'hash': compute_frame_hash(frame_path) if keep else None
+        })
+    return results
+
+
+_analysis_pool: Optional[ProcessPoolExecutor] = None
+_analysis_pool_lock = threading.Lock()
+
+
+def get_frame_analysis_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Shared process pool for frame analysis, created on first use
+
+    Uses the 'spawn' start method - forking a process that runs an event loop
+    and worker threads is unsafe. Returns None if FRAME_ANALYSIS_WORKERS=0 or
+    the pool can't be created.
+    """
+    global _analysis_pool
+
+    if FRAME_ANALYSIS_WORKERS <= 0:
+        return None
+
+    with _analysis_pool_lock:
+        if _analysis_pool is None:
+            try:
+                _analysis_pool = ProcessPoolExecutor(
+                    max_workers=FRAME_ANALYSIS_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_analysis_worker
+                )
+                logger.info(f"🧵 Started frame analysis pool with {FRAME_ANALYSIS_WORKERS} workers")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not start frame analysis pool, analyzing in-thread: {e}")
+                return None
+        return _analysis_pool
+
+
+def reset_frame_analysis_pool(broken_pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next extraction starts a fresh one"""
+    global _analysis_pool
+
+    with _analysis_pool_lock:
+        if _analysis_pool is broken_pool:
+            _analysis_pool = None
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
 
 class FrameExtractor:
     """Extract significant frames from demo videos"""
@@ -59,41 +269,18 @@ class FrameExtractor:
         self.min_interval_seconds = min_interval_seconds
         self.similarity_threshold = similarity_threshold
         self.temp_dir = None
-        self.face_cascade = None
 
-        # Initialize detection cascades if OpenCV is available
-        self.upperbody_cascade = None
-        if CV2_AVAILABLE:
-            try:
-                # Face detection
-                cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-                self.face_cascade = cv2.CascadeClassifier(cascade_path)
-                if self.face_cascade.empty():
-                    logger.warning("⚠️ Face detection cascade failed to load")
-                    self.face_cascade = None
-                else:
-                    logger.info("✅ Face detection cascade loaded successfully")
-
-                # Upper body detection (detects head + shoulders + torso)
-                upperbody_path = cv2.data.haarcascades + 'haarcascade_upperbody.xml'
-                self.upperbody_cascade = cv2.CascadeClassifier(upperbody_path)
-                if self.upperbody_cascade.empty():
-                    logger.warning("⚠️ Upper body detection cascade failed to load")
-                    self.upperbody_cascade = None
-                else:
-                    logger.info("✅ Upper body detection cascade loaded successfully")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not initialize detection cascades: {e}")
-                self.face_cascade = None
-                self.upperbody_cascade = None
+        # Cascades for in-process _is_screen_share_frame(), loaded on first use;
+        # extract_frames() analyzes in pool workers, which load their own
+        self._cascades: Optional[Tuple[Optional[object], Optional[object]]] = None
 
     async def extract_frames(self, video_path: str) -> List[Dict[str, any]]:
         """
         Extract frames from video using scene detection with minimum interval enforcement.
 
-        Uses ffmpeg's scene detection to identify visual changes, with a built-in filter
-        to ensure frames are at least min_interval_seconds apart. Falls back to fixed
-        interval extraction if scene detection finds no changes.
+        Decodes the video once at low resolution to find visual changes at least
+        min_interval_seconds apart, falling back to fixed intervals if there are
+        no scene changes. Only the selected frames are written as full-size JPEGs.
 
         Args:
             video_path: Path to video file
@@ -105,253 +292,145 @@ class FrameExtractor:
                 - time_formatted: Formatted timestamp (MM:SS or HH:MM:SS)
                 - hash: Perceptual hash of the frame (for metadata only)
         """
-        logger.debug(f"extract_frames called - CV2_AVAILABLE={CV2_AVAILABLE}, face_cascade={self.face_cascade is not None}")
+        return [frame async for frame in self.iter_frames(video_path)]
+
+    async def iter_frames(self, video_path: str) -> AsyncIterator[Dict[str, any]]:
+        """
+        Streaming version of extract_frames()
+
+        Yields screen share frames in timestamp order as soon as their batch has
+        been classified and hashed, so callers can upload early frames while
+        later ones are still being analyzed.
+
+        Args:
+            video_path: Path to video file
+
+        Yields:
+            Frame dictionaries (same shape as extract_frames())
+        """
         logger.info(f"🎬 Starting frame extraction from video: {video_path}")
 
         if not IMAGEHASH_AVAILABLE:
             logger.error("❌ imagehash library is required for frame extraction")
-            return []
+            return
 
         # Create temporary directory for frames
         self.temp_dir = tempfile.mkdtemp(prefix="video_frames_")
         logger.info(f"📁 Created temp directory: {self.temp_dir}")
 
         try:
-            # Use ffmpeg scene detection to find significant changes
-            # The ffmpeg filter enforces minimum interval during extraction
-            frames = await self._detect_scene_changes(video_path)
-            logger.info(f"🎯 Detected {len(frames)} scene changes")
+            frames = await self._sample_frames(video_path)
 
-            if not frames:
-                logger.warning("⚠️ No scene changes detected, falling back to interval extraction")
-                frames = await self._extract_by_interval(video_path)
-
-            # Filter frames to only include screen share content
-            screen_share_frames = []
+            # Filter frames to only include screen share content, hashing the ones we keep
+            kept_count = 0
             filtered_count = 0
-            for idx, frame in enumerate(frames, 1):
-                logger.info(f"📋 Analyzing frame {idx}/{len(frames)} at {frame['time_formatted']}")
-                is_screen_share = self._is_screen_share_frame(frame["path"])
-                if is_screen_share:
-                    screen_share_frames.append(frame)
+            async for frame, analysis in self._analyze_frames(frames):
+                logger.info(f"📋 Frame at {frame['time_formatted']}: {analysis['reason'].strip()}")
+                if analysis['keep']:
+                    frame["hash"] = analysis['hash']
+                    kept_count += 1
+                    yield frame
                 else:
                     filtered_count += 1
-                    logger.info(f"🚫 Filtered out frame {idx}/{len(frames)} at {frame['time_formatted']}")
 
             if filtered_count > 0:
                 logger.info(f"📊 Filtered {filtered_count} frames showing faces/webcam feeds")
 
-            # Compute perceptual hashes for metadata (not used for filtering)
-            for frame in screen_share_frames:
-                try:
-                    img = Image.open(frame["path"])
-                    phash = imagehash.phash(img)
-                    frame["hash"] = str(phash)
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not compute hash for frame {frame['path']}: {e}")
-                    frame["hash"] = None
-
-            logger.info(f"✅ Extracted {len(screen_share_frames)} screen share frames")
-            return screen_share_frames
+            logger.info(f"✅ Extracted {kept_count} screen share frames")
 
         except Exception as e:
             logger.error(f"❌ Frame extraction failed: {e}", exc_info=True)
-            return []
 
-    async def _detect_scene_changes(self, video_path: str) -> List[Dict[str, any]]:
+    async def _analyze_frames(self, frames: List[Dict]) -> AsyncIterator[Tuple[Dict, Dict]]:
         """
-        Use ffmpeg scene detection to find significant frame changes
+        Classify and hash frames in batches on the process pool
 
-        Returns:
-            List of frames with timestamps
-        """
-        logger.info("🔍 Running ffmpeg scene detection...")
+        All batches are submitted up front (the pool bounds concurrency); results
+        are yielded in frame order as each batch completes.
 
+        Yields:
+            (frame, analysis) pairs - see analyze_frame_batch()
+        """
+        if not frames:
+            return
+
+        loop = asyncio.get_running_loop()
+        pool = get_frame_analysis_pool()
+        batch_size = max(1, FRAME_ANALYSIS_BATCH_SIZE)
+        batches = [frames[i:i + batch_size] for i in range(0, len(frames), batch_size)]
+        logger.info(f"🧮 Analyzing {len(frames)} frames in {len(batches)} batches ({'process pool' if pool else 'in-thread'})")
+
+        def submit(batch):
+            paths = [frame["path"] for frame in batch]
+            if pool is not None:
+                return loop.run_in_executor(pool, analyze_frame_batch, paths)
+            return asyncio.ensure_future(asyncio.to_thread(analyze_frame_batch, paths))
+
+        futures = [submit(batch) for batch in batches]
         try:
-            # Use ffmpeg select filter for scene detection only
-            # scene=0.2 means detect scenes with 20% change (lower = more sensitive)
-            # Minimum interval filtering is done in Python post-processing for reliability
-            # showinfo writes frame info to stderr for timestamp extraction
-            filter_complex = "select='gt(scene,0.2)',showinfo"
-
-            output_pattern = os.path.join(self.temp_dir, "scene_%04d.jpg")
-
-            cmd = [
-                "ffmpeg",
-                "-i", video_path,
-                "-vf", filter_complex,
-                "-vsync", "vfr",  # Variable frame rate to match scene changes
-                "-q:v", "2",  # High quality JPEG
-                output_pattern
-            ]
-
-            # Run ffmpeg in subprocess (async-friendly)
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, stderr = await process.communicate()
-            stderr_text = stderr.decode('utf-8', errors='ignore')
-
-            if process.returncode != 0:
-                logger.warning(f"⚠️ ffmpeg scene detection had warnings: {stderr_text[:500]}")
-
-            # Get frame files
-            frame_files = sorted(Path(self.temp_dir).glob("scene_*.jpg"))
-
-            # Parse timestamps from stderr (showinfo output)
-            timestamps = self._parse_showinfo_timestamps(stderr_text)
-
-            logger.info(f"📊 Found {len(frame_files)} frames and {len(timestamps)} timestamps")
-
-            # Build frame list
-            frames = []
-            for idx, frame_file in enumerate(frame_files):
-                # Use metadata timestamp if available, otherwise estimate
-                if idx < len(timestamps):
-                    timestamp_seconds = timestamps[idx]
-                else:
-                    logger.warning(f"⚠️ No timestamp for frame {idx}, using estimate")
-                    timestamp_seconds = idx * self.min_interval_seconds
-
-                frames.append({
-                    "path": str(frame_file),
-                    "timestamp_seconds": timestamp_seconds,
-                    "time_formatted": self._format_timestamp(timestamp_seconds),
-                    "hash": None  # Will be computed later
-                })
-
-            # Post-process filter: Enforce minimum interval
-            # The ffmpeg filter sometimes lets through frames that are too close
-            filtered_frames = []
-            last_timestamp = -self.min_interval_seconds  # Allow first frame
-
-            for frame in frames:
-                if frame["timestamp_seconds"] - last_timestamp >= self.min_interval_seconds:
-                    filtered_frames.append(frame)
-                    last_timestamp = frame["timestamp_seconds"]
-                else:
-                    logger.debug(f"🔍 Filtered out frame at {frame['time_formatted']} (too close to previous)")
-
-            if len(filtered_frames) < len(frames):
-                logger.info(f"🔍 Filtered {len(frames) - len(filtered_frames)} frames that were too close together")
-
-            return filtered_frames
-
-        except Exception as e:
-            logger.error(f"❌ Scene detection failed: {e}", exc_info=True)
-            return []
-
-    async def _extract_by_interval(self, video_path: str) -> List[Dict[str, any]]:
+            for batch, future in zip(batches, futures):
+                try:
+                    analyses = await future
+                except Exception as e:
+                    # Broken pool or worker crash - keep frames unhashed rather than lose them
+                    logger.warning(f"⚠️ Frame analysis batch failed, keeping frames by default: {e}")
+                    if isinstance(e, BrokenProcessPool):
+                        reset_frame_analysis_pool(pool)
+                    analyses = [{'keep': True, 'reason': 'analysis failed', 'hash': None} for _ in batch]
+                for frame, analysis in zip(batch, analyses):
+                    yield frame, analysis
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def _sample_frames(self, video_path: str) -> List[Dict[str, any]]:
         """
-        Fallback: Extract frames at fixed intervals
+        Pick frames in a single decode pass and encode only the ones kept
+
+        The video is decoded once into small grayscale frames (see
+        processors/frame_sampler.py); scene detection and the minimum interval
+        are applied in-stream, falling back to fixed intervals when there are
+        no scene changes. Full-resolution JPEGs are then written just for the
+        selected timestamps.
 
         Returns:
             List of frames with timestamps
         """
-        logger.info(f"⏱️ Extracting frames every {self.min_interval_seconds} seconds...")
+        logger.info("🔍 Sampling video for scene changes (single pass)...")
 
         try:
-            # Get video duration first
-            duration = await self._get_video_duration(video_path)
-
-            if not duration:
-                logger.error("❌ Could not determine video duration")
+            timestamps, from_scenes = await select_frame_timestamps(video_path, self.min_interval_seconds)
+            if not timestamps:
                 return []
+            if from_scenes:
+                logger.info(f"🎯 Detected {len(timestamps)} scene changes")
+            else:
+                logger.warning(f"⚠️ No scene changes detected, using frames every {self.min_interval_seconds} seconds")
 
-            frames = []
-            output_pattern = os.path.join(self.temp_dir, "frame_%04d.jpg")
-
-            # Extract one frame every N seconds
-            cmd = [
-                "ffmpeg",
-                "-i", video_path,
-                "-vf", f"fps=1/{self.min_interval_seconds}",
-                "-q:v", "2",  # High quality JPEG
-                output_pattern
-            ]
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            await process.communicate()
-
-            # Collect extracted frames
-            frame_files = sorted(Path(self.temp_dir).glob("frame_*.jpg"))
-
-            for idx, frame_file in enumerate(frame_files):
-                timestamp_seconds = idx * self.min_interval_seconds
-
-                frames.append({
-                    "path": str(frame_file),
+            encoded = await encode_frames(video_path, timestamps, self.temp_dir)
+            return [
+                {
+                    "path": path,
                     "timestamp_seconds": timestamp_seconds,
                     "time_formatted": self._format_timestamp(timestamp_seconds),
-                    "hash": None
-                })
-
-            return frames
-
-        except Exception as e:
-            logger.error(f"❌ Interval extraction failed: {e}", exc_info=True)
-            return []
-
-
-    async def _get_video_duration(self, video_path: str) -> Optional[float]:
-        """Get video duration in seconds using ffprobe"""
-        try:
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                video_path
+                    "hash": None  # Computed during analysis
+                }
+                for timestamp_seconds, path in encoded
             ]
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-
-            stdout, _ = await process.communicate()
-            duration_str = stdout.decode('utf-8').strip()
-
-            return float(duration_str)
-
+        except FileNotFoundError:
+            logger.error("❌ ffmpeg not found - install ffmpeg to extract video frames")
+            return []
         except Exception as e:
-            logger.error(f"❌ Could not get video duration: {e}")
-            return None
-
-    def _parse_showinfo_timestamps(self, stderr_text: str) -> List[float]:
-        """Parse timestamps from ffmpeg showinfo filter output in stderr"""
-        import re
-
-        timestamps = []
-        # showinfo outputs lines like: [Parsed_showinfo_1 @ 0x...] n:0 pts:18304 pts_time:1.144 ...
-        # Note: pts_time is followed by a space and value, not a colon
-        pattern = r'\[Parsed_showinfo.*?\]\s+n:\s*\d+.*?pts_time:([\d.]+)'
-
-        for match in re.finditer(pattern, stderr_text):
-            try:
-                timestamps.append(float(match.group(1)))
-            except ValueError:
-                continue
-
-        logger.info(f"📋 Parsed {len(timestamps)} timestamps from showinfo")
-        return timestamps
+            logger.error(f"❌ Frame sampling failed: {e}", exc_info=True)
+            return []
 
     def _is_screen_share_frame(self, frame_path: str) -> bool:
         """
         Determine if a frame contains screen share content vs just a person's face.
 
-        Uses two detection methods:
-        1. Face detection - if a large face is detected, it's likely a webcam feed
-        2. Edge density analysis - screen shares have more sharp edges (UI, text, slides)
+        In-process wrapper around classify_frame() (extract_frames() runs the
+        same check on the analysis pool).
 
         Args:
             frame_path: Path to the frame image file
@@ -359,80 +438,11 @@ class FrameExtractor:
         Returns:
             True if frame appears to be screen share content, False if it's just a face
         """
-        if not CV2_AVAILABLE or self.face_cascade is None:
-            # If OpenCV not available, default to keeping the frame
-            logger.debug(f"⚠️ OpenCV not available, keeping frame by default")
-            return True
-
-        try:
-            # Read the image
-            img = cv2.imread(frame_path)
-            if img is None:
-                logger.warning(f"⚠️ Could not read frame {frame_path}")
-                return True  # Keep frame by default if we can't read it
-
-            # Convert to grayscale for analysis
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-            # 2. Edge density analysis (do this FIRST - it's more reliable)
-            edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.count_nonzero(edges) / edges.size
-
-            # 1. Upper body detection - detects head, shoulders, torso (better for webcam detection)
-            if self.upperbody_cascade is not None:
-                upperbodies = self.upperbody_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=3)
-
-                if len(upperbodies) > 0:
-                    # Calculate upper body area ratio
-                    upperbody_area = sum(w * h for (x, y, w, h) in upperbodies)
-                    frame_area = img.shape[0] * img.shape[1]
-                    upperbody_ratio = upperbody_area / frame_area
-
-                    # Upper body > 15% of frame = likely webcam/talking head
-                    if upperbody_ratio > 0.15:
-                        logger.info(f"   🚫 REJECT: Upper body {upperbody_ratio:.1%}, edges {edge_density:.1%} - webcam/talking head")
-                        return False
-                    else:
-                        logger.info(f"   👤 Upper body {upperbody_ratio:.1%} detected but below threshold")
-
-            # 2. Face detection
-            faces = self.face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=2)
-
-            if len(faces) > 0:
-                # Calculate face area ratio
-                face_area = sum(w * h for (x, y, w, h) in faces)
-                frame_area = img.shape[0] * img.shape[1]
-                face_ratio = face_area / frame_area
-
-                # REJECT if face >20% - large talking head
-                if face_ratio > 0.20:
-                    logger.info(f"   🚫 REJECT: Face {face_ratio:.1%}, edges {edge_density:.1%} - large face >20%")
-                    return False
-
-                # If face >2%, keep only if edges >4%
-                if face_ratio > 0.02:
-                    if edge_density > 0.04:
-                        logger.info(f"   ✅ KEEP: Face {face_ratio:.1%}, edges {edge_density:.1%} - edges >4%")
-                        return True
-                    else:
-                        logger.info(f"   🚫 REJECT: Face {face_ratio:.1%}, edges {edge_density:.1%} - edges ≤4%")
-                        return False
-                else:
-                    # Face ≤2% - ignore as false positive, use lower edge threshold
-                    logger.info(f"   👤 Ignoring tiny face detection {face_ratio:.1%} (likely false positive)")
-
-            # No significant face detected (or face ≤2%)
-            # Keep if edges >0.01%
-            if edge_density > 0.0001:
-                logger.info(f"   ✅ KEEP: Edges {edge_density:.1%} - screen share")
-                return True
-            else:
-                logger.info(f"   🚫 REJECT: Edges {edge_density:.1%} - blank/transition screen")
-                return False
-
-        except Exception as e:
-            logger.warning(f"⚠️ Error analyzing frame {frame_path}: {e}")
-            return True  # Keep frame by default on error
+        if self._cascades is None:
+            self._cascades = load_detection_cascades()
+        keep, reason = classify_frame(frame_path, *self._cascades)
+        logger.info(reason)
+        return keep
 
     def _format_timestamp(self, seconds: float) -> str:
         """Format timestamp as MM:SS or HH:MM:SS"""
@@ -0,0 +1,224 @@
+"""
+Single-Pass Frame Sampler
+
+Decodes a video once with ffmpeg, downscaled to a small grayscale analysis
+size and sampled at a low frame rate, and reads the raw frames from stdout as
+NumPy arrays. Scene detection and the minimum-interval rule are applied in
+Python while the stream is read, so nothing is written to disk for frames
+that would be discarded.
+
+Only the frames that survive selection are encoded as full-resolution JPEGs,
+each with a fast input-seeking ffmpeg call.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Analysis stream settings: small fixed-size luma frames are enough for scene scores
+ANALYSIS_WIDTH = 320
+ANALYSIS_HEIGHT = 180
+SAMPLE_FPS = float(os.getenv('FRAME_SAMPLE_FPS', '2'))
+
+# Same threshold as ffmpeg's select='gt(scene,0.2)' used previously
+DEFAULT_SCENE_THRESHOLD = 0.2
+
+# Concurrent full-resolution JPEG encodes for selected frames
+ENCODE_CONCURRENCY = 4
+
+
+def scene_score(previous: np.ndarray, current: np.ndarray, previous_mafd: Optional[float]) -> Tuple[float, float]:
+    """
+    Scene-change score between two grayscale frames, modelled on ffmpeg's `scene`
+
+    ffmpeg scores a frame by its mean absolute frame difference (MAFD) and by
+    how much that differs from the previous MAFD, so steady motion scores low
+    and hard cuts score high.
+
+    Args:
+        previous: Previous grayscale frame (uint8)
+        current: Current grayscale frame (uint8)
+        previous_mafd: MAFD of the previous frame pair (None for the first pair)
+
+    Returns:
+        Tuple of (score in 0..1, mafd for the next call)
+    """
+    mafd = float(np.mean(np.abs(current.astype(np.int16) - previous.astype(np.int16))))
+    diff = abs(mafd - previous_mafd) if previous_mafd is not None else mafd
+    return min(max(min(mafd, diff) / 100.0, 0.0), 1.0), mafd
+
+
+class FrameSelector:
+    """
+    In-stream frame selection: scene changes at least min_interval_seconds apart,
+    with fixed-interval timestamps as the fallback when no scene changes occur
+    """
+
+    def __init__(self, min_interval_seconds: float, scene_threshold: float = DEFAULT_SCENE_THRESHOLD):
+        """
+        Args:
+            min_interval_seconds: Minimum time between selected frames
+            scene_threshold: Scene score above which a frame counts as a scene change
+        """
+        self.min_interval_seconds = min_interval_seconds
+        self.scene_threshold = scene_threshold
+
+        self.scene_timestamps: List[float] = []
+        self.interval_timestamps: List[float] = []
+        self.scene_changes = 0  # Scene changes seen, including ones dropped by the interval rule
+
+        self._previous: Optional[np.ndarray] = None
+        self._previous_mafd: Optional[float] = None
+        self._last_scene = -min_interval_seconds  # Allow first frame
+        self._next_interval = 0.0
+
+    def push(self, timestamp: float, frame: np.ndarray) -> None:
+        """Consume the next sampled frame"""
+        if timestamp >= self._next_interval:
+            self.interval_timestamps.append(timestamp)
+            self._next_interval = timestamp + self.min_interval_seconds
+
+        if self._previous is not None:
+            score, self._previous_mafd = scene_score(self._previous, frame, self._previous_mafd)
+            if score > self.scene_threshold:
+                self.scene_changes += 1
+                if timestamp - self._last_scene >= self.min_interval_seconds:
+                    self.scene_timestamps.append(timestamp)
+                    self._last_scene = timestamp
+
+        self._previous = frame
+
+    @property
+    def selected(self) -> List[float]:
+        """Scene-change timestamps, or fixed-interval ones if no scene changed"""
+        return self.scene_timestamps or self.interval_timestamps
+
+
+def build_sample_command(video_path: str, fps: float = SAMPLE_FPS) -> List[str]:
+    """ffmpeg command that writes downscaled raw grayscale frames to stdout"""
+    return [
+        "ffmpeg",
+        "-v", "error",
+        "-i", str(video_path),
+        "-an", "-sn",
+        "-vf", f"fps={fps},scale={ANALYSIS_WIDTH}:{ANALYSIS_HEIGHT}",
+        "-pix_fmt", "gray",
+        "-f", "rawvideo",
+        "pipe:1"
+    ]
+
+
+async def select_frame_timestamps(
+    video_path: str,
+    min_interval_seconds: float,
+    scene_threshold: float = DEFAULT_SCENE_THRESHOLD,
+    fps: float = SAMPLE_FPS
+) -> Tuple[List[float], bool]:
+    """
+    Decode the video once and pick the timestamps worth keeping
+
+    Args:
+        video_path: Path to video file
+        min_interval_seconds: Minimum time between selected frames
+        scene_threshold: Scene score threshold (0..1)
+        fps: Analysis sampling rate
+
+    Returns:
+        Tuple of (timestamps, from_scene_detection) - from_scene_detection is
+        False when no scene changes were found and fixed intervals were used
+    """
+    selector = FrameSelector(min_interval_seconds, scene_threshold)
+    frame_size = ANALYSIS_WIDTH * ANALYSIS_HEIGHT
+
+    process = await asyncio.create_subprocess_exec(
+        *build_sample_command(video_path, fps),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    # Drain stderr concurrently so a chatty ffmpeg can't block on a full pipe
+    stderr_task = asyncio.create_task(process.stderr.read())
+
+    frame_count = 0
+    try:
+        while True:
+            try:
+                data = await process.stdout.readexactly(frame_size)
+            except asyncio.IncompleteReadError:
+                break
+            frame = np.frombuffer(data, dtype=np.uint8).reshape(ANALYSIS_HEIGHT, ANALYSIS_WIDTH)
+            selector.push(frame_count / fps, frame)
+            frame_count += 1
+    finally:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+        stderr_text = (await stderr_task).decode('utf-8', errors='ignore')
+
+    if frame_count == 0:
+        logger.warning(f"⚠️ ffmpeg produced no frames: {stderr_text[:500]}")
+        return [], False
+
+    logger.info(
+        f"📊 Sampled {frame_count} frames ({frame_count / fps:.0f}s at {fps:g} fps): "
+        f"{selector.scene_changes} scene changes, {len(selector.scene_timestamps)} kept after "
+        f"{min_interval_seconds:g}s interval rule"
+    )
+    return selector.selected, bool(selector.scene_timestamps)
+
+
+async def encode_frame(video_path: str, timestamp: float, output_path: str) -> bool:
+    """
+    Encode one full-resolution JPEG at timestamp (input seeking, single frame decode)
+
+    Returns:
+        True if the JPEG was written
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-v", "error", "-y",
+        "-ss", f"{timestamp:.3f}",
+        "-i", str(video_path),
+        "-frames:v", "1",
+        "-q:v", "2",  # High quality JPEG
+        str(output_path),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0 or not Path(output_path).exists():
+        logger.warning(f"⚠️ Could not encode frame at {timestamp:.1f}s: {stderr.decode('utf-8', errors='ignore')[:200]}")
+        return False
+    return True
+
+
+async def encode_frames(
+    video_path: str,
+    timestamps: List[float],
+    output_dir: str,
+    prefix: str = "scene"
+) -> List[Tuple[float, str]]:
+    """
+    Encode full-resolution JPEGs for the selected timestamps
+
+    Returns:
+        (timestamp, path) pairs in timestamp order for frames that were written
+    """
+    semaphore = asyncio.Semaphore(ENCODE_CONCURRENCY)
+
+    async def encode(index: int, timestamp: float) -> Optional[Tuple[float, str]]:
+        output_path = os.path.join(output_dir, f"{prefix}_{index:04d}.jpg")
+        async with semaphore:
+            if await encode_frame(video_path, timestamp, output_path):
+                return timestamp, output_path
+        return None
+
+    results = await asyncio.gather(*(encode(i, t) for i, t in enumerate(timestamps, 1)))
+    return [result for result in results if result]
@@ -0,0 +1,68 @@
+"""
+Tests for processors/audio_splitter.py
+
+Tests ffmpeg command construction and segment-list parsing.
+ffmpeg itself is not invoked.
+"""
+
+import pytest
+
+from processors.audio_splitter import build_segment_command, parse_segment_list_line
+
+
+class TestBuildSegmentCommand:
+    """Tests for build_segment_command()"""
+
+    @pytest.mark.unit
+    def test_stream_copies_mp3(self, tmp_path):
+        """Should segment MP3 without re-encoding"""
+        cmd, extension = build_segment_command('episode.mp3', str(tmp_path), 1200, 'mp3')
+
+        assert extension == '.mp3'
+        assert cmd[cmd.index('-c:a') + 1] == 'copy'
+        assert cmd[cmd.index('-f') + 1] == 'segment'
+        assert cmd[cmd.index('-segment_time') + 1] == '1200'
+        assert cmd[cmd.index('-segment_list') + 1] == 'pipe:1'
+        assert cmd[-1] == str(tmp_path / 'chunk_%04d.mp3')
+
+    @pytest.mark.unit
+    def test_stream_copies_aac_into_adts(self, tmp_path):
+        """Should write AAC audio as standalone ADTS chunks"""
+        cmd, extension = build_segment_command('episode.m4a', str(tmp_path), 1200, 'aac')
+
+        assert extension == '.aac'
+        assert cmd[cmd.index('-segment_format') + 1] == 'adts'
+        assert cmd[cmd.index('-c:a') + 1] == 'copy'
+
+    @pytest.mark.unit
+    def test_falls_back_to_mp3_reencode_for_unknown_codec(self, tmp_path):
+        """Should re-encode to MP3 when the codec cannot be stream-copied"""
+        cmd, extension = build_segment_command('episode.wma', str(tmp_path), 600, None)
+
+        assert extension == '.mp3'
+        assert cmd[cmd.index('-c:a') + 1] == 'libmp3lame'
+
+
+class TestParseSegmentListLine:
+    """Tests for parse_segment_list_line()"""
+
+    @pytest.mark.unit
+    def test_parses_csv_line(self, tmp_path):
+        """Should return start offset and chunk path"""
+        result = parse_segment_list_line('chunk_0001.mp3,1200.012000,2400.000000\n', str(tmp_path))
+
+        assert result == (1200.012, str(tmp_path / 'chunk_0001.mp3'))
+
+    @pytest.mark.unit
+    def test_keeps_absolute_paths(self, tmp_path):
+        """Should keep absolute filenames reported by ffmpeg"""
+        path = str(tmp_path / 'chunk_0000.mp3')
+        result = parse_segment_list_line(f'{path},0.000000,1200.000000', str(tmp_path))
+
+        assert result == (0.0, path)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('line', ['', '\n', 'garbage', 'chunk.mp3,abc,def'])
+    def test_ignores_malformed_lines(self, line, tmp_path):
+        """Should return None for blank or malformed lines"""
+        assert parse_segment_list_line(line, str(tmp_path)) is None
@@ -0,0 +1,133 @@
+"""
+Tests for core/browser_pool.py
+
+Tests browser checkout, recycling after max pages and relaunch of
+disconnected browsers. Playwright is mocked.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from core.browser_pool import BrowserPool, build_browser_args
+
+
+def make_playwright():
+    """Mock Playwright whose chromium.launch() returns a fresh connected browser each call"""
+    def launch(**kwargs):
+        browser = Mock()
+        browser.is_connected.return_value = True
+        browser.new_context = AsyncMock(side_effect=lambda **options: AsyncMock())
+        browser.close = AsyncMock()
+        return browser
+
+    playwright = Mock()
+    playwright.chromium.launch = AsyncMock(side_effect=launch)
+    return playwright
+
+
+class TestBuildBrowserArgs:
+    """Tests for build_browser_args()"""
+
+    @pytest.mark.unit
+    def test_default_args_use_single_process(self):
+        """Should use --single-process for regular fetches"""
+        args = build_browser_args(media_enabled=False)
+        assert '--single-process' in args
+        assert not any(arg.startswith('--enable-features') for arg in args)
+
+    @pytest.mark.unit
+    def test_media_args_skip_single_process(self):
+        """Should drop --single-process and enable media for Q4 pages"""
+        args = build_browser_args(media_enabled=True)
+        assert '--single-process' not in args
+        assert '--autoplay-policy=no-user-gesture-required' in args
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool"""
+
+    @pytest.mark.unit
+    async def test_warm_start_launches_all_browsers(self):
+        """Should launch every slot up front when warm"""
+        playwright = make_playwright()
+        pool = BrowserPool('test', [], size=2, max_pages_per_browser=10)
+
+        await pool.start(playwright)
+
+        assert playwright.chromium.launch.await_count == 2
+        assert pool.status()['launched'] == 2
+        assert pool.status()['idle'] == 2
+
+    @pytest.mark.unit
+    async def test_lazy_start_launches_on_first_use(self):
+        """Should not launch until checkout when warm=False"""
+        playwright = make_playwright()
+        pool = BrowserPool('test', [], size=1, max_pages_per_browser=10, warm=False)
+
+        await pool.start(playwright)
+        assert playwright.chromium.launch.await_count == 0
+
+        async with pool.context():
+            pass
+
+        assert playwright.chromium.launch.await_count == 1
+
+    @pytest.mark.unit
+    async def test_reuses_browser_and_closes_context(self):
+        """Should serve consecutive requests from the same browser with fresh contexts"""
+        playwright = make_playwright()
+        pool = BrowserPool('test', [], size=1, max_pages_per_browser=10)
+        await pool.start(playwright)
+
+        async with pool.context(locale='en-US') as context:
+            first = context
+        async with pool.context() as context:
+            second = context
+
+        assert playwright.chromium.launch.await_count == 1
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
+        assert pool.status()['pages_served'] == 2
+
+    @pytest.mark.unit
+    async def test_recycles_after_max_pages(self):
+        """Should close and relaunch a browser once it has served max pages"""
+        playwright = make_playwright()
+        pool = BrowserPool('test', [], size=1, max_pages_per_browser=2)
+        await pool.start(playwright)
+        original = pool._slots[0].browser
+
+        for _ in range(2):
+            async with pool.context():
+                pass
+
+        original.close.assert_awaited_once()
+        assert pool._slots[0].browser is not original
+        assert pool.status()['recycled'] == 1
+
+    @pytest.mark.unit
+    async def test_relaunches_disconnected_browser(self):
+        """Should replace a crashed browser on checkout"""
+        playwright = make_playwright()
+        pool = BrowserPool('test', [], size=1, max_pages_per_browser=10)
+        await pool.start(playwright)
+        crashed = pool._slots[0].browser
+        crashed.is_connected.return_value = False
+
+        async with pool.context():
+            pass
+
+        assert pool._slots[0].browser is not crashed
+        assert playwright.chromium.launch.await_count == 2
+
+    @pytest.mark.unit
+    async def test_returns_slot_when_fetch_raises(self):
+        """Should put the browser back in the pool even if the caller fails"""
+        pool = BrowserPool('test', [], size=1, max_pages_per_browser=10)
+        await pool.start(make_playwright())
+
+        with pytest.raises(RuntimeError):
+            async with pool.context():
+                raise RuntimeError("navigation failed")
+
+        assert pool.status()['idle'] == 1
@@ -0,0 +1,197 @@
+"""
+Tests for processors/chunked_transcriber.py
+
+Tests bounded-concurrency chunk scheduling, ordered reassembly and
+per-chunk retries. The DeepGram-backed FileTranscriber is mocked.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+from processors.chunked_transcriber import ChunkedTranscriber
+
+
+def make_result(chunk_path, text):
+    """Build a FileTranscriber-style result for a chunk"""
+    return {
+        'transcript_data': {
+            'text': text,
+            'segments': [{'start': 1.0, 'end': 3.0, 'text': text}],
+            'words': [{'word': text, 'start': 1.0, 'end': 1.5, 'confidence': 0.9}],
+        },
+        'output_file': None
+    }
+
+
+@pytest.fixture
+def chunks():
+    """Three chunks of 20 minutes each"""
+    return [(0.0, 'chunk0.mp3'), (1200.0, 'chunk1.mp3'), (2400.0, 'chunk2.mp3')]
+
+
+class TestTranscribeChunks:
+    """Tests for transcribe_chunks()"""
+
+    @pytest.mark.unit
+    async def test_reassembles_in_chunk_order_with_offsets(self, chunks):
+        """Should merge results in chunk order even when chunks finish out of order"""
+        delays = {'chunk0.mp3': 0.05, 'chunk1.mp3': 0.0, 'chunk2.mp3': 0.02}
+
+        def transcribe_file(path, **kwargs):
+            time.sleep(delays[path])
+            return make_result(path, path.split('.')[0])
+
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = transcribe_file
+
+        result = await ChunkedTranscriber(transcriber, max_concurrency=3).transcribe_chunks(chunks)
+
+        assert result['text'] == 'chunk0 chunk1 chunk2'
+        assert [s['start'] for s in result['segments']] == [1.0, 1201.0, 2401.0]
+        assert [w['end'] for w in result['words']] == [1.5, 1201.5, 2401.5]
+        assert result['segments'][0]['duration'] == 2.0
+        assert result['chunks_completed'] == 3
+        assert result['failed_chunks'] == []
+
+    @pytest.mark.unit
+    async def test_respects_concurrency_limit(self, chunks):
+        """Should never run more chunks at once than max_concurrency"""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def transcribe_file(path, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return make_result(path, path)
+
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = transcribe_file
+
+        await ChunkedTranscriber(transcriber, max_concurrency=2).transcribe_chunks(chunks)
+
+        assert peak <= 2
+
+    @pytest.mark.unit
+    async def test_retries_only_failed_chunk(self, chunks):
+        """Should retry the failing chunk without re-running successful ones"""
+        attempts = {'chunk0.mp3': 0, 'chunk1.mp3': 0, 'chunk2.mp3': 0}
+
+        def transcribe_file(path, **kwargs):
+            attempts[path] += 1
+            if path == 'chunk1.mp3' and attempts[path] == 1:
+                raise ConnectionError("upload reset")
+            return make_result(path, path)
+
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = transcribe_file
+
+        scheduler = ChunkedTranscriber(transcriber, max_retries=2, retry_backoff_seconds=0)
+        result = await scheduler.transcribe_chunks(chunks)
+
+        assert attempts == {'chunk0.mp3': 1, 'chunk1.mp3': 2, 'chunk2.mp3': 1}
+        assert result['chunks_completed'] == 3
+
+    @pytest.mark.unit
+    async def test_reports_partial_result_when_retries_exhausted(self, chunks):
+        """Should return remaining chunks and list the failed index"""
+        def transcribe_file(path, **kwargs):
+            if path == 'chunk2.mp3':
+                raise ConnectionError("still failing")
+            return make_result(path, path)
+
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = transcribe_file
+
+        scheduler = ChunkedTranscriber(transcriber, max_retries=1, retry_backoff_seconds=0)
+        result = await scheduler.transcribe_chunks(chunks)
+
+        assert result['chunks_completed'] == 2
+        assert result['total_chunks'] == 3
+        assert result['failed_chunks'] == [2]
+        assert transcriber.transcribe_file.call_count == 4
+
+    @pytest.mark.unit
+    async def test_emits_progress_events(self, chunks):
+        """Should call progress_callback once per completed chunk"""
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = lambda path, **kwargs: make_result(path, path)
+        events = []
+
+        async def progress_callback(event_type, data):
+            events.append((event_type, data['current'], data['total']))
+
+        await ChunkedTranscriber(transcriber).transcribe_chunks(chunks, progress_callback=progress_callback)
+
+        assert [e[1] for e in events] == [1, 2, 3]
+        assert all(e[0] == 'transcribing_chunk' and e[2] == 3 for e in events)
+
+    @pytest.mark.unit
+    async def test_accepts_async_chunk_stream(self, chunks):
+        """Should dispatch chunks from an async iterator as they are yielded"""
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = lambda path, **kwargs: make_result(path, path.split('.')[0])
+
+        async def chunk_stream():
+            for chunk in chunks:
+                await asyncio.sleep(0)
+                yield chunk
+
+        result = await ChunkedTranscriber(transcriber).transcribe_chunks(chunk_stream(), expected_chunks=3)
+
+        assert result['text'] == 'chunk0 chunk1 chunk2'
+        assert result['total_chunks'] == 3
+        assert result['chunks_completed'] == 3
+
+    @pytest.mark.unit
+    async def test_deadline_covers_stalled_chunk_stream(self, chunks):
+        """Should stop waiting on a stalled chunk source at the deadline and keep finished chunks"""
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = lambda path, **kwargs: make_result(path, path.split('.')[0])
+        closed = []
+
+        async def stalled_stream():
+            try:
+                yield chunks[0]
+                await asyncio.sleep(60)
+                yield chunks[1]
+            finally:
+                closed.append(True)
+
+        started = time.time()
+        result = await ChunkedTranscriber(transcriber).transcribe_chunks(stalled_stream(), timeout_seconds=0.2)
+
+        assert time.time() - started < 5
+        assert result['text'] == 'chunk0'
+        assert result['total_chunks'] == 1
+        assert closed == [True]
+
+    @pytest.mark.unit
+    async def test_deadline_waits_for_in_flight_uploads(self, chunks):
+        """Should not return (so chunk files aren't deleted) until running DeepGram calls finish"""
+        finished = []
+        events = []
+
+        def transcribe_file(path, cancel_event=None):
+            events.append(cancel_event)
+            time.sleep(0.3)
+            finished.append(path)
+            return make_result(path, path)
+
+        transcriber = Mock()
+        transcriber.transcribe_file.side_effect = transcribe_file
+
+        result = await ChunkedTranscriber(transcriber, max_concurrency=1).transcribe_chunks(chunks, timeout_seconds=0.1)
+
+        assert finished == ['chunk0.mp3']
+        assert transcriber.transcribe_file.call_count == 1
+        assert result['chunks_completed'] == 0
+        assert events[0].is_set()
@@ -0,0 +1,136 @@
+"""
+Tests for core/claude_client.py
+
+Tests shared client reuse, the async call path and the opt-in debug dump.
+The Braintrust-wrapped OpenAI clients are mocked.
+"""
+
+import logging
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+import core.claude_client as claude_client
+from core.claude_client import ClaudeClient
+
+
+def make_completion(text):
+    """Build an OpenAI-style chat completion"""
+    message = Mock()
+    message.choices = [Mock(message=Mock(content=text))]
+    return message
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """ClaudeClient rooted in a temp dir with Braintrust login stubbed"""
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+    monkeypatch.delenv('CLAUDE_DEBUG_DUMP', raising=False)
+    with patch.object(claude_client.braintrust, 'login'):
+        return ClaudeClient('claude', tmp_path, logging.getLogger('test'))
+
+
+class TestSharedClients:
+    """Tests for the process-wide client factories"""
+
+    @pytest.mark.unit
+    def test_sync_client_created_once(self, monkeypatch, tmp_path):
+        """Should build the wrapped OpenAI client only once per process"""
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+        monkeypatch.setattr(claude_client, '_sync_client', None)
+
+        with patch.object(claude_client.braintrust, 'wrap_openai', side_effect=lambda c: c) as wrap:
+            first = claude_client.get_shared_client(tmp_path)
+            second = claude_client.get_shared_client(tmp_path)
+
+        assert first is second
+        assert wrap.call_count == 1
+
+    @pytest.mark.unit
+    async def test_async_client_shared_within_loop(self, monkeypatch, tmp_path):
+        """Should reuse one AsyncOpenAI client per event loop"""
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+        monkeypatch.setattr(claude_client, '_async_clients', {})
+
+        with patch.object(claude_client.braintrust, 'wrap_openai', side_effect=lambda c: c):
+            first = claude_client.get_shared_async_client(tmp_path)
+            second = claude_client.get_shared_async_client(tmp_path)
+
+        assert first is second
+
+    @pytest.mark.unit
+    def test_missing_api_key_raises(self, monkeypatch, tmp_path):
+        """Should raise ValueError when ANTHROPIC_API_KEY is unset"""
+        monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)
+        monkeypatch.setattr(claude_client, '_sync_client', None)
+
+        with pytest.raises(ValueError):
+            claude_client.get_shared_client(tmp_path)
+
+
+class TestClaudeClient:
+    """Tests for ClaudeClient.call_api() / acall_api()"""
+
+    @pytest.mark.unit
+    def test_call_api_returns_stripped_text(self, client):
+        """Should return the completion text without writing debug files"""
+        shared = Mock()
+        shared.chat.completions.create.return_value = make_completion('  {"summary": "ok"}\n')
+
+        with patch.object(claude_client, 'get_shared_client', return_value=shared):
+            response = client.call_api('prompt')
+
+        assert response == '{"summary": "ok"}'
+        assert not (client.logs_dir / 'debug_prompt.txt').exists()
+
+    @pytest.mark.unit
+    async def test_acall_api_awaits_async_client(self, client):
+        """Should await the shared async client"""
+        shared = Mock()
+        shared.chat.completions.create = AsyncMock(return_value=make_completion('answer'))
+
+        with patch.object(claude_client, 'get_shared_async_client', return_value=shared):
+            response = await client.acall_api('prompt')
+
+        assert response == 'answer'
+        shared.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.unit
+    def test_empty_response_raises(self, client):
+        """Should raise RuntimeError on an empty completion"""
+        shared = Mock()
+        shared.chat.completions.create.return_value = make_completion('')
+
+        with patch.object(claude_client, 'get_shared_client', return_value=shared):
+            with pytest.raises(RuntimeError):
+                client.call_api('prompt')
+
+    @pytest.mark.unit
+    def test_debug_dump_opt_in(self, client):
+        """Should write prompt and response files only when CLAUDE_DEBUG_DUMP is set"""
+        client.debug_dump = True
+        shared = Mock()
+        shared.chat.completions.create.return_value = make_completion('answer')
+
+        with patch.object(claude_client, 'get_shared_client', return_value=shared):
+            client.call_api('prompt')
+
+        assert (client.logs_dir / 'debug_prompt.txt').read_text() == 'prompt'
+        assert 'answer' in (client.logs_dir / 'debug_response.txt').read_text()
+
+    @pytest.mark.unit
+    async def test_astream_api_yields_deltas(self, client):
+        """Should yield non-empty content deltas from the streamed completion"""
+        async def stream():
+            for text in ['{"summary": ', None, '"hi"}']:
+                event = Mock()
+                event.choices = [Mock(delta=Mock(content=text))]
+                yield event
+
+        shared = Mock()
+        shared.chat.completions.create = AsyncMock(return_value=stream())
+
+        with patch.object(claude_client, 'get_shared_async_client', return_value=shared):
+            deltas = [delta async for delta in client.astream_api('prompt')]
+
+        assert deltas == ['{"summary": ', '"hi"}']
+        assert shared.chat.completions.create.await_args.kwargs['stream'] is True
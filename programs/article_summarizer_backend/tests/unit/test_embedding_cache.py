@@ -0,0 +1,74 @@
+"""
+Tests for core/embedding_cache.py
+
+Tests key normalization, LRU eviction and the Supabase tier (mocked).
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from core.embedding_cache import EmbeddingCache, make_embedding_key, normalize_embedding_text
+
+
+class TestEmbeddingKeys:
+    """Tests for normalize_embedding_text() and make_embedding_key()"""
+
+    @pytest.mark.unit
+    def test_whitespace_differences_normalize_to_same_text(self):
+        """Should collapse whitespace so reformatted text maps to one key"""
+        assert normalize_embedding_text("Title: A\n\n  Summary:\tB ") == "Title: A Summary: B"
+
+    @pytest.mark.unit
+    def test_key_depends_on_model_and_dimensions(self):
+        """Should produce different keys for different models or dimensions"""
+        base = make_embedding_key("text", "text-embedding-3-small", 384)
+
+        assert base == make_embedding_key("text", "text-embedding-3-small", 384)
+        assert base != make_embedding_key("text", "text-embedding-3-small", 1536)
+        assert base != make_embedding_key("text", "text-embedding-3-large", 384)
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache"""
+
+    @pytest.mark.unit
+    def test_round_trip_in_process(self):
+        """Should return stored vectors and report misses"""
+        cache = EmbeddingCache(use_supabase=False)
+        cache.set_many({'a': [0.1], 'b': [0.2]})
+
+        assert cache.get_many(['a', 'b', 'c']) == {'a': [0.1], 'b': [0.2]}
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """Should drop the least recently used entry when over capacity"""
+        cache = EmbeddingCache(max_entries=2, use_supabase=False)
+        cache.set_many({'a': [1.0], 'b': [2.0]})
+        cache.get_many(['a'])  # 'b' is now least recently used
+        cache.set_many({'c': [3.0]})
+
+        assert cache.get_many(['a', 'b', 'c']) == {'a': [1.0], 'c': [3.0]}
+
+    @pytest.mark.unit
+    def test_supabase_hits_are_promoted(self):
+        """Should look up misses in Supabase and keep them in the LRU"""
+        supabase = Mock()
+        supabase.table.return_value.select.return_value.in_.return_value.execute.return_value = Mock(
+            data=[{'cache_key': 'a', 'embedding': [0.5]}]
+        )
+        cache = EmbeddingCache(use_supabase=True, supabase=supabase)
+
+        assert cache.get_many(['a']) == {'a': [0.5]}
+        assert cache.get_many(['a']) == {'a': [0.5]}
+        assert supabase.table.return_value.select.call_count == 1
+
+    @pytest.mark.unit
+    def test_supabase_failure_disables_tier(self):
+        """Should fall back to in-process only after a Supabase error"""
+        supabase = Mock()
+        supabase.table.return_value.select.return_value.in_.return_value.execute.side_effect = Exception("relation does not exist")
+        cache = EmbeddingCache(use_supabase=True, supabase=supabase)
+
+        assert cache.get_many(['a']) == {}
+        assert cache.supabase is None
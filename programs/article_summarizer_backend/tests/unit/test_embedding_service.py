@@ -0,0 +1,126 @@
+"""
+Tests for core/embedding_service.py
+
+Tests request batching, ordered results, retries on rate limits and
+per-batch failure isolation. The OpenAI client is mocked.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+
+import httpx
+from openai import RateLimitError
+
+from core.embedding_cache import EmbeddingCache
+from core.embedding_service import EmbeddingService, MAX_INPUT_CHARS
+
+
+def make_client(fail_first=0, fail_inputs=None):
+    """Mock OpenAI client returning [len(text)] vectors; optionally rate-limits or fails"""
+    client = Mock()
+    calls = []
+    lock = threading.Lock()
+
+    def create(model, input, dimensions):
+        with lock:
+            calls.append(list(input))
+            attempt = len(calls)
+        if attempt <= fail_first:
+            response = httpx.Response(429, request=httpx.Request('POST', 'https://api.openai.com'))
+            raise RateLimitError("rate limited", response=response, body=None)
+        if fail_inputs and any(text in fail_inputs for text in input):
+            raise ValueError("bad input")
+        # Return items out of order to check index-based placement
+        data = [Mock(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+        return Mock(data=list(reversed(data)))
+
+    client.embeddings.create.side_effect = create
+    return client, calls
+
+
+class TestEmbedMany:
+    """Tests for EmbeddingService.embed_many()"""
+
+    @pytest.mark.unit
+    def test_groups_texts_into_batches(self):
+        """Should send batch_size texts per request"""
+        client, calls = make_client()
+        service = EmbeddingService(client, batch_size=2, max_concurrency=1)
+
+        service.embed_many(['a', 'bb', 'ccc', 'dddd', 'eeeee'])
+
+        assert [len(batch) for batch in calls] == [2, 2, 1]
+
+    @pytest.mark.unit
+    def test_results_follow_input_order(self):
+        """Should map vectors back to their input positions, skipping empty texts"""
+        client, _ = make_client()
+        service = EmbeddingService(client, batch_size=2, max_concurrency=3)
+
+        vectors = service.embed_many(['a', '', 'ccc', '  ', 'eeeee'])
+
+        assert vectors == [[1.0], None, [3.0], None, [5.0]]
+
+    @pytest.mark.unit
+    def test_truncates_long_inputs(self):
+        """Should cap each input at MAX_INPUT_CHARS"""
+        client, calls = make_client()
+
+        EmbeddingService(client).embed_one('x' * (MAX_INPUT_CHARS + 100))
+
+        assert len(calls[0][0]) == MAX_INPUT_CHARS
+
+    @pytest.mark.unit
+    def test_retries_rate_limited_batch(self):
+        """Should back off and retry when the API returns 429"""
+        client, calls = make_client(fail_first=2)
+        service = EmbeddingService(client, max_retries=3, retry_backoff_seconds=0)
+
+        assert service.embed_one('hello') == [5.0]
+        assert len(calls) == 3
+
+    @pytest.mark.unit
+    def test_gives_up_after_max_retries(self):
+        """Should return None once retries are exhausted"""
+        client, calls = make_client(fail_first=10)
+        service = EmbeddingService(client, max_retries=1, retry_backoff_seconds=0)
+
+        assert service.embed_one('hello') is None
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_failed_batch_does_not_affect_others(self):
+        """Should return None only for texts in the failing batch"""
+        client, _ = make_client(fail_inputs={'bad'})
+        service = EmbeddingService(client, batch_size=1, max_concurrency=2)
+
+        assert service.embed_many(['ok', 'bad', 'fine']) == [[2.0], None, [4.0]]
+
+
+class TestEmbeddingCacheIntegration:
+    """Tests for EmbeddingService with an EmbeddingCache"""
+
+    @pytest.mark.unit
+    def test_identical_text_is_embedded_once(self):
+        """Should serve repeat (whitespace-normalized) inputs from the cache"""
+        client, calls = make_client()
+        service = EmbeddingService(client, cache=EmbeddingCache(use_supabase=False))
+
+        first = service.embed_one('Title: A\n\nSummary: B')
+        second = service.embed_one('Title: A  Summary: B')
+
+        assert first == second
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_only_uncached_texts_are_sent(self):
+        """Should request embeddings just for cache misses"""
+        client, calls = make_client()
+        service = EmbeddingService(client, cache=EmbeddingCache(use_supabase=False))
+        service.embed_many(['a', 'bb'])
+
+        vectors = service.embed_many(['a', 'bb', 'ccc'])
+
+        assert vectors == [[1.0], [2.0], [3.0]]
+        assert calls[-1] == ['ccc']
@@ -0,0 +1,101 @@
+"""
+Tests for processors/frame_extractor.py
+
+Tests batched frame classification/hashing and ordered streaming of
+results. Uses small synthetic images; ffmpeg is not required.
+"""
+
+import pytest
+import numpy as np
+
+import processors.frame_extractor as frame_extractor
+from processors.frame_extractor import FrameExtractor, analyze_frame_batch, load_detection_cascades
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("imagehash")
+
+# Some OpenCV builds ship without the Haar cascade module
+CASCADES_AVAILABLE = load_detection_cascades()[0] is not None
+
+
+@pytest.fixture
+def frame_files(tmp_path):
+    """Alternating 'screen share' (grid lines) and blank frames"""
+    paths = []
+    for i in range(6):
+        img = np.zeros((120, 160, 3), dtype=np.uint8)
+        if i % 2 == 0:
+            img[::10, :] = 255
+            img[:, ::10] = 255
+        path = tmp_path / f"scene_{i:04d}.jpg"
+        cv2.imwrite(str(path), img)
+        paths.append(str(path))
+    return paths
+
+
+def make_frames(paths):
+    """Frame dicts as produced by _sample_frames()"""
+    return [
+        {"path": path, "timestamp_seconds": i * 30.0, "time_formatted": f"00:{i:02d}", "hash": None}
+        for i, path in enumerate(paths)
+    ]
+
+
+@pytest.mark.skipif(not CASCADES_AVAILABLE, reason="OpenCV Haar cascades not available")
+class TestAnalyzeFrameBatch:
+    """Tests for analyze_frame_batch()"""
+
+    @pytest.mark.unit
+    def test_keeps_edges_rejects_blank(self, frame_files):
+        """Should keep high-edge frames and reject blank ones"""
+        results = analyze_frame_batch(frame_files[:2])
+
+        assert [r['keep'] for r in results] == [True, False]
+        assert [r['path'] for r in results] == frame_files[:2]
+
+    @pytest.mark.unit
+    def test_hashes_only_kept_frames(self, frame_files):
+        """Should compute a perceptual hash only for frames that are kept"""
+        results = analyze_frame_batch(frame_files[:2])
+
+        assert results[0]['hash']
+        assert results[1]['hash'] is None
+
+
+class TestAnalyzeFrames:
+    """Tests for FrameExtractor._analyze_frames()"""
+
+    @pytest.mark.unit
+    async def test_streams_results_in_frame_order(self, frame_files, monkeypatch):
+        """Should yield every frame in order across batches"""
+        monkeypatch.setattr(frame_extractor, 'FRAME_ANALYSIS_WORKERS', 0)
+        monkeypatch.setattr(frame_extractor, 'FRAME_ANALYSIS_BATCH_SIZE', 4)
+        batches = []
+
+        def fake_analyze(paths):
+            batches.append(len(paths))
+            return [{'path': p, 'keep': p.endswith(('0.jpg', '2.jpg', '4.jpg')), 'reason': '', 'hash': None} for p in paths]
+
+        monkeypatch.setattr(frame_extractor, 'analyze_frame_batch', fake_analyze)
+        frames = make_frames(frame_files)
+
+        results = [pair async for pair in FrameExtractor()._analyze_frames(frames)]
+
+        assert sorted(batches) == [2, 4]
+        assert [frame['path'] for frame, _ in results] == frame_files
+        assert [analysis['keep'] for _, analysis in results] == [True, False] * 3
+
+    @pytest.mark.unit
+    async def test_failed_batch_keeps_frames(self, frame_files, monkeypatch):
+        """Should keep frames (unhashed) when a batch fails"""
+        monkeypatch.setattr(frame_extractor, 'FRAME_ANALYSIS_WORKERS', 0)
+
+        def broken(paths):
+            raise RuntimeError("worker crashed")
+
+        monkeypatch.setattr(frame_extractor, 'analyze_frame_batch', broken)
+
+        results = [pair async for pair in FrameExtractor()._analyze_frames(make_frames(frame_files[:2]))]
+
+        assert [analysis['keep'] for _, analysis in results] == [True, True]
+        assert all(analysis['hash'] is None for _, analysis in results)
@@ -0,0 +1,126 @@
+"""
+Tests for processors/frame_sampler.py
+
+Tests the scene score and in-stream frame selection on synthetic frames,
+plus an end-to-end sampling run that is skipped when ffmpeg is not installed.
+"""
+
+import shutil
+import pytest
+import numpy as np
+
+from processors.frame_sampler import (
+    ANALYSIS_HEIGHT,
+    ANALYSIS_WIDTH,
+    FrameSelector,
+    build_sample_command,
+    encode_frames,
+    scene_score,
+    select_frame_timestamps,
+)
+
+
+def solid(value):
+    """Solid grayscale analysis frame"""
+    return np.full((ANALYSIS_HEIGHT, ANALYSIS_WIDTH), value, dtype=np.uint8)
+
+
+class TestSceneScore:
+    """Tests for scene_score()"""
+
+    @pytest.mark.unit
+    def test_identical_frames_score_zero(self):
+        """Should score identical frames as no change"""
+        score, mafd = scene_score(solid(100), solid(100), None)
+
+        assert score == 0.0
+        assert mafd == 0.0
+
+    @pytest.mark.unit
+    def test_hard_cut_scores_high(self):
+        """Should score a black-to-white cut at the maximum"""
+        score, _ = scene_score(solid(0), solid(255), 0.0)
+
+        assert score == 1.0
+
+    @pytest.mark.unit
+    def test_steady_motion_scores_low(self):
+        """Should discount a change that matches the previous frame difference"""
+        score, _ = scene_score(solid(0), solid(60), 60.0)
+
+        assert score == 0.0
+
+
+class TestFrameSelector:
+    """Tests for FrameSelector"""
+
+    @pytest.mark.unit
+    def test_keeps_scene_changes_min_interval_apart(self):
+        """Should drop scene changes closer than min_interval_seconds to the last kept one"""
+        selector = FrameSelector(min_interval_seconds=10)
+        values = {0: 0, 5: 200, 8: 0, 20: 200}
+
+        value = 0
+        for t in range(0, 30):
+            value = values.get(t, value)
+            selector.push(float(t), solid(value))
+
+        assert selector.scene_changes == 3
+        assert selector.selected == [5.0, 20.0]
+
+    @pytest.mark.unit
+    def test_falls_back_to_intervals_without_scene_changes(self):
+        """Should return fixed-interval timestamps for a static video"""
+        selector = FrameSelector(min_interval_seconds=10)
+
+        for i in range(50):
+            selector.push(i * 0.5, solid(80))
+
+        assert selector.scene_timestamps == []
+        assert selector.selected == [0.0, 10.0, 20.0]
+
+
+class TestBuildSampleCommand:
+    """Tests for build_sample_command()"""
+
+    @pytest.mark.unit
+    def test_streams_downscaled_gray_frames_to_stdout(self):
+        """Should decode to raw grayscale at the analysis size on stdout"""
+        cmd = build_sample_command('demo.mp4', fps=2)
+
+        assert cmd[cmd.index('-vf') + 1] == f'fps=2,scale={ANALYSIS_WIDTH}:{ANALYSIS_HEIGHT}'
+        assert cmd[cmd.index('-pix_fmt') + 1] == 'gray'
+        assert cmd[cmd.index('-f') + 1] == 'rawvideo'
+        assert cmd[-1] == 'pipe:1'
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg not installed")
+class TestSampleVideo:
+    """End-to-end sampling with a generated test video"""
+
+    @pytest.fixture
+    def video(self, tmp_path):
+        """6s video: black for 3s, then white for 3s"""
+        import subprocess
+
+        path = tmp_path / 'cut.mp4'
+        subprocess.run([
+            'ffmpeg', '-v', 'error', '-y',
+            '-f', 'lavfi', '-i', 'color=c=black:s=640x360:d=3:r=10',
+            '-f', 'lavfi', '-i', 'color=c=white:s=640x360:d=3:r=10',
+            '-filter_complex', '[0:v][1:v]concat=n=2:v=1[v]', '-map', '[v]',
+            str(path)
+        ], check=True)
+        return str(path)
+
+    @pytest.mark.unit
+    async def test_detects_cut_and_encodes_full_size_frame(self, video, tmp_path):
+        """Should find the cut and write a full-resolution JPEG for it"""
+        cv2 = pytest.importorskip("cv2")
+
+        timestamps, from_scenes = await select_frame_timestamps(video, min_interval_seconds=1, fps=2)
+        encoded = await encode_frames(video, timestamps, str(tmp_path))
+
+        assert from_scenes
+        assert timestamps == [3.0]
+        assert cv2.imread(encoded[0][1]).shape[:2] == (360, 640)
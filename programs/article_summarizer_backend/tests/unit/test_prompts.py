@@ -0,0 +1,38 @@
+"""
+Tests for core/prompts.py
+
+Tests that ArticleAnalysisPrompt.RESPONSE_FIELDS matches the JSON format the
+prompt asks Claude to return, since streaming previews are keyed off it.
+"""
+
+import json
+import pytest
+
+from core.prompts import ArticleAnalysisPrompt
+
+
+def response_format(prompt):
+    """Parse the example JSON object the prompt asks Claude to return"""
+    start = prompt.index('{', prompt.index('Return your response in this JSON format:'))
+    obj, _ = json.JSONDecoder().raw_decode(prompt[start:])
+    return obj
+
+
+class TestArticleAnalysisPrompt:
+    """Tests for ArticleAnalysisPrompt.build()"""
+
+    @pytest.mark.unit
+    def test_response_fields_match_prompt_with_frames(self):
+        """Should list every key of the requested JSON when video frames exist"""
+        metadata = {'video_frames': [{'time_formatted': '0:30'}]}
+        prompt = ArticleAnalysisPrompt.build('https://example.com/a', '', metadata)
+
+        assert tuple(response_format(prompt)) == ArticleAnalysisPrompt.RESPONSE_FIELDS
+
+    @pytest.mark.unit
+    def test_response_fields_match_prompt_without_frames(self):
+        """Should only omit frame_summaries when there are no video frames"""
+        prompt = ArticleAnalysisPrompt.build('https://example.com/a', '', {})
+
+        expected = tuple(f for f in ArticleAnalysisPrompt.RESPONSE_FIELDS if f != 'frame_summaries')
+        assert tuple(response_format(prompt)) == expected
@@ -0,0 +1,78 @@
+"""
+Tests for core/streaming_json.py
+
+Tests that top-level fields of a streamed JSON object are reported as soon
+as they complete, regardless of how the text is split into chunks.
+"""
+
+import json
+import pytest
+
+from core.streaming_json import IncrementalJSONParser
+
+
+SAMPLE = {
+    "summary": "<p>He said \"ship it\", then {braces} and [brackets] \\ too.</p>",
+    "key_insights": [{"insight": "Commas, and } inside strings", "timestamp": "1:02"}],
+    "duration_minutes": 45,
+    "has_video": True,
+    "speaker": None,
+    "media_timestamps": [],
+}
+
+
+def feed_in_chunks(parser, text, size):
+    """Feed text in fixed-size chunks and collect completed fields"""
+    fields = []
+    for i in range(0, len(text), size):
+        fields.extend(parser.feed(text[i:i + size]))
+    return fields
+
+
+class TestIncrementalJSONParser:
+    """Tests for IncrementalJSONParser.feed()"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 10000])
+    def test_reports_every_field_in_order(self, chunk_size):
+        """Should yield each top-level field once with its parsed value"""
+        parser = IncrementalJSONParser()
+        fields = feed_in_chunks(parser, json.dumps(SAMPLE, indent=2), chunk_size)
+
+        assert fields == list(SAMPLE.items())
+        assert parser.done
+
+    @pytest.mark.unit
+    def test_reports_field_before_object_completes(self):
+        """Should report summary as soon as the following comma arrives"""
+        parser = IncrementalJSONParser()
+
+        assert parser.feed('{"summary": "<p>Hello') == []
+        assert parser.feed('</p>", "key_insights": [{"insight": "x"') == [('summary', '<p>Hello</p>')]
+        assert not parser.done
+
+    @pytest.mark.unit
+    def test_ignores_preamble_and_code_fence(self):
+        """Should skip text before the root object"""
+        parser = IncrementalJSONParser()
+        text = 'Here is the analysis:\n```json\n{"summary": "ok"}\n```'
+
+        assert parser.feed(text) == [('summary', 'ok')]
+        assert parser.done
+
+    @pytest.mark.unit
+    def test_skips_invalid_values(self):
+        """Should drop a malformed value but keep parsing later fields"""
+        parser = IncrementalJSONParser()
+
+        fields = parser.feed('{"bad": tru, "good": 1}')
+
+        assert fields == [('good', 1)]
+
+    @pytest.mark.unit
+    def test_ignores_text_after_root_object(self):
+        """Should stop once the root object closes"""
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1}')
+
+        assert parser.feed('{"b": 2}') == []
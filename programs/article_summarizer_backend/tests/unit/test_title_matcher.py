@@ -0,0 +1,111 @@
+"""
+Unit tests for core/title_matcher.py
+
+Tests relative/absolute date parsing and bulk fuzzy matching of an episode
+title against scraped videos.
+"""
+
+import random
+import string
+from datetime import datetime
+from difflib import SequenceMatcher
+
+import pytest
+
+from core.title_matcher import TitleMatcher, parse_published_date
+
+
+class TestParsePublishedDate:
+    """Tests for parse_published_date() function"""
+
+    @pytest.mark.unit
+    def test_relative_days(self):
+        """Should subtract relative units from the reference time"""
+        now = datetime(2024, 10, 23, 12, 0)
+        assert parse_published_date("2 days ago", now=now) == datetime(2024, 10, 21, 12, 0)
+
+    @pytest.mark.unit
+    def test_relative_with_prefix(self):
+        """Should handle YouTube prefixes like 'Streamed'"""
+        now = datetime(2024, 10, 23)
+        assert parse_published_date("Streamed 1 week ago", now=now) == datetime(2024, 10, 16)
+
+    @pytest.mark.unit
+    def test_iso_date_is_naive(self):
+        """Should parse ISO dates and drop the timezone"""
+        assert parse_published_date("2024-10-23T08:00:00Z") == datetime(2024, 10, 23, 8, 0)
+
+    @pytest.mark.unit
+    def test_unparseable(self):
+        """Should return None for empty or unknown values"""
+        assert parse_published_date(None) is None
+        assert parse_published_date("") is None
+        assert parse_published_date("a while ago") is None
+        assert parse_published_date("not a date") is None
+
+
+class TestTitleMatcher:
+    """Tests for TitleMatcher.best_match()"""
+
+    @pytest.mark.unit
+    def test_finds_exact_title(self):
+        """Should pick the identical title with full confidence"""
+        videos = [
+            {'title': 'Cooking with Gas', 'url': 'a'},
+            {'title': 'AI Engineering 101', 'url': 'b'},
+            {'title': 'Gardening Tips', 'url': 'c'},
+        ]
+        match = TitleMatcher(videos).best_match("AI Engineering 101")
+        assert match.candidate['url'] == 'b'
+        assert match.ratio == 1.0
+        assert match.is_match
+
+    @pytest.mark.unit
+    def test_ratio_matches_sequence_matcher(self):
+        """Best ratio should equal the brute-force SequenceMatcher maximum"""
+        rng = random.Random(7)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(40)]
+        videos = [{'title': " ".join(rng.choices(words, k=6)), 'url': str(i)} for i in range(300)]
+        episode = " ".join(rng.choices(words, k=6))
+
+        expected = max(SequenceMatcher(None, episode.lower(), video['title'].lower()).ratio() for video in videos)
+        match = TitleMatcher(videos).best_match(episode)
+
+        assert match.ratio == pytest.approx(expected)
+        assert TitleMatcher(videos).ratios(episode)[int(match.candidate['url'])] == pytest.approx(expected)
+
+    @pytest.mark.unit
+    def test_low_similarity_not_a_match(self):
+        """Should report the best candidate but not match below 70%"""
+        match = TitleMatcher([{'title': 'Gardening Tips', 'url': 'a'}]).best_match("AI Engineering 101")
+        assert match is None or not match.is_match
+
+    @pytest.mark.unit
+    def test_relaxed_threshold_when_published_same_day(self):
+        """Should accept 40% similarity when dates are within a day"""
+        videos = [{'title': 'AI agents | Episode 12', 'url': 'a', 'published': '2024-10-22'}]
+        matcher = TitleMatcher(videos)
+
+        same_day = matcher.best_match("Episode 12: AI agents", "2024-10-22T10:00:00Z")
+        week_apart = matcher.best_match("Episode 12: AI agents", "2024-10-29T10:00:00Z")
+
+        assert same_day.threshold == 0.40
+        assert same_day.is_match
+        assert week_apart.threshold == 0.70
+        assert not week_apart.is_match
+
+    @pytest.mark.unit
+    def test_relative_video_dates_parsed_once(self):
+        """Should use the reference time given at construction for relative dates"""
+        now = datetime(2024, 10, 23)
+        matcher = TitleMatcher([{'title': 'Episode 12', 'published': '1 day ago'}], now=now)
+        match = matcher.best_match("Episode 12", "2024-10-22")
+        assert match.published_date == datetime(2024, 10, 22)
+        assert match.threshold == 0.40
+
+    @pytest.mark.unit
+    def test_skips_candidates_without_title(self):
+        """Should ignore candidates with no title"""
+        matcher = TitleMatcher([{'title': '', 'url': 'a'}, {'url': 'b'}])
+        assert len(matcher) == 0
+        assert matcher.best_match("Anything") is None
@@ -0,0 +1,152 @@
+"""
+Unit tests for core/transcript_aligner.py
+
+Tests locating transcript segments in Deepgram word lists with the
+word-position index, and building transcripts from audio alone.
+"""
+
+import pytest
+
+from core.transcript_aligner import TranscriptAligner, WordIndex, normalize_word, transcript_from_deepgram
+
+
+def make_dg_words(text: str):
+    """Deepgram-style word dicts, one word per second"""
+    return [
+        {'word': word, 'start': float(i), 'end': i + 0.9}
+        for i, word in enumerate(text.split())
+    ]
+
+
+@pytest.fixture
+def aligner(monkeypatch):
+    monkeypatch.delenv('DEEPGRAM_API_KEY', raising=False)
+    return TranscriptAligner()
+
+
+class TestWordIndex:
+    """Tests for WordIndex.find()"""
+
+    @pytest.mark.unit
+    def test_finds_exact_phrase(self):
+        """Should locate an exact phrase"""
+        index = WordIndex("good morning everyone revenue grew twelve percent this quarter".split())
+        start, end, score = index.find("revenue grew twelve percent".split())
+        assert (start, end, score) == (3, 6, 1.0)
+
+    @pytest.mark.unit
+    def test_tolerates_misheard_words(self):
+        """Should still match when a word was transcribed differently"""
+        index = WordIndex("welcome to the call our margins expanded to record levels thanks".split())
+        start, end, score = index.find("our margin expanded to record levels".split())
+        assert start == 4
+        assert score > 0.75
+
+    @pytest.mark.unit
+    def test_respects_start_at(self):
+        """Should only consider matches at or after start_at"""
+        index = WordIndex("thank you next question please thank you".split())
+        assert index.find(["thank", "you"])[0] == 0
+        assert index.find(["thank", "you"], start_at=2)[0] == 5
+
+    @pytest.mark.unit
+    def test_prefers_nearest_good_match(self):
+        """Should take the next occurrence of a recurring phrase, not a later one"""
+        words = "alpha beta gamma delta operator next question please epsilon operator next question please".split()
+        index = WordIndex(words)
+        assert index.find("operator next question please".split(), start_at=1)[0] == 4
+
+    @pytest.mark.unit
+    def test_no_shared_words(self):
+        """Should return no match when no target word occurs in the audio"""
+        index = WordIndex("one two three".split())
+        assert index.find(["four", "five"]) == (None, None, 0.0)
+
+
+class TestFindTextInTranscript:
+    """Tests for TranscriptAligner._find_text_in_transcript()"""
+
+    @pytest.mark.unit
+    def test_normalizes_punctuation_and_case(self, aligner):
+        """Should match Deepgram's punctuated, capitalized words"""
+        dg_words = make_dg_words("Hello, everyone. Revenue grew 12% this quarter.")
+        start, end = aligner._find_text_in_transcript("revenue grew 12% this quarter", dg_words)
+        assert (start, end) == (2, 6)
+
+    @pytest.mark.unit
+    def test_below_threshold_returns_none(self, aligner):
+        """Should not return weak matches"""
+        dg_words = make_dg_words("completely unrelated words spoken here today")
+        assert aligner._find_text_in_transcript("revenue grew this quarter", dg_words) == (None, None)
+
+    @pytest.mark.unit
+    def test_falls_back_to_whole_transcript(self, aligner):
+        """Should search from the beginning if nothing matches after start_at"""
+        dg_words = make_dg_words("guidance for next year is unchanged and we remain confident")
+        index = WordIndex([normalize_word(w['word']) for w in dg_words])
+        start, end = aligner._find_text_in_transcript(
+            "guidance for next year is unchanged", dg_words, word_index=index, start_at=8
+        )
+        assert (start, end) == (0, 5)
+
+    @pytest.mark.unit
+    def test_segments_aligned_in_order(self, aligner):
+        """Each segment should be found after the previous one"""
+        segments = [
+            "good morning and welcome to the call",
+            "thank you",
+            "revenue was up twelve percent year over year",
+            "thank you",
+        ]
+        dg_words = make_dg_words(" ".join(segments))
+        index = WordIndex([normalize_word(w['word']) for w in dg_words])
+
+        cursor = 0
+        starts = []
+        for text in segments:
+            start, end = aligner._find_text_in_transcript(text, dg_words, word_index=index, start_at=cursor)
+            starts.append(start)
+            cursor = end + 1
+
+        assert starts == [0, 7, 9, 17]
+
+
+class TestTranscriptFromDeepgram:
+    """Tests for transcript_from_deepgram()"""
+
+    @pytest.mark.unit
+    def test_segments_in_aligned_shape(self):
+        """Should turn merged chunk segments into aligned_transcript entries"""
+        merged = {
+            'segments': [
+                {'start': 0.0, 'duration': 2.0, 'text': 'Good morning.'},
+                {'start': 600.0, 'duration': 3.0, 'text': 'Next question.'},
+            ],
+            'words': [
+                {'word': 'Good', 'start': 0.0, 'end': 0.5, 'confidence': 1.0},
+                {'word': 'morning', 'start': 0.6, 'end': 1.5, 'confidence': 0.8},
+                {'word': 'Next', 'start': 600.0, 'end': 600.5, 'confidence': 0.6},
+                {'word': 'question', 'start': 600.6, 'end': 601.4, 'confidence': 0.8},
+            ],
+            'text': 'Good morning. Next question.',
+            'chunks_completed': 2,
+            'total_chunks': 2,
+            'failed_chunks': []
+        }
+
+        result = transcript_from_deepgram(merged)
+
+        assert result['source'] == 'transcribed_with_deepgram'
+        assert [(s['text'], s['start'], s['end']) for s in result['aligned_transcript']] == [
+            ('Good morning.', 0.0, 2.0),
+            ('Next question.', 600.0, 603.0),
+        ]
+        assert result['aligned_transcript'][0]['confidence'] == pytest.approx(0.9)
+        assert result['aligned_transcript'][1]['confidence'] == pytest.approx(0.7)
+        assert result['deepgram_transcript']['total_chunks'] == 2
+
+    @pytest.mark.unit
+    def test_skips_empty_segments(self):
+        """Should drop segments without text"""
+        merged = {'segments': [{'start': 0.0, 'duration': 1.0, 'text': '  '}], 'words': []}
+        assert transcript_from_deepgram(merged)['aligned_transcript'] == []
@@ -0,0 +1,148 @@
+"""
+Tests for core/transcript_cache.py
+
+Tests media fingerprinting, URL canonicalization, cache keys and the
+disk tier's LRU eviction. The Supabase tier is mocked.
+"""
+
+import os
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from core.transcript_cache import (
+    TranscriptCache,
+    canonicalize_media_url,
+    fingerprint_file,
+    make_cache_key,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Disk-only cache in a temp directory"""
+    return TranscriptCache(tmp_path / 'cache', max_size_mb=1, use_supabase=False)
+
+
+class TestFingerprintFile:
+    """Tests for fingerprint_file()"""
+
+    @pytest.mark.unit
+    def test_same_bytes_same_fingerprint(self, tmp_path):
+        """Should depend only on file content, not name"""
+        a = tmp_path / 'a.mp3'
+        b = tmp_path / 'b.mp3'
+        a.write_bytes(b'ID3' + b'\x00' * 5000)
+        b.write_bytes(b'ID3' + b'\x00' * 5000)
+
+        assert fingerprint_file(str(a)) == fingerprint_file(str(b))
+        assert fingerprint_file(str(a)).startswith('sha256:')
+
+    @pytest.mark.unit
+    def test_different_bytes_different_fingerprint(self, tmp_path):
+        """Should change when content changes"""
+        a = tmp_path / 'a.mp3'
+        b = tmp_path / 'b.mp3'
+        a.write_bytes(b'episode one')
+        b.write_bytes(b'episode two')
+
+        assert fingerprint_file(str(a)) != fingerprint_file(str(b))
+
+
+class TestCanonicalizeMediaUrl:
+    """Tests for canonicalize_media_url()"""
+
+    @pytest.mark.unit
+    def test_strips_podtrac_prefix(self):
+        """Should unwrap analytics redirect prefixes"""
+        url = 'https://dts.podtrac.com/redirect.mp3/traffic.libsyn.com/show/ep1.mp3'
+        assert canonicalize_media_url(url) == 'https://traffic.libsyn.com/show/ep1.mp3'
+
+    @pytest.mark.unit
+    def test_strips_chained_prefixes(self):
+        """Should unwrap several stacked tracking prefixes"""
+        url = 'https://chtbl.com/track/ABC123/pdst.fm/e/https://traffic.megaphone.fm/EP1.mp3'
+        assert canonicalize_media_url(url) == 'https://traffic.megaphone.fm/EP1.mp3'
+
+    @pytest.mark.unit
+    def test_lowercases_host_and_drops_tracking_params(self):
+        """Should normalize host case and drop utm params but keep others"""
+        url = 'https://CDN.Example.com/ep.mp3?utm_source=rss&b=2&a=1#t=30'
+        assert canonicalize_media_url(url) == 'https://cdn.example.com/ep.mp3?a=1&b=2'
+
+    @pytest.mark.unit
+    def test_same_enclosure_from_two_feeds(self):
+        """Should map the same enclosure with different wrappers to one URL"""
+        direct = 'https://traffic.libsyn.com/show/ep1.mp3'
+        wrapped = 'https://dts.podtrac.com/redirect.mp3/traffic.libsyn.com/show/ep1.mp3?utm_medium=podcast'
+        assert canonicalize_media_url(direct) == canonicalize_media_url(wrapped)
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key()"""
+
+    @pytest.mark.unit
+    def test_options_change_key(self):
+        """Should produce different keys for different transcription options"""
+        assert make_cache_key('sha256:abc', {'model': 'nova-2'}) != make_cache_key('sha256:abc', {'model': 'nova-3'})
+
+    @pytest.mark.unit
+    def test_option_order_does_not_matter(self):
+        """Should be stable regardless of dict ordering"""
+        assert make_cache_key('x', {'a': 1, 'b': 2}) == make_cache_key('x', {'b': 2, 'a': 1})
+
+
+class TestTranscriptCache:
+    """Tests for TranscriptCache get/set/eviction"""
+
+    @pytest.mark.unit
+    def test_round_trip(self, cache):
+        """Should return what was stored"""
+        transcript = {'text': 'hello world', 'words': [{'word': 'hello', 'start': 0.0}]}
+        cache.set('key1', transcript)
+
+        assert cache.get('key1') == transcript
+
+    @pytest.mark.unit
+    def test_miss_returns_none(self, cache):
+        """Should return None for unknown keys"""
+        assert cache.get('missing') is None
+
+    @pytest.mark.unit
+    def test_drops_corrupt_entry(self, cache):
+        """Should treat unreadable JSON as a miss and remove it"""
+        path = cache.cache_dir / 'bad.json'
+        path.write_text('{not json')
+
+        assert cache.get('bad') is None
+        assert not path.exists()
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Should evict the least recently read entries once over budget"""
+        cache = TranscriptCache(tmp_path / 'cache', max_size_mb=0.01, use_supabase=False)  # ~10KB
+        payload = {'text': 'x' * 4000}
+
+        cache.set('old', payload)
+        cache.set('recent', payload)
+        past = time.time() - 100
+        os.utime(cache.cache_dir / 'old.json', (past, past))
+        os.utime(cache.cache_dir / 'recent.json', (past, past))
+        cache.get('recent')  # Touch - now most recently used
+
+        cache.set('new', payload)
+
+        assert cache.get('old') is None
+        assert cache.get('recent') == payload
+        assert cache.get('new') == payload
+
+    @pytest.mark.unit
+    def test_supabase_hit_is_promoted_to_disk(self, cache):
+        """Should read through to Supabase and keep a local copy"""
+        transcript = {'text': 'from supabase'}
+        cache.supabase = MagicMock()
+        query = cache.supabase.table.return_value.select.return_value.eq.return_value.limit.return_value
+        query.execute.return_value = MagicMock(data=[{'transcript': transcript}])
+
+        assert cache.get('shared') == transcript
+        assert (cache.cache_dir / 'shared.json').exists()
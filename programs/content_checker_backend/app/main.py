@@ -12,7 +12,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
-from app.routes import podcast_history, posts, sources
+from app.routes import podcast_history, posts, sources, scheduler
+from app.services.poll_scheduler import poll_scheduler
+from core.config import Config
 
 # Load environment variables
 load_dotenv('.env.local')
@@ -50,7 +52,10 @@ logger.info(f"Logging to file: {log_file}")
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown"""
     logger.info("Content Checker Backend starting up...")
+    if Config.POLL_SCHEDULER_ENABLED:
+        poll_scheduler.start()
     yield
+    await poll_scheduler.stop()
     logger.info("Content Checker Backend shutting down...")
 
 
@@ -76,6 +81,7 @@ app.add_middleware(
 app.include_router(podcast_history.router, prefix="/api", tags=["podcast_history"])
 app.include_router(posts.router, prefix="/api", tags=["posts"])
 app.include_router(sources.router, prefix="/api", tags=["sources"])
+app.include_router(scheduler.router, prefix="/api", tags=["scheduler"])
 
 
 @app.get("/health")
@@ -5,6 +5,7 @@ Uses Supabase client library to verify tokens.
 
 from fastapi import HTTPException, status, Header
 from typing import Optional
+import hmac
 import os
 import logging
 from supabase import create_client, Client
@@ -122,3 +123,32 @@ def verify_api_key(api_key: Optional[str] = None):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key"
         )
+
+
+def verify_service_api_key(api_key: Optional[str] = None):
+    """
+    API key validation for service routes that act on every user's data
+
+    Unlike verify_api_key, this fails closed: if API_KEY is not configured
+    the route is unavailable rather than open.
+
+    Args:
+        api_key: API key from X-API-Key header
+
+    Raises:
+        HTTPException: 503 if no API key is configured, 401 if it is invalid or missing
+    """
+    required_api_key = os.getenv('API_KEY', '').strip()
+
+    if not required_api_key:
+        logger.error("🔒 Service route called but API_KEY is not configured")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="API key authentication is not configured"
+        )
+
+    if not api_key or not hmac.compare_digest(api_key.encode('utf-8'), required_api_key.encode('utf-8')):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing API key"
+        )
@@ -30,6 +30,16 @@ class CheckPostsResponse(BaseModel):
     newly_discovered_ids: List[str]
 
 
+class CheckAllPostsResponse(BaseModel):
+    """Response model for POST /api/posts/check-all"""
+    message: str
+    new_posts_found: int
+    users_checked: int
+    total_sources_checked: int
+    unique_feeds_fetched: int
+    newly_discovered_ids: List[str]
+
+
 class GetPostsResponse(BaseModel):
     """Response model for GET /api/posts/discovered"""
     posts: List[Post]
@@ -2,12 +2,12 @@
 API routes for post checking operations
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from typing import Optional
 
-from app.models.post import GetPostsResponse, CheckPostsResponse, Post
+from app.models.post import GetPostsResponse, CheckPostsResponse, CheckAllPostsResponse, Post
 from app.services.post_checker import PostCheckerService
-from app.middleware.auth import verify_supabase_jwt
+from app.middleware.auth import verify_supabase_jwt, verify_service_api_key
 
 router = APIRouter()
 
@@ -60,3 +60,28 @@ async def check_posts(
         total_sources_checked=result["total_sources_checked"],
         newly_discovered_ids=result.get("newly_discovered_ids", [])
     )
+
+
+@router.post("/posts/check-all", response_model=CheckAllPostsResponse)
+async def check_posts_all_users(
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key")
+):
+    """
+    Check every user's content_sources for new posts (scheduled runs)
+
+    Each unique feed is fetched once and its new entries are queued for
+    every subscribing user.
+
+    Args:
+        x_api_key: API key for authentication
+
+    Returns:
+        Results of the post check across all users
+    """
+    # Verify API key (required - this crawls every user's sources)
+    verify_service_api_key(x_api_key)
+
+    service = PostCheckerService()
+    result = await service.check_for_new_posts_all_users()
+
+    return CheckAllPostsResponse(**result)
@@ -0,0 +1,39 @@
+"""
+API routes for the background poll scheduler
+"""
+
+import asyncio
+from fastapi import APIRouter, Header, HTTPException
+from typing import Optional
+
+from app.services.poll_scheduler import poll_scheduler
+from app.middleware.auth import verify_service_api_key
+
+router = APIRouter()
+
+
+@router.get("/scheduler/status")
+async def get_scheduler_status(
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key")
+):
+    """
+    Get background polling status and the stored per-feed schedules
+
+    Args:
+        x_api_key: API key for authentication
+
+    Returns:
+        Scheduler state (last run and its result) and a summary of feed schedules
+    """
+    # Verify API key (required - schedules cover every user's sources)
+    verify_service_api_key(x_api_key)
+
+    try:
+        schedules = await asyncio.to_thread(poll_scheduler.schedule_summary)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load poll schedules: {str(e)}")
+
+    return {
+        "scheduler": poll_scheduler.status(),
+        "schedules": schedules
+    }
@@ -3,7 +3,9 @@ API routes for content source management (RSS feeds, newsletters, etc.)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from typing import Optional
+import json
 import logging
 import os
 from supabase import create_client, Client
@@ -19,6 +21,8 @@ from app.models.content_source import (
     PreviewPost
 )
 from app.middleware.auth import verify_supabase_jwt
+from app.services.post_checker import PostCheckerService
+from app.services.source_discovery import SourceDiscoveryService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -43,6 +47,18 @@ def get_supabase() -> Client:
     return _supabase_client
 
 
+_discovery_service: Optional[SourceDiscoveryService] = None
+
+def get_discovery_service() -> SourceDiscoveryService:
+    """Get or create the source discovery service (singleton, shares the Supabase client)"""
+    global _discovery_service
+
+    if _discovery_service is None:
+        _discovery_service = SourceDiscoveryService(PostCheckerService(supabase=get_supabase()))
+
+    return _discovery_service
+
+
 @router.get("/sources", response_model=ContentSourceListResponse)
 async def list_content_sources(
     user_id: str = Depends(verify_supabase_jwt),
@@ -343,6 +359,9 @@ async def discover_source(
     3. Fall back to HTML scraping if no RSS found
     4. Extract title and preview posts
 
+    The URL is fetched and parsed once (see app/services/source_discovery.py).
+    Use /sources/discover/stream to receive the metadata before the preview.
+
     Args:
         request: URL to discover
         user_id: User ID extracted from JWT token
@@ -350,81 +369,20 @@ async def discover_source(
     Returns:
         Discovered source information with preview posts
     """
+    url = str(request.url)
+    logger.info(f"Discovering source from URL: {url}")
+
     try:
-        from app.services.post_checker import PostCheckerService
-
-        url = str(request.url)
-        logger.info(f"Discovering source from URL: {url}")
-
-        # Initialize post checker service (reuse existing discovery logic)
-        post_checker = PostCheckerService()
-
-        # Try RSS discovery first
-        discovered_feed_url = None
-        has_rss = False
-        feed_type = "html_scraping"
-
-        # Fetch the URL
-        response = post_checker.session.get(url, timeout=10)
-        response.raise_for_status()
-
-        # Check if it's already an RSS feed
-        if post_checker._is_rss_feed(url, response):
-            discovered_feed_url = url
-            has_rss = True
-            feed_type = "rss_feed"
-            logger.info(f"URL is already an RSS feed: {url}")
-        else:
-            # Try to discover RSS feed from HTML
-            discovered_feed_url = post_checker._discover_rss_feed(url, response)
-            if discovered_feed_url:
-                has_rss = True
-                feed_type = "rss_feed"
-                logger.info(f"Discovered RSS feed: {discovered_feed_url}")
-
-        # Use discovered feed URL or fall back to original URL
-        final_url = discovered_feed_url if discovered_feed_url else url
-
-        # Extract posts to get title and preview
-        # Pass user's intended source_type ('newsletter' or 'podcast')
-        platform_type = post_checker._detect_platform_type(final_url)
-        posts = post_checker._extract_posts_from_feed(final_url, platform_type, user_source_type=request.source_type)
-
-        # Extract title from posts or fetch from page
-        title = "Unknown Source"
-        if posts and len(posts) > 0:
-            # Get channel title from first post if available
-            title = posts[0].get('channel_title', 'Unknown Source')
-
-        # If still no title, try to extract from HTML
-        if title == "Unknown Source":
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            title_tag = soup.find('title')
-            if title_tag:
-                title = title_tag.get_text().strip()
-            # Also try og:title meta tag
-            og_title = soup.find('meta', property='og:title')
-            if og_title and og_title.get('content'):
-                title = og_title.get('content').strip()
-
-        # Create preview posts (last 2)
-        preview_posts = []
-        for post in posts[:2]:
-            preview_posts.append(PreviewPost(
-                title=post['title'],
-                url=post['url'],
-                published_date=post['published'].isoformat() if post.get('published') else None
-            ))
-
-        logger.info(f"Successfully discovered source: {title} ({len(preview_posts)} preview posts)")
+        result = await get_discovery_service().discover_all(url, request.source_type)
+
+        logger.info(f"Successfully discovered source: {result['title']} ({len(result['preview_posts'])} preview posts)")
 
         return SourceDiscoveryResponse(
-            url=final_url,
-            title=title,
-            has_rss=has_rss,
-            source_type=request.source_type,  # Return user's intended source_type, not feed_type
-            preview_posts=preview_posts
+            url=result['url'],
+            title=result['title'],
+            has_rss=result['has_rss'],
+            source_type=result['source_type'],
+            preview_posts=[PreviewPost(**post) for post in result['preview_posts']]
         )
 
     except Exception as e:
@@ -433,3 +391,33 @@ async def discover_source(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to discover source: {str(e)}"
         )
+
+
+@router.post("/sources/discover/stream")
+async def discover_source_stream(
+    request: SourceDiscoveryRequest,
+    user_id: str = Depends(verify_supabase_jwt)
+):
+    """
+    Streaming version of /sources/discover (newline-delimited JSON)
+
+    Emits a 'metadata' line (url, title, has_rss, source_type) as soon as the
+    feed is known, then a 'preview' line with preview_posts. On failure a
+    single 'error' line with detail is emitted.
+
+    Args:
+        request: URL to discover
+        user_id: User ID extracted from JWT token
+    """
+    url = str(request.url)
+    logger.info(f"Discovering source from URL (streaming): {url}")
+
+    async def events():
+        try:
+            async for event in get_discovery_service().discover(url, request.source_type):
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Error discovering source from {url}: {e}")
+            yield json.dumps({'event': 'error', 'detail': f"Failed to discover source: {str(e)}"}) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
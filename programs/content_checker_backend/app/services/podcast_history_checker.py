@@ -3,12 +3,16 @@ Podcast history checking service - tracks PocketCasts listening history
 """
 
 import os
+import asyncio
 import logging
 import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from supabase import create_client, Client
 
+from core.content_queue import upsert_content_queue
+from core.url_index import ExistingUrlIndex
+from core.title_matcher import TitleMatcher, DEFAULT_THRESHOLD
 from core.podcast_auth import PodcastAuth
 
 
@@ -58,16 +62,20 @@ class PodcastHistoryCheckerService:
         total_episodes_checked = 0
         newly_discovered_ids = []
 
-        # Load existing podcasts from database
-        existing_urls = self._get_existing_podcast_urls()
+        episodes_details = [
+            details for details in (self._extract_episode_details(episode) for episode in in_progress_episodes)
+            if details
+        ]
 
-        # Process each episode
-        for episode in in_progress_episodes:
-            episode_details = self._extract_episode_details(episode)
-
-            if not episode_details:
-                continue
+        # Look up only the episodes in this history page (cached index, not every tracked episode)
+        url_index = self._existing_url_index()
+        existing_urls = await asyncio.to_thread(
+            url_index.find_existing, [details['episode_url'] for details in episodes_details]
+        )
 
+        # Process each episode
+        new_episodes = []
+        for episode_details in episodes_details:
             total_episodes_checked += 1
 
             episode_url = episode_details['episode_url']
@@ -75,12 +83,15 @@ class PodcastHistoryCheckerService:
             # Check if we've already tracked this episode
             if episode_url not in existing_urls:
                 self.logger.info(f"New episode found: {episode_details['episode_title']}")
+                existing_urls.add(episode_url)
+                new_episodes.append(episode_details)
 
-                # Save to database and get the ID
-                episode_id = self._save_podcast_episode(episode_details)
-                if episode_id:
-                    new_podcasts_found += 1
-                    newly_discovered_ids.append(episode_id)
+        # Save all new episodes in bulk and collect their IDs
+        if new_episodes:
+            saved_ids = await asyncio.to_thread(self._save_podcast_episodes, new_episodes)
+            url_index.add(saved_ids)
+            newly_discovered_ids = list(saved_ids.values())
+            new_podcasts_found = len(newly_discovered_ids)
 
         message = f"Found {new_podcasts_found} new podcast episodes" if new_podcasts_found > 0 else "No new podcasts found"
 
@@ -279,20 +290,13 @@ class PodcastHistoryCheckerService:
             self.logger.warning(f"Error extracting episode details: {e}")
             return None
 
-    def _get_existing_podcast_urls(self) -> set:
-        """Get all existing podcast URLs from database (podcast_history source only)"""
-        try:
-            result = self.supabase.table('content_queue').select('url').eq(
-                'content_type', 'podcast_episode'
-            ).eq(
-                'source', 'podcast_history'
-            ).execute()
-
-            return set(row['url'] for row in result.data)
-
-        except Exception as e:
-            self.logger.error(f"Error fetching existing podcasts: {e}")
-            return set()
+    def _existing_url_index(self) -> ExistingUrlIndex:
+        """Dedup index over content_queue for podcast history episodes"""
+        return ExistingUrlIndex(
+            self.supabase,
+            {'content_type': 'podcast_episode', 'source': 'podcast_history'},
+            logger=self.logger
+        )
 
     # REMOVED: YouTube discovery methods moved to Article Processor
     # The following methods have been removed:
@@ -318,61 +322,13 @@ class PodcastHistoryCheckerService:
         Returns:
             Tuple of (matches, similarity_ratio, threshold_used)
         """
-        from difflib import SequenceMatcher
-        from datetime import datetime, timedelta
-        import re
-
-        # Calculate character-level similarity ratio
-        ratio = SequenceMatcher(None, episode_title.lower(), video_title.lower()).ratio()
-
-        # Use relaxed threshold (40%) if published within 1 day OF EACH OTHER, otherwise require 70%
-        threshold = 0.70
-        if episode_published_date and video_published_date:
-            try:
-                from dateutil import parser
-                episode_date = parser.parse(episode_published_date)
-
-                # Convert relative dates like "2 days ago" to actual dates
-                video_date = None
-                if 'ago' in video_published_date.lower():
-                    # Parse relative dates
-                    match = re.search(r'(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago', video_published_date.lower())
-                    if match:
-                        amount = int(match.group(1))
-                        unit = match.group(2)
-
-                        now = datetime.now()
-                        if unit == 'second':
-                            video_date = now - timedelta(seconds=amount)
-                        elif unit == 'minute':
-                            video_date = now - timedelta(minutes=amount)
-                        elif unit == 'hour':
-                            video_date = now - timedelta(hours=amount)
-                        elif unit == 'day':
-                            video_date = now - timedelta(days=amount)
-                        elif unit == 'week':
-                            video_date = now - timedelta(weeks=amount)
-                        elif unit == 'month':
-                            video_date = now - timedelta(days=amount*30)  # Approximate
-                        elif unit == 'year':
-                            video_date = now - timedelta(days=amount*365)  # Approximate
-                else:
-                    # Try to parse as ISO format
-                    try:
-                        video_date = parser.parse(video_published_date)
-                    except:
-                        pass
-
-                if video_date:
-                    # Compare episode date vs video date (not vs today!)
-                    days_apart = abs((episode_date.replace(tzinfo=None) - video_date.replace(tzinfo=None)).days)
-                    if days_apart <= 1:
-                        threshold = 0.40  # Relaxed: published within 1 day of each other
-            except:
-                pass
-
-        matches = ratio >= threshold
-        return matches, ratio, threshold
+        # 70% title similarity, or 40% if published within 1 day OF EACH OTHER (not vs today!)
+        match = TitleMatcher([{'title': video_title, 'published': video_published_date}]).best_match(
+            episode_title, episode_published_date
+        )
+        if not match:
+            return False, 0.0, DEFAULT_THRESHOLD
+        return match.is_match, match.ratio, match.threshold
 
     def _fetch_podcast_title_from_uuid(self, podcast_uuid: str) -> str:
         """
@@ -427,77 +383,83 @@ class PodcastHistoryCheckerService:
         self.logger.warning(f"   ⚠️ Could not extract podcast title from page")
         return 'ERROR: Cannot find podcast'
 
-    def _save_podcast_episode(self, episode_details: Dict) -> Optional[str]:
+    def _save_podcast_episodes(self, episodes: List[Dict]) -> Dict[str, str]:
         """
-        Save podcast episode to database with source='podcast_history'
+        Save podcast episodes to database with source='podcast_history'
+
+        All records are written with bulk upserts (see core/content_queue.py).
+
+        Args:
+            episodes: Episode details from _extract_episode_details()
 
         Returns:
-            The ID of the saved episode, or None on error
+            Mapping of episode URL -> content_queue ID for saved episodes
         """
-        try:
-            # Handle published_date - convert empty string to None
-            published_date = episode_details.get('published_date')
-            if published_date == '' or not published_date:
-                published_date = None
-
-            # REMOVED: YouTube discovery now happens in Article Processor
-            # video_url = self._find_youtube_video_url(episode_details)
-
-            # Fetch podcast title if missing (PocketCasts API changed)
-            podcast_title = episode_details['podcast_title']
-            has_error = False
-
-            if podcast_title == 'Unknown Podcast' and episode_details.get('podcast_uuid'):
-                self.logger.info(f"   ℹ️ Podcast title missing for '{episode_details['episode_title']}', fetching from PocketCasts...")
-                fetched_title = self._fetch_podcast_title_from_uuid(episode_details['podcast_uuid'])
-
-                # Check if fetch failed
-                if fetched_title.startswith('ERROR:'):
-                    self.logger.error(f"   ❌ Failed to fetch podcast title: {fetched_title}")
-                    podcast_title = None  # Set to None instead of error message
-                    has_error = True
-                else:
-                    self.logger.info(f"   ✅ Successfully fetched podcast title: {fetched_title}")
-                    podcast_title = fetched_title
-
-            # IMPORTANT: content_queue is populated from multiple sources (RSS feeds AND PocketCasts history)
-            # channel_title is duplicated (not normalized) because:
-            # - PocketCasts entries don't have a corresponding entry in content_sources table
-            # - They're discovered from listening history, not from subscribed RSS feeds
-            record = {
-                'url': episode_details['episode_url'],  # Episode audio file URL
-                'title': episode_details['episode_title'],  # Episode title
-                'content_type': 'podcast_episode',  # Hardcoded for PocketCasts (vs RSS's dynamic detection)
-                'source': 'podcast_history',  # Discovery mechanism for this flow (vs 'rss_feed')
-                'channel_title': podcast_title,  # Podcast name (from PocketCasts API or scraped)
-                # 'video_url': video_url,  # REMOVED - discovery happens in Article Processor
-                'platform': 'pocketcasts',  # Discovery platform (vs 'podcast_rss' or 'rss_feed')
-                'found_at': datetime.now().isoformat(),
-                'published_date': published_date,
-                'status': 'failed' if has_error else 'discovered',
-                'podcast_uuid': episode_details['podcast_uuid'],  # PocketCasts-specific identifier
-                'episode_uuid': episode_details['episode_uuid'],  # PocketCasts-specific identifier
-                'duration_seconds': episode_details.get('duration'),
-                'played_up_to': episode_details.get('played_up_to'),  # PocketCasts-specific: progress tracking
-                'progress_percent': episode_details.get('progress_percent'),  # PocketCasts-specific: progress tracking
-                'playing_status': episode_details.get('playing_status')  # PocketCasts-specific: playback state
-            }
+        records = [self._build_podcast_record(episode_details) for episode_details in episodes]
+        saved_ids = upsert_content_queue(self.supabase, records, logger=self.logger)
 
-            result = self.supabase.table('content_queue').upsert(
-                record,
-                on_conflict='url'
-            ).execute()
+        for episode_details in episodes:
+            if episode_details['episode_url'] in saved_ids:
+                self.logger.info(f"Saved podcast episode: {episode_details['episode_title']}")
 
-            self.logger.info(f"Saved podcast episode: {episode_details['episode_title']}")
+        return saved_ids
 
-            # Return the ID if available
-            if result.data and len(result.data) > 0:
-                return result.data[0].get('id')
-            return None
+    def _build_podcast_record(self, episode_details: Dict) -> Dict:
+        """
+        Build the content_queue record for a podcast episode
 
-        except Exception as e:
-            self.logger.error(f"Error saving podcast episode: {e}")
-            raise
+        Returns:
+            content_queue record with source='podcast_history'
+        """
+        # Handle published_date - convert empty string to None
+        published_date = episode_details.get('published_date')
+        if published_date == '' or not published_date:
+            published_date = None
+
+        # REMOVED: YouTube discovery now happens in Article Processor
+        # video_url = self._find_youtube_video_url(episode_details)
+
+        # Fetch podcast title if missing (PocketCasts API changed)
+        podcast_title = episode_details['podcast_title']
+        has_error = False
+
+        if podcast_title == 'Unknown Podcast' and episode_details.get('podcast_uuid'):
+            self.logger.info(f"   ℹ️ Podcast title missing for '{episode_details['episode_title']}', fetching from PocketCasts...")
+            fetched_title = self._fetch_podcast_title_from_uuid(episode_details['podcast_uuid'])
+
+            # Check if fetch failed
+            if fetched_title.startswith('ERROR:'):
+                self.logger.error(f"   ❌ Failed to fetch podcast title: {fetched_title}")
+                podcast_title = None  # Set to None instead of error message
+                has_error = True
+            else:
+                self.logger.info(f"   ✅ Successfully fetched podcast title: {fetched_title}")
+                podcast_title = fetched_title
+
+        # IMPORTANT: content_queue is populated from multiple sources (RSS feeds AND PocketCasts history)
+        # channel_title is duplicated (not normalized) because:
+        # - PocketCasts entries don't have a corresponding entry in content_sources table
+        # - They're discovered from listening history, not from subscribed RSS feeds
+        record = {
+            'url': episode_details['episode_url'],  # Episode audio file URL
+            'title': episode_details['episode_title'],  # Episode title
+            'content_type': 'podcast_episode',  # Hardcoded for PocketCasts (vs RSS's dynamic detection)
+            'source': 'podcast_history',  # Discovery mechanism for this flow (vs 'rss_feed')
+            'channel_title': podcast_title,  # Podcast name (from PocketCasts API or scraped)
+            # 'video_url': video_url,  # REMOVED - discovery happens in Article Processor
+            'platform': 'pocketcasts',  # Discovery platform (vs 'podcast_rss' or 'rss_feed')
+            'found_at': datetime.now().isoformat(),
+            'published_date': published_date,
+            'status': 'failed' if has_error else 'discovered',
+            'podcast_uuid': episode_details['podcast_uuid'],  # PocketCasts-specific identifier
+            'episode_uuid': episode_details['episode_uuid'],  # PocketCasts-specific identifier
+            'duration_seconds': episode_details.get('duration'),
+            'played_up_to': episode_details.get('played_up_to'),  # PocketCasts-specific: progress tracking
+            'progress_percent': episode_details.get('progress_percent'),  # PocketCasts-specific: progress tracking
+            'playing_status': episode_details.get('playing_status')  # PocketCasts-specific: playback state
+        }
+
+        return record
 
     async def get_discovered_podcasts(self, limit: int = 100) -> List[Dict]:
         """
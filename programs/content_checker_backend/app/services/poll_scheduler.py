@@ -0,0 +1,129 @@
+"""
+Background poll scheduler - checks content sources without an external trigger
+
+Runs inside the API process as an asyncio task (enabled with
+POLL_SCHEDULER_ENABLED). Every tick it runs an all-users post check limited
+to the feeds that are due; core/poll_schedule.py decides when each feed is
+next due from how often it publishes, so active feeds are picked up within
+minutes and dormant ones are polled rarely.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.services.post_checker import PostCheckerService
+from core.config import Config
+from core.poll_schedule import PollSchedule
+
+
+class PollScheduler:
+    """Periodically checks due feeds for all users"""
+
+    def __init__(self, tick_seconds: Optional[int] = None):
+        """
+        Args:
+            tick_seconds: Seconds between runs (default: Config.POLL_SCHEDULER_TICK_SECONDS)
+        """
+        self.tick_seconds = tick_seconds or Config.POLL_SCHEDULER_TICK_SECONDS
+        self.logger = logging.getLogger(__name__)
+
+        self._task: Optional[asyncio.Task] = None
+        self._service: Optional[PostCheckerService] = None
+        self._schedule: Optional[PollSchedule] = None
+        self._run_lock = asyncio.Lock()
+
+        self.runs = 0
+        self.last_run_started_at: Optional[datetime] = None
+        self.last_run_finished_at: Optional[datetime] = None
+        self.last_result: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the polling loop (no-op if already running)"""
+        if self.running:
+            return
+        self.logger.info(f"🕒 [SCHEDULER] Starting background polling every {self.tick_seconds}s")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the polling loop, cancelling a run in progress"""
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.logger.info("🕒 [SCHEDULER] Stopped background polling")
+
+    async def run_once(self) -> Dict:
+        """
+        Check the feeds that are due now
+
+        Returns:
+            Result of PostCheckerService.check_for_new_posts_all_users()
+        """
+        async with self._run_lock:
+            schedule = self._get_schedule()
+
+            self.last_run_started_at = datetime.now(timezone.utc)
+            try:
+                result = await self._service.check_for_new_posts_all_users(poll_schedule=schedule)
+                self.last_result = result
+                self.last_error = None
+                return result
+            except Exception as e:
+                self.last_error = str(e)
+                raise
+            finally:
+                self.runs += 1
+                self.last_run_finished_at = datetime.now(timezone.utc)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                result = await self.run_once()
+                if result['unique_feeds_fetched']:
+                    self.logger.info(f"🕒 [SCHEDULER] {result['message']}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"❌ [SCHEDULER] Scheduled check failed: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    def status(self) -> Dict:
+        """Scheduler state for the status endpoint"""
+        return {
+            'enabled': Config.POLL_SCHEDULER_ENABLED,
+            'running': self.running,
+            'tick_seconds': self.tick_seconds,
+            'runs': self.runs,
+            'last_run_started_at': self.last_run_started_at.isoformat() if self.last_run_started_at else None,
+            'last_run_finished_at': self.last_run_finished_at.isoformat() if self.last_run_finished_at else None,
+            'last_result': self.last_result,
+            'last_error': self.last_error
+        }
+
+    def schedule_summary(self) -> Dict:
+        """Per-feed schedules (blocking - call from a worker thread)"""
+        return self._get_schedule().summary()
+
+    def _get_schedule(self) -> PollSchedule:
+        # One schedule for the scheduler's lifetime, so learned intervals
+        # survive between runs even when they can't be persisted
+        if self._service is None:
+            self._service = PostCheckerService()
+        if self._schedule is None:
+            self._schedule = PollSchedule(self._service.supabase, self.logger)
+        return self._schedule
+
+
+# Shared instance started by the app lifespan
+poll_scheduler = PollScheduler()
@@ -4,10 +4,11 @@ Scans content_sources table for new newsletter/blog posts
 """
 
 import os
+import asyncio
 import logging
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 import feedparser
@@ -15,25 +16,42 @@ import email.utils
 from supabase import create_client, Client
 
 from core.config import Config
+from core.feed_fetcher import FeedFetcher
+from core.feed_state import FeedStateStore
+from core.content_queue import upsert_content_queue
+from core.url_index import ExistingUrlIndex
+from core.post_dates import PostDateCache, extract_published_date, parse_date
+from core.poll_schedule import PollSchedule
+from core.rss_discovery import COMMON_FEED_PATHS, RSSDiscovery, is_known_feedless, remember_feedless
 # REMOVED: YouTube discovery moved to Article Processor
 # from core.youtube_discovery import YouTubeDiscoveryService
 
+# content_sources rows per request when loading every user's sources
+SOURCE_PAGE_SIZE = 1000
+
 
 class PostCheckerService:
     """Service for checking content sources for new posts/articles"""
 
-    def __init__(self):
+    def __init__(self, supabase: Optional[Client] = None):
+        """
+        Args:
+            supabase: Existing Supabase client to reuse (default: create one from env)
+        """
         self.logger = logging.getLogger(__name__)
 
-        # Initialize Supabase client
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+        if supabase is not None:
+            self.supabase: Client = supabase
+        else:
+            # Initialize Supabase client
+            supabase_url = os.getenv('SUPABASE_URL')
+            supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
 
-        if not supabase_url or not supabase_key:
-            raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
+            if not supabase_url or not supabase_key:
+                raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
 
-        self.supabase: Client = create_client(supabase_url, supabase_key)
-        self.logger.info("Connected to Supabase")
+            self.supabase = create_client(supabase_url, supabase_key)
+            self.logger.info("Connected to Supabase")
 
         # Setup HTTP session
         self.session = requests.Session()
@@ -55,7 +73,7 @@ class PostCheckerService:
         self.logger.info(f"Starting post check for user: {user_id}...")
 
         # Load content sources from database (filtered by user_id)
-        sources = self._load_content_sources(user_id)
+        sources = await asyncio.to_thread(self._load_content_sources, user_id)
 
         if not sources:
             self.logger.warning(f"No active content sources found for user: {user_id}")
@@ -68,76 +86,344 @@ class PostCheckerService:
 
         self.logger.info(f"Processing {len(sources)} content sources for user: {user_id}...")
 
-        new_posts_found = 0
-        total_sources_checked = 0
-        newly_discovered_ids = []
+        # ETag/Last-Modified, body hashes and seen entries from the last check
+        feed_state = FeedStateStore(self.supabase, user_id, self.logger)
+        await asyncio.to_thread(feed_state.load)
 
-        # Load existing posts from database (filtered by user_id)
-        existing_urls = self._get_existing_post_urls(user_id)
+        # Fetch all sources concurrently (bounded globally and per host), so a
+        # full check takes roughly as long as the slowest feed
+        async with FeedFetcher(logger=self.logger) as fetcher:
+            source_posts = await asyncio.gather(
+                *(self._fetch_source_posts(fetcher, source, feed_state) for source in sources)
+            )
+
+        date_cache = PostDateCache(self.supabase, self.logger)
+        result = await self._save_new_posts(user_id, sources, source_posts, feed_state, date_cache)
+        await asyncio.to_thread(date_cache.flush)
+
+        self.logger.info(f"Check complete: {result['message']}")
+        return result
+
+    async def check_for_new_posts_all_users(self, poll_schedule: Optional[PollSchedule] = None) -> Dict:
+        """
+        Check every user's active content_sources in one pass
+
+        Subscriptions are grouped by feed URL, so a feed followed by many users
+        is fetched and parsed once; its entries are then filtered against each
+        subscriber's seen entries and queued per user. Fetches scale with
+        unique feeds rather than subscriptions. Shared fetches are
+        unconditional (validators are per user), but an unchanged body is
+        still skipped per subscriber by its content hash.
+
+        Args:
+            poll_schedule: If given, only feeds that are due are checked, and
+                each checked feed's next poll is scheduled (background scheduler)
 
-        # Process each source
+        Returns:
+            Dictionary with totals across users, including newly_discovered_ids
+        """
+        self.logger.info("Starting post check for all users...")
+
+        sources = await asyncio.to_thread(self._load_all_content_sources)
+        if not sources:
+            self.logger.warning("No active content sources found")
+            return {
+                "new_posts_found": 0,
+                "users_checked": 0,
+                "total_sources_checked": 0,
+                "unique_feeds_fetched": 0,
+                "message": "No active content sources found",
+                "newly_discovered_ids": []
+            }
+
+        # Source type changes how a feed is parsed, so it's part of the key
+        subscriptions: Dict[Tuple[str, str], List[Dict]] = {}
         for source in sources:
-            source_url = source['url']
-            source_type = source.get('source_type', 'newsletter')  # Default to 'newsletter' if not set
-            self.logger.info(f"Checking source: {source_url} (type: {source_type})")
-            total_sources_checked += 1
+            key = (source['url'], source.get('source_type', 'newsletter'))
+            subscriptions.setdefault(key, []).append(source)
+
+        if poll_schedule:
+            await asyncio.to_thread(poll_schedule.load, subscriptions)
+            subscriptions = {key: subs for key, subs in subscriptions.items() if poll_schedule.is_due(key)}
+            sources = [source for subscribers in subscriptions.values() for source in subscribers]
+            if not sources:
+                self.logger.info("No feeds due for polling")
+                return {
+                    "new_posts_found": 0,
+                    "users_checked": 0,
+                    "total_sources_checked": 0,
+                    "unique_feeds_fetched": 0,
+                    "message": "No feeds due for polling",
+                    "newly_discovered_ids": []
+                }
 
-            # Detect platform type
-            platform_type = self._detect_platform_type(source_url)
+        user_ids = list(dict.fromkeys(source['user_id'] for source in sources))
+        self.logger.info(
+            f"Processing {len(sources)} subscriptions for {len(user_ids)} users "
+            f"({len(subscriptions)} unique feeds)..."
+        )
 
-            # For YouTube channels, skip platform detection and go straight to RSS parsing
-            if source_type == 'youtube_channel':
-                platform_type = 'youtube_rss'
+        feed_states = await asyncio.to_thread(FeedStateStore.load_many, self.supabase, user_ids, self.logger)
 
-            # Extract posts from source, using the stored source_type
-            posts = self._extract_posts_from_feed(source_url, platform_type, user_source_type=source_type)
+        async with FeedFetcher(logger=self.logger) as fetcher:
+            fetched_feeds = await asyncio.gather(
+                *(self._fetch_shared_source(fetcher, url, source_type) for url, source_type in subscriptions)
+            )
 
-            if not posts:
-                self.logger.info(f"No posts found from {source_url}")
+        if poll_schedule:
+            for key, feed in zip(subscriptions, fetched_feeds):
+                poll_schedule.record(key, feed)
+
+        # Fan each feed's entries out to its subscribers
+        user_sources: Dict[str, List[Dict]] = {user_id: [] for user_id in user_ids}
+        user_posts: Dict[str, List[List[Dict]]] = {user_id: [] for user_id in user_ids}
+        for feed, subscribers in zip(fetched_feeds, subscriptions.values()):
+            for source in subscribers:
+                user_id = source['user_id']
+                user_sources[user_id].append(source)
+                user_posts[user_id].append(self._posts_for_subscriber(feed, source['url'], feed_states[user_id]))
+
+        # Dates looked up for one user's undated posts are reused for the others
+        date_cache = PostDateCache(self.supabase, self.logger)
+        newly_discovered_ids = []
+        new_posts_found = 0
+        for user_id in user_ids:
+            try:
+                result = await self._save_new_posts(
+                    user_id, user_sources[user_id], user_posts[user_id], feed_states[user_id], date_cache
+                )
+            except Exception as e:
+                self.logger.error(f"Error saving new posts for user {user_id}: {e}")
                 continue
+            new_posts_found += result['new_posts_found']
+            newly_discovered_ids.extend(result['newly_discovered_ids'])
+        await asyncio.to_thread(date_cache.flush)
+        if poll_schedule:
+            await asyncio.to_thread(poll_schedule.flush)
+
+        message = (
+            f"Found {new_posts_found} new posts from {len(sources)} sources "
+            f"({len(subscriptions)} unique feeds) for {len(user_ids)} users"
+        )
+        self.logger.info(f"Check complete: {message}")
 
-            self.logger.info(f"Found {len(posts)} posts from {source_url}, checking for new content...")
+        return {
+            "new_posts_found": new_posts_found,
+            "users_checked": len(user_ids),
+            "total_sources_checked": len(sources),
+            "unique_feeds_fetched": len(subscriptions),
+            "message": message,
+            "newly_discovered_ids": newly_discovered_ids
+        }
 
-            # Check each post
-            for post in posts:
-                post_url = post['url']
+    async def _save_new_posts(
+        self,
+        user_id: str,
+        sources: List[Dict],
+        source_posts: List[List[Dict]],
+        feed_state: FeedStateStore,
+        date_cache: PostDateCache
+    ) -> Dict:
+        """
+        Queue one user's new, recent posts and persist their feed state
 
-                # Check if already tracked
-                if post_url in existing_urls:
-                    self.logger.debug(f"Skipping already tracked: {post.get('title', '')[:60]}")
-                    continue
+        Args:
+            user_id: UUID of the user
+            sources: The user's content_sources rows
+            source_posts: Posts fetched for each source (same order as sources)
+            feed_state: The user's feed state (sources are committed once their posts are saved)
+            date_cache: Published dates of undated posts (not flushed here)
 
-                # Check if recent
-                published_date = post.get('published')
-                if not self._is_recent_post(post_url, published_date):
-                    if published_date:
-                        days_ago = (datetime.now() - published_date).days
-                        self.logger.debug(f"Skipping old post ({days_ago} days ago): {post.get('title', '')[:60]}")
-                    else:
-                        self.logger.debug(f"Skipping post (no date or too old): {post.get('title', '')[:60]}")
-                    continue
+        Returns:
+            Dictionary with results including newly_discovered_ids
+        """
+        total_sources_checked = 0
 
-                self.logger.info(f"New post found: {post['title']}")
-                new_posts_found += 1
+        # Look up only the URLs these feeds returned (cached index, not the user's whole history)
+        url_index = self._existing_url_index(user_id)
+        existing_urls = await asyncio.to_thread(
+            url_index.find_existing, (post['url'] for posts in source_posts for post in posts)
+        )
+
+        # Dates already looked up for new posts whose feed entry had none
+        await asyncio.to_thread(date_cache.load, (
+            post['url'] for posts in source_posts for post in posts
+            if not post.get('published') and post['url'] not in existing_urls
+        ))
+
+        # Process each source, collecting queue records for one bulk write
+        records = []
+        source_record_urls = {}
+        for source, posts in zip(sources, source_posts):
+            source_url = source['url']
+            total_sources_checked += 1
 
-                # REMOVED: YouTube discovery now happens in Article Processor
-                # self._discover_youtube_url_for_post(post, source_url)
+            if not posts:
+                self.logger.info(f"No new posts found from {source_url}")
+                source_record_urls[source_url] = []
+                continue
 
-                # Save to database and get the ID
-                post_id = self._save_post_to_queue(post, source_url, user_id)
-                if post_id:
-                    newly_discovered_ids.append(post_id)
+            self.logger.info(f"Found {len(posts)} posts from {source_url}, checking for new content...")
 
-        message = f"Found {new_posts_found} new posts from {total_sources_checked} sources"
-        self.logger.info(f"Check complete: {message}")
+            # Date lookups are blocking - keep them off the event loop
+            source_records = await asyncio.to_thread(
+                self._collect_new_posts, posts, source_url, existing_urls, user_id, date_cache
+            )
+            records.extend(source_records)
+            source_record_urls[source_url] = [record['url'] for record in source_records]
+
+        new_posts_found = len(records)
+        saved_ids = await asyncio.to_thread(upsert_content_queue, self.supabase, records, logger=self.logger)
+        url_index.add(saved_ids)
+        newly_discovered_ids = list(dict.fromkeys(
+            saved_ids[record['url']] for record in records if record['url'] in saved_ids
+        ))
+
+        # Only remember a feed version if every new post from it was saved,
+        # otherwise the next check would skip the ones that failed
+        for source_url, urls in source_record_urls.items():
+            if all(url in saved_ids for url in urls):
+                feed_state.commit_source(source_url)
+        await asyncio.to_thread(feed_state.flush)
 
         return {
             "new_posts_found": new_posts_found,
             "total_sources_checked": total_sources_checked,
-            "message": message,
+            "message": f"Found {new_posts_found} new posts from {total_sources_checked} sources",
             "newly_discovered_ids": newly_discovered_ids
         }
 
+    async def _fetch_source_posts(
+        self,
+        fetcher: FeedFetcher,
+        source: Dict,
+        feed_state: Optional[FeedStateStore] = None
+    ) -> List[Dict]:
+        """
+        Fetch and parse one content source
+
+        Args:
+            fetcher: Shared FeedFetcher for this check
+            source: content_sources row
+            feed_state: Feed validators/seen entries for conditional fetching
+
+        Returns:
+            Posts from the source (empty list on any error)
+        """
+        source_url = source['url']
+        source_type = source.get('source_type', 'newsletter')  # Default to 'newsletter' if not set
+        self.logger.info(f"Checking source: {source_url} (type: {source_type})")
+
+        # Detect platform type
+        platform_type = self._detect_platform_type(source_url)
+
+        # For YouTube channels, skip platform detection and go straight to RSS parsing
+        if source_type == 'youtube_channel':
+            platform_type = 'youtube_rss'
+
+        try:
+            return await self._extract_posts_from_feed_async(
+                fetcher, source_url, platform_type, source_type, feed_state
+            )
+        except Exception as e:
+            self.logger.warning(f"Error extracting posts from {source_url}: {e}")
+            return []
+
+    async def _fetch_shared_source(self, fetcher: FeedFetcher, url: str, source_type: str) -> Dict:
+        """
+        Fetch and parse a source once for all of its subscribers
+
+        Args:
+            fetcher: Shared FeedFetcher for this check
+            url: Source URL
+            source_type: Source type the subscriptions share
+
+        Returns:
+            {'feed_url', 'response', 'posts', 'error'} - feed_url/response are None
+            for HTML-scraped sources and on errors (posts is then empty and
+            error holds the message)
+        """
+        self.logger.info(f"Checking source: {url} (type: {source_type})")
+        platform_type = 'youtube_rss' if source_type == 'youtube_channel' else self._detect_platform_type(url)
+
+        try:
+            if 'pocketcasts.com/podcast/' in url:
+                self._warn_pocketcasts_unsupported()
+                return {'feed_url': None, 'response': None, 'posts': [], 'error': 'PocketCasts URLs are not supported'}
+
+            feed_url, response = await self._resolve_feed(fetcher, url, platform_type, source_type)
+            if not feed_url:
+                posts = await asyncio.to_thread(self._extract_posts_from_html, url, response.content, platform_type)
+                return {'feed_url': None, 'response': None, 'posts': posts}
+
+            posts = await asyncio.to_thread(self._extract_posts_from_rss_feed, feed_url, source_type, response)
+            return {'feed_url': feed_url, 'response': response, 'posts': posts}
+
+        except Exception as e:
+            self.logger.warning(f"Error extracting posts from {url}: {e}")
+            return {'feed_url': None, 'response': None, 'posts': [], 'error': str(e)}
+
+    def _posts_for_subscriber(self, feed: Dict, source_url: str, feed_state: FeedStateStore) -> List[Dict]:
+        """Entries of a shared feed that are new for one subscriber (see _fetch_shared_source)"""
+        if not feed['feed_url']:
+            return feed['posts']
+        if self._feed_unchanged(feed_state, feed['feed_url'], feed['response']):
+            return []
+        return self._apply_feed_state(source_url, feed['feed_url'], feed['response'], feed['posts'], feed_state)
+
+    def _collect_new_posts(
+        self,
+        posts: List[Dict],
+        source_url: str,
+        existing_urls: set,
+        user_id: str,
+        date_cache: Optional[PostDateCache] = None
+    ) -> List[Dict]:
+        """
+        Build content_queue records for the posts from one source that are new and recent
+
+        Args:
+            posts: Posts extracted from the source
+            source_url: Source (feed) URL
+            existing_urls: URLs already in content_queue for this user (updated with new posts)
+            user_id: UUID of the user
+            date_cache: Published dates of undated posts (lookups are added to it)
+
+        Returns:
+            content_queue records to upsert
+        """
+        records = []
+
+        # Check each post
+        for post in posts:
+            post_url = post['url']
+
+            # Check if already tracked
+            if post_url in existing_urls:
+                self.logger.debug(f"Skipping already tracked: {post.get('title', '')[:60]}")
+                continue
+
+            # Check if recent
+            published_date = post.get('published')
+            if not self._is_recent_post(post_url, published_date, date_cache):
+                if published_date:
+                    days_ago = (datetime.now() - published_date).days
+                    self.logger.debug(f"Skipping old post ({days_ago} days ago): {post.get('title', '')[:60]}")
+                else:
+                    self.logger.debug(f"Skipping post (no date or too old): {post.get('title', '')[:60]}")
+                continue
+
+            self.logger.info(f"New post found: {post['title']}")
+
+            # REMOVED: YouTube discovery now happens in Article Processor
+            # self._discover_youtube_url_for_post(post, source_url)
+
+            # Another source may list the same post
+            existing_urls.add(post_url)
+            records.append(self._build_queue_record(post, source_url, user_id))
+
+        return records
+
     def _load_content_sources(self, user_id: str) -> List[Dict]:
         """Load active content sources from Supabase for a specific user"""
         try:
@@ -154,20 +440,28 @@ class PostCheckerService:
             self.logger.error(f"Error loading content sources: {e}")
             return []
 
-    def _get_existing_post_urls(self, user_id: str) -> set:
-        """Get set of existing post URLs from content_queue for a specific user (RSS feed source only)"""
+    def _load_all_content_sources(self) -> List[Dict]:
+        """Load active content sources for every user (paged past the API row limit)"""
+        sources = []
         try:
-            result = self.supabase.table('content_queue').select('url').eq(
-                'user_id', user_id
-            ).eq(
-                'source', 'rss_feed'
-            ).execute()
+            while True:
+                result = self.supabase.table('content_sources').select('*').eq(
+                    'is_active', True
+                ).order('id').range(len(sources), len(sources) + SOURCE_PAGE_SIZE - 1).execute()
+                sources.extend(result.data or [])
+                if len(result.data or []) < SOURCE_PAGE_SIZE:
+                    break
 
-            return {row['url'] for row in result.data}
+            self.logger.info(f"Loaded {len(sources)} active content sources across all users")
+            return sources
 
         except Exception as e:
-            self.logger.error(f"Error loading existing posts: {e}")
-            return set()
+            self.logger.error(f"Error loading content sources: {e}")
+            return []
+
+    def _existing_url_index(self, user_id: str) -> ExistingUrlIndex:
+        """Dedup index over content_queue for a specific user (RSS feed source only)"""
+        return ExistingUrlIndex(self.supabase, {'user_id': user_id, 'source': 'rss_feed'}, logger=self.logger)
 
     def _detect_platform_type(self, url: str) -> str:
         """Detect the type of platform from URL"""
@@ -200,229 +494,357 @@ class PostCheckerService:
 
         return False
 
-    def _discover_rss_feed(self, url: str, response) -> Optional[str]:
+    async def _discover_rss_feed_async(
+        self,
+        fetcher: FeedFetcher,
+        url: str,
+        response,
+        soup: Optional[BeautifulSoup] = None
+    ) -> Optional[str]:
         """
-        Auto-discover RSS feed URL from HTML page
-        Looks for <link> tags in the HTML head that point to RSS/Atom feeds
+        Auto-discover a feed URL for an HTML page - <link> tags first, then the
+        common feed paths probed concurrently
+
+        Returns:
+            Feed URL (first match in COMMON_FEED_PATHS order) or None
         """
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Look for RSS/Atom feed links in <head>
-            feed_link_types = [
-                'application/rss+xml',
-                'application/atom+xml',
-                'application/xml'
-            ]
+            if soup is None:
+                soup = await asyncio.to_thread(BeautifulSoup, response.content, 'html.parser')
+            feeds = RSSDiscovery._discover_from_html_head(soup, url)
+            if feeds:
+                self.logger.info(f"Found RSS feed link: {feeds[0]['url']}")
+                return feeds[0]['url']
 
-            for link in soup.find_all('link', type=feed_link_types):
-                href = link.get('href')
-                if href:
-                    # Convert relative URLs to absolute
-                    feed_url = urljoin(url, href)
-                    self.logger.info(f"Found RSS feed link: {feed_url}")
-                    return feed_url
-
-            # Fallback: try common RSS feed patterns
             parsed_url = urlparse(url)
             base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            common_feed_paths = ['/feed', '/rss', '/feed.xml', '/rss.xml', '/atom.xml']
+            domain = parsed_url.netloc.lower()
+            if is_known_feedless(domain):
+                self.logger.debug(f"Skipping common feed paths, none found recently on {domain}")
+                return None
 
-            for feed_path in common_feed_paths:
-                potential_feed = base_url + feed_path
-                try:
-                    feed_response = self.session.head(potential_feed, timeout=Config.SHORT_TIMEOUT)
-                    if feed_response.status_code == 200:
-                        content_type = feed_response.headers.get('content-type', '').lower()
-                        if any(t in content_type for t in ['xml', 'rss', 'atom']):
-                            self.logger.info(f"Found RSS feed via common path: {potential_feed}")
-                            return potential_feed
-                except:
-                    continue
+            candidates = [base_url + feed_path for feed_path in COMMON_FEED_PATHS]
 
+            async def probe(potential_feed: str) -> bool:
+                try:
+                    return self._is_feed_probe_hit(await fetcher.head(potential_feed, timeout=Config.SHORT_TIMEOUT))
+                except Exception:
+                    return False
+
+            # All probes start at once; the most preferred path that answers wins
+            # and lower-priority probes still in flight are cancelled
+            probes = [asyncio.create_task(probe(candidate)) for candidate in candidates]
+            try:
+                for potential_feed, task in zip(candidates, probes):
+                    if await task:
+                        self.logger.info(f"Found RSS feed via common path: {potential_feed}")
+                        return potential_feed
+            finally:
+                for task in probes:
+                    task.cancel()
+                await asyncio.gather(*probes, return_exceptions=True)
+
+            remember_feedless(domain)
             return None
 
         except Exception as e:
             self.logger.warning(f"Error discovering RSS feed: {e}")
             return None
 
-    def _extract_posts_from_feed(self, url: str, platform_type: str, user_source_type: str = 'newsletter') -> List[Dict]:
-        """Extract posts from a content source (RSS feed or webpage)
+    @staticmethod
+    def _is_feed_probe_hit(response) -> bool:
+        """True if a HEAD probe found a feed (200 with an XML/RSS/Atom content type)"""
+        if response.status_code != 200:
+            return False
+        content_type = response.headers.get('content-type', '').lower()
+        return any(t in content_type for t in ['xml', 'rss', 'atom'])
+
+    async def _extract_posts_from_feed_async(
+        self,
+        fetcher: FeedFetcher,
+        url: str,
+        platform_type: str,
+        user_source_type: str = 'newsletter',
+        feed_state: Optional[FeedStateStore] = None
+    ) -> List[Dict]:
+        """
+        Extract posts from a content source (RSS feed or webpage)
+
+        Each URL is downloaded once through the fetcher and the bytes are handed
+        to feedparser/BeautifulSoup (parsing runs in a worker thread). With a
+        feed_state, feeds are requested conditionally and only entries not seen
+        on the last check are returned.
 
         Args:
+            fetcher: Shared FeedFetcher
             url: URL of the feed or webpage
             platform_type: Detected platform type
             user_source_type: User's intended source type ('newsletter', 'podcast', or 'youtube_channel')
+            feed_state: Feed validators/seen entries (optional)
         """
-        try:
-            # Check if this is a PocketCasts channel URL
-            if 'pocketcasts.com/podcast/' in url:
-                self.logger.warning(f"⚠️ PocketCasts channel URLs are not currently supported in post_checker.")
-                self.logger.warning(f"   Please use the podcast's RSS feed URL instead.")
-                self.logger.warning(f"   Tip: Most podcasts have an RSS feed you can find via their website or podcast directories.")
-                return []
+        # Check if this is a PocketCasts channel URL
+        if 'pocketcasts.com/podcast/' in url:
+            self._warn_pocketcasts_unsupported()
+            return []
 
-            # YouTube RSS feeds are direct XML feeds - parse them directly
-            if user_source_type == 'youtube_channel' or platform_type == 'youtube_rss':
-                return self._extract_posts_from_rss_feed(url, user_source_type)
+        feed_url, response = await self._resolve_feed(fetcher, url, platform_type, user_source_type, feed_state)
+        if feed_url:
+            return await self._parse_feed_response(url, feed_url, response, user_source_type, feed_state)
 
-            response = self.session.get(url, timeout=Config.DEFAULT_TIMEOUT)
-            response.raise_for_status()
+        return await asyncio.to_thread(self._extract_posts_from_html, url, response.content, platform_type)
 
-            # Check if this is an RSS/XML feed
-            if self._is_rss_feed(url, response):
-                return self._extract_posts_from_rss_feed(url, user_source_type)
+    async def _resolve_feed(
+        self,
+        fetcher: FeedFetcher,
+        url: str,
+        platform_type: str,
+        user_source_type: str,
+        feed_state: Optional[FeedStateStore] = None
+    ) -> Tuple[Optional[str], object]:
+        """
+        Fetch a source URL, following it to its feed if it's an HTML page
 
-            # Try to auto-discover RSS feed from HTML page
-            discovered_feed_url = self._discover_rss_feed(url, response)
-            if discovered_feed_url:
-                self.logger.info(f"Auto-discovered RSS feed: {discovered_feed_url}")
-                return self._extract_posts_from_rss_feed(discovered_feed_url, user_source_type)
+        Returns:
+            (feed_url, feed response), or (None, page response) if the page has no feed
+        """
+        # Only URLs previously parsed as feeds have validators, so pages aren't affected
+        response = await fetcher.get(url, headers=feed_state.request_headers(url) if feed_state else None)
+
+        # YouTube RSS feeds are direct XML feeds - parse them directly
+        if (response.status_code == 304 or user_source_type == 'youtube_channel'
+                or platform_type == 'youtube_rss' or self._is_rss_feed(url, response)):
+            return url, response
+
+        # Try to auto-discover RSS feed from HTML page
+        discovered_feed_url = await self._discover_rss_feed_async(fetcher, url, response)
+        if discovered_feed_url:
+            self.logger.info(f"Auto-discovered RSS feed: {discovered_feed_url}")
+            feed_response = await fetcher.get(
+                discovered_feed_url,
+                headers=feed_state.request_headers(discovered_feed_url) if feed_state else None
+            )
+            return discovered_feed_url, feed_response
+
+        return None, response
+
+    async def _parse_feed_response(
+        self,
+        source_url: str,
+        feed_url: str,
+        response,
+        user_source_type: str,
+        feed_state: Optional[FeedStateStore]
+    ) -> List[Dict]:
+        """
+        Parse a fetched feed, skipping it if unchanged since the last check
 
-            # Parse HTML content
-            soup = BeautifulSoup(response.content, 'html.parser')
-            posts = []
+        Returns:
+            Posts for entries that weren't in the feed last time
+        """
+        if feed_state and self._feed_unchanged(feed_state, feed_url, response):
+            return []
 
-            if platform_type == 'substack':
-                # Look for article links in main content area, not navigation
-                # Substack typically has articles in <article> or <div class="post"> elements
-                main_content = soup.find('main') or soup.find('article') or soup
-                post_links = main_content.find_all('a', href=True)
-
-                for link in post_links:
-                    href = link.get('href')
-                    if not href or '/p/' not in href:
-                        continue
-
-                    title = link.get_text().strip()
-
-                    # Filter out navigation/footer links
-                    if not title or len(title) < 15:  # Increased minimum length
-                        continue
-
-                    # Skip common non-article patterns
-                    skip_patterns = [
-                        'privacy', 'terms', 'about', 'subscribe', 'sign in',
-                        'log in', 'contact', 'settings', 'archive', 'policy'
-                    ]
-                    if any(pattern in title.lower() for pattern in skip_patterns):
-                        continue
-
-                    # Skip if it looks like a navigation element (parent has nav/footer)
-                    parent_classes = ' '.join(link.parent.get('class', [])).lower()
-                    if any(nav in parent_classes for nav in ['nav', 'footer', 'header', 'menu', 'sidebar']):
-                        continue
-
-                    full_url = urljoin(url, href)
-                    posts.append({
-                        'title': title,
-                        'url': full_url,
-                        'platform': 'substack',
-                        'published': None
-                    })
-
-            elif platform_type == 'medium':
-                # Focus on main content area for Medium
-                main_content = soup.find('main') or soup.find('article') or soup
-                article_links = main_content.find_all('a', href=True)
-
-                for link in article_links:
-                    href = link.get('href')
-                    if not href or not ('/@' in href or '/p/' in href or 'medium.com' in href):
-                        continue
-
-                    title = link.get_text().strip()
-
-                    # Filter out short titles and common non-article patterns
-                    if not title or len(title) < 15:
-                        continue
-
-                    skip_patterns = [
-                        'privacy', 'terms', 'about', 'subscribe', 'sign in',
-                        'log in', 'contact', 'settings', 'archive', 'policy'
-                    ]
-                    if any(pattern in title.lower() for pattern in skip_patterns):
-                        continue
-
-                    # Skip navigation elements
-                    parent_classes = ' '.join(link.parent.get('class', [])).lower()
-                    if any(nav in parent_classes for nav in ['nav', 'footer', 'header', 'menu', 'sidebar']):
-                        continue
-
-                    full_url = urljoin(url, href)
-                    posts.append({
-                        'title': title,
-                        'url': full_url,
-                        'platform': 'medium',
-                        'published': None
-                    })
+        posts = await asyncio.to_thread(self._extract_posts_from_rss_feed, feed_url, user_source_type, response)
+        if not feed_state:
+            return posts
+        return self._apply_feed_state(source_url, feed_url, response, posts, feed_state)
+
+    def _feed_unchanged(self, feed_state: FeedStateStore, feed_url: str, response) -> bool:
+        """True (and logged) if the feed is unchanged since the last check"""
+        if not feed_state.is_unchanged(feed_url, response):
+            return False
+        self.logger.info(f"Feed unchanged since last check ({response.status_code}): {feed_url}")
+        return True
+
+    def _apply_feed_state(
+        self,
+        source_url: str,
+        feed_url: str,
+        response,
+        posts: List[Dict],
+        feed_state: FeedStateStore
+    ) -> List[Dict]:
+        """
+        Stage a changed feed's new state and return the posts not seen on the last check
 
-            else:
-                # Generic approach - look for article-like links in main content
-                main_content = soup.find('main') or soup.find('article') or soup
-                links = main_content.find_all('a', href=True)
+        Callers check _feed_unchanged() first and skip unchanged feeds.
+        """
+        feed_state.record(source_url, feed_url, response, [post.get('entry_id') for post in posts])
+        new_posts = feed_state.filter_seen(feed_url, posts)
+        if len(new_posts) < len(posts):
+            self.logger.info(f"{len(posts) - len(new_posts)} entries already seen on last check: {feed_url}")
+        return new_posts
+
+    def _warn_pocketcasts_unsupported(self) -> None:
+        self.logger.warning(f"⚠️ PocketCasts channel URLs are not currently supported in post_checker.")
+        self.logger.warning(f"   Please use the podcast's RSS feed URL instead.")
+        self.logger.warning(f"   Tip: Most podcasts have an RSS feed you can find via their website or podcast directories.")
+
+    def _extract_posts_from_html(
+        self,
+        url: str,
+        content: bytes,
+        platform_type: str,
+        soup: Optional[BeautifulSoup] = None
+    ) -> List[Dict]:
+        """Extract article links from an HTML page (sources without an RSS feed)
+
+        Args:
+            url: Page URL (for resolving relative links)
+            content: Page HTML
+            platform_type: Detected platform type
+            soup: Already-parsed page, if the caller has one
+        """
+        # Parse HTML content
+        if soup is None:
+            soup = BeautifulSoup(content, 'html.parser')
+        posts = []
+
+        if platform_type == 'substack':
+            # Look for article links in main content area, not navigation
+            # Substack typically has articles in <article> or <div class="post"> elements
+            main_content = soup.find('main') or soup.find('article') or soup
+            post_links = main_content.find_all('a', href=True)
+
+            for link in post_links:
+                href = link.get('href')
+                if not href or '/p/' not in href:
+                    continue
 
-                skip_href_patterns = [
-                    'javascript:', 'mailto:', '#', 'about', 'contact',
-                    'privacy', 'terms', 'subscribe', 'login', 'signin'
+                title = link.get_text().strip()
+
+                # Filter out navigation/footer links
+                if not title or len(title) < 15:  # Increased minimum length
+                    continue
+
+                # Skip common non-article patterns
+                skip_patterns = [
+                    'privacy', 'terms', 'about', 'subscribe', 'sign in',
+                    'log in', 'contact', 'settings', 'archive', 'policy'
                 ]
-                skip_title_patterns = [
+                if any(pattern in title.lower() for pattern in skip_patterns):
+                    continue
+
+                # Skip if it looks like a navigation element (parent has nav/footer)
+                parent_classes = ' '.join(link.parent.get('class', [])).lower()
+                if any(nav in parent_classes for nav in ['nav', 'footer', 'header', 'menu', 'sidebar']):
+                    continue
+
+                full_url = urljoin(url, href)
+                posts.append({
+                    'title': title,
+                    'url': full_url,
+                    'platform': 'substack',
+                    'published': None
+                })
+
+        elif platform_type == 'medium':
+            # Focus on main content area for Medium
+            main_content = soup.find('main') or soup.find('article') or soup
+            article_links = main_content.find_all('a', href=True)
+
+            for link in article_links:
+                href = link.get('href')
+                if not href or not ('/@' in href or '/p/' in href or 'medium.com' in href):
+                    continue
+
+                title = link.get_text().strip()
+
+                # Filter out short titles and common non-article patterns
+                if not title or len(title) < 15:
+                    continue
+
+                skip_patterns = [
                     'privacy', 'terms', 'about', 'subscribe', 'sign in',
                     'log in', 'contact', 'settings', 'archive', 'policy'
                 ]
+                if any(pattern in title.lower() for pattern in skip_patterns):
+                    continue
 
-                for link in links:
-                    href = link.get('href')
-                    title = link.get_text().strip()
-
-                    # Basic validation
-                    if not href or not title or len(title) < 15:
-                        continue
-
-                    # Skip common non-article patterns
-                    if any(skip in href.lower() for skip in skip_href_patterns):
-                        continue
-
-                    if any(pattern in title.lower() for pattern in skip_title_patterns):
-                        continue
-
-                    # Skip navigation elements
-                    parent_classes = ' '.join(link.parent.get('class', [])).lower()
-                    if any(nav in parent_classes for nav in ['nav', 'footer', 'header', 'menu', 'sidebar']):
-                        continue
-
-                    full_url = urljoin(url, href)
-                    posts.append({
-                        'title': title,
-                        'url': full_url,
-                        'platform': 'generic',
-                        'published': None
-                    })
-
-            # Remove duplicates
-            seen_urls = set()
-            unique_posts = []
-            for post in posts:
-                if post['url'] not in seen_urls:
-                    seen_urls.add(post['url'])
-                    unique_posts.append(post)
+                # Skip navigation elements
+                parent_classes = ' '.join(link.parent.get('class', [])).lower()
+                if any(nav in parent_classes for nav in ['nav', 'footer', 'header', 'menu', 'sidebar']):
+                    continue
 
-            # Limit to most recent posts
-            return unique_posts[:Config.RSS_FEED_ENTRY_LIMIT]
+                full_url = urljoin(url, href)
+                posts.append({
+                    'title': title,
+                    'url': full_url,
+                    'platform': 'medium',
+                    'published': None
+                })
 
-        except Exception as e:
-            self.logger.warning(f"Error extracting posts from {url}: {e}")
-            return []
+        else:
+            # Generic approach - look for article-like links in main content
+            main_content = soup.find('main') or soup.find('article') or soup
+            links = main_content.find_all('a', href=True)
+
+            skip_href_patterns = [
+                'javascript:', 'mailto:', '#', 'about', 'contact',
+                'privacy', 'terms', 'subscribe', 'login', 'signin'
+            ]
+            skip_title_patterns = [
+                'privacy', 'terms', 'about', 'subscribe', 'sign in',
+                'log in', 'contact', 'settings', 'archive', 'policy'
+            ]
+
+            for link in links:
+                href = link.get('href')
+                title = link.get_text().strip()
+
+                # Basic validation
+                if not href or not title or len(title) < 15:
+                    continue
+
+                # Skip common non-article patterns
+                if any(skip in href.lower() for skip in skip_href_patterns):
+                    continue
+
+                if any(pattern in title.lower() for pattern in skip_title_patterns):
+                    continue
+
+                # Skip navigation elements
+                parent_classes = ' '.join(link.parent.get('class', [])).lower()
+                if any(nav in parent_classes for nav in ['nav', 'footer', 'header', 'menu', 'sidebar']):
+                    continue
 
-    def _extract_posts_from_rss_feed(self, url: str, user_source_type: str = 'newsletter') -> List[Dict]:
+                full_url = urljoin(url, href)
+                posts.append({
+                    'title': title,
+                    'url': full_url,
+                    'platform': 'generic',
+                    'published': None
+                })
+
+        # Remove duplicates
+        seen_urls = set()
+        unique_posts = []
+        for post in posts:
+            if post['url'] not in seen_urls:
+                seen_urls.add(post['url'])
+                unique_posts.append(post)
+
+        # Limit to most recent posts
+        return unique_posts[:Config.RSS_FEED_ENTRY_LIMIT]
+
+    def _extract_posts_from_rss_feed(self, url: str, user_source_type: str = 'newsletter', response=None) -> List[Dict]:
         """Extract posts from RSS/Atom feed using feedparser
 
         Args:
             url: RSS feed URL
             user_source_type: User's intended source type ('newsletter' or 'podcast')
+            response: Already-fetched feed response (requests or httpx); if omitted,
+                      feedparser downloads the URL itself
         """
         try:
-            feed = feedparser.parse(url)
+            if response is not None:
+                # Parse the bytes we already have rather than downloading the feed again
+                feed = feedparser.parse(response.content, response_headers={
+                    'content-location': str(response.url),
+                    'content-type': response.headers.get('content-type', '')
+                })
+            else:
+                feed = feedparser.parse(url)
 
             if feed.bozo:
                 self.logger.warning(f"Feed parsing warning: {feed.bozo_exception}")
@@ -448,6 +870,7 @@ class PostCheckerService:
                 # Extract title and link
                 title = entry.get('title', 'No title')
                 link = entry.get('link', '')
+                entry_id = entry.get('id') or link  # Stable ID for seen-entry tracking
 
                 # Extract published date
                 published = None
@@ -528,7 +951,8 @@ class PostCheckerService:
                     'platform': platform,
                     'published': published,
                     'audio_url': audio_url,
-                    'duration': duration
+                    'duration': duration,
+                    'entry_id': entry_id
                 }
                 posts.append(post_data)
 
@@ -643,119 +1067,118 @@ class PostCheckerService:
             self.logger.error(f"Error extracting episodes from PocketCasts: {e}")
             return []
 
-    def _is_recent_post(self, post_url: str, published_date: Optional[datetime] = None) -> bool:
-        """Check if a post is recent (within last 3 days)"""
+    def _is_recent_post(
+        self,
+        post_url: str,
+        published_date: Optional[datetime] = None,
+        date_cache: Optional[PostDateCache] = None
+    ) -> bool:
+        """
+        Check if a post is recent (within Config.RSS_POST_RECENCY_DAYS)
+
+        Without a feed date, the date is taken from the cache, else a HEAD
+        request (an old Last-Modified means an old post), else the page itself.
+
+        Args:
+            post_url: URL of the post
+            published_date: Date from the feed entry, if any
+            date_cache: Cache of previously looked-up dates
+
+        Returns:
+            True if recent, or if no date could be determined
+        """
         # If we have a published date from RSS feed, use it directly
         if published_date:
-            days_ago = (datetime.now() - published_date).days
-            return days_ago <= Config.RSS_POST_RECENCY_DAYS
+            return self._is_within_recency(published_date)
+
+        cached_date = date_cache.get(post_url) if date_cache else None
+        if cached_date:
+            return self._is_within_recency(cached_date)
 
         try:
-            response = self.session.get(post_url, timeout=Config.SHORT_TIMEOUT)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Last-Modified is never earlier than the published date, so an old one settles it
+            head = self.session.head(post_url, timeout=Config.SHORT_TIMEOUT, allow_redirects=True)
+            last_modified = parse_date(head.headers.get('Last-Modified')) if head.ok else None
+            if last_modified and not self._is_within_recency(last_modified):
+                if date_cache:
+                    date_cache.record(post_url, last_modified, 'last_modified')
+                return False
 
-            # Look for date indicators
-            date_selectors = [
-                'meta[property="article:published_time"]',
-                'meta[name="date"]',
-                'time[datetime]',
-                '.date',
-                '.published',
-                '.post-date'
-            ]
+            response = self.session.get(post_url, timeout=Config.SHORT_TIMEOUT)
+            post_date = extract_published_date(response.content)
+            if not post_date:
+                # If no date found, assume it might be recent
+                return True
 
-            for selector in date_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    date_str = element.get('content') or element.get('datetime') or element.get_text()
-                    if date_str:
-                        try:
-                            # Try to parse various date formats
-                            for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%B %d, %Y', '%d %B %Y']:
-                                try:
-                                    post_date = datetime.strptime(date_str[:19], fmt)
-                                    days_ago = (datetime.now() - post_date).days
-                                    return days_ago <= Config.RSS_POST_RECENCY_DAYS
-                                except ValueError:
-                                    continue
-                        except Exception:
-                            continue
-
-            # If no date found, assume it might be recent
-            return True
+            if date_cache:
+                date_cache.record(post_url, post_date, 'page')
+            return self._is_within_recency(post_date)
 
         except Exception as e:
             self.logger.warning(f"Error checking post date for {post_url}: {e}")
             return True  # Assume recent if we can't determine
 
-    def _save_post_to_queue(self, post: Dict, source_feed: str, user_id: str) -> Optional[str]:
-        """Save post to content_queue table with user_id"""
-        try:
-            # Determine content_type based on the ACTUAL URL we're saving
-            # Check if URL contains an audio file extension (even with query params)
-            # e.g., "episode.mp3?tracking=xyz" should be detected as audio
-            from urllib.parse import urlparse
-            url_lower = post['url'].lower()
-            parsed_url = urlparse(url_lower)
-            url_path = parsed_url.path  # Gets path without query params
-            is_audio_file = any(ext in url_path for ext in ['.mp3', '.m4a', '.wav', '.ogg', '.aac', '.flac'])
-
-            # Check if this is a YouTube video URL
-            is_youtube_video = (
-                'youtube.com/watch' in url_lower or
-                'youtu.be/' in url_lower or
-                post.get('platform') == 'youtube_rss'
-            )
-
-            # Content type describes what the URL points to:
-            # - 'youtube_video' if URL is a YouTube video
-            # - 'podcast/audio' if URL is an audio file
-            # - 'article' if URL is a webpage
-            if is_youtube_video:
-                content_type = 'youtube_video'
-            elif is_audio_file:
-                content_type = 'podcast/audio'
-            else:
-                content_type = 'article'
-
-            # Extract channel title from RSS metadata
-            channel_title = post.get('channel_title')
-            if not channel_title:
-                # Fallback: extract from URL (best effort)
-                channel_title, _ = self._extract_channel_info(post['url'], source_feed)
-
-            # IMPORTANT: content_queue is populated from multiple sources (RSS feeds AND PocketCasts history)
-            # channel_title is duplicated (not normalized) because:
-            # - PocketCasts entries don't have a corresponding entry in content_sources table
-            # - Different discovery mechanisms provide different metadata (RSS vs PocketCasts API)
-            record = {
-                'url': post['url'],  # The actual article/episode/video URL to process
-                'title': post['title'],  # Episode/article/video title
-                'content_type': content_type,  # 'youtube_video', 'podcast/audio', or 'article' (based on URL)
-                'source': 'rss_feed',  # Discovery mechanism for this flow (vs 'podcast_history')
-                'channel_title': channel_title,  # Channel/podcast/newsletter name (from RSS metadata)
-                # 'video_url': None,  # REMOVED - YouTube discovery happens in Article Processor
-                'audio_url': post.get('audio_url'),  # Direct audio file URL from RSS enclosure
-                'platform': post.get('platform', 'generic'),  # 'podcast_rss' or 'rss_feed' (from source_type)
-                'found_at': datetime.now().isoformat(),
-                'published_date': post['published'].isoformat() if post.get('published') else None,
-                'duration_seconds': post.get('duration'),
-                'status': 'discovered',
-                'user_id': user_id
-            }
-
-            result = self.supabase.table('content_queue').upsert(
-                record,
-                on_conflict='url'
-            ).execute()
-
-            if result.data:
-                return result.data[0]['id']
-            return None
+    @staticmethod
+    def _is_within_recency(published_date: datetime) -> bool:
+        days_ago = (datetime.now() - published_date).days
+        return days_ago <= Config.RSS_POST_RECENCY_DAYS
+
+    def _build_queue_record(self, post: Dict, source_feed: str, user_id: str) -> Dict:
+        """Build the content_queue record for a post (saved in bulk by upsert_content_queue)"""
+        # Determine content_type based on the ACTUAL URL we're saving
+        # Check if URL contains an audio file extension (even with query params)
+        # e.g., "episode.mp3?tracking=xyz" should be detected as audio
+        from urllib.parse import urlparse
+        url_lower = post['url'].lower()
+        parsed_url = urlparse(url_lower)
+        url_path = parsed_url.path  # Gets path without query params
+        is_audio_file = any(ext in url_path for ext in ['.mp3', '.m4a', '.wav', '.ogg', '.aac', '.flac'])
+
+        # Check if this is a YouTube video URL
+        is_youtube_video = (
+            'youtube.com/watch' in url_lower or
+            'youtu.be/' in url_lower or
+            post.get('platform') == 'youtube_rss'
+        )
+
+        # Content type describes what the URL points to:
+        # - 'youtube_video' if URL is a YouTube video
+        # - 'podcast/audio' if URL is an audio file
+        # - 'article' if URL is a webpage
+        if is_youtube_video:
+            content_type = 'youtube_video'
+        elif is_audio_file:
+            content_type = 'podcast/audio'
+        else:
+            content_type = 'article'
+
+        # Extract channel title from RSS metadata
+        channel_title = post.get('channel_title')
+        if not channel_title:
+            # Fallback: extract from URL (best effort)
+            channel_title, _ = self._extract_channel_info(post['url'], source_feed)
+
+        # IMPORTANT: content_queue is populated from multiple sources (RSS feeds AND PocketCasts history)
+        # channel_title is duplicated (not normalized) because:
+        # - PocketCasts entries don't have a corresponding entry in content_sources table
+        # - Different discovery mechanisms provide different metadata (RSS vs PocketCasts API)
+        record = {
+            'url': post['url'],  # The actual article/episode/video URL to process
+            'title': post['title'],  # Episode/article/video title
+            'content_type': content_type,  # 'youtube_video', 'podcast/audio', or 'article' (based on URL)
+            'source': 'rss_feed',  # Discovery mechanism for this flow (vs 'podcast_history')
+            'channel_title': channel_title,  # Channel/podcast/newsletter name (from RSS metadata)
+            # 'video_url': None,  # REMOVED - YouTube discovery happens in Article Processor
+            'audio_url': post.get('audio_url'),  # Direct audio file URL from RSS enclosure
+            'platform': post.get('platform', 'generic'),  # 'podcast_rss' or 'rss_feed' (from source_type)
+            'found_at': datetime.now().isoformat(),
+            'published_date': post['published'].isoformat() if post.get('published') else None,
+            'duration_seconds': post.get('duration'),
+            'status': 'discovered',
+            'user_id': user_id
+        }
 
-        except Exception as e:
-            self.logger.error(f"Error saving post to queue: {e}")
-            return None
+        return record
 
     # REMOVED: YouTube discovery moved to Article Processor
     # def _discover_youtube_url_for_post() - deleted
@@ -0,0 +1,149 @@
+"""
+Source discovery service - feed detection, metadata and preview for the add-source flow
+
+Fetches the URL once and parses it once: the same response (and, for HTML
+pages, the same BeautifulSoup tree) is used to detect a feed, read the page
+title and, when there's no feed, scrape posts. Network I/O is async and
+parsing runs in worker threads, so the route never blocks the event loop.
+
+Results are produced in two steps so the UI can show something quickly:
+1. 'metadata' - final URL, title, whether a feed was found
+2. 'preview'  - the latest posts (may also refine the title from feed metadata)
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from app.services.post_checker import PostCheckerService
+from core.feed_fetcher import FeedFetcher
+
+# Posts included in the discovery preview
+PREVIEW_POST_COUNT = 2
+
+
+class SourceDiscoveryService:
+    """Discovers feed URL, title and preview posts for a source URL"""
+
+    def __init__(self, post_checker: PostCheckerService):
+        """
+        Args:
+            post_checker: Provides the feed/HTML parsing helpers (its Supabase client is not used)
+        """
+        self.post_checker = post_checker
+        self.logger = logging.getLogger(__name__)
+
+    async def discover(self, url: str, source_type: str = 'newsletter') -> AsyncIterator[Dict]:
+        """
+        Discover a source, yielding a 'metadata' event and then a 'preview' event
+
+        Args:
+            url: URL entered by the user (page or feed)
+            source_type: User's intended source type ('newsletter', 'podcast', or 'youtube_channel')
+
+        Yields:
+            {'event': 'metadata', 'url', 'title', 'has_rss', 'source_type'}
+            {'event': 'preview', 'preview_posts': [...], 'title' (only if the feed names the source)}
+
+        Raises:
+            httpx.HTTPError: If the URL can't be fetched
+        """
+        checker = self.post_checker
+
+        async with FeedFetcher(logger=self.logger) as fetcher:
+            response = await fetcher.get(url)
+
+            # Already a feed: one parse gives both the title and the preview
+            if source_type == 'youtube_channel' or checker._is_rss_feed(url, response):
+                self.logger.info(f"URL is already an RSS feed: {url}")
+                posts = await asyncio.to_thread(checker._extract_posts_from_rss_feed, url, source_type, response)
+                title = self._feed_title(posts)
+                if not title:
+                    title, _ = await asyncio.to_thread(self._parse_page, url, response.content)
+                yield self._metadata(url, title, True, source_type)
+                yield self._preview(posts)
+                return
+
+            # HTML page: parse once for the title and feed <link>
+            page_title, soup = await asyncio.to_thread(self._parse_page, url, response.content)
+            feed_url = await checker._discover_rss_feed_async(fetcher, url, response, soup)
+
+            if not feed_url:
+                yield self._metadata(url, page_title, False, source_type)
+                platform_type = checker._detect_platform_type(url)
+                posts = await asyncio.to_thread(
+                    checker._extract_posts_from_html, url, response.content, platform_type, soup
+                )
+                yield self._preview(posts)
+                return
+
+            self.logger.info(f"Discovered RSS feed: {feed_url}")
+            yield self._metadata(feed_url, page_title, True, source_type)
+
+            try:
+                feed_response = await fetcher.get(feed_url)
+                posts = await asyncio.to_thread(
+                    checker._extract_posts_from_rss_feed, feed_url, source_type, feed_response
+                )
+            except Exception as e:
+                self.logger.warning(f"Could not load preview from {feed_url}: {e}")
+                posts = []
+            yield self._preview(posts, title=self._feed_title(posts))
+
+    async def discover_all(self, url: str, source_type: str = 'newsletter') -> Dict:
+        """Run discover() to completion and merge its events into one result"""
+        result: Dict = {}
+        async for event in self.discover(url, source_type):
+            result.update({key: value for key, value in event.items() if key != 'event'})
+        return result
+
+    @staticmethod
+    def _parse_page(url: str, content: bytes) -> Tuple[str, BeautifulSoup]:
+        """Parse HTML once; returns (title, soup) - og:title wins over <title>"""
+        soup = BeautifulSoup(content, 'html.parser')
+        title = "Unknown Source"
+
+        title_tag = soup.find('title')
+        if title_tag:
+            title = title_tag.get_text().strip() or title
+        og_title = soup.find('meta', property='og:title')
+        if og_title and og_title.get('content'):
+            title = og_title.get('content').strip()
+
+        return title, soup
+
+    @staticmethod
+    def _feed_title(posts: List[Dict]) -> Optional[str]:
+        """Channel title from feed metadata, if the feed had entries"""
+        if posts and posts[0].get('channel_title') not in (None, '', 'Unknown'):
+            return posts[0]['channel_title']
+        return None
+
+    @staticmethod
+    def _metadata(url: str, title: str, has_rss: bool, source_type: str) -> Dict:
+        return {
+            'event': 'metadata',
+            'url': url,
+            'title': title,
+            'has_rss': has_rss,
+            'source_type': source_type  # Return user's intended source_type, not feed_type
+        }
+
+    @staticmethod
+    def _preview(posts: List[Dict], title: Optional[str] = None) -> Dict:
+        event = {
+            'event': 'preview',
+            'preview_posts': [
+                {
+                    'title': post['title'],
+                    'url': post['url'],
+                    'published_date': post['published'].isoformat() if post.get('published') else None
+                }
+                for post in posts[:PREVIEW_POST_COUNT]
+            ]
+        }
+        if title:
+            event['title'] = title
+        return event
@@ -20,6 +20,27 @@ class Config:
     LONG_TIMEOUT = 300
     SHORT_TIMEOUT = 15
 
+    # Feed polling concurrency (all sources / per host)
+    FEED_FETCH_CONCURRENCY = int(os.getenv('FEED_FETCH_CONCURRENCY', '16'))
+    FEED_FETCH_PER_HOST = int(os.getenv('FEED_FETCH_PER_HOST', '2'))
+
+    # content_queue records per bulk upsert request
+    CONTENT_QUEUE_UPSERT_BATCH_SIZE = int(os.getenv('CONTENT_QUEUE_UPSERT_BATCH_SIZE', '100'))
+
+    # In-process cache of URLs known to be in content_queue (see core/url_index.py)
+    EXISTING_URL_CACHE_TTL_SECONDS = int(os.getenv('EXISTING_URL_CACHE_TTL_SECONDS', '86400'))
+    EXISTING_URL_CACHE_MAX_ENTRIES = int(os.getenv('EXISTING_URL_CACHE_MAX_ENTRIES', '100000'))
+
+    # How long RSS discovery remembers a domain with no feed at any common path
+    RSS_DISCOVERY_NEGATIVE_TTL_SECONDS = int(os.getenv('RSS_DISCOVERY_NEGATIVE_TTL_SECONDS', '21600'))
+
+    # Background poll scheduler (see app/services/poll_scheduler.py)
+    POLL_SCHEDULER_ENABLED = os.getenv('POLL_SCHEDULER_ENABLED', 'false').lower() == 'true'
+    POLL_SCHEDULER_TICK_SECONDS = int(os.getenv('POLL_SCHEDULER_TICK_SECONDS', '60'))
+    POLL_INITIAL_INTERVAL_SECONDS = int(os.getenv('POLL_INITIAL_INTERVAL_SECONDS', '3600'))
+    POLL_MIN_INTERVAL_SECONDS = int(os.getenv('POLL_MIN_INTERVAL_SECONDS', '900'))
+    POLL_MAX_INTERVAL_SECONDS = int(os.getenv('POLL_MAX_INTERVAL_SECONDS', '86400'))
+
     # Retry settings
     DEFAULT_RETRIES = 3
     MAX_RETRIES = 5
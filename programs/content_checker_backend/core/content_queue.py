@@ -0,0 +1,67 @@
+"""
+Content Queue Writes
+
+Bulk upsert of discovered items into the content_queue table, shared by the
+RSS post checker and the PocketCasts history checker. Records are written in
+bounded batches (one round-trip per batch instead of per item), and the
+returned row IDs are mapped back by URL.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from supabase import Client
+
+from core.config import Config
+
+
+def upsert_content_queue(
+    supabase: Client,
+    records: List[Dict],
+    batch_size: Optional[int] = None,
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, str]:
+    """
+    Upsert records into content_queue (on_conflict='url')
+
+    A batch that fails is retried one record at a time, so a single bad
+    record doesn't lose the rest of the batch.
+
+    Args:
+        supabase: Supabase client
+        records: content_queue rows; all records in one call should have the same keys
+        batch_size: Records per request (default: Config.CONTENT_QUEUE_UPSERT_BATCH_SIZE)
+        logger: Logger instance
+
+    Returns:
+        Mapping of URL -> content_queue ID for every record that was saved
+    """
+    logger = logger or logging.getLogger(__name__)
+    batch_size = max(1, batch_size or Config.CONTENT_QUEUE_UPSERT_BATCH_SIZE)
+
+    # Postgres rejects an upsert that touches the same row twice - keep the last record per URL
+    unique_records = list({record['url']: record for record in records}.values())
+    if not unique_records:
+        return {}
+
+    saved: Dict[str, str] = {}
+    for start in range(0, len(unique_records), batch_size):
+        batch = unique_records[start:start + batch_size]
+        try:
+            saved.update(_upsert_batch(supabase, batch))
+        except Exception as e:
+            logger.warning(f"⚠️ Batch upsert of {len(batch)} content_queue records failed, retrying individually: {e}")
+            for record in batch:
+                try:
+                    saved.update(_upsert_batch(supabase, [record]))
+                except Exception as record_error:
+                    logger.error(f"Error saving {record['url']} to content_queue: {record_error}")
+
+    batches = (len(unique_records) + batch_size - 1) // batch_size
+    logger.info(f"Saved {len(saved)}/{len(unique_records)} records to content_queue in {batches} batch(es)")
+    return saved
+
+
+def _upsert_batch(supabase: Client, batch: List[Dict]) -> Dict[str, str]:
+    result = supabase.table('content_queue').upsert(batch, on_conflict='url').execute()
+    return {row['url']: row['id'] for row in result.data or [] if row.get('id')}
@@ -0,0 +1,127 @@
+"""
+Async Feed Fetcher
+
+Fetches many feeds/pages concurrently over one pooled httpx.AsyncClient.
+Concurrency is capped globally (fan-out across all sources) and per host, so
+checking dozens of sources on the same platform (e.g. substack.com) doesn't
+hammer one server while other hosts sit idle.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from core.config import Config
+
+
+class FeedFetcher:
+    """
+    Concurrent HTTP fetcher with global and per-host limits
+
+    Usage:
+        async with FeedFetcher() as fetcher:
+            responses = await asyncio.gather(*(fetcher.get(url) for url in urls))
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        timeout: float = Config.DEFAULT_TIMEOUT,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            max_concurrency: Requests in flight across all hosts (default: Config.FEED_FETCH_CONCURRENCY)
+            per_host_limit: Requests in flight per host (default: Config.FEED_FETCH_PER_HOST)
+            timeout: Request timeout in seconds
+            logger: Logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_concurrency = max(1, max_concurrency or Config.FEED_FETCH_CONCURRENCY)
+        self.per_host_limit = max(1, per_host_limit or Config.FEED_FETCH_PER_HOST)
+        self.timeout = timeout
+
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "FeedFetcher":
+        self._client = httpx.AsyncClient(
+            headers=Config.get_default_headers(),
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send a request within the global and per-host limits
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            timeout: Per-request timeout override
+            headers: Extra request headers (e.g. conditional GET validators)
+
+        Returns:
+            httpx.Response (status is not checked; see get())
+        """
+        if self._client is None:
+            raise RuntimeError("FeedFetcher must be used as an async context manager")
+
+        # Take the host slot first so waiting on a busy host doesn't hold a global slot
+        async with self._host_semaphore(url):
+            async with self._global_semaphore:
+                return await self._client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+                )
+
+    async def get(
+        self,
+        url: str,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """GET a URL, raising httpx.HTTPStatusError for error responses (304 Not Modified is returned)"""
+        response = await self.request("GET", url, timeout=timeout, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    async def head(self, url: str, timeout: Optional[float] = None) -> httpx.Response:
+        """HEAD a URL (status is not checked)"""
+        return await self.request("HEAD", url, timeout=timeout)
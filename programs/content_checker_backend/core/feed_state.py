@@ -0,0 +1,217 @@
+"""
+Feed State Store
+
+Remembers, per user and feed, what the last successful poll saw:
+- HTTP validators (ETag / Last-Modified) for conditional GETs
+- A hash of the feed body, for servers that don't send validators
+- The entry IDs that were in the feed
+
+A poll sends If-None-Match / If-Modified-Since, skips parsing entirely on a
+304 or an identical body, and otherwise only processes entries that weren't
+in the feed last time. Most feeds change weekly, so most polls end at the
+conditional GET.
+
+State lives in the Supabase `feed_fetch_state` table (migration 1020) and is
+keyed by user as well as URL: entries one user has already processed may
+still be new for another user following the same feed.
+"""
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from supabase import Client
+
+# Users per `in_` lookup in load_many()
+USER_CHUNK_SIZE = 100
+
+# Rows per request when loading state (Supabase caps responses at 1000 rows)
+STATE_PAGE_SIZE = 1000
+
+
+def hash_feed_content(content: bytes) -> str:
+    """SHA-256 hex digest of a feed body"""
+    return hashlib.sha256(content).hexdigest()
+
+
+class FeedStateStore:
+    """
+    Per-user feed validators and seen entries for one post check
+
+    Usage:
+        store = FeedStateStore(supabase, user_id)
+        store.load()
+        response = await fetcher.get(url, headers=store.request_headers(url))
+        if store.is_unchanged(url, response): ...
+        posts = store.filter_seen(url, posts)
+        store.record(source_url, url, response, entry_ids)
+        ... after the source's posts are saved:
+        store.commit_source(source_url)
+        store.flush()
+    """
+
+    TABLE_NAME = "feed_fetch_state"
+    STATE_COLUMNS = 'user_id, feed_url, etag, last_modified, content_hash, seen_entry_ids'
+
+    def __init__(self, supabase: Optional[Client], user_id: str, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            supabase: Supabase client (None disables persistence)
+            user_id: UUID of the user being checked
+            logger: Logger instance
+        """
+        self.supabase = supabase
+        self.user_id = user_id
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._states: Dict[str, Dict] = {}     # feed_url -> state from the last poll
+        self._pending: Dict[str, Dict] = {}    # source_url -> new state (not yet confirmed)
+        self._committed: Dict[str, Dict] = {}  # feed_url -> new state ready to be written
+
+    def load(self) -> None:
+        """Load this user's feed state (a failure just means every feed is fetched in full)"""
+        if not self.supabase:
+            return
+        try:
+            rows = self._load_rows(self.supabase, [self.user_id])
+            self._states = {row['feed_url']: row for row in rows}
+            self.logger.info(f"Loaded fetch state for {len(self._states)} feeds")
+        except Exception as e:
+            self._disable(f"load failed: {e}")
+
+    @classmethod
+    def load_many(
+        cls,
+        supabase: Optional[Client],
+        user_ids: Iterable[str],
+        logger: Optional[logging.Logger] = None
+    ) -> Dict[str, "FeedStateStore"]:
+        """
+        Load feed state for several users with one query per chunk of users
+
+        Returns:
+            Mapping of user_id -> loaded FeedStateStore
+        """
+        stores = {user_id: cls(supabase, user_id, logger) for user_id in dict.fromkeys(user_ids)}
+        if not supabase or not stores:
+            return stores
+
+        user_id_list = list(stores)
+        try:
+            for start in range(0, len(user_id_list), USER_CHUNK_SIZE):
+                for row in cls._load_rows(supabase, user_id_list[start:start + USER_CHUNK_SIZE]):
+                    stores[row['user_id']]._states[row['feed_url']] = row
+        except Exception as e:
+            for index, store in enumerate(stores.values()):
+                store._disable(f"load failed: {e}", log=index == 0)
+            return stores
+
+        feed_count = sum(len(store._states) for store in stores.values())
+        (logger or logging.getLogger(__name__)).info(
+            f"Loaded fetch state for {feed_count} feeds across {len(stores)} users"
+        )
+        return stores
+
+    @classmethod
+    def _load_rows(cls, supabase: Client, user_ids: List[str]) -> List[Dict]:
+        """Every state row for the given users (paged past Supabase's row limit)"""
+        rows = []
+        start = 0
+        while True:
+            result = supabase.table(cls.TABLE_NAME).select(
+                cls.STATE_COLUMNS
+            ).in_('user_id', user_ids).order('user_id').order('feed_url').range(
+                start, start + STATE_PAGE_SIZE - 1
+            ).execute()
+            page = result.data or []
+            rows.extend(page)
+            if len(page) < STATE_PAGE_SIZE:
+                return rows
+            start += STATE_PAGE_SIZE
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for a feed URL (empty if never seen)"""
+        state = self._states.get(url)
+        if not state:
+            return {}
+
+        headers = {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+        return headers
+
+    def is_unchanged(self, url: str, response) -> bool:
+        """True if the server answered 304 or sent the same body as last time"""
+        if response.status_code == 304:
+            return True
+        state = self._states.get(url)
+        return bool(state and state.get('content_hash') == hash_feed_content(response.content))
+
+    def filter_seen(self, url: str, posts: List[Dict]) -> List[Dict]:
+        """Drop posts whose entry ID was already in the feed on the last poll"""
+        seen = self.seen_entry_ids(url)
+        if not seen:
+            return posts
+        return [post for post in posts if post.get('entry_id') not in seen]
+
+    def seen_entry_ids(self, url: str) -> Set[str]:
+        state = self._states.get(url)
+        return set(state.get('seen_entry_ids') or []) if state else set()
+
+    def record(self, source_url: str, feed_url: str, response, entry_ids: Iterable[str]) -> None:
+        """
+        Stage the new state for a feed
+
+        It is only written once commit_source() confirms the source's posts
+        were saved - otherwise a failed save would be skipped on every later poll.
+        """
+        self._pending[source_url] = {
+            'user_id': self.user_id,
+            'feed_url': feed_url,
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'content_hash': hash_feed_content(response.content),
+            'seen_entry_ids': [entry_id for entry_id in entry_ids if entry_id],
+            'checked_at': datetime.now().isoformat()
+        }
+
+    def commit_source(self, source_url: str) -> None:
+        """Mark a source's staged state as safe to persist"""
+        state = self._pending.pop(source_url, None)
+        if not state:
+            return
+
+        # Several sources can resolve to one feed (same URL under two source
+        # types, or a page and its feed URL). An upsert can't touch the same
+        # (user_id, feed_url) row twice, so keep one state per feed: the latest
+        # validators, and every entry ID either source saw.
+        previous = self._committed.get(state['feed_url'])
+        if previous:
+            seen = dict.fromkeys(previous['seen_entry_ids'])
+            seen.update(dict.fromkeys(state['seen_entry_ids']))
+            state['seen_entry_ids'] = list(seen)
+        self._committed[state['feed_url']] = state
+
+    def flush(self) -> None:
+        """Write all committed states in one upsert"""
+        if not self.supabase or not self._committed:
+            return
+        try:
+            self.supabase.table(self.TABLE_NAME).upsert(
+                list(self._committed.values()),
+                on_conflict='user_id,feed_url'
+            ).execute()
+            self.logger.info(f"Saved fetch state for {len(self._committed)} feeds")
+            self._committed = {}
+        except Exception as e:
+            self._disable(f"save failed: {e}")
+
+    def _disable(self, reason: str, log: bool = True) -> None:
+        # Most likely the migration hasn't been applied; carry on with full fetches
+        if log:
+            self.logger.warning(f"⚠️ Feed state {reason} - fetching feeds without conditional requests")
+        self.supabase = None
+        self._states = {}
@@ -0,0 +1,233 @@
+"""
+Poll Schedule
+
+Learns how often each feed publishes and decides when it's next worth
+polling. Used by the background scheduler (app/services/poll_scheduler.py)
+through PostCheckerService.check_for_new_posts_all_users():
+- A feed that changed is next polled at a fraction of its typical gap
+  between entries (from the entries' published dates)
+- A feed that didn't change (or failed) has its interval doubled, so dormant
+  feeds back off exponentially up to Config.POLL_MAX_INTERVAL_SECONDS
+
+Schedules are keyed by (source URL, source type), like the shared fetches.
+One PollSchedule lives for the whole scheduler, so learned intervals are kept
+in memory between runs; they are also persisted in the Supabase
+`feed_poll_schedule` table (migration 1022) so a restart doesn't re-poll
+everything at once. Without the table, the in-memory schedule still applies.
+"""
+
+import hashlib
+import logging
+import statistics
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from supabase import Client
+
+from core.config import Config
+from core.feed_state import hash_feed_content
+
+# Polls per typical gap between entries for a feed that's publishing
+POLLS_PER_PUBLISH_GAP = 4
+
+# Interval multiplier after a poll that found nothing new
+BACKOFF_FACTOR = 2
+
+# Most recent entries used to estimate a feed's publishing cadence
+CADENCE_SAMPLE_SIZE = 10
+
+# Source URLs per `in_` lookup (keeps the request URL short)
+LOOKUP_CHUNK_SIZE = 100
+
+# Rows per request when reading every schedule for the summary
+SUMMARY_PAGE_SIZE = 1000
+
+FeedKey = Tuple[str, str]  # (source URL, source type)
+
+
+def feed_signature(feed: Dict) -> Optional[str]:
+    """Hash identifying a fetched feed's content (the feed body, or the scraped post URLs)"""
+    if feed.get('response') is not None:
+        return hash_feed_content(feed['response'].content)
+    urls = sorted(post['url'] for post in feed.get('posts') or [])
+    if not urls:
+        return None
+    return hashlib.sha256('\n'.join(urls).encode('utf-8')).hexdigest()
+
+
+def estimate_interval(posts: List[Dict]) -> Optional[float]:
+    """
+    Poll interval (seconds) matching a feed's publishing cadence
+
+    Returns:
+        Median gap between the latest entries / POLLS_PER_PUBLISH_GAP, or
+        None if there aren't enough dated entries
+    """
+    dates = sorted((post['published'] for post in posts if post.get('published')), reverse=True)
+    dates = dates[:CADENCE_SAMPLE_SIZE]
+    gaps = [(newer - older).total_seconds() for newer, older in zip(dates, dates[1:]) if newer > older]
+    if not gaps:
+        return None
+    return statistics.median(gaps) / POLLS_PER_PUBLISH_GAP
+
+
+class PollSchedule:
+    """
+    Next-poll times for the scheduled feeds, kept across scheduled checks
+
+    Usage:
+        schedule = PollSchedule(supabase)
+        ... every scheduled check:
+        schedule.load(feed_keys)
+        due = [key for key in feed_keys if schedule.is_due(key)]
+        ... after fetching each due feed:
+        schedule.record(key, feed)
+        schedule.flush()
+    """
+
+    TABLE_NAME = "feed_poll_schedule"
+
+    def __init__(self, supabase: Optional[Client], logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            supabase: Supabase client (None keeps schedules in memory only)
+            logger: Logger instance
+        """
+        self.supabase = supabase
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._rows: Dict[FeedKey, Dict] = {}
+        self._updated: Dict[FeedKey, Dict] = {}
+
+    def load(self, keys: Iterable[FeedKey]) -> None:
+        """Load stored schedules for these feeds (a failure keeps the in-memory ones)"""
+        urls = list(dict.fromkeys(url for url, _ in keys))
+        if not self.supabase or not urls:
+            return
+        try:
+            for start in range(0, len(urls), LOOKUP_CHUNK_SIZE):
+                result = self.supabase.table(self.TABLE_NAME).select('*').in_(
+                    'source_url', urls[start:start + LOOKUP_CHUNK_SIZE]
+                ).execute()
+                for row in result.data or []:
+                    self._rows[(row['source_url'], row['source_type'])] = row
+        except Exception as e:
+            self._disable(f"load failed: {e}")
+
+    def is_due(self, key: FeedKey, now: Optional[datetime] = None) -> bool:
+        """True if the feed has no schedule yet or its next poll time has passed"""
+        next_poll_at = _parse_timestamp(self._rows.get(key, {}).get('next_poll_at'))
+        return next_poll_at is None or next_poll_at <= (now or datetime.now(timezone.utc))
+
+    def record(self, key: FeedKey, feed: Dict) -> None:
+        """
+        Schedule a feed's next poll from what this poll found
+
+        Args:
+            key: (source URL, source type)
+            feed: Shared fetch result ({'feed_url', 'response', 'posts', 'error'})
+        """
+        previous = self._rows.get(key)
+        now = datetime.now(timezone.utc)
+        interval = float((previous or {}).get('poll_interval_seconds') or Config.POLL_INITIAL_INTERVAL_SECONDS)
+        signature = feed_signature(feed)
+        changed = not feed.get('error') and signature != (previous or {}).get('content_hash')
+
+        if changed:
+            # Publishing: poll at the feed's own cadence (or speed up if it can't be told)
+            cadence = estimate_interval(feed.get('posts') or [])
+            if cadence:
+                interval = cadence
+            elif previous:
+                interval /= BACKOFF_FACTOR
+        else:
+            interval *= BACKOFF_FACTOR
+
+        interval = min(max(interval, Config.POLL_MIN_INTERVAL_SECONDS), Config.POLL_MAX_INTERVAL_SECONDS)
+        row = {
+            'source_url': key[0],
+            'source_type': key[1],
+            'poll_interval_seconds': int(interval),
+            'next_poll_at': (now + timedelta(seconds=interval)).isoformat(),
+            'last_polled_at': now.isoformat(),
+            'last_changed_at': now.isoformat() if changed else (previous or {}).get('last_changed_at'),
+            'content_hash': signature if not feed.get('error') else (previous or {}).get('content_hash'),
+            'consecutive_unchanged': 0 if changed else (previous or {}).get('consecutive_unchanged', 0) + 1,
+            'last_error': feed.get('error')
+        }
+        self._rows[key] = row
+        self._updated[key] = row
+
+    def flush(self) -> None:
+        """Write the updated schedules in one upsert"""
+        if not self.supabase:
+            self._updated = {}
+            return
+        if not self._updated:
+            return
+        try:
+            self.supabase.table(self.TABLE_NAME).upsert(
+                list(self._updated.values()),
+                on_conflict='source_url,source_type'
+            ).execute()
+            self.logger.info(f"Saved poll schedule for {len(self._updated)} feeds")
+            self._updated = {}
+        except Exception as e:
+            self._disable(f"save failed: {e}")
+
+    def summary(self, upcoming: int = 10) -> Dict:
+        """
+        Overview of all stored schedules (for the status endpoint)
+
+        Args:
+            upcoming: Number of next-due feeds to list
+
+        Returns:
+            Counts of scheduled/due/backed-off feeds and the next feeds to be polled
+        """
+        if self.supabase:
+            rows = self._load_all_rows()
+        else:
+            rows = sorted(list(self._rows.values()), key=lambda row: row.get('next_poll_at') or '')
+        now = datetime.now(timezone.utc)
+
+        return {
+            'persistence': self.supabase is not None,
+            'feeds_scheduled': len(rows),
+            'feeds_due': sum(1 for row in rows if (_parse_timestamp(row.get('next_poll_at')) or now) <= now),
+            'feeds_at_max_interval': sum(
+                1 for row in rows if row.get('poll_interval_seconds', 0) >= Config.POLL_MAX_INTERVAL_SECONDS
+            ),
+            'feeds_with_errors': sum(1 for row in rows if row.get('last_error')),
+            'next_polls': rows[:upcoming]
+        }
+
+    def _load_all_rows(self) -> List[Dict]:
+        """Every stored schedule, soonest first (paged past Supabase's row limit)"""
+        rows = []
+        start = 0
+        while True:
+            result = self.supabase.table(self.TABLE_NAME).select(
+                'source_url, source_type, poll_interval_seconds, next_poll_at, last_changed_at, last_error'
+            ).order('next_poll_at').order('source_url').range(start, start + SUMMARY_PAGE_SIZE - 1).execute()
+            page = result.data or []
+            rows.extend(page)
+            if len(page) < SUMMARY_PAGE_SIZE:
+                return rows
+            start += SUMMARY_PAGE_SIZE
+
+    def _disable(self, reason: str) -> None:
+        # Most likely the migration hasn't been applied; keep scheduling in memory
+        # (feeds not polled since startup are due once, then follow their intervals)
+        self.logger.warning(f"⚠️ Poll schedule {reason} - keeping schedules in memory only")
+        self.supabase = None
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
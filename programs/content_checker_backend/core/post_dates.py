@@ -0,0 +1,230 @@
+"""
+Post Published Dates
+
+For feed entries without a published date, the post checker has to look at
+the post itself. This module makes that cheap:
+- extract_published_date() reads JSON-LD, <meta> and <time> tags in a single
+  pass over one parsed page (falling back to common date classes)
+- PostDateCache remembers dates already found, in the Supabase
+  `post_published_dates` table (migration 1021), so an undated post is
+  downloaded at most once rather than on every poll
+
+A post's published date doesn't change, so cached dates never expire. URLs
+where no date could be found are not cached: they're treated as recent and
+saved to content_queue, after which they aren't checked again anyway.
+"""
+
+import email.utils
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from supabase import Client
+
+# <meta> property/name/itemprop values holding the publish date, best first
+DATE_META_KEYS = [
+    'article:published_time',
+    'og:published_time',
+    'datepublished',
+    'publishdate',
+    'pubdate',
+    'date',
+    'dc.date',
+    'dc.date.issued',
+    'sailthru.date',
+]
+
+# Last resort: visible text of elements with these classes
+DATE_TEXT_SELECTOR = '.date, .published, .post-date'
+
+# URLs per `in_` lookup (keeps the request URL short)
+LOOKUP_CHUNK_SIZE = 100
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a date string from a page or header into a naive local datetime
+
+    Accepts ISO 8601, RFC 2822 (HTTP headers) and free-form dates such as
+    "March 5, 2024". Naive local time matches the datetime.now() comparisons
+    used for feed dates.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    # Require a year so fragments like "5 min read" aren't taken for dates
+    if not value or len(value) > 100 or not re.search(r'\d{4}', value):
+        return None
+
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = date_parser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def extract_published_date(content: bytes) -> Optional[datetime]:
+    """
+    Find a post's published date in its HTML
+
+    Priority: JSON-LD datePublished, then date <meta> tags, then
+    <time datetime>, then the text of common date classes.
+
+    Args:
+        content: Raw HTML of the post page
+
+    Returns:
+        Published date, or None if the page doesn't state one
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+
+    json_ld_dates: List[str] = []
+    meta_dates: Dict[str, str] = {}
+    time_dates: List[str] = []
+
+    # One pass over the tags that can carry a date
+    for tag in soup.find_all(['script', 'meta', 'time']):
+        if tag.name == 'script':
+            if (tag.get('type') or '').lower() == 'application/ld+json':
+                json_ld_dates.extend(_json_ld_dates(tag.string))
+        elif tag.name == 'meta':
+            key = (tag.get('property') or tag.get('name') or tag.get('itemprop') or '').lower()
+            if key in DATE_META_KEYS and tag.get('content'):
+                meta_dates.setdefault(key, tag['content'])
+        elif tag.get('datetime'):
+            time_dates.append(tag['datetime'])
+
+    candidates = json_ld_dates + [meta_dates[key] for key in DATE_META_KEYS if key in meta_dates] + time_dates
+    for value in candidates:
+        parsed = parse_date(value)
+        if parsed:
+            return parsed
+
+    for element in soup.select(DATE_TEXT_SELECTOR):
+        parsed = parse_date(element.get_text())
+        if parsed:
+            return parsed
+
+    return None
+
+
+def _json_ld_dates(raw: Optional[str]) -> List[str]:
+    """datePublished values from a JSON-LD block (handles lists and @graph)"""
+    if not raw:
+        return []
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return []
+
+    dates = []
+    stack = [data]
+    while stack:
+        item = stack.pop(0)
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            if isinstance(item.get('datePublished'), str):
+                dates.append(item['datePublished'])
+            if '@graph' in item:
+                stack.append(item['@graph'])
+    return dates
+
+
+class PostDateCache:
+    """
+    Published dates of posts whose feed entries had none
+
+    Usage:
+        cache = PostDateCache(supabase)
+        cache.load(undated_urls)
+        published = cache.get(url)
+        ... after looking a date up:
+        cache.record(url, published, 'page')
+        cache.flush()
+    """
+
+    TABLE_NAME = "post_published_dates"
+
+    def __init__(self, supabase: Optional[Client], logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            supabase: Supabase client (None disables persistence)
+            logger: Logger instance
+        """
+        self.supabase = supabase
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._dates: Dict[str, datetime] = {}
+        self._new: Dict[str, Dict] = {}
+
+    def load(self, urls: Iterable[str]) -> None:
+        """Load cached dates for these URLs (a failure just means pages are fetched)"""
+        candidates = [url for url in dict.fromkeys(urls) if url and url not in self._dates]
+        if not self.supabase or not candidates:
+            return
+
+        for start in range(0, len(candidates), LOOKUP_CHUNK_SIZE):
+            chunk = candidates[start:start + LOOKUP_CHUNK_SIZE]
+            try:
+                result = self.supabase.table(self.TABLE_NAME).select(
+                    'url, published_at'
+                ).in_('url', chunk).execute()
+            except Exception as e:
+                self._disable(f"load failed: {e}")
+                return
+            for row in result.data or []:
+                published = parse_date(row.get('published_at'))
+                if published:
+                    self._dates[row['url']] = published
+
+        self.logger.info(f"Post date cache: {len(self._dates)}/{len(candidates)} undated posts already known")
+
+    def get(self, url: str) -> Optional[datetime]:
+        return self._dates.get(url)
+
+    def record(self, url: str, published: datetime, source: str) -> None:
+        """
+        Remember a looked-up date
+
+        Args:
+            url: Post URL
+            published: Date found (for 'last_modified', an upper bound on the published date)
+            source: Where it came from: 'page' or 'last_modified'
+        """
+        self._dates[url] = published
+        self._new[url] = {
+            'url': url,
+            'published_at': published.astimezone().isoformat(),
+            'date_source': source,
+            'checked_at': datetime.now().astimezone().isoformat()
+        }
+
+    def flush(self) -> None:
+        """Write newly found dates in one upsert"""
+        if not self.supabase or not self._new:
+            return
+        try:
+            self.supabase.table(self.TABLE_NAME).upsert(
+                list(self._new.values()),
+                on_conflict='url'
+            ).execute()
+            self.logger.info(f"Cached published dates for {len(self._new)} posts")
+            self._new = {}
+        except Exception as e:
+            self._disable(f"save failed: {e}")
+
+    def _disable(self, reason: str) -> None:
+        # Most likely the migration hasn't been applied; dates are still looked up, just not cached
+        self.logger.warning(f"⚠️ Post date cache {reason} - undated posts will be fetched each check")
+        self.supabase = None
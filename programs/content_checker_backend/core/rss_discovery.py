@@ -6,13 +6,56 @@ source URLs between content_sources and known_channels tables.
 """
 
 import requests
+import threading
+import time
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from typing import Optional, List, Dict
 import logging
 
 from core.config import Config
 
+# Candidate paths probed when a page doesn't link its feed, in order of preference
+COMMON_FEED_PATHS = [
+    '/feed',
+    '/rss',
+    '/feed.xml',
+    '/rss.xml',
+    '/atom.xml',
+    '/index.xml',
+    '/feeds/posts/default'  # Blogger
+]
+
+FEED_LINK_TYPES = [
+    'application/rss+xml',
+    'application/atom+xml',
+    'application/xml'
+]
+
+# Domains where no common feed path answered: domain -> expiry (time.monotonic())
+_no_feed_domains: Dict[str, float] = {}
+_no_feed_domains_lock = threading.Lock()
+
+
+def is_known_feedless(domain: str) -> bool:
+    """True if probing domain's common feed paths found nothing within the TTL"""
+    with _no_feed_domains_lock:
+        expiry = _no_feed_domains.get(domain)
+        if expiry is None:
+            return False
+        if expiry < time.monotonic():
+            del _no_feed_domains[domain]
+            return False
+        return True
+
+
+def remember_feedless(domain: str) -> None:
+    """Record that no common feed path answered on domain"""
+    if Config.RSS_DISCOVERY_NEGATIVE_TTL_SECONDS > 0:
+        with _no_feed_domains_lock:
+            _no_feed_domains[domain] = time.monotonic() + Config.RSS_DISCOVERY_NEGATIVE_TTL_SECONDS
+
 
 class RSSDiscovery:
     """Discovers RSS feeds from web pages"""
@@ -22,6 +65,10 @@ class RSSDiscovery:
         self.session = requests.Session()
         self.session.headers.update(Config.get_default_headers())
 
+        # Feed <link>s per page URL, so discover_rss_feed() and get_all_feeds()
+        # on the same page share one fetch
+        self._page_feeds: Dict[str, List[Dict[str, str]]] = {}
+
     def discover_rss_feed(self, url: str) -> Optional[str]:
         """
         Auto-discover RSS feed from a web page URL
@@ -39,15 +86,10 @@ class RSSDiscovery:
 
             self.logger.info(f"🔍 [RSS DISCOVERY] Checking for RSS feed at: {url}")
 
-            response = self.session.get(url, timeout=Config.DEFAULT_TIMEOUT)
-            response.raise_for_status()
-
-            # Try to discover from HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-
             # Strategy 1: Look for RSS/Atom feed links in <head>
-            feed_url = self._discover_from_html_head(soup, url)
-            if feed_url:
+            feeds = self._get_page_feeds(url)
+            if feeds:
+                feed_url = feeds[0]['url']
                 self.logger.info(f"✅ [RSS DISCOVERY] Found in HTML head: {feed_url}")
                 return feed_url
 
@@ -80,61 +122,81 @@ class RSSDiscovery:
         ]
         return any(indicator in url_lower for indicator in rss_indicators)
 
-    def _discover_from_html_head(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """Discover RSS feed from HTML <head> <link> tags"""
-        try:
-            feed_link_types = [
-                'application/rss+xml',
-                'application/atom+xml',
-                'application/xml'
-            ]
-
-            for link in soup.find_all('link', type=feed_link_types):
-                href = link.get('href')
-                if href:
-                    # Convert relative URLs to absolute
-                    feed_url = urljoin(base_url, href)
-                    return feed_url
+    def _get_page_feeds(self, url: str) -> List[Dict[str, str]]:
+        """Fetch a page once and return its feed <link>s (raises on HTTP errors)"""
+        if url not in self._page_feeds:
+            response = self.session.get(url, timeout=Config.DEFAULT_TIMEOUT)
+            response.raise_for_status()
 
-            return None
+            soup = BeautifulSoup(response.content, 'html.parser')
+            self._page_feeds[url] = self._discover_from_html_head(soup, url)
 
-        except Exception as e:
-            self.logger.debug(f"Error discovering from HTML head: {e}")
-            return None
+        return self._page_feeds[url]
+
+    @staticmethod
+    def _discover_from_html_head(soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
+        """Discover RSS/Atom feeds from HTML <head> <link> tags, in page order"""
+        feeds = []
+
+        for link in soup.find_all('link', type=FEED_LINK_TYPES):
+            href = link.get('href')
+            if href:
+                # Convert relative URLs to absolute
+                feeds.append({
+                    'url': urljoin(base_url, href),
+                    'type': link.get('type', 'unknown'),
+                    'title': link.get('title', 'Untitled Feed')
+                })
+
+        return feeds
 
     def _try_common_feed_paths(self, url: str) -> Optional[str]:
-        """Try common RSS feed paths"""
+        """
+        Try common RSS feed paths
+
+        All candidates are probed at once. The most preferred path that answers
+        wins; lower-priority probes still in flight are abandoned once it's
+        known. Domains with no feed at any path are remembered for
+        Config.RSS_DISCOVERY_NEGATIVE_TTL_SECONDS.
+        """
         try:
             parsed_url = urlparse(url)
             base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
-            common_paths = [
-                '/feed',
-                '/rss',
-                '/feed.xml',
-                '/rss.xml',
-                '/atom.xml',
-                '/index.xml',
-                '/feeds/posts/default'  # Blogger
-            ]
-
-            for path in common_paths:
-                feed_url = base_url + path
-                try:
-                    response = self.session.head(feed_url, timeout=5, allow_redirects=True)
-                    if response.status_code == 200:
-                        content_type = response.headers.get('content-type', '').lower()
-                        if any(t in content_type for t in ['xml', 'rss', 'atom']):
-                            return feed_url
-                except:
-                    continue
-
+            domain = parsed_url.netloc.lower()
+
+            if is_known_feedless(domain):
+                self.logger.info(f"ℹ️ [RSS DISCOVERY] Skipping common paths, no feed found recently on {domain}")
+                return None
+
+            candidates = [base_url + path for path in COMMON_FEED_PATHS]
+            executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix='rss-probe')
+            try:
+                futures = [executor.submit(self._probe_feed_url, candidate) for candidate in candidates]
+                for feed_url, future in zip(candidates, futures):
+                    if future.result():
+                        return feed_url
+            finally:
+                # Don't wait for slower, lower-priority probes once we have an answer
+                executor.shutdown(wait=False, cancel_futures=True)
+
+            remember_feedless(domain)
             return None
 
         except Exception as e:
             self.logger.debug(f"Error trying common paths: {e}")
             return None
 
+    def _probe_feed_url(self, feed_url: str) -> bool:
+        """HEAD a candidate feed URL; True if it answers 200 with an XML/RSS/Atom type"""
+        try:
+            response = self.session.head(feed_url, timeout=5, allow_redirects=True)
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '').lower()
+                return any(t in content_type for t in ['xml', 'rss', 'atom'])
+        except Exception:
+            pass
+        return False
+
     def get_all_feeds(self, url: str) -> List[Dict[str, str]]:
         """
         Get all RSS/Atom feeds found on a page
@@ -145,34 +207,8 @@ class RSSDiscovery:
         Returns:
             List of dicts with 'url', 'type', and 'title' keys
         """
-        feeds = []
-
         try:
-            response = self.session.get(url, timeout=Config.DEFAULT_TIMEOUT)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            feed_link_types = [
-                'application/rss+xml',
-                'application/atom+xml',
-                'application/xml'
-            ]
-
-            for link in soup.find_all('link', type=feed_link_types):
-                href = link.get('href')
-                title = link.get('title', 'Untitled Feed')
-                feed_type = link.get('type', 'unknown')
-
-                if href:
-                    feed_url = urljoin(url, href)
-                    feeds.append({
-                        'url': feed_url,
-                        'type': feed_type,
-                        'title': title
-                    })
-
+            return list(self._get_page_feeds(url))
         except Exception as e:
             self.logger.warning(f"Error getting all feeds: {e}")
-
-        return feeds
+            return []
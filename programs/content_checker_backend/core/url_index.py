@@ -0,0 +1,114 @@
+"""
+Existing URL Index
+
+Answers "which of these candidate URLs are already in content_queue?" without
+loading a user's whole history. Candidates are looked up with `in_` queries
+(one per chunk), and URLs known to exist are remembered in a process-wide
+TTL cache so repeat polls of the same feeds rarely reach the database.
+
+Only positive answers are cached: a URL that isn't in the queue yet may be
+added by the very next check. The TTL bounds how long a URL deleted from the
+queue is still treated as known.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from supabase import Client
+
+from core.config import Config
+
+# URLs per `in_` lookup (keeps the request URL short)
+LOOKUP_CHUNK_SIZE = 100
+
+_known_urls: "OrderedDict[Tuple, float]" = OrderedDict()  # (scope, url) -> expiry
+_known_urls_lock = threading.Lock()
+
+
+class ExistingUrlIndex:
+    """
+    Dedup index over content_queue for one scope (e.g. a user's RSS posts)
+
+    Usage:
+        index = ExistingUrlIndex(supabase, {'user_id': user_id, 'source': 'rss_feed'})
+        existing = index.find_existing(candidate_urls)
+        ... after saving new rows:
+        index.add(saved_urls)
+    """
+
+    def __init__(
+        self,
+        supabase: Client,
+        filters: Dict[str, str],
+        ttl_seconds: Optional[int] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            supabase: Supabase client
+            filters: content_queue column equality filters defining the scope
+            ttl_seconds: How long known URLs are cached (default: Config.EXISTING_URL_CACHE_TTL_SECONDS)
+            logger: Logger instance
+        """
+        self.supabase = supabase
+        self.filters = filters
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else Config.EXISTING_URL_CACHE_TTL_SECONDS
+        self.logger = logger or logging.getLogger(__name__)
+        self._scope = tuple(sorted(filters.items()))
+
+    def find_existing(self, urls: Iterable[str]) -> Set[str]:
+        """
+        Return the subset of urls already in content_queue for this scope
+
+        A failed lookup is logged and its URLs treated as new; the upsert on
+        url makes a duplicate save harmless.
+        """
+        candidates = list(dict.fromkeys(url for url in urls if url))
+        existing = {url for url in candidates if self._is_cached(url)}
+        unknown = [url for url in candidates if url not in existing]
+
+        found = set()
+        for start in range(0, len(unknown), LOOKUP_CHUNK_SIZE):
+            chunk = unknown[start:start + LOOKUP_CHUNK_SIZE]
+            try:
+                query = self.supabase.table('content_queue').select('url')
+                for column, value in self.filters.items():
+                    query = query.eq(column, value)
+                result = query.in_('url', chunk).execute()
+                found.update(row['url'] for row in result.data or [])
+            except Exception as e:
+                self.logger.error(f"Error looking up existing URLs: {e}")
+
+        self.add(found)
+        self.logger.info(
+            f"Existing URL check: {len(candidates)} candidates, {len(existing)} cached, "
+            f"{len(found)}/{len(unknown)} found in database"
+        )
+        return existing | found
+
+    def add(self, urls: Iterable[str]) -> None:
+        """Record URLs as existing (e.g. right after they were saved)"""
+        if self.ttl_seconds <= 0:
+            return
+        expiry = time.monotonic() + self.ttl_seconds
+        with _known_urls_lock:
+            for url in urls:
+                key = (self._scope, url)
+                _known_urls[key] = expiry
+                _known_urls.move_to_end(key)
+            while len(_known_urls) > Config.EXISTING_URL_CACHE_MAX_ENTRIES:
+                _known_urls.popitem(last=False)
+
+    def _is_cached(self, url: str) -> bool:
+        key = (self._scope, url)
+        with _known_urls_lock:
+            expiry = _known_urls.get(key)
+            if expiry is None:
+                return False
+            if expiry < time.monotonic():
+                del _known_urls[key]
+                return False
+            return True
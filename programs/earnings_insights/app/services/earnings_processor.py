@@ -9,14 +9,27 @@ Coordinates the complete earnings call processing pipeline:
 5. Claude analysis → insights
 6. Save to database
 
+Several calls can be processed at once with process_earnings_calls(): the
+calls share one processor, the external services are each limited to a few
+concurrent requests, and the time spent in each stage is collected in
+PipelineMetrics.
+
 Usage:
     from services.earnings_processor import process_earnings_call
     await process_earnings_call(earnings_call_id)
+
+    from services.earnings_processor import process_earnings_calls
+    summary = await process_earnings_calls([123, 124, 125], concurrency=4)
 """
 
+import asyncio
 import logging
 import os
-from typing import Dict, Optional
+import shutil
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
 from supabase import create_client, Client
 
 # Import from parent directories
@@ -27,12 +40,59 @@ sys.path.insert(0, str(earnings_insights_path))
 
 from shared import (
     TranscriptAligner,
-    format_aligned_transcript_for_claude
+    format_aligned_transcript_for_claude,
+    transcript_from_deepgram
 )
 from programs.earnings_insights.processors.earnings_analyzer import EarningsAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Calls in flight at once in process_earnings_calls()
+EARNINGS_BATCH_CONCURRENCY = int(os.getenv('EARNINGS_BATCH_CONCURRENCY', '4'))
+
+# Concurrent requests per external service (Deepgram alignment, Claude analysis)
+EARNINGS_ALIGN_CONCURRENCY = int(os.getenv('EARNINGS_ALIGN_CONCURRENCY', '3'))
+EARNINGS_ANALYZE_CONCURRENCY = int(os.getenv('EARNINGS_ANALYZE_CONCURRENCY', '3'))
+
+# Audio-only calls: chunk length for parallel Deepgram transcription, and overall deadline
+EARNINGS_AUDIO_CHUNK_SECONDS = int(os.getenv('EARNINGS_AUDIO_CHUNK_SECONDS', str(10 * 60)))
+EARNINGS_TRANSCRIBE_TIMEOUT_SECONDS = int(os.getenv('EARNINGS_TRANSCRIBE_TIMEOUT_SECONDS', str(20 * 60)))
+
+PIPELINE_STAGES = ('load', 'align', 'analyze', 'save')
+
+
+class PipelineMetrics:
+    """Time spent in each pipeline stage, across all calls processed"""
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = {stage: [] for stage in PIPELINE_STAGES}
+        self.failures: Dict[str, int] = {stage: 0 for stage in PIPELINE_STAGES}
+
+    def record(self, stage: str, seconds: float, failed: bool = False) -> None:
+        self.durations.setdefault(stage, []).append(seconds)
+        if failed:
+            self.failures[stage] = self.failures.get(stage, 0) + 1
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Per-stage totals
+
+        Returns:
+            {stage: {'count', 'failed', 'total_seconds', 'avg_seconds', 'max_seconds'}}
+        """
+        summary = {}
+        for stage, durations in self.durations.items():
+            if not durations:
+                continue
+            summary[stage] = {
+                'count': len(durations),
+                'failed': self.failures.get(stage, 0),
+                'total_seconds': round(sum(durations), 2),
+                'avg_seconds': round(sum(durations) / len(durations), 2),
+                'max_seconds': round(max(durations), 2)
+            }
+        return summary
+
 
 class EarningsProcessor:
     """Main orchestrator for earnings call processing"""
@@ -53,8 +113,13 @@ class EarningsProcessor:
         self.aligner = TranscriptAligner()
         self.analyzer = EarningsAnalyzer()
 
-        # Note: FileTranscriber not initialized - audio-only transcription not yet supported
-        # For now, we require transcript_text from scraper (SeekingAlpha provides this)
+        # Shared by every call this processor handles
+        self.metrics = PipelineMetrics()
+        self._align_slots = asyncio.Semaphore(EARNINGS_ALIGN_CONCURRENCY)
+        self._analyze_slots = asyncio.Semaphore(EARNINGS_ANALYZE_CONCURRENCY)
+
+        # Created on first audio-only call (most calls have a scraped transcript)
+        self._file_transcriber = None
 
     async def process_earnings_call(self, earnings_call_id: int):
         """
@@ -72,7 +137,8 @@ class EarningsProcessor:
 
         try:
             # 1. Load call from database
-            call = await self._load_call(earnings_call_id)
+            async with self._stage('load'):
+                call = await self._load_call(earnings_call_id)
             if not call:
                 return False
 
@@ -88,24 +154,27 @@ class EarningsProcessor:
             if not call.get('transcript_text'):
                 self.logger.warning("⚠️  No transcript text - will transcribe from audio")
 
-            # 3. Align transcript with audio (add timestamps)
-            transcript_for_claude = await self._prepare_transcript(call, earnings_call_id)
+            # 3. Align transcript with audio (add timestamps), or transcribe audio-only calls
+            async with self._stage('align', self._align_slots):
+                transcript_for_claude = await self._prepare_transcript(call, earnings_call_id)
 
             if not transcript_for_claude:
                 raise ValueError("Could not prepare transcript for analysis")
 
             # 4. Run Claude analysis
-            insights = await self.analyzer.analyze_earnings_call(
-                transcript_text=transcript_for_claude,
-                company_symbol=call['symbol'],
-                quarter=call['quarter']
-            )
+            async with self._stage('analyze', self._analyze_slots):
+                insights = await self.analyzer.analyze_earnings_call(
+                    transcript_text=transcript_for_claude,
+                    company_symbol=call['symbol'],
+                    quarter=call['quarter']
+                )
 
             # 5. Save insights to database
-            await self._save_insights(earnings_call_id, call, insights)
+            async with self._stage('save'):
+                await self._save_insights(earnings_call_id, call, insights)
 
-            # 6. Update status to 'completed'
-            await self._update_call_status(earnings_call_id, 'completed')
+                # 6. Update status to 'completed'
+                await self._update_call_status(earnings_call_id, 'completed')
 
             self.logger.info(f"\n✅ Successfully processed {call['symbol']} {call['quarter']}\n")
             return True
@@ -122,13 +191,89 @@ class EarningsProcessor:
 
             return False
 
+    async def process_earnings_calls(
+        self,
+        earnings_call_ids: List[int],
+        concurrency: Optional[int] = None
+    ) -> Dict:
+        """
+        Process several earnings calls concurrently
+
+        Args:
+            earnings_call_ids: IDs of earnings_calls records
+            concurrency: Calls in flight at once (default: EARNINGS_BATCH_CONCURRENCY)
+
+        Returns:
+            Dict with processed/succeeded/failed counts, elapsed_seconds,
+            failed_ids and per-stage metrics
+        """
+        slots = asyncio.Semaphore(max(1, concurrency or EARNINGS_BATCH_CONCURRENCY))
+
+        async def run(earnings_call_id: int) -> bool:
+            async with slots:
+                return await self.process_earnings_call(earnings_call_id)
+
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(run(call_id) for call_id in earnings_call_ids),
+            return_exceptions=True
+        )
+        elapsed = time.monotonic() - started
+
+        failed_ids = [call_id for call_id, result in zip(earnings_call_ids, results) if result is not True]
+        for call_id, result in zip(earnings_call_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ Unexpected error processing call {call_id}: {result}")
+
+        summary = {
+            'processed': len(earnings_call_ids),
+            'succeeded': len(earnings_call_ids) - len(failed_ids),
+            'failed': len(failed_ids),
+            'failed_ids': failed_ids,
+            'elapsed_seconds': round(elapsed, 2),
+            'stages': self.metrics.summary()
+        }
+        self._log_metrics(summary)
+        return summary
+
+    @asynccontextmanager
+    async def _stage(self, stage: str, slots: Optional[asyncio.Semaphore] = None):
+        """Time a pipeline stage, waiting for a slot first if the stage is rate-limited"""
+        if slots is not None:
+            await slots.acquire()
+        started = time.monotonic()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.metrics.record(stage, time.monotonic() - started, failed)
+            if slots is not None:
+                slots.release()
+
+    def _log_metrics(self, summary: Dict):
+        self.logger.info(
+            f"📊 [PIPELINE] {summary['succeeded']}/{summary['processed']} calls succeeded "
+            f"in {summary['elapsed_seconds']:.1f}s"
+        )
+        for stage, stats in summary['stages'].items():
+            self.logger.info(
+                f"   {stage:<8} {stats['count']:>3} runs, avg {stats['avg_seconds']:.1f}s, "
+                f"max {stats['max_seconds']:.1f}s, total {stats['total_seconds']:.1f}s"
+                + (f", {stats['failed']} failed" if stats['failed'] else "")
+            )
+
     async def _load_call(self, earnings_call_id: int) -> Optional[Dict]:
         """Load earnings call from database"""
         try:
-            result = self.supabase.table('earnings_calls')\
-                .select('*')\
-                .eq('id', earnings_call_id)\
-                .execute()
+            result = await asyncio.to_thread(
+                self.supabase.table('earnings_calls')
+                .select('*')
+                .eq('id', earnings_call_id)
+                .execute
+            )
 
             if not result.data:
                 self.logger.error(f"❌ Earnings call {earnings_call_id} not found")
@@ -173,10 +318,12 @@ class EarningsProcessor:
                     transcript_text
                 )
 
-                # Save aligned version to database (Supabase is sync, not async)
-                self.supabase.table('earnings_calls').update({
-                    'transcript_json': aligned_data
-                }).eq('id', earnings_call_id).execute()
+                # Save aligned version to database (Supabase is sync - run off the event loop)
+                await asyncio.to_thread(
+                    self.supabase.table('earnings_calls').update({
+                        'transcript_json': aligned_data
+                    }).eq('id', earnings_call_id).execute
+                )
 
                 self.logger.info("   ✅ Saved aligned transcript to database")
 
@@ -191,10 +338,31 @@ class EarningsProcessor:
 
         # Scenario 2: Audio only - TRANSCRIBE
         elif audio_url and not transcript_text:
-            self.logger.error("❌ Audio-only transcription not yet supported")
-            self.logger.error("   SeekingAlpha scraper should provide transcript_text")
-            self.logger.error("   If you need this feature, FileTranscriber needs audio URL support")
-            return None
+            self.logger.info("🎤 Audio only - transcribing with Deepgram")
+
+            try:
+                transcribed_data = await self._transcribe_audio(audio_url)
+            except Exception as e:
+                self.logger.error(f"   ❌ Transcription failed: {e}")
+                return None
+
+            segments = transcribed_data['aligned_transcript']
+            if not segments:
+                self.logger.error("   ❌ Transcription returned no segments")
+                return None
+
+            # Save transcribed version to database (Supabase is sync - run off the event loop)
+            await asyncio.to_thread(
+                self.supabase.table('earnings_calls').update({
+                    'transcript_json': transcribed_data,
+                    'transcript_source': 'deepgram',
+                    'audio_duration_seconds': int(segments[-1]['end'])
+                }).eq('id', earnings_call_id).execute
+            )
+
+            self.logger.info("   ✅ Saved transcribed transcript to database")
+
+            return format_aligned_transcript_for_claude(transcribed_data)
 
         # Scenario 3: Transcript only - NO TIMESTAMPS
         elif transcript_text and not audio_url:
@@ -207,6 +375,51 @@ class EarningsProcessor:
             self.logger.error("❌ No audio or transcript available - cannot process")
             return None
 
+    async def _transcribe_audio(self, audio_url: str) -> Dict:
+        """
+        Transcribe call audio in parallel chunks with word timestamps
+
+        ffmpeg reads the audio URL directly and writes fixed-length chunks;
+        each chunk goes to Deepgram as soon as it's written (bounded by
+        DEEPGRAM_CHUNK_CONCURRENCY, failed chunks retried individually).
+        EARNINGS_TRANSCRIBE_TIMEOUT_SECONDS bounds the whole run, including
+        ffmpeg reading a slow or stalled URL; DeepGram requests already in
+        flight at the deadline finish before the chunk directory is removed.
+
+        Args:
+            audio_url: URL of the call audio
+
+        Returns:
+            Same shape as TranscriptAligner.align_transcript() (speaker labels
+            are generic - the audio isn't diarized)
+        """
+        # Imported here so transcript-only processing doesn't need the Deepgram SDK
+        from programs.article_summarizer_backend.processors.audio_splitter import iter_audio_chunks
+        from programs.article_summarizer_backend.processors.chunked_transcriber import ChunkedTranscriber
+        from programs.article_summarizer_backend.processors.file_transcriber import FileTranscriber
+
+        if self._file_transcriber is None:
+            self._file_transcriber = FileTranscriber()
+
+        chunk_dir = tempfile.mkdtemp(prefix='earnings_audio_')
+        try:
+            merged = await ChunkedTranscriber(self._file_transcriber).transcribe_chunks(
+                iter_audio_chunks(audio_url, chunk_dir, EARNINGS_AUDIO_CHUNK_SECONDS),
+                timeout_seconds=EARNINGS_TRANSCRIBE_TIMEOUT_SECONDS
+            )
+        finally:
+            await asyncio.to_thread(shutil.rmtree, chunk_dir, True)
+
+        if merged['failed_chunks']:
+            self.logger.warning(
+                f"   ⚠️ Partial transcript: {merged['chunks_completed']}/{merged['total_chunks']} chunks "
+                f"(failed: {merged['failed_chunks']})"
+            )
+
+        transcribed = transcript_from_deepgram(merged)
+        self.logger.info(f"   ✅ Transcribed {len(transcribed['aligned_transcript'])} segments from audio")
+        return transcribed
+
     async def _save_insights(
         self,
         earnings_call_id: int,
@@ -226,38 +439,41 @@ class EarningsProcessor:
             insights: Insights dict from analyzer
         """
         try:
-            # 1. Update earnings_calls.summary_json
-            self.supabase.table('earnings_calls').update({
-                'summary_json': insights
-            }).eq('id', earnings_call_id).execute()
-
-            self.logger.info("   ✅ Saved summary_json to earnings_calls")
-
-            # 2. Upsert into earnings_insights table (delete old if exists, then insert)
-            # First, delete any existing insights for this earnings_call_id
-            self.supabase.table('earnings_insights').delete().eq('earnings_call_id', earnings_call_id).execute()
-
-            insights_record = {
-                'earnings_call_id': earnings_call_id,
-                'company_id': call['company_id'],
-                'symbol': call['symbol'],
-                'quarter': call['quarter'],
-                'key_metrics': insights.get('key_metrics', {}),
-                'business_highlights': insights.get('business_highlights', []),
-                'guidance': insights.get('guidance', {}),
-                'risks_concerns': insights.get('risks_concerns', []),
-                'positives': insights.get('positives', []),
-                'notable_quotes': insights.get('notable_quotes', [])
-            }
-
-            self.supabase.table('earnings_insights').insert(insights_record).execute()
-
-            self.logger.info("   ✅ Saved structured insights to earnings_insights")
-
+            await asyncio.to_thread(self._write_insights, earnings_call_id, call, insights)
         except Exception as e:
             self.logger.error(f"   ❌ Error saving insights: {e}")
             raise
 
+    def _write_insights(self, earnings_call_id: int, call: Dict, insights: Dict):
+        """Blocking Supabase writes for _save_insights (runs in a worker thread)"""
+        # 1. Update earnings_calls.summary_json
+        self.supabase.table('earnings_calls').update({
+            'summary_json': insights
+        }).eq('id', earnings_call_id).execute()
+
+        self.logger.info("   ✅ Saved summary_json to earnings_calls")
+
+        # 2. Upsert into earnings_insights table (delete old if exists, then insert)
+        # First, delete any existing insights for this earnings_call_id
+        self.supabase.table('earnings_insights').delete().eq('earnings_call_id', earnings_call_id).execute()
+
+        insights_record = {
+            'earnings_call_id': earnings_call_id,
+            'company_id': call['company_id'],
+            'symbol': call['symbol'],
+            'quarter': call['quarter'],
+            'key_metrics': insights.get('key_metrics', {}),
+            'business_highlights': insights.get('business_highlights', []),
+            'guidance': insights.get('guidance', {}),
+            'risks_concerns': insights.get('risks_concerns', []),
+            'positives': insights.get('positives', []),
+            'notable_quotes': insights.get('notable_quotes', [])
+        }
+
+        self.supabase.table('earnings_insights').insert(insights_record).execute()
+
+        self.logger.info("   ✅ Saved structured insights to earnings_insights")
+
     async def _update_call_status(
         self,
         earnings_call_id: int,
@@ -271,9 +487,11 @@ class EarningsProcessor:
             if error_message:
                 update_data['error_message'] = error_message
 
-            self.supabase.table('earnings_calls').update(update_data)\
-                .eq('id', earnings_call_id)\
-                .execute()
+            await asyncio.to_thread(
+                self.supabase.table('earnings_calls').update(update_data)
+                .eq('id', earnings_call_id)
+                .execute
+            )
 
         except Exception as e:
             self.logger.warning(f"Could not update status: {e}")
@@ -299,3 +517,22 @@ async def process_earnings_call(earnings_call_id: int):
     """
     processor = EarningsProcessor()
     return await processor.process_earnings_call(earnings_call_id)
+
+
+async def process_earnings_calls(earnings_call_ids: List[int], concurrency: Optional[int] = None) -> Dict:
+    """
+    Convenience function to process several earnings calls concurrently
+
+    Usage:
+        from services.earnings_processor import process_earnings_calls
+        summary = await process_earnings_calls([123, 124], concurrency=4)
+
+    Args:
+        earnings_call_ids: IDs of earnings_calls records
+        concurrency: Calls in flight at once (default: EARNINGS_BATCH_CONCURRENCY)
+
+    Returns:
+        Batch summary (see EarningsProcessor.process_earnings_calls)
+    """
+    processor = EarningsProcessor()
+    return await processor.process_earnings_calls(earnings_call_ids, concurrency)
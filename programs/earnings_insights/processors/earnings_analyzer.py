@@ -84,9 +84,9 @@ class EarningsAnalyzer:
             # Format prompt
             prompt = format_earnings_prompt(transcript_text)
 
-            # Send to Claude (call_api is synchronous, not async)
+            # Await the async client so other calls keep running during generation
             self.logger.info("   Sending to Claude API...")
-            response = self.claude.call_api(prompt)
+            response = await self.claude.acall_api(prompt)
 
             self.logger.info(f"   ✅ Received response: {len(response)} chars")
 
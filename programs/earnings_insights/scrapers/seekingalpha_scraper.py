@@ -3,17 +3,38 @@ Seeking Alpha Scraper for Earnings Calls
 
 Scrapes earnings call transcripts, audio files, and presentation PDFs from Seeking Alpha.
 
+For several symbols, open a browser session once: the authenticated context
+is created and warmed up a single time, symbols are scraped in parallel tabs
+(SEEKING_ALPHA_TABS), and page loads across all tabs are spaced out by
+SEEKING_ALPHA_MIN_REQUEST_INTERVAL seconds. Pages are considered ready when
+the element we need appears, not after a fixed sleep.
+
+Transcript pages are read from the article JSON the page itself fetches from
+Seeking Alpha's API, captured with Playwright response interception (as
+PlaywrightAuthenticator.login detects a successful login): transcript, title,
+publish date and slide links come from one response instead of one browser
+round-trip per element. If the response doesn't arrive, the rendered page is
+read instead; SEEKING_ALPHA_EXTRACTION=dom always reads the rendered page.
+
 Usage:
     scraper = SeekingAlphaScraper()
     calls = await scraper.get_latest_earnings_calls("AAPL", num_quarters=4)
+
+    async with scraper.browser_session():
+        results = await asyncio.gather(
+            *(scraper.get_latest_earnings_calls(symbol, 4) for symbol in symbols)
+        )
 """
 
 import logging
 import re
 import asyncio
 import os
+import time
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional
 from datetime import datetime
+from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import requests
 from pathlib import Path
@@ -26,6 +47,160 @@ from shared import AuthenticationManager
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = "https://seekingalpha.com"
+
+# Symbols scraped at once (one tab each) within a browser session
+SEEKING_ALPHA_TABS = int(os.getenv('SEEKING_ALPHA_TABS', '3'))
+
+# Minimum seconds between page loads across all tabs
+SEEKING_ALPHA_MIN_REQUEST_INTERVAL = float(os.getenv('SEEKING_ALPHA_MIN_REQUEST_INTERVAL', '2'))
+
+# Longest wait for a page's content to appear (includes bot checks resolving themselves)
+SEEKING_ALPHA_PAGE_TIMEOUT_MS = int(os.getenv('SEEKING_ALPHA_PAGE_TIMEOUT_MS', '45000'))
+
+# Best-effort wait for the homepage to settle when warming up a session
+WARM_UP_IDLE_TIMEOUT_MS = 10000
+
+# How transcript pages are read: 'api' (article JSON, rendered page as fallback) or 'dom'
+SEEKING_ALPHA_EXTRACTION = os.getenv('SEEKING_ALPHA_EXTRACTION', 'api').lower()
+
+# Longest wait for the article JSON before falling back to the rendered page
+SEEKING_ALPHA_API_WAIT_MS = int(os.getenv('SEEKING_ALPHA_API_WAIT_MS', '10000'))
+
+# Article endpoint the transcript page fetches (not its /comments etc. sub-resources)
+ARTICLE_API_PATH = re.compile(r'^/api/v3/articles/(\d+)/?$')
+
+# Link text identifying an earnings presentation
+PRESENTATION_KEYWORDS = ['presentation', 'slides', 'deck', 'earnings']
+
+ARTICLE_CONTENT_SELECTORS = [
+    'div[data-test-id="content-container"]',
+    'article',
+    '.article-content',
+    '#article-content'
+]
+
+# Scrolls towards the (lazy-loaded) Earnings History table until a Transcript link shows up
+TRANSCRIPT_LINKS_READY_JS = """
+() => {
+    window.scrollTo(0, document.body.scrollHeight / 2);
+    return Array.from(document.querySelectorAll('a, button'))
+        .some(el => /transcript/i.test(el.textContent));
+}
+"""
+
+# Visible Transcript links/buttons in Earnings History (whole page as fallback),
+# with the period label of their row. Each one is tagged with its index so a
+# button can be clicked later.
+COLLECT_TRANSCRIPT_LINKS_JS = """
+() => {
+    const heading = Array.from(document.querySelectorAll('h2, h3'))
+        .find(el => el.textContent.includes('Earnings History'));
+    const section = (heading && (heading.closest('section') || heading.parentElement.parentElement))
+        || document.querySelector('[class*="earnings-history"], [id*="earnings-history"]')
+        || document;
+
+    const links = [];
+    const seen = new Set();
+    for (const el of section.querySelectorAll('a, button')) {
+        if (!/transcript/i.test(el.textContent)) continue;
+        if (el.getClientRects().length === 0) continue;
+
+        // Buttons navigate when clicked; links must point at an article
+        const href = el.getAttribute('href');
+        if (href && (!href.includes('/article/') || seen.has(href))) continue;
+        if (href) seen.add(href);
+
+        const row = el.closest('tr') || el.closest("[class*='period']") || el.parentElement;
+        const cell = row && row.querySelector('td:first-child, [class*="period"]');
+
+        el.setAttribute('data-sa-transcript', String(links.length));
+        links.push({href: href, period: cell ? cell.innerText.trim() : ''});
+    }
+    return links;
+}
+"""
+
+
+class RequestRateLimiter:
+    """Spaces out page loads shared by several tabs"""
+
+    def __init__(self, min_interval: float):
+        """
+        Args:
+            min_interval: Minimum seconds between consecutive requests
+        """
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self):
+        """Wait until the next request is allowed"""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+            self._next_at = max(now, self._next_at) + self.min_interval
+
+
+class ArticleResponseCapture:
+    """
+    Captures the article JSON a transcript page fetches from Seeking Alpha's API
+
+    Usage:
+        capture = ArticleResponseCapture(page, article_id)
+        await page.goto(article_url)
+        article = await capture.wait(timeout_ms)  # JSON:API 'data' object, or None
+    """
+
+    def __init__(self, page, article_id: Optional[str] = None):
+        """
+        Args:
+            page: Playwright page about to navigate to the article
+            article_id: Expected article ID (None accepts any article with content)
+        """
+        self.page = page
+        self.article_id = article_id
+        self._article = asyncio.get_running_loop().create_future()
+        self._listening = True
+        page.on("response", self._on_response)
+
+    async def _on_response(self, response):
+        if self._article.done():
+            return
+
+        match = ARTICLE_API_PATH.match(urlparse(response.url).path)
+        if not match or response.status != 200:
+            return
+        if self.article_id and match.group(1) != self.article_id:
+            return
+
+        try:
+            data = await response.json()
+        except Exception as e:
+            logger.debug(f"Error parsing article response: {e}")
+            return
+
+        article = data.get('data') if isinstance(data, dict) else None
+        if isinstance(article, dict) and (article.get('attributes') or {}).get('content'):
+            if not self._article.done():
+                self._article.set_result(article)
+
+    async def wait(self, timeout_ms: int) -> Optional[Dict]:
+        """Wait for the article JSON (None if it didn't arrive in time)"""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._article), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop listening (safe to call more than once)"""
+        if self._listening:
+            self._listening = False
+            self.page.remove_listener("response", self._on_response)
+
 
 class SeekingAlphaScraper:
     """
@@ -37,6 +212,7 @@ class SeekingAlphaScraper:
     - Get transcript, audio URL, and presentation links
     - Parse quarter/fiscal year from article titles
     - Uses authenticated session from Supabase for access
+    - Reuses one warmed-up browser context across symbols (browser_session)
     """
 
     def __init__(self):
@@ -60,51 +236,48 @@ class SeekingAlphaScraper:
         # Note: _load_storage_state_cookies() is called automatically by AuthenticationManager.__init__()
         # It injects cookies from storage_state into self.session for API calls
 
-    async def get_latest_earnings_calls(
-        self,
-        symbol: str,
-        num_quarters: int = 1
-    ) -> List[Dict]:
+        # Open browser session (see browser_session)
+        self._context = None
+        self._tabs: Optional[asyncio.Semaphore] = None
+        self._rate_limiter: Optional[RequestRateLimiter] = None
+
+    @asynccontextmanager
+    async def browser_session(self, tabs: Optional[int] = None):
         """
-        Get latest N quarters of earnings calls for a symbol
+        Keep one authenticated, warmed-up browser context open
 
-        Args:
-            symbol: Stock ticker (e.g., "AAPL")
-            num_quarters: Number of quarters to fetch (default 1, max 4)
+        get_latest_earnings_calls() calls made inside the session share the
+        context, each in its own tab (at most `tabs` at once).
 
-        Returns:
-            List of earnings call dicts with transcript, audio_url, etc.
+        Args:
+            tabs: Symbols scraped at once (default: SEEKING_ALPHA_TABS)
         """
-        # Cap at 4 quarters maximum
-        if num_quarters > 4:
-            self.logger.warning(f"⚠️ Requested {num_quarters} quarters, capping at 4")
-            num_quarters = 4
-
-        self.logger.info(f"🔍 [SEEKING ALPHA] Fetching {num_quarters} earnings call{'s' if num_quarters > 1 else ''} for {symbol}")
+        if self._context is not None:
+            # Already inside a session - reuse it
+            yield self
+            return
 
         # Import Playwright here to avoid import errors if not installed
         try:
             from playwright.async_api import async_playwright
         except ImportError:
             self.logger.error("❌ Playwright not installed. Install: pip install playwright && playwright install chromium")
-            return []
-
-        earnings_calls = []
-
-        try:
-            async with async_playwright() as p:
-                # Launch browser with stealth settings to avoid bot detection
-                # Use headless=False for debugging, change to True for production
-                headless = os.getenv('PLAYWRIGHT_HEADLESS', 'true').lower() == 'true'
-                browser = await p.chromium.launch(
-                    headless=headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',  # Hide webdriver flag
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox',
-                    ]
-                )
+            raise
+
+        async with async_playwright() as p:
+            # Launch browser with stealth settings to avoid bot detection
+            # Set PLAYWRIGHT_HEADLESS=false for debugging
+            headless = os.getenv('PLAYWRIGHT_HEADLESS', 'true').lower() == 'true'
+            browser = await p.chromium.launch(
+                headless=headless,
+                args=[
+                    '--disable-blink-features=AutomationControlled',  # Hide webdriver flag
+                    '--disable-dev-shm-usage',
+                    '--no-sandbox',
+                ]
+            )
 
+            try:
                 # Create context with storage state (authentication) and stealth settings
                 context_options = {
                     'viewport': {'width': 1920, 'height': 1080},
@@ -121,211 +294,171 @@ class SeekingAlphaScraper:
 
                 context = await browser.new_context(**context_options)
 
-                # Add stealth scripts to hide automation
-                page = await context.new_page()
-
-                # Override navigator.webdriver
-                await page.add_init_script("""
+                # Override navigator.webdriver in every tab
+                await context.add_init_script("""
                     Object.defineProperty(navigator, 'webdriver', {
                         get: () => undefined
                     });
                 """)
 
-                # First navigate to homepage to establish session
-                self.logger.info("   🏠 Loading homepage first to establish session...")
-                await page.goto("https://seekingalpha.com/", wait_until='networkidle')
-                await asyncio.sleep(3)
+                self._rate_limiter = RequestRateLimiter(SEEKING_ALPHA_MIN_REQUEST_INTERVAL)
+                self._tabs = asyncio.Semaphore(max(1, tabs or SEEKING_ALPHA_TABS))
+                await self._warm_up(context)
+                self._context = context
 
-                # Add some human-like mouse movement
-                await page.mouse.move(100, 200)
-                await asyncio.sleep(0.5)
-                await page.mouse.move(300, 400)
+                yield self
 
-                # Navigate to symbol earnings page
-                earnings_url = f"https://seekingalpha.com/symbol/{symbol}/earnings"
-                self.logger.info(f"   📄 Navigating to: {earnings_url}")
-                await page.goto(earnings_url, wait_until='networkidle')
+            finally:
+                self._context = None
+                self._tabs = None
+                self._rate_limiter = None
+                await browser.close()
 
-                # Wait for CAPTCHA/bot detection to complete
-                # Give it plenty of time - Sometimes the CAPTCHA solves itself
-                self.logger.info("   ⏳ Waiting 15 seconds for page to fully load and CAPTCHA to resolve...")
-                self.logger.warning("   ⚠️  DO NOT CLOSE THE BROWSER WINDOW - let it load completely")
-                await asyncio.sleep(15)
+    async def get_latest_earnings_calls(
+        self,
+        symbol: str,
+        num_quarters: int = 1
+    ) -> List[Dict]:
+        """
+        Get latest N quarters of earnings calls for a symbol
 
-                # Check if page is still valid
-                try:
-                    if page.is_closed():
-                        self.logger.error("   ❌ Browser window was closed!")
-                        await context.close()
-                        await browser.close()
-                        return earnings_calls
-                except:
-                    pass
-
-                # Scroll down to see the earnings history section
-                await page.evaluate('window.scrollTo(0, document.body.scrollHeight / 2)')
-                await asyncio.sleep(3)
-
-                # Find the Earnings History section specifically
-                self.logger.info("   🔍 Locating Earnings History section...")
-
-                # Look for the earnings history heading or section
-                earnings_history_section = None
-                possible_selectors = [
-                    'h2:has-text("Earnings History")',
-                    'h3:has-text("Earnings History")',
-                    '[class*="earnings-history"]',
-                    '[id*="earnings-history"]',
-                ]
+        Uses the open browser session if there is one, otherwise opens one
+        just for this symbol.
 
-                for selector in possible_selectors:
-                    try:
-                        heading = await page.query_selector(selector)
-                        if heading:
-                            # Get the parent container that holds the table
-                            earnings_history_section = await heading.evaluate_handle(
-                                'el => el.closest("section") || el.parentElement.parentElement'
-                            )
-                            self.logger.info(f"      ✅ Found Earnings History section using selector: {selector}")
-                            break
-                    except:
-                        pass
-
-                # If we can't find the section, use the whole page as fallback
-                if not earnings_history_section:
-                    self.logger.warning("      ⚠️ Could not locate Earnings History section, searching whole page")
-                    earnings_history_section = page
-
-                # Look for transcript buttons/links within the Earnings History section only
-                self.logger.info("   🔍 Searching for Transcript buttons in Earnings History...")
-
-                # Find all "Transcript" buttons/links within the section
-                if hasattr(earnings_history_section, 'query_selector_all'):
-                    all_transcript_elements = await earnings_history_section.query_selector_all(
-                        'button:has-text("Transcript"), a:has-text("Transcript")'
-                    )
-                else:
-                    all_transcript_elements = await page.query_selector_all(
-                        'button:has-text("Transcript"), a:has-text("Transcript")'
-                    )
+        Args:
+            symbol: Stock ticker (e.g., "AAPL")
+            num_quarters: Number of quarters to fetch (default 1, max 4)
 
-                # Filter to only article links/buttons (not listing pages)
-                visible_transcripts = []
-                seen_hrefs = set()
+        Returns:
+            List of earnings call dicts with transcript, audio_url, etc.
+        """
+        # Cap at 4 quarters maximum
+        if num_quarters > 4:
+            self.logger.warning(f"⚠️ Requested {num_quarters} quarters, capping at 4")
+            num_quarters = 4
 
-                for element in all_transcript_elements:
-                    try:
-                        is_visible = await element.is_visible()
-                        if not is_visible:
-                            continue
+        if self._context is not None:
+            return await self._scrape_symbol(symbol, num_quarters)
 
-                        # Get href (for links) or data attribute (for buttons)
-                        href = await element.get_attribute('href')
+        try:
+            async with self.browser_session():
+                return await self._scrape_symbol(symbol, num_quarters)
+        except ImportError:
+            return []
+        except Exception as e:
+            self.logger.error(f"❌ [SEEKING ALPHA] Error: {e}")
+            return []
 
-                        # If it's a button, we'll click it later and it will navigate
-                        # For now, just collect all visible transcript elements
-                        if not href:
-                            # It's a button - store it directly
-                            visible_transcripts.append(element)
-                            self.logger.info(f"      Found transcript button (will click to navigate)")
-                            continue
+    async def _warm_up(self, context):
+        """Load the homepage once to establish the session"""
+        self.logger.info("   🏠 Loading homepage first to establish session...")
+        page = await context.new_page()
+        try:
+            await self._goto(page, BASE_URL)
+            try:
+                await page.wait_for_load_state('networkidle', timeout=WARM_UP_IDLE_TIMEOUT_MS)
+            except Exception:
+                pass  # Ads/trackers can keep the network busy - the page itself is loaded
+
+            # Add some human-like mouse movement
+            await page.mouse.move(100, 200)
+            await page.mouse.move(300, 400)
+        finally:
+            await page.close()
+
+    async def _goto(self, page, url: str):
+        """Navigate once the rate limiter allows it"""
+        await self._rate_limiter.wait()
+        await page.goto(url, wait_until='domcontentloaded', timeout=SEEKING_ALPHA_PAGE_TIMEOUT_MS)
+
+    async def _open_earnings_page(self, page, earnings_url: str) -> List[Dict]:
+        """
+        Load a symbol's earnings page and list its transcript links
 
-                        # Must be an article link (not a listing page)
-                        if '/article/' not in href:
-                            continue
+        Returns:
+            [{'href': str or None (button), 'period': str}, ...] in page order
+        """
+        await self._goto(page, earnings_url)
 
-                        # Deduplicate
-                        if href in seen_hrefs:
-                            continue
+        # Wait for the Earnings History table (and any CAPTCHA in front of it)
+        await page.wait_for_function(
+            TRANSCRIPT_LINKS_READY_JS,
+            polling=500,
+            timeout=SEEKING_ALPHA_PAGE_TIMEOUT_MS
+        )
+        return await page.evaluate(COLLECT_TRANSCRIPT_LINKS_JS)
 
-                        seen_hrefs.add(href)
-                        visible_transcripts.append(element)
-                        self.logger.info(f"      Found transcript link: {href}")
+    async def _scrape_symbol(self, symbol: str, num_quarters: int) -> List[Dict]:
+        """Scrape a symbol's latest earnings calls in a tab of the open session"""
+        earnings_calls = []
 
-                    except Exception as e:
-                        self.logger.debug(f"      Error checking element: {e}")
-                        pass
+        async with self._tabs:
+            self.logger.info(f"🔍 [SEEKING ALPHA] Fetching {num_quarters} earnings call{'s' if num_quarters > 1 else ''} for {symbol}")
+            page = await self._context.new_page()
+
+            try:
+                earnings_url = f"{BASE_URL}/symbol/{symbol}/earnings"
+                self.logger.info(f"   📄 Navigating to: {earnings_url}")
 
-                self.logger.info(f"   ✅ Found {len(visible_transcripts)} transcript elements in Earnings History")
+                try:
+                    links = await self._open_earnings_page(page, earnings_url)
+                except Exception as e:
+                    self.logger.warning(f"   ⚠️ {symbol}: earnings page did not show any transcripts ({e})")
+                    return earnings_calls
+
+                self.logger.info(f"   ✅ {symbol}: found {len(links)} transcript links in Earnings History")
 
-                if len(visible_transcripts) == 0:
+                if not links:
                     self.logger.warning(f"   ⚠️ No visible transcript links found for {symbol}")
-                    await context.close()
-                    await browser.close()
                     return earnings_calls
 
-                # Process each transcript (up to num_quarters)
-                # Use the already-found transcript links - no need to re-query on first iteration
-                for i in range(min(num_quarters, len(visible_transcripts))):
+                on_earnings_page = True
+                for index, link in enumerate(links):
+                    # Stop if we have enough
+                    if len(earnings_calls) >= num_quarters:
+                        break
+
+                    capture = None
                     try:
-                        # Only re-query if we're going back to the earnings page (i > 0)
-                        if i > 0:
-                            await page.evaluate('window.scrollTo(0, document.body.scrollHeight / 2)')
-                            await asyncio.sleep(1)
-
-                            # Re-find transcript buttons/links with same filtering logic
-                            all_elements = await page.query_selector_all('button:has-text("Transcript"), a:has-text("Transcript")')
-                            visible_transcripts = []
-                            for elem in all_elements:
-                                try:
-                                    if not await elem.is_visible():
-                                        continue
-                                    href = await elem.get_attribute('href')
-                                    # Accept buttons (no href) or article links
-                                    if not href or '/article/' in href:
-                                        visible_transcripts.append(elem)
-                                except:
-                                    pass
-
-                        if i >= len(visible_transcripts):
-                            break
-
-                        element = visible_transcripts[i]
-
-                        # Check if it's a button or link
-                        href = await element.get_attribute('href')
-
-                        if href:
+                        if link['href']:
                             # It's a link - navigate directly
-                            if href.startswith('/'):
-                                transcript_url = f"https://seekingalpha.com{href}"
-                            else:
-                                transcript_url = href
+                            transcript_url = urljoin(BASE_URL, link['href'])
+                            if SEEKING_ALPHA_EXTRACTION == 'api':
+                                capture = ArticleResponseCapture(page, self._extract_article_id(transcript_url))
+                            await self._goto(page, transcript_url)
                         else:
-                            # It's a button - click it and wait for navigation
+                            # It's a button - click it on the earnings page and follow the navigation
+                            if not on_earnings_page:
+                                await self._open_earnings_page(page, earnings_url)
                             self.logger.info(f"   🖱️  Clicking Transcript button...")
-                            async with page.expect_navigation(wait_until='networkidle', timeout=30000):
-                                await element.click()
+                            if SEEKING_ALPHA_EXTRACTION == 'api':
+                                capture = ArticleResponseCapture(page)
+                            await self._rate_limiter.wait()
+                            async with page.expect_navigation(wait_until='domcontentloaded', timeout=SEEKING_ALPHA_PAGE_TIMEOUT_MS):
+                                await page.click(f'[data-sa-transcript="{index}"]')
                             transcript_url = page.url
 
-                        # Get period info from the table row
-                        # Look for the quarter text in the same row as the Transcript button/link
-                        parent_row = await element.evaluate_handle('''el => {
-                            let row = el.closest("tr");
-                            if (!row) row = el.closest("[class*='period']");
-                            if (!row) row = el.parentElement;
-                            return row;
-                        }''')
-
-                        # Try to extract quarter from the row's first cell or period label
-                        period_text = ""
-                        try:
-                            # Get first cell in row which usually has the period (Q4 2024, etc.)
-                            first_cell = await parent_row.query_selector('td:first-child, [class*="period"]')
-                            if first_cell:
-                                period_text = await first_cell.inner_text()
-                        except:
-                            pass
-
-                        self.logger.info(f"   📄 Transcript {i+1}: Period='{period_text}' URL={transcript_url}")
-
-                        # Navigate to transcript page
-                        await page.goto(transcript_url, wait_until='networkidle')
-                        await asyncio.sleep(2)  # Let transcript page load
-
-                        # Get current URL and title
+                        on_earnings_page = False
+                        period_text = link['period']
+                        self.logger.info(f"   📄 {symbol} transcript {index + 1}: Period='{period_text}' URL={transcript_url}")
+
+                        article = await capture.wait(SEEKING_ALPHA_API_WAIT_MS) if capture else None
                         article_url = page.url
-                        article_title = await page.title()
+
+                        if article:
+                            parsed_article = self._parse_article_json(article)
+                            article_title = parsed_article['title']
+                        else:
+                            if capture:
+                                self.logger.info("      ℹ️ No article JSON captured - reading the rendered page")
+                            parsed_article = None
+
+                            # Let the transcript render
+                            await page.wait_for_selector(
+                                ', '.join(ARTICLE_CONTENT_SELECTORS),
+                                timeout=SEEKING_ALPHA_PAGE_TIMEOUT_MS
+                            )
+                            article_title = await page.title()
 
                         self.logger.info(f"      Article title: {article_title}")
 
@@ -345,56 +478,50 @@ class SeekingAlphaScraper:
                             quarter_info = self._parse_quarter_from_title(article_url)
                         if not quarter_info:
                             self.logger.warning(f"      ⚠️ Could not parse quarter from title")
-                            await page.goto(earnings_url, wait_until='networkidle')
-                            await asyncio.sleep(2)
                             continue
 
-                        # Extract article ID for audio URL
-                        article_id = self._extract_article_id(article_url)
-
-                        # Extract call date from article
-                        article_date = await self._extract_call_date(page)
-
-                        # Get transcript and audio
-                        call_data = await self._extract_call_data_from_page(
-                            page,
-                            article_url,
-                            article_id,
-                            symbol,
-                            quarter_info,
-                            article_date
-                        )
+                        if parsed_article:
+                            # Everything came with the article JSON
+                            call_data = await self._extract_call_data_from_article(
+                                parsed_article,
+                                article_url,
+                                symbol,
+                                quarter_info
+                            )
+                        else:
+                            # Extract article ID for audio URL
+                            article_id = self._extract_article_id(article_url)
+
+                            # Extract call date from article
+                            article_date = await self._extract_call_date(page)
+
+                            # Get transcript and audio
+                            call_data = await self._extract_call_data_from_page(
+                                page,
+                                article_url,
+                                article_id,
+                                symbol,
+                                quarter_info,
+                                article_date
+                            )
 
                         if call_data:
                             earnings_calls.append(call_data)
                             self.logger.info(f"      ✅ Extracted: {symbol} {call_data['quarter']}")
 
-                        # Go back to earnings page for next transcript
-                        if i < len(transcript_buttons) - 1 and len(earnings_calls) < num_quarters:
-                            await page.goto(earnings_url, wait_until='networkidle')
-                            await asyncio.sleep(2)
-                            # Re-query transcript buttons as DOM may have changed
-                            transcript_buttons = await page.query_selector_all('button:has-text("Transcript"), a:has-text("Transcript")')
-
-                        # Stop if we have enough
-                        if len(earnings_calls) >= num_quarters:
-                            break
-
                     except Exception as e:
-                        self.logger.error(f"      ❌ Error processing transcript: {e}")
-                        # Try to go back to earnings page
-                        try:
-                            await page.goto(earnings_url, wait_until='networkidle')
-                            await asyncio.sleep(2)
-                        except:
-                            pass
+                        self.logger.error(f"      ❌ Error processing {symbol} transcript: {e}")
                         continue
 
-                await context.close()
-                await browser.close()
+                    finally:
+                        if capture:
+                            capture.close()
 
-        except Exception as e:
-            self.logger.error(f"❌ [SEEKING ALPHA] Error: {e}")
+            except Exception as e:
+                self.logger.error(f"❌ [SEEKING ALPHA] Error scraping {symbol}: {e}")
+
+            finally:
+                await page.close()
 
         self.logger.info(f"✅ [SEEKING ALPHA] Extracted {len(earnings_calls)} earnings calls for {symbol}")
         return earnings_calls
@@ -430,8 +557,8 @@ class SeekingAlphaScraper:
                 self.logger.warning(f"      ⚠️ Transcript too short or empty")
                 return None
 
-            # Check for audio
-            audio_url = self._check_audio_exists(article_id)
+            # Check for audio (blocking HEAD request - keep other tabs running)
+            audio_url = await asyncio.to_thread(self._check_audio_exists, article_id)
 
             # Look for presentation PDF
             presentation_url = await self._find_presentation_pdf(page)
@@ -440,25 +567,109 @@ class SeekingAlphaScraper:
             if not call_date:
                 call_date = await self._extract_call_date(page)
 
-            return {
-                "symbol": symbol,
-                "quarter": quarter_info['quarter'],
-                "fiscal_year": quarter_info['fiscal_year'],
-                "call_date": call_date,
-                "transcript": transcript,
-                "transcript_source": "seekingalpha",
-                "audio_url": audio_url,
-                "audio_source": "seekingalpha" if audio_url else None,
-                "presentation_url": presentation_url,
-                "presentation_source": "seekingalpha" if presentation_url else None,
-                "article_url": article_url,
-                "article_id": article_id
-            }
+            return self._build_call_data(
+                symbol, quarter_info, call_date, transcript, audio_url, presentation_url, article_url, article_id
+            )
 
         except Exception as e:
             self.logger.error(f"      ❌ Error extracting call data: {e}")
             return None
 
+    async def _extract_call_data_from_article(
+        self,
+        parsed_article: Dict,
+        article_url: str,
+        symbol: str,
+        quarter_info: Dict
+    ) -> Optional[Dict]:
+        """
+        Build call data from the captured article JSON (no DOM queries)
+
+        Args:
+            parsed_article: Result of _parse_article_json()
+            article_url: URL of the transcript article
+            symbol: Stock ticker
+            quarter_info: Dict with 'quarter' and 'fiscal_year'
+
+        Returns:
+            Dict with call data or None
+        """
+        transcript = parsed_article['transcript']
+        self.logger.info(f"      ✅ Extracted transcript from article JSON: {len(transcript)} chars")
+
+        if not transcript or len(transcript) < 100:
+            self.logger.warning(f"      ⚠️ Transcript too short or empty")
+            return None
+
+        article_id = parsed_article['article_id'] or self._extract_article_id(article_url)
+
+        # Check for audio (blocking HEAD request - keep other tabs running)
+        audio_url = await asyncio.to_thread(self._check_audio_exists, article_id)
+
+        presentation_url = parsed_article['presentation_url']
+        if presentation_url:
+            self.logger.info(f"      ✅ Found presentation: {presentation_url}")
+
+        return self._build_call_data(
+            symbol, quarter_info, parsed_article['call_date'], transcript, audio_url,
+            presentation_url, article_url, article_id
+        )
+
+    def _parse_article_json(self, article: Dict) -> Dict:
+        """
+        Pull the fields we store out of an article JSON:API 'data' object
+
+        Args:
+            article: {'id': ..., 'attributes': {'title', 'content', 'publishOn', ...}}
+
+        Returns:
+            Dict with article_id, title, transcript, call_date, presentation_url
+        """
+        attributes = article.get('attributes') or {}
+        content_html = attributes.get('content') or ''
+
+        call_date = None
+        if attributes.get('publishOn'):
+            try:
+                call_date = datetime.fromisoformat(attributes['publishOn'].replace('Z', '+00:00'))
+            except ValueError:
+                pass
+
+        return {
+            'article_id': str(article['id']) if article.get('id') else None,
+            'title': attributes.get('title') or '',
+            'transcript': self._html_to_text(content_html),
+            'call_date': call_date,
+            'presentation_url': self._find_presentation_in_html(content_html)
+        }
+
+    def _build_call_data(
+        self,
+        symbol: str,
+        quarter_info: Dict,
+        call_date: Optional[datetime],
+        transcript: str,
+        audio_url: Optional[str],
+        presentation_url: Optional[str],
+        article_url: str,
+        article_id: Optional[str]
+    ) -> Dict:
+        """Earnings call dict returned by get_latest_earnings_calls()"""
+        return {
+            "symbol": symbol,
+            "quarter": quarter_info['quarter'],
+            "fiscal_year": quarter_info['fiscal_year'],
+            "call_date": call_date,
+            "transcript": transcript,
+            "transcript_source": "seekingalpha",
+            "audio_url": audio_url,
+            "audio_source": "seekingalpha" if audio_url else None,
+            "presentation_url": presentation_url,
+            "presentation_source": "seekingalpha" if presentation_url else None,
+            "article_url": article_url,
+            "article_id": article_id
+        }
+
     async def _extract_transcript(self, page) -> str:
         """
         Extract transcript text from article page
@@ -469,15 +680,8 @@ class SeekingAlphaScraper:
         try:
             # Seeking Alpha stores transcripts in article body
             # Look for main content area
-            content_selectors = [
-                'div[data-test-id="content-container"]',
-                'article',
-                '.article-content',
-                '#article-content'
-            ]
-
             content_element = None
-            for selector in content_selectors:
+            for selector in ARTICLE_CONTENT_SELECTORS:
                 content_element = await page.query_selector(selector)
                 if content_element:
                     break
@@ -488,19 +692,7 @@ class SeekingAlphaScraper:
 
             # Get HTML content
             content_html = await content_element.inner_html()
-
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(content_html, 'html.parser')
-
-            # Remove unwanted elements (ads, related articles, etc.)
-            for unwanted in soup.find_all(['script', 'style', 'aside', 'nav']):
-                unwanted.decompose()
-
-            # Extract text
-            text = soup.get_text(separator='\n', strip=True)
-
-            # Clean up multiple newlines
-            text = re.sub(r'\n{3,}', '\n\n', text)
+            text = self._html_to_text(content_html)
 
             self.logger.info(f"      ✅ Extracted transcript: {len(text)} chars")
             return text
@@ -509,6 +701,21 @@ class SeekingAlphaScraper:
             self.logger.error(f"      ❌ Error extracting transcript: {e}")
             return ""
 
+    def _html_to_text(self, content_html: str) -> str:
+        """Transcript text (with speaker labels) from article body HTML"""
+        # Parse with BeautifulSoup
+        soup = BeautifulSoup(content_html, 'html.parser')
+
+        # Remove unwanted elements (ads, related articles, etc.)
+        for unwanted in soup.find_all(['script', 'style', 'aside', 'nav']):
+            unwanted.decompose()
+
+        # Extract text
+        text = soup.get_text(separator='\n', strip=True)
+
+        # Clean up multiple newlines
+        return re.sub(r'\n{3,}', '\n\n', text)
+
     def _check_audio_exists(self, article_id: str) -> Optional[str]:
         """
         Check if audio file exists for this article
@@ -558,7 +765,7 @@ class SeekingAlphaScraper:
                 text = await link.inner_text()
 
                 # Check if it's an earnings presentation
-                if any(keyword in text.lower() for keyword in ['presentation', 'slides', 'deck', 'earnings']):
+                if any(keyword in text.lower() for keyword in PRESENTATION_KEYWORDS):
                     # Make absolute URL
                     if href.startswith('/'):
                         href = f"https://seekingalpha.com{href}"
@@ -572,6 +779,14 @@ class SeekingAlphaScraper:
             self.logger.debug(f"      Could not find presentation: {e}")
             return None
 
+    def _find_presentation_in_html(self, content_html: str) -> Optional[str]:
+        """Presentation PDF linked from article body HTML (same rules as _find_presentation_pdf)"""
+        soup = BeautifulSoup(content_html, 'html.parser')
+        for link in soup.select('a[href$=".pdf"]'):
+            if any(keyword in link.get_text().lower() for keyword in PRESENTATION_KEYWORDS):
+                return urljoin(BASE_URL, link['href'])
+        return None
+
     async def _extract_call_date(self, page) -> Optional[datetime]:
         """Extract call date from article metadata"""
         try:
@@ -22,7 +22,8 @@ if str(article_summarizer_backend) not in sys.path:
 from core.transcript_aligner import (
     TranscriptAligner,
     format_aligned_transcript_for_claude,
-    format_timestamp
+    format_timestamp,
+    transcript_from_deepgram
 )
 from core.browser_fetcher import BrowserFetcher
 from core.authentication import AuthenticationManager
@@ -33,6 +34,7 @@ __all__ = [
     'TranscriptAligner',
     'format_aligned_transcript_for_claude',
     'format_timestamp',
+    'transcript_from_deepgram',
     'BrowserFetcher',
     'AuthenticationManager',
     'ContentTypeDetector',
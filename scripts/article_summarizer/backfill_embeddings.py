@@ -3,10 +3,12 @@
 Backfill Embeddings Script
 
 Generates embeddings for existing articles in the database that don't have them.
-Uses OpenAI's text-embedding-3-small model (384 dimensions).
+Uses OpenAI's text-embedding-3-small model (384 dimensions) via the backend's
+batched EmbeddingService (many articles per request, bounded concurrency,
+backoff on rate limits).
 
 Usage:
-    python3 backfill_embeddings.py
+    python3 backfill_embeddings.py [--page-size 500]
 
 Environment Variables Required:
     - SUPABASE_URL
@@ -14,10 +16,10 @@ Environment Variables Required:
     - OPENAI_API_KEY
 """
 
+import argparse
 import os
 import sys
-import time
-from typing import List, Optional
+from typing import List
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -33,11 +35,14 @@ elif webapp_env.exists():
     load_dotenv(webapp_env)
     print(f"📁 Loaded env from: {webapp_env}")
 
-# Add parent directory to Python path
+# Add parent directory and article_summarizer_backend to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'programs' / 'article_summarizer_backend'))
 
 from supabase import create_client, Client
 from openai import OpenAI
+from core.embedding_cache import EmbeddingCache
+from core.embedding_service import EmbeddingService
 
 
 class EmbeddingBackfiller:
@@ -59,6 +64,11 @@ class EmbeddingBackfiller:
             raise ValueError("OPENAI_API_KEY must be set")
 
         self.openai_client = OpenAI(api_key=openai_api_key)
+        # Reuse vectors already in the shared embedding_cache table (same text, model, dimensions)
+        self.embedding_service = EmbeddingService(
+            self.openai_client,
+            cache=EmbeddingCache(supabase=self.supabase)
+        )
         print("✅ OpenAI client initialized")
 
     def fetch_articles_without_embeddings(self) -> List[dict]:
@@ -128,35 +138,6 @@ class EmbeddingBackfiller:
 
         return "\n\n".join(parts)
 
-    def generate_embedding(self, text: str) -> Optional[List[float]]:
-        """
-        Generate embedding vector for text using OpenAI API
-
-        Args:
-            text: Text to generate embedding for
-
-        Returns:
-            Embedding vector (384 dimensions) or None if generation fails
-        """
-        try:
-            # Truncate text to avoid token limits (8191 tokens max for text-embedding-3-small)
-            # Approximately 4 characters per token, so limit to ~32000 characters
-            if len(text) > 32000:
-                text = text[:32000]
-                print(f"      ⚠️  Truncated text to 32000 characters")
-
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text,
-                dimensions=384  # Use 384 dimensions for performance
-            )
-
-            return response.data[0].embedding
-
-        except Exception as e:
-            print(f"      ❌ Failed to generate embedding: {e}")
-            return None
-
     def update_article_embedding(self, article_id: int, embedding: List[float]) -> bool:
         """
         Update article with generated embedding
@@ -179,13 +160,15 @@ class EmbeddingBackfiller:
             print(f"      ❌ Failed to update article {article_id}: {e}")
             return False
 
-    def process_articles(self, batch_size: int = 10, delay_between_batches: float = 1.0):
+    def process_articles(self, page_size: int = 500):
         """
-        Process all articles without embeddings in batches
+        Process all articles without embeddings in pages
+
+        Each page is embedded with batched, concurrent requests; the
+        EmbeddingService handles rate limits, so no fixed sleeps are needed.
 
         Args:
-            batch_size: Number of articles to process before taking a break
-            delay_between_batches: Seconds to wait between batches (to avoid rate limits)
+            page_size: Number of articles to embed before writing results to the database
         """
         articles = self.fetch_articles_without_embeddings()
 
@@ -198,42 +181,39 @@ class EmbeddingBackfiller:
         fail_count = 0
 
         print(f"\n🚀 Starting to process {total} articles...")
-        print(f"   Batch size: {batch_size}")
-        print(f"   Delay between batches: {delay_between_batches}s\n")
-
-        for i, article in enumerate(articles, 1):
-            article_id = article['id']
-            title = article.get('title', 'Unknown')[:60]
+        print(f"   Page size: {page_size}")
+        print(f"   Requests: up to {self.embedding_service.batch_size} articles each, "
+              f"{self.embedding_service.max_concurrency} concurrent\n")
 
-            print(f"[{i}/{total}] Processing article {article_id}: {title}...")
+        for page_start in range(0, total, page_size):
+            page = articles[page_start:page_start + page_size]
+            print(f"[{page_start + 1}-{page_start + len(page)}/{total}] Embedding {len(page)} articles...")
 
             # Build text for embedding
-            embedding_text = self.build_embedding_text(article)
+            texts = [self.build_embedding_text(article) for article in page]
+            embeddings = self.embedding_service.embed_many(texts)
 
-            if not embedding_text.strip():
-                print(f"      ⚠️  Skipping - no text content available")
-                fail_count += 1
-                continue
+            for article, text, embedding in zip(page, texts, embeddings):
+                article_id = article['id']
+                title = (article.get('title') or 'Unknown')[:60]
 
-            # Generate embedding
-            embedding = self.generate_embedding(embedding_text)
+                if not text.strip():
+                    print(f"      ⚠️  Skipping {article_id} ({title}) - no text content available")
+                    fail_count += 1
+                    continue
 
-            if not embedding:
-                print(f"      ❌ Skipping - embedding generation failed")
-                fail_count += 1
-                continue
+                if not embedding:
+                    print(f"      ❌ Skipping {article_id} ({title}) - embedding generation failed")
+                    fail_count += 1
+                    continue
 
-            # Update database
-            if self.update_article_embedding(article_id, embedding):
-                print(f"      ✅ Embedding saved ({len(embedding)} dimensions)")
-                success_count += 1
-            else:
-                fail_count += 1
+                # Update database
+                if self.update_article_embedding(article_id, embedding):
+                    success_count += 1
+                else:
+                    fail_count += 1
 
-            # Delay between batches to avoid rate limits
-            if i % batch_size == 0 and i < total:
-                print(f"\n   ⏸️  Batch complete. Waiting {delay_between_batches}s before next batch...\n")
-                time.sleep(delay_between_batches)
+            print(f"   ✅ Saved {success_count} embeddings so far ({fail_count} failed)")
 
         # Final summary
         print(f"\n{'='*60}")
@@ -246,13 +226,18 @@ class EmbeddingBackfiller:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Generate embeddings for articles that don't have them")
+    parser.add_argument('--page-size', type=int, default=500,
+                        help='Articles to embed before writing results to the database (default: 500)')
+    args = parser.parse_args()
+
     print("\n" + "="*60)
     print("Embedding Backfill Script")
     print("="*60 + "\n")
 
     try:
         backfiller = EmbeddingBackfiller()
-        backfiller.process_articles(batch_size=10, delay_between_batches=1.0)
+        backfiller.process_articles(page_size=args.page_size)
 
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
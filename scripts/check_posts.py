@@ -22,16 +22,16 @@ API_KEY = os.getenv('CONTENT_CHECKER_API_KEY', '')
 
 
 async def check_posts():
-    """Call the content_checker_backend API to check for new posts/articles"""
+    """Call the content_checker_backend API to check all users' sources for new posts/articles"""
 
-    print("📰 Checking for new newsletter/blog posts...")
+    print("📰 Checking for new newsletter/blog posts (all users)...")
     print(f"📡 API: {CONTENT_CHECKER_API_URL}")
 
     try:
         async with httpx.AsyncClient(timeout=120.0) as client:
-            # Call the check endpoint
+            # Call the all-users check endpoint (each unique feed is fetched once)
             response = await client.post(
-                f"{CONTENT_CHECKER_API_URL}/api/posts/check",
+                f"{CONTENT_CHECKER_API_URL}/api/posts/check-all",
                 headers={"X-API-Key": API_KEY}
             )
 
@@ -40,7 +40,8 @@ async def check_posts():
 
                 print(f"\n✅ {data['message']}")
                 print(f"📊 New posts: {data['new_posts_found']}")
-                print(f"📊 Sources checked: {data['total_sources_checked']}")
+                print(f"📊 Users checked: {data['users_checked']}")
+                print(f"📊 Sources checked: {data['total_sources_checked']} ({data['unique_feeds_fetched']} unique feeds)")
 
                 if data.get('newly_discovered_ids'):
                     print(f"\n🆕 Newly discovered posts ({len(data['newly_discovered_ids'])}):")
@@ -55,6 +56,10 @@ async def check_posts():
                 print("❌ Authentication failed. Check your API key.")
                 return 1
 
+            elif response.status_code == 503:
+                print("❌ The content checker has no API_KEY configured - set it to enable all-user checks.")
+                return 1
+
             else:
                 print(f"❌ API error: {response.status_code}")
                 print(f"   {response.text}")
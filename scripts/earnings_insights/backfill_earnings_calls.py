@@ -3,9 +3,13 @@ Backfill Earnings Calls
 
 Fetches latest N quarters of earnings calls from Seeking Alpha for all companies.
 
+All companies are scraped in one browser session, several at a time in
+parallel tabs (--tabs, default SEEKING_ALPHA_TABS).
+
 Usage:
     python scripts/earnings_insights/backfill_earnings_calls.py --quarters 4
     python scripts/earnings_insights/backfill_earnings_calls.py --symbol AAPL --quarters 8
+    python scripts/earnings_insights/backfill_earnings_calls.py --quarters 4 --tabs 5
 """
 
 import os
@@ -93,8 +97,8 @@ async def backfill_company_earnings(
                     "processing_status": "pending"
                 }
 
-                # Try to insert
-                result = supabase.table('earnings_calls').insert(call_data).execute()
+                # Try to insert (Supabase is sync - keep the other tabs scraping)
+                await asyncio.to_thread(supabase.table('earnings_calls').insert(call_data).execute)
 
                 logger.info(f"   ✅ Added: {symbol} {call['quarter']}")
                 inserted_count += 1
@@ -116,13 +120,14 @@ async def backfill_company_earnings(
         return 0
 
 
-async def backfill_all_companies(num_quarters: int, symbol_filter: str = None):
+async def backfill_all_companies(num_quarters: int, symbol_filter: str = None, tabs: int = None):
     """
     Backfill earnings calls for all companies (or specific symbol)
 
     Args:
         num_quarters: Number of quarters to fetch per company
         symbol_filter: If provided, only process this symbol
+        tabs: Companies scraped at once (default: SEEKING_ALPHA_TABS)
     """
     logger.info("=" * 60)
     logger.info("BACKFILLING EARNINGS CALLS")
@@ -162,29 +167,35 @@ async def backfill_all_companies(num_quarters: int, symbol_filter: str = None):
         logger.error(f"❌ Error fetching companies: {e}")
         return
 
-    # Process each company
-    total_inserted = 0
+    if not companies:
+        logger.info("Nothing to backfill")
+        return
 
-    for i, company in enumerate(companies, 1):
+    # Process companies in parallel tabs of one browser session
+    # (the scraper limits open tabs and spaces out page loads)
+    async def backfill_one(i: int, company: dict) -> int:
         logger.info(f"\n[{i}/{len(companies)}] Processing {company['symbol']}...")
-
         try:
-            count = await backfill_company_earnings(
+            return await backfill_company_earnings(
                 supabase,
                 scraper,
                 company,
                 num_quarters
             )
-            total_inserted += count
-
-            # Rate limiting: wait between companies
-            if i < len(companies):
-                logger.info("   ⏳ Waiting 3 seconds before next company...")
-                await asyncio.sleep(3)
-
         except Exception as e:
             logger.error(f"❌ Error processing {company['symbol']}: {e}")
-            continue
+            return 0
+
+    try:
+        async with scraper.browser_session(tabs=tabs):
+            counts = await asyncio.gather(
+                *(backfill_one(i, company) for i, company in enumerate(companies, 1))
+            )
+    except Exception as e:
+        logger.error(f"❌ Could not start browser session: {e}")
+        return
+
+    total_inserted = sum(counts)
 
     # Summary
     logger.info("\n" + "=" * 60)
@@ -226,6 +237,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Backfill earnings calls from Seeking Alpha")
     parser.add_argument('--quarters', type=int, default=4, help='Number of quarters to fetch per company')
     parser.add_argument('--symbol', type=str, help='Process specific symbol only')
+    parser.add_argument('--tabs', type=int, help='Companies to scrape at once (default: SEEKING_ALPHA_TABS or 3)')
     args = parser.parse_args()
 
     # Load environment variables
@@ -233,4 +245,4 @@ if __name__ == "__main__":
     env_path = project_root / ".env.local"
     load_dotenv(env_path)
 
-    asyncio.run(backfill_all_companies(args.quarters, args.symbol))
+    asyncio.run(backfill_all_companies(args.quarters, args.symbol, args.tabs))
@@ -1,11 +1,12 @@
 """
 Process All Pending Earnings Calls
 
-Batch processes all earnings calls with status='pending'.
+Batch processes all earnings calls with status='pending', several at a time.
 
 Usage:
     python scripts/earnings_insights/process_all_pending.py
     python scripts/earnings_insights/process_all_pending.py --limit 10
+    python scripts/earnings_insights/process_all_pending.py --concurrency 8
 """
 
 import os
@@ -24,7 +25,7 @@ earnings_insights_path = project_root / 'programs' / 'earnings_insights'
 sys.path.insert(0, str(earnings_insights_path))
 
 from supabase import create_client, Client
-from app.services.earnings_processor import process_earnings_call
+from app.services.earnings_processor import process_earnings_calls
 
 # Configure logging
 logging.basicConfig(
@@ -34,12 +35,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def process_all_pending(limit: int = None):
+async def process_all_pending(limit: int = None, concurrency: int = None):
     """
     Process all pending earnings calls
 
     Args:
         limit: Optional limit on number of calls to process
+        concurrency: Calls processed at once (default: EARNINGS_BATCH_CONCURRENCY)
     """
     logger.info("=" * 60)
     logger.info("PROCESSING ALL PENDING EARNINGS CALLS")
@@ -77,38 +79,29 @@ async def process_all_pending(limit: int = None):
         logger.error(f"❌ Error fetching pending calls: {e}")
         return
 
-    # Process each call
-    success_count = 0
-    failed_count = 0
-
-    for i, call in enumerate(pending_calls, 1):
-        logger.info(f"\n[{i}/{len(pending_calls)}] Processing {call['symbol']} {call['quarter']} (ID: {call['id']})")
-
-        try:
-            success = await process_earnings_call(call['id'])
-
-            if success:
-                success_count += 1
-            else:
-                failed_count += 1
+    if not pending_calls:
+        logger.info("\n🎉 Nothing to process")
+        return
 
-            # Rate limiting: wait between calls
-            if i < len(pending_calls):
-                logger.info("   ⏳ Waiting 5 seconds before next call...")
-                await asyncio.sleep(5)
+    for call in pending_calls:
+        logger.info(f"   • {call['symbol']} {call['quarter']} (ID: {call['id']})")
 
-        except Exception as e:
-            logger.error(f"❌ Error processing call {call['id']}: {e}")
-            failed_count += 1
-            continue
+    # Process calls concurrently (the processor rate-limits Deepgram and Claude per stage)
+    try:
+        summary = await process_earnings_calls([call['id'] for call in pending_calls], concurrency)
+    except Exception as e:
+        logger.error(f"❌ Error processing calls: {e}")
+        return
 
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("SUMMARY")
     logger.info("=" * 60)
-    logger.info(f"Total calls processed: {len(pending_calls)}")
-    logger.info(f"✅ Successful: {success_count}")
-    logger.info(f"❌ Failed: {failed_count}")
+    logger.info(f"Total calls processed: {summary['processed']} in {summary['elapsed_seconds']:.1f}s")
+    logger.info(f"✅ Successful: {summary['succeeded']}")
+    logger.info(f"❌ Failed: {summary['failed']}")
+    if summary['failed_ids']:
+        logger.info(f"   Failed IDs: {', '.join(str(call_id) for call_id in summary['failed_ids'])}")
 
     # Check remaining pending
     try:
@@ -130,6 +123,7 @@ if __name__ == "__main__":
     # Parse arguments
     parser = argparse.ArgumentParser(description="Process all pending earnings calls")
     parser.add_argument('--limit', type=int, help='Limit number of calls to process')
+    parser.add_argument('--concurrency', type=int, help='Calls to process at once (default: EARNINGS_BATCH_CONCURRENCY or 4)')
     args = parser.parse_args()
 
     # Load environment variables
@@ -137,4 +131,4 @@ if __name__ == "__main__":
     env_path = project_root / ".env.local"
     load_dotenv(env_path)
 
-    asyncio.run(process_all_pending(args.limit))
+    asyncio.run(process_all_pending(args.limit, args.concurrency))
@@ -0,0 +1,19 @@
+-- =====================================================
+-- Migration: 1018_create_transcript_cache
+-- Purpose: Create transcript_cache table for reusing DeepGram transcripts across processing runs
+-- =====================================================
+
+-- cache_key = sha256 of (media fingerprint or canonical media URL, transcription options)
+CREATE TABLE IF NOT EXISTS transcript_cache (
+  cache_key TEXT PRIMARY KEY,
+  transcript JSONB NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Index for age-based cleanup
+CREATE INDEX IF NOT EXISTS idx_transcript_cache_created_at ON transcript_cache(created_at);
+
+-- Enable Row Level Security (no policies: backend service role only)
+ALTER TABLE transcript_cache ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE transcript_cache IS 'DeepGram transcripts keyed by media fingerprint + options; avoids re-transcribing the same media';
@@ -0,0 +1,19 @@
+-- =====================================================
+-- Migration: 1019_create_embedding_cache
+-- Purpose: Create embedding_cache table for reusing OpenAI embeddings of unchanged text
+-- =====================================================
+
+-- cache_key = sha256 of (normalized embedding text, model, dimensions)
+CREATE TABLE IF NOT EXISTS embedding_cache (
+  cache_key TEXT PRIMARY KEY,
+  embedding JSONB NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Index for age-based cleanup
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_created_at ON embedding_cache(created_at);
+
+-- Enable Row Level Security (no policies: backend service role only)
+ALTER TABLE embedding_cache ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE embedding_cache IS 'OpenAI embeddings keyed by normalized input text + model + dimensions; avoids re-embedding unchanged text';
@@ -0,0 +1,22 @@
+-- =====================================================
+-- Migration: 1020_create_feed_fetch_state
+-- Purpose: Create feed_fetch_state table for conditional GETs and seen entries per user feed
+-- =====================================================
+
+-- One row per (user, feed URL) as of the last successful poll.
+-- Keyed by user: entries one user has processed may still be new for another.
+CREATE TABLE IF NOT EXISTS feed_fetch_state (
+  user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+  feed_url TEXT NOT NULL,
+  etag TEXT,
+  last_modified TEXT,
+  content_hash TEXT,
+  seen_entry_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+  checked_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  PRIMARY KEY (user_id, feed_url)
+);
+
+-- Enable Row Level Security (no policies: backend service role only)
+ALTER TABLE feed_fetch_state ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE feed_fetch_state IS 'ETag/Last-Modified, body hash and last-seen entry IDs per user feed; lets post checks skip unchanged feeds';
@@ -0,0 +1,19 @@
+-- =====================================================
+-- Migration: 1021_create_post_published_dates
+-- Purpose: Create post_published_dates table for caching dates of undated feed entries
+-- =====================================================
+
+-- One row per post URL. A published date is a fact about the URL, not the
+-- user, so the cache is shared. date_source 'last_modified' means the date is
+-- the page's Last-Modified header (an upper bound, only stored when old).
+CREATE TABLE IF NOT EXISTS post_published_dates (
+  url TEXT PRIMARY KEY,
+  published_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  date_source TEXT NOT NULL DEFAULT 'page' CHECK (date_source IN ('page', 'last_modified')),
+  checked_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Enable Row Level Security (no policies: backend service role only)
+ALTER TABLE post_published_dates ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE post_published_dates IS 'Published dates looked up from post pages for undated feed entries; avoids re-downloading the same posts every check';
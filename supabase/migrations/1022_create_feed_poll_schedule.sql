@@ -0,0 +1,28 @@
+-- =====================================================
+-- Migration: 1022_create_feed_poll_schedule
+-- Purpose: Create feed_poll_schedule table for per-source adaptive polling intervals
+-- =====================================================
+
+-- One row per (source URL, source type) - shared by every user subscribed to it.
+-- Active feeds are polled at a fraction of their publishing gap; feeds that
+-- don't change have poll_interval_seconds doubled up to a maximum.
+CREATE TABLE IF NOT EXISTS feed_poll_schedule (
+  source_url TEXT NOT NULL,
+  source_type TEXT NOT NULL,
+  poll_interval_seconds INTEGER NOT NULL,
+  next_poll_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  last_polled_at TIMESTAMP WITH TIME ZONE,
+  last_changed_at TIMESTAMP WITH TIME ZONE,
+  content_hash TEXT,
+  consecutive_unchanged INTEGER NOT NULL DEFAULT 0,
+  last_error TEXT,
+  PRIMARY KEY (source_url, source_type)
+);
+
+-- Status endpoint lists the next feeds due
+CREATE INDEX IF NOT EXISTS idx_feed_poll_schedule_next_poll_at ON feed_poll_schedule(next_poll_at);
+
+-- Enable Row Level Security (no policies: backend service role only)
+ALTER TABLE feed_poll_schedule ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE feed_poll_schedule IS 'Next poll time and learned interval per content source; polls busy feeds often and backs off dormant ones';
@@ -20,6 +20,14 @@ interface ProcessingStep {
   substeps?: string[];
 }
 
+// Summary fields streamed as 'ai_partial' events before the full response is parsed
+interface PartialSummary {
+  summary?: string;
+  key_insights?: { insight: string; time_formatted?: string | null }[];
+  quotes?: { quote: string; speaker?: string }[];
+  topics?: string[];
+}
+
 function AdminPageContent() {
   const { user, loading: authLoading } = useAuth();
   const router = useRouter();
@@ -32,6 +40,7 @@ function AdminPageContent() {
   const [detectedPrivacy, setDetectedPrivacy] = useState<boolean | null>(null);
   const [steps, setSteps] = useState<ProcessingStep[]>([]);
   const [uploadProgress, setUploadProgress] = useState(0);
+  const [partialSummary, setPartialSummary] = useState<PartialSummary>({});
   const [result, setResult] = useState<{
     status: 'success' | 'error' | 'info';
     message: string;
@@ -141,6 +150,7 @@ function AdminPageContent() {
     setResult(null);
     setDuplicateWarning(null);
     setDetectedPrivacy(null);
+    setPartialSummary({});
     audioDurationRef.current = null;
     setUploadProgress(0);
 
@@ -415,6 +425,13 @@ function AdminPageContent() {
         updateStep('ai', { status: 'processing' });
       });
 
+      eventSource.addEventListener('ai_partial', (e) => {
+        // Streamed summary fields arrive while Claude is still generating the rest
+        const data = JSON.parse(e.data);
+        updateStep('ai', { status: 'processing', detail: `Received ${String(data.field).replace(/_/g, ' ')}...` });
+        setPartialSummary(prev => ({ ...prev, [data.field]: data.value }));
+      });
+
       eventSource.addEventListener('ai_complete', () => {
         updateStep('ai', { status: 'complete', detail: 'Summary generated by Claude' });
       });
@@ -846,6 +863,55 @@ function AdminPageContent() {
             </div>
           )}
 
+          {loading && (partialSummary.summary || partialSummary.key_insights || partialSummary.quotes) && (
+            <div className="mt-6 p-4 rounded-lg border border-gray-200 bg-gray-50 space-y-4">
+              <h3 className="text-sm font-medium text-gray-700">Summary Preview</h3>
+              {partialSummary.summary && (
+                <div
+                  className="prose prose-sm max-w-none text-gray-700"
+                  dangerouslySetInnerHTML={{ __html: partialSummary.summary }}
+                />
+              )}
+              {partialSummary.key_insights && partialSummary.key_insights.length > 0 && (
+                <div>
+                  <h4 className="text-xs font-semibold text-gray-600 uppercase tracking-wide">Key Insights</h4>
+                  <ul className="mt-1 space-y-1">
+                    {partialSummary.key_insights.map((item, idx) => (
+                      <li key={idx} className="text-sm text-gray-700">
+                        • {item.insight}
+                        {item.time_formatted && (
+                          <span className="text-xs text-gray-400 ml-1">({item.time_formatted})</span>
+                        )}
+                      </li>
+                    ))}
+                  </ul>
+                </div>
+              )}
+              {partialSummary.quotes && partialSummary.quotes.length > 0 && (
+                <div>
+                  <h4 className="text-xs font-semibold text-gray-600 uppercase tracking-wide">Quotes</h4>
+                  <ul className="mt-1 space-y-1">
+                    {partialSummary.quotes.map((item, idx) => (
+                      <li key={idx} className="text-sm text-gray-700 italic">
+                        &ldquo;{item.quote}&rdquo;
+                        {item.speaker && <span className="not-italic text-gray-500"> — {item.speaker}</span>}
+                      </li>
+                    ))}
+                  </ul>
+                </div>
+              )}
+              {partialSummary.topics && partialSummary.topics.length > 0 && (
+                <div className="flex flex-wrap gap-1">
+                  {partialSummary.topics.map((topic) => (
+                    <span key={topic} className="px-2 py-0.5 rounded-full text-xs bg-gray-200 text-gray-700">
+                      {topic}
+                    </span>
+                  ))}
+                </div>
+              )}
+            </div>
+          )}
+
           {result && (
             <div
               className={`mt-6 p-4 rounded-lg border-2 ${
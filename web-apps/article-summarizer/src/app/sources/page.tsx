@@ -8,7 +8,7 @@ import {
   createContentSource,
   deleteContentSource,
   ContentSource,
-  discoverSource,
+  discoverSourceStream,
   PreviewPost,
 } from '@/lib/api-client';
 import { searchPodcastIndex, getPodcastEpisodes } from '@/lib/podcast-index';
@@ -241,8 +241,8 @@ export default function ContentSourcesPage() {
     setDiscoveredSource(null);
 
     try {
-      const result = await discoverSource(urlInput, 'newsletter');
-      setDiscoveredSource(result);
+      // Show the feed/title as soon as it's known; preview posts follow
+      await discoverSourceStream(urlInput, 'newsletter', (source) => setDiscoveredSource(source));
     } catch (error) {
       console.error('Error discovering source:', error);
       addNotification('error', error instanceof Error ? error.message : 'Failed to discover source');
@@ -322,3 +322,74 @@ export async function discoverSource(url: string, sourceType: 'newsletter' | 'po
 
   return response.json()
 }
+
+/**
+ * Discovered source information (see discoverSource)
+ */
+export interface DiscoveredSource {
+  url: string
+  title: string
+  has_rss: boolean
+  source_type: string
+  preview_posts: PreviewPost[]
+}
+
+/**
+ * Discover a source, reporting the feed metadata before the preview posts
+ * @param url - URL to discover (website or RSS feed)
+ * @param sourceType - User's intended source type
+ * @param onUpdate - Called with the result so far: first without preview posts, then complete
+ * @returns Complete discovered source information
+ */
+export async function discoverSourceStream(
+  url: string,
+  sourceType: 'newsletter' | 'podcast' = 'newsletter',
+  onUpdate?: (source: DiscoveredSource, complete: boolean) => void
+): Promise<DiscoveredSource> {
+  const response = await fetchContentCheckerBackend('/api/sources/discover/stream', {
+    method: 'POST',
+    body: JSON.stringify({ url, source_type: sourceType }),
+  })
+
+  if (!response.ok || !response.body) {
+    const error = await response.json().catch(() => ({ detail: 'Unknown error' }))
+    throw new Error(error.detail || 'Failed to discover source')
+  }
+
+  // Newline-delimited JSON: a 'metadata' event, then a 'preview' event (or a single 'error')
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  let source: DiscoveredSource | null = null
+
+  const handleLine = (line: string) => {
+    if (!line.trim()) return
+    const { event, ...data } = JSON.parse(line)
+
+    if (event === 'error') {
+      throw new Error(data.detail || 'Failed to discover source')
+    }
+    if (event === 'metadata') {
+      source = { ...data, preview_posts: [] } as DiscoveredSource
+      onUpdate?.(source, false)
+    } else if (event === 'preview' && source) {
+      source = { ...source, ...data }
+      onUpdate?.(source, true)
+    }
+  }
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+    const lines = buffer.split('\n')
+    buffer = lines.pop() || ''
+    lines.forEach(handleLine)
+  }
+  handleLine(buffer)
+
+  if (!source) {
+    throw new Error('Failed to discover source')
+  }
+  return source
+}